@@ -0,0 +1,203 @@
+"""Synthetic ledger builders shared by the benchmark scripts.
+
+Rows are written with ``executemany`` straight into the schema created by
+``SQLiteDatabase.initialize()`` so that building a 100k-transaction ledger
+takes seconds rather than the minutes the per-row repository API would need.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from family_office_ledger.domain.value_objects import to_minor_units  # noqa: E402
+from family_office_ledger.repositories.sqlite import SQLiteDatabase  # noqa: E402
+
+
+@dataclass
+class SyntheticLedger:
+    """Handles to the rows created by :func:`build_sqlite_ledger`."""
+
+    db: SQLiteDatabase
+    entity_ids: list[UUID] = field(default_factory=list)
+    account_ids: list[UUID] = field(default_factory=list)
+    cash_account_id: UUID | None = None
+    transaction_count: int = 0
+    start_date: date = date(2020, 1, 1)
+    end_date: date = date(2020, 1, 1)
+
+
+def build_sqlite_ledger(
+    path: str | Path,
+    transactions: int = 100_000,
+    entities: int = 4,
+    accounts_per_entity: int = 10,
+    start_date: date = date(2020, 1, 1),
+    seed: int = 7,
+) -> SyntheticLedger:
+    """Create a ledger where every transaction debits one busy cash account.
+
+    Each transaction has two entries: a debit to the first asset account of
+    the first entity (the "brokerage cash" account benchmarks query) and a
+    credit to a random income/expense account.
+    """
+    rng = random.Random(seed)
+    db = SQLiteDatabase(path)
+    db.initialize()
+    conn = db.get_connection()
+    now = datetime.now(UTC).isoformat()
+    ledger = SyntheticLedger(db=db, start_date=start_date)
+
+    entity_rows = []
+    account_rows = []
+    for e in range(entities):
+        entity_id = uuid4()
+        ledger.entity_ids.append(entity_id)
+        entity_rows.append(
+            (str(entity_id), f"Entity {e}", "llc", "2020-12-31", 1, now, now)
+        )
+        for a in range(accounts_per_entity):
+            account_id = uuid4()
+            ledger.account_ids.append(account_id)
+            account_type = "asset" if a < accounts_per_entity // 2 else "income"
+            account_rows.append(
+                (
+                    str(account_id),
+                    f"Account {e}-{a}",
+                    str(entity_id),
+                    account_type,
+                    "other",
+                    "USD",
+                    0,
+                    1,
+                    now,
+                )
+            )
+    conn.executemany(
+        "INSERT INTO entities (id, name, entity_type, fiscal_year_end, is_active, "
+        "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        entity_rows,
+    )
+    conn.executemany(
+        "INSERT INTO accounts (id, name, entity_id, account_type, sub_type, currency, "
+        "is_investment_account, is_active, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        account_rows,
+    )
+    ledger.cash_account_id = ledger.account_ids[0]
+
+    txn_rows = []
+    entry_rows = []
+    days = max(1, transactions // 100)
+    for i in range(transactions):
+        txn_id = str(uuid4())
+        txn_date = (start_date + timedelta(days=i * days // transactions)).isoformat()
+        amount = f"{rng.randint(1, 100_000) / 100:.2f}"
+        minor = to_minor_units(Decimal(amount))
+        counter = ledger.account_ids[rng.randrange(1, len(ledger.account_ids))]
+        txn_rows.append((txn_id, txn_date, txn_date, f"txn {i}", "", now, 0))
+        entry_rows.append(
+            (
+                str(uuid4()),
+                txn_id,
+                str(ledger.cash_account_id),
+                amount,
+                "USD",
+                "0",
+                "USD",
+                minor,
+                0,
+            )
+        )
+        entry_rows.append(
+            (str(uuid4()), txn_id, str(counter), "0", "USD", amount, "USD", 0, minor)
+        )
+    conn.executemany(
+        "INSERT INTO transactions (id, transaction_date, posted_date, memo, reference, "
+        "created_at, is_reversed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        txn_rows,
+    )
+    conn.executemany(
+        "INSERT INTO entries (id, transaction_id, account_id, debit_amount, "
+        "debit_currency, credit_amount, credit_currency, debit_amount_minor, "
+        "credit_amount_minor) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        entry_rows,
+    )
+    conn.commit()
+    db.rebuild_balance_snapshots()
+    ledger.transaction_count = transactions
+    ledger.end_date = start_date + timedelta(days=days)
+    return ledger
+
+
+_LEDGER_TABLES = (
+    "entities",
+    "accounts",
+    "transactions",
+    "entries",
+    "account_balance_snapshots",
+)
+_BOOLEAN_COLUMNS = {"is_active", "is_reversed", "is_investment_account", "is_recurring"}
+
+
+def copy_ledger_to_postgres(ledger: SyntheticLedger, db: Any) -> None:
+    """Replace the ledger tables of a throwaway Postgres database with ``ledger``."""
+    source = ledger.db.get_connection()
+    conn = db.get_connection()
+    with conn.cursor() as cur:
+        for table in reversed(_LEDGER_TABLES):
+            cur.execute(f"DELETE FROM {table}")
+        for table in _LEDGER_TABLES:
+            rows = source.execute(f"SELECT * FROM {table}").fetchall()
+            if not rows:
+                continue
+            columns = rows[0].keys()
+            values = [
+                tuple(
+                    bool(value)
+                    if column in _BOOLEAN_COLUMNS and value is not None
+                    else value
+                    for column, value in zip(columns, row, strict=True)
+                )
+                for row in rows
+            ]
+            placeholders = ", ".join(["%s"] * len(columns))
+            cur.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                values,
+            )
+    conn.commit()
+
+
+@contextmanager
+def count_queries(conn: sqlite3.Connection) -> Iterator[list[str]]:
+    """Record every SQL statement executed on ``conn`` inside the block."""
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    try:
+        yield statements
+    finally:
+        conn.set_trace_callback(None)
+
+
+def timed(fn: Callable[[], object], repeat: int = 3) -> tuple[float, object]:
+    """Return the best wall-clock time over ``repeat`` runs and the last result."""
+    best = float("inf")
+    result: object = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
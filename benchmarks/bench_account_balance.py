@@ -0,0 +1,77 @@
+"""Benchmark account balance lookups.
+
+Compares three ways of computing an as-of balance for a busy account:
+
+* summing a fully hydrated account history in Python (the original
+  ``get_account_balance`` implementation);
+* ``sum_by_account`` with a ``start`` date, which aggregates the
+  scaled-integer amount columns in one ``GROUP BY`` query;
+* ``sum_by_account`` without ``start``, which reads the latest row of
+  ``account_balance_snapshots`` on or before the as-of date.
+
+Usage:
+    python benchmarks/bench_account_balance.py [--transactions 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+from _ledger_fixtures import build_sqlite_ledger, count_queries, timed
+
+from family_office_ledger.repositories.sqlite import SQLiteTransactionRepository
+
+
+def _hydrated_balance(repo: SQLiteTransactionRepository, account_id: UUID) -> Decimal:
+    balance = Decimal("0")
+    for txn in repo.list_by_account(account_id):
+        for entry in txn.entries:
+            if entry.account_id == account_id:
+                balance += entry.debit_amount.amount - entry.credit_amount.amount
+    return balance
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "bench.db", args.transactions)
+        repo = SQLiteTransactionRepository(ledger.db)
+        conn = ledger.db.get_connection()
+        account_id = ledger.cash_account_id
+        assert account_id is not None
+
+        def aggregated(**window: object) -> Callable[[], Decimal]:
+            return lambda: sum(
+                (t.balance for t in repo.sum_by_account([account_id], **window)),  # type: ignore[arg-type]
+                Decimal("0"),
+            )
+
+        variants: list[tuple[str, Callable[[], Decimal], int]] = [
+            ("hydrate and sum", lambda: _hydrated_balance(repo, account_id), 1),
+            ("GROUP BY", aggregated(start=ledger.start_date), 3),
+            ("snapshot", aggregated(as_of=ledger.end_date), 3),
+        ]
+
+        print(f"SQLite, {args.transactions:,} transactions on one account")
+        balances = set()
+        for label, fn, repeat in variants:
+            with count_queries(conn) as queries:
+                elapsed, balance = timed(fn, repeat=repeat)
+            balances.add(balance)
+            print(
+                f"  {label:<16} {len(queries) // repeat:>6,} queries  {elapsed:8.4f}s"
+            )
+        assert len(balances) == 1, balances
+        print(f"  balance:         {balances.pop()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark sync and async report endpoints under concurrent load.
+
+Serves the report endpoints over the synthetic ledger with a single uvicorn
+worker, in its own process, and fires ``--requests`` requests at each,
+``--concurrency`` at a time, from an httpx client:
+
+* sync: the previous ``def`` endpoints, which run ``ReportingServiceImpl``
+  on Starlette's threadpool (40 threads) and count each entity's
+  transactions by streaming them;
+* async: the ``async def`` endpoints of ``family_office_ledger.api.routes``,
+  which await ``AsyncReportingServiceImpl`` on aiosqlite connections.
+
+Reports requests per second and the p50/p99 latency of the dashboard and
+the net worth report.
+
+Usage:
+    python benchmarks/bench_async_api.py [--transactions 20000]
+        [--requests 400] [--concurrency 200] [--port 8765]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Annotated
+
+import httpx
+import uvicorn
+from _ledger_fixtures import build_sqlite_ledger
+from fastapi import APIRouter, Depends, FastAPI, Query
+
+from family_office_ledger.api.routes import (
+    _serialize_dashboard_data,
+    _serialize_report_data,
+    _serialize_totals,
+    get_reporting_service,
+    health_router,
+    report_router,
+)
+from family_office_ledger.api.schemas import ReportResponse
+from family_office_ledger.repositories.sqlite import SQLiteDatabase
+
+sync_router = APIRouter(prefix="/sync/reports")
+
+
+@sync_router.get("/dashboard", response_model=ReportResponse)
+def sync_dashboard_summary(
+    db: Annotated[SQLiteDatabase, Depends()],
+    as_of_date: Annotated[date, Query()],
+) -> ReportResponse:
+    report_data = get_reporting_service(db).dashboard_summary(None, as_of_date)
+    return ReportResponse(
+        report_name=report_data["report_name"],
+        as_of_date=report_data["as_of_date"],
+        data=_serialize_dashboard_data(report_data["data"]),
+        totals={},
+    )
+
+
+@sync_router.get("/net-worth", response_model=ReportResponse)
+def sync_net_worth_report(
+    db: Annotated[SQLiteDatabase, Depends()],
+    as_of_date: Annotated[date, Query()],
+) -> ReportResponse:
+    report_data = get_reporting_service(db).net_worth_report(None, as_of_date)
+    return ReportResponse(
+        report_name=report_data["report_name"],
+        as_of_date=report_data["as_of_date"],
+        data=_serialize_report_data(report_data["data"]),
+        totals=_serialize_totals(report_data["totals"]),
+    )
+
+
+def _serve(path: Path, port: int) -> None:
+    db = SQLiteDatabase(path)
+    app = FastAPI()
+    app.include_router(health_router)
+    app.include_router(report_router)
+    app.include_router(sync_router)
+    app.dependency_overrides[SQLiteDatabase] = lambda: db
+    uvicorn.run(app, port=port, log_level="warning", workers=1)
+
+
+async def _load(
+    base_url: str, path: str, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=300
+    ) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return time.perf_counter() - started, latencies
+
+
+async def _wait_for(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                (await client.get("/health")).raise_for_status()
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ledger.db"
+        ledger = build_sqlite_ledger(path, args.transactions)
+        as_of = ledger.end_date.isoformat()
+        ledger.db.close()
+
+        server = multiprocessing.Process(target=_serve, args=(path, args.port))
+        server.start()
+        base_url = f"http://127.0.0.1:{args.port}"
+        try:
+            asyncio.run(_wait_for(base_url))
+            print(
+                f"SQLite, {args.transactions:,} transactions, {args.requests} "
+                f"requests, {args.concurrency} concurrent"
+            )
+            print(f"  {'':<20} {'req/s':>8} {'p50':>10} {'p99':>10}")
+            for report in ("dashboard", "net-worth"):
+                for label, prefix in (("sync", "/sync"), ("async", "")):
+                    url = f"{prefix}/reports/{report}?as_of_date={as_of}"
+                    # Warm up connections and caches.
+                    asyncio.run(_load(base_url, url, 10, 10))
+                    elapsed, latencies = asyncio.run(
+                        _load(base_url, url, args.requests, args.concurrency)
+                    )
+                    cuts = statistics.quantiles(latencies, n=100)
+                    print(
+                        f"  {report + ' ' + label:<20} "
+                        f"{args.requests / elapsed:>8.1f} "
+                        f"{cuts[49] * 1000:>7.1f} ms {cuts[98] * 1000:>7.1f} ms"
+                    )
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
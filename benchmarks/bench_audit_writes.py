@@ -0,0 +1,102 @@
+"""Benchmark audited transaction posts.
+
+Posts transactions one at a time to an on-disk SQLite ledger and records an
+audit entry for each, first with a synchronous ``AuditWriter`` (one extra
+commit per post, as ``AuditService`` used to do) and then with the default
+batched writer, which buffers entries and commits them with ``executemany``
+from a background thread. ``close()`` is included in the batched timing so
+every entry is durable before the clock stops. ``--synchronous FULL`` makes
+SQLite fsync on every commit, which is where per-entry commits hurt most.
+
+Usage:
+    python benchmarks/bench_audit_writes.py [--transactions 2000] [--synchronous FULL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import SyntheticLedger, build_sqlite_ledger, timed
+
+from family_office_ledger.domain.audit import AuditEntityType
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import (
+    SQLiteDatabase,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.audit import AuditService, AuditWriter
+
+
+def _post(
+    ledger: SyntheticLedger,
+    repo: SQLiteTransactionRepository,
+    audit: AuditService,
+    writer: AuditWriter,
+    count: int,
+) -> None:
+    assert ledger.cash_account_id is not None
+    for i in range(count):
+        amount = Money(Decimal(i % 1000 + 1))
+        txn = Transaction(
+            transaction_date=ledger.start_date + timedelta(days=i % 30),
+            memo=f"post {i}",
+        )
+        txn.add_entry(Entry(account_id=ledger.cash_account_id, debit_amount=amount))
+        txn.add_entry(Entry(account_id=ledger.account_ids[1], credit_amount=amount))
+        repo.add(txn)
+        audit.log_create(
+            AuditEntityType.TRANSACTION,
+            txn.id,
+            {"memo": txn.memo, "amount": str(amount.amount)},
+        )
+    writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=2_000)
+    parser.add_argument("--synchronous", choices=("NORMAL", "FULL"), default="NORMAL")
+    args = parser.parse_args()
+
+    print(
+        f"SQLite on disk (synchronous={args.synchronous}), "
+        f"{args.transactions:,} audited posts"
+    )
+    for label, synchronous in (("synchronous", True), ("batched", False)):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.db"
+            ledger = build_sqlite_ledger(path, transactions=0)
+            assert ledger.cash_account_id is not None
+            ledger.db.close()
+            db = SQLiteDatabase(path, synchronous=args.synchronous)
+            repo = SQLiteTransactionRepository(db)
+            writer = AuditWriter(db, synchronous=synchronous)
+            audit = AuditService(db, writer)
+
+            elapsed, _ = timed(
+                functools.partial(
+                    _post, ledger, repo, audit, writer, args.transactions
+                ),
+                repeat=1,
+            )
+            stored = (
+                db.get_connection()
+                .execute("SELECT COUNT(*) FROM audit_log")
+                .fetchone()[0]
+            )
+            assert stored == args.transactions, stored
+            print(
+                f"  {label:<12} {elapsed:8.3f}s  "
+                f"{args.transactions / elapsed:>10,.0f} posts/s"
+            )
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
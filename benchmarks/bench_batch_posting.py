@@ -0,0 +1,110 @@
+"""Benchmark posting a batch of transactions through the ledger service.
+
+Compares ``LedgerServiceImpl.post_transaction`` called once per transaction,
+which looks up every entry's account and commits each transaction on its
+own, with ``post_transactions``, which validates the batch with one account
+lookup and one duplicate check and writes it with a single ``add_many``.
+Both post the same statement to an on-disk SQLite ledger that already holds
+``--existing`` transactions.
+
+Usage:
+    python benchmarks/bench_batch_posting.py [--transactions 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import SyntheticLedger, build_sqlite_ledger, count_queries, timed
+
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteEntityRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.ledger import LedgerServiceImpl
+
+
+def _statement(
+    ledger: SyntheticLedger, count: int, seed: int = 11
+) -> list[Transaction]:
+    rng = random.Random(seed)
+    assert ledger.cash_account_id is not None
+    txns = []
+    for i in range(count):
+        amount = Money(Decimal(rng.randint(1, 100_000)) / 100)
+        txn = Transaction(
+            transaction_date=ledger.end_date + timedelta(days=i * 30 // count),
+            memo=f"import {i}",
+        )
+        txn.add_entry(Entry(account_id=ledger.cash_account_id, debit_amount=amount))
+        txn.add_entry(
+            Entry(
+                account_id=ledger.account_ids[
+                    rng.randrange(1, len(ledger.account_ids))
+                ],
+                credit_amount=amount,
+            )
+        )
+        txns.append(txn)
+    return txns
+
+
+def _post_each(service: LedgerServiceImpl, txns: list[Transaction]) -> int:
+    for txn in txns:
+        service.post_transaction(txn)
+    return len(txns)
+
+
+def _post_batch(service: LedgerServiceImpl, txns: list[Transaction]) -> int:
+    return sum(result.posted for result in service.post_transactions(txns))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=10_000)
+    parser.add_argument("--existing", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"SQLite on disk, posting {args.transactions:,} transactions "
+        f"onto {args.existing:,}"
+    )
+    for label, post in (
+        ("post_transaction", _post_each),
+        ("post_transactions", _post_batch),
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = build_sqlite_ledger(Path(tmp) / "bench.db", args.existing)
+            service = LedgerServiceImpl(
+                SQLiteTransactionRepository(ledger.db),
+                SQLiteAccountRepository(ledger.db),
+                SQLiteEntityRepository(ledger.db),
+            )
+            txns = _statement(ledger, args.transactions)
+
+            with count_queries(ledger.db.get_connection()) as queries:
+                elapsed, posted = timed(
+                    functools.partial(post, service, txns), repeat=1
+                )
+            assert posted == args.transactions, posted
+            # Lines starting with "--" trace FTS and trigger internals.
+            statements = [q for q in queries if not q.startswith("--")]
+            assert ledger.db.verify_balance_snapshots() == []
+            print(
+                f"  {label:<18} {len(statements):>8,} statements  {elapsed:8.3f}s  "
+                f"{args.transactions / elapsed:>10,.0f} txn/s"
+            )
+            ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
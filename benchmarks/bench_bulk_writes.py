@@ -0,0 +1,104 @@
+"""Benchmark bulk transaction writes.
+
+Compares three ways of writing a statement import to an on-disk SQLite ledger:
+
+* ``add`` per transaction, which commits (and fsyncs) once per row;
+* ``add`` per transaction inside ``SQLiteDatabase.unit_of_work()``, which
+  defers the commit to the end of the block;
+* a single ``add_many`` call, which also batches the inserts with
+  ``executemany`` and folds balance snapshots once per posting date.
+
+Usage:
+    python benchmarks/bench_bulk_writes.py [--transactions 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import SyntheticLedger, build_sqlite_ledger, timed
+
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import SQLiteTransactionRepository
+
+
+def _statement(
+    ledger: SyntheticLedger, count: int, seed: int = 11
+) -> list[Transaction]:
+    rng = random.Random(seed)
+    assert ledger.cash_account_id is not None
+    txns = []
+    for i in range(count):
+        amount = Money(Decimal(rng.randint(1, 100_000)) / 100)
+        txn = Transaction(
+            transaction_date=ledger.start_date + timedelta(days=i * 30 // count),
+            memo=f"import {i}",
+        )
+        txn.add_entry(Entry(account_id=ledger.cash_account_id, debit_amount=amount))
+        txn.add_entry(
+            Entry(
+                account_id=ledger.account_ids[
+                    rng.randrange(1, len(ledger.account_ids))
+                ],
+                credit_amount=amount,
+            )
+        )
+        txns.append(txn)
+    return txns
+
+
+def _write(
+    label: str,
+    ledger: SyntheticLedger,
+    repo: SQLiteTransactionRepository,
+    txns: list[Transaction],
+) -> None:
+    if label == "add per row":
+        for txn in txns:
+            repo.add(txn)
+    elif label == "unit of work":
+        with ledger.db.unit_of_work():
+            for txn in txns:
+                repo.add(txn)
+    else:
+        repo.add_many(txns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"SQLite on disk, {args.transactions:,} transactions")
+    for label in ("add per row", "unit of work", "add_many"):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = build_sqlite_ledger(Path(tmp) / "bench.db", transactions=0)
+            repo = SQLiteTransactionRepository(ledger.db)
+            txns = _statement(ledger, args.transactions)
+
+            elapsed, _ = timed(
+                functools.partial(_write, label, ledger, repo, txns), repeat=1
+            )
+            stored = (
+                ledger.db.get_connection()
+                .execute("SELECT COUNT(*) FROM transactions")
+                .fetchone()[0]
+            )
+            assert stored == args.transactions, stored
+            assert ledger.db.verify_balance_snapshots() == []
+            print(
+                f"  {label:<14} {elapsed:8.3f}s  "
+                f"{args.transactions / elapsed:>10,.0f} txn/s"
+            )
+            ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark exchange-rate lookups in the multi-currency reports.
+
+Runs ``net_worth_report`` with a base currency and ``fx_gains_losses_report``
+over a ledger whose asset accounts are held in EUR, with a daily EUR/USD
+series of ``--days`` rates:
+
+* ``per call`` looks each rate up with exact-date ``get_rate`` queries
+  (direct, then inverse) for every account, as ``convert`` used to;
+* ``cached`` is ``CurrencyServiceImpl`` as shipped: each pair's series is
+  loaded once and every later lookup is a bisection in memory.
+
+``cold`` is the first pair of reports on a fresh service, so the cached run
+pays for loading the whole series; ``warm`` repeats them on the same service.
+
+Usage:
+    python benchmarks/bench_fx_reports.py [--accounts 200] [--days 3650]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from collections.abc import Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import build_sqlite_ledger, count_queries, timed
+
+from family_office_ledger.domain.exchange_rates import ExchangeRate
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteEntityRepository,
+    SQLiteExchangeRateRepository,
+    SQLitePositionRepository,
+    SQLiteSecurityRepository,
+    SQLiteTaxLotRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.currency import CurrencyServiceImpl
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+
+class _PerCallCurrencyService(CurrencyServiceImpl):
+    """Exact-date ``get_rate`` lookups per conversion, as ``convert`` used to do."""
+
+    def _lookup(
+        self, amount: Money, to_currency: str, as_of_date: date
+    ) -> Money | None:
+        from_currency = str(amount.currency.value)
+        if from_currency == to_currency:
+            return amount
+        rate = self._repo.get_rate(from_currency, to_currency, as_of_date)
+        if rate is not None:
+            return Money(amount.amount * rate.rate, to_currency)
+        inverse = self._repo.get_rate(to_currency, from_currency, as_of_date)
+        if inverse is not None:
+            return Money(amount.amount / inverse.rate, to_currency)
+        return None
+
+    def convert(self, amount: Money, to_currency: str, as_of_date: date) -> Money:
+        converted = self._lookup(amount, to_currency, as_of_date)
+        assert converted is not None
+        return converted
+
+    def convert_many(
+        self,
+        amounts: Sequence[Money],
+        to_currency: str,
+        dates: date | Sequence[date],
+    ) -> list[Money | None]:
+        assert isinstance(dates, date)
+        return [self._lookup(amount, to_currency, dates) for amount in amounts]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--days", type=int, default=3650)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(
+            Path(tmp) / "bench.db",
+            transactions=20_000,
+            entities=4,
+            accounts_per_entity=args.accounts // 2,
+        )
+        conn = ledger.db.get_connection()
+        conn.execute(
+            "UPDATE accounts SET currency = 'EUR' "
+            "WHERE account_type = 'asset' AND id != ?",
+            (str(ledger.cash_account_id),),
+        )
+        conn.commit()
+        rate_repo = SQLiteExchangeRateRepository(ledger.db)
+        first_day = ledger.start_date
+        for day in range(args.days):
+            rate_repo.add(
+                ExchangeRate(
+                    from_currency="EUR",
+                    to_currency="USD",
+                    rate=Decimal("1.10") + Decimal(day % 50) / 1000,
+                    effective_date=first_day + timedelta(days=day),
+                )
+            )
+        end_date = first_day + timedelta(days=args.days - 1)
+
+        print(
+            f"SQLite on disk, {args.accounts * 2} accounts, {args.days:,} daily rates"
+        )
+        for label, service_cls in (
+            ("per call", _PerCallCurrencyService),
+            ("cached", CurrencyServiceImpl),
+        ):
+            reporting = ReportingServiceImpl(
+                entity_repo=SQLiteEntityRepository(ledger.db),
+                account_repo=SQLiteAccountRepository(ledger.db),
+                transaction_repo=SQLiteTransactionRepository(ledger.db),
+                position_repo=SQLitePositionRepository(ledger.db),
+                tax_lot_repo=SQLiteTaxLotRepository(ledger.db),
+                security_repo=SQLiteSecurityRepository(ledger.db),
+                currency_service=service_cls(rate_repo),
+            )
+
+            def run(reporting: ReportingServiceImpl = reporting) -> None:
+                reporting.net_worth_report(None, end_date, base_currency="USD")
+                reporting.fx_gains_losses_report(None, first_day, end_date, "USD")
+
+            with count_queries(conn) as statements:
+                cold, _ = timed(run, repeat=1)
+            rate_queries = sum("FROM exchange_rates" in s for s in statements)
+            warm, _ = timed(run)
+            print(
+                f"  {label:<9} cold {cold * 1000:8.1f} ms  warm {warm * 1000:8.1f} ms  "
+                f"{rate_queries:>6,} rate queries"
+            )
+        ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark a monthly net worth chart against one report per month.
+
+Builds five years of ledger activity and computes the month-end net worth
+two ways:
+
+* ``ReportingServiceImpl.net_worth_report`` once per month, the calls a
+  chart would make without a series endpoint;
+* ``ReportingServiceImpl.net_worth_series``, which samples every month from
+  one ``iter_balance_history`` scan.
+
+Usage:
+    python benchmarks/bench_net_worth_series.py [--years 5]
+    python benchmarks/bench_net_worth_series.py --postgres-url postgresql://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from _ledger_fixtures import (
+    SyntheticLedger,
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+    count_queries,
+    timed,
+)
+
+from family_office_ledger.repositories.interfaces import (
+    AccountRepository,
+    EntityRepository,
+    TransactionRepository,
+)
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteEntityRepository,
+    SQLitePositionRepository,
+    SQLiteSecurityRepository,
+    SQLiteTaxLotRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.interfaces import SeriesFrequency
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+_ENTITIES = 10
+
+
+def _per_month(service: ReportingServiceImpl, dates: list[date]) -> list[Decimal]:
+    return [service.net_worth_report(None, day)["totals"]["net_worth"] for day in dates]
+
+
+def _series(service: ReportingServiceImpl, dates: list[date]) -> list[Decimal]:
+    return [point["net_worth"] for point in service.net_worth_series(dates)["data"]]
+
+
+def _run(
+    label: str,
+    ledger: SyntheticLedger,
+    dates: list[date],
+    entity_repo: EntityRepository,
+    account_repo: AccountRepository,
+    transaction_repo: TransactionRepository,
+    repeat: int,
+    sqlite_db: Any,
+) -> None:
+    # Positions, lots and securities are not read by the net worth reports.
+    service = ReportingServiceImpl(
+        entity_repo,
+        account_repo,
+        transaction_repo,
+        SQLitePositionRepository(sqlite_db),
+        SQLiteTaxLotRepository(sqlite_db),
+        SQLiteSecurityRepository(sqlite_db),
+    )
+    per_month_time, per_month = timed(
+        functools.partial(_per_month, service, dates), repeat
+    )
+    series_time, series = timed(functools.partial(_series, service, dates), repeat)
+    assert per_month == series, (per_month, series)
+    print(
+        f"{label}, {len(dates)} month ends, {len(ledger.account_ids):,} accounts, "
+        f"{ledger.transaction_count:,} transactions"
+    )
+    print(f"  net_worth_report per month {per_month_time * 1000:>9.1f} ms")
+    print(f"  net_worth_series           {series_time * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--postgres-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = date(2020, 1, 1)
+        end = date(start.year + args.years, 1, 1) - timedelta(days=1)
+        # The fixture spreads 100 transactions over each day.
+        ledger = build_sqlite_ledger(
+            Path(tmp) / "bench.db",
+            ((end - start).days + 1) * 100,
+            entities=_ENTITIES,
+            accounts_per_entity=args.accounts // _ENTITIES,
+            start_date=start,
+        )
+        dates = SeriesFrequency.MONTHLY.sample_dates(start, end)
+
+        sqlite_service = ReportingServiceImpl(
+            SQLiteEntityRepository(ledger.db),
+            SQLiteAccountRepository(ledger.db),
+            SQLiteTransactionRepository(ledger.db),
+            SQLitePositionRepository(ledger.db),
+            SQLiteTaxLotRepository(ledger.db),
+            SQLiteSecurityRepository(ledger.db),
+        )
+        for name, run in (("per month", _per_month), ("series", _series)):
+            with count_queries(ledger.db.get_connection()) as queries:
+                run(sqlite_service, dates)
+            statements = [q for q in queries if not q.startswith("--")]
+            print(f"SQLite {name}: {len(statements):,} statements")
+
+        _run(
+            "SQLite",
+            ledger,
+            dates,
+            SQLiteEntityRepository(ledger.db),
+            SQLiteAccountRepository(ledger.db),
+            SQLiteTransactionRepository(ledger.db),
+            args.repeat,
+            ledger.db,
+        )
+
+        if args.postgres_url:
+            from family_office_ledger.repositories.postgres import (
+                PostgresAccountRepository,
+                PostgresDatabase,
+                PostgresEntityRepository,
+                PostgresTransactionRepository,
+            )
+
+            db = PostgresDatabase(args.postgres_url)
+            db.initialize()
+            copy_ledger_to_postgres(ledger, db)
+            _run(
+                "Postgres",
+                ledger,
+                dates,
+                PostgresEntityRepository(db),
+                PostgresAccountRepository(db),
+                PostgresTransactionRepository(db),
+                args.repeat,
+                ledger.db,
+            )
+        ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark bulk ingestion of transactions into PostgreSQL.
+
+Loads ``--entries`` entries (two per transaction, spread over a year and
+the synthetic ledger's accounts) into an empty ledger with:
+
+* ``add_many``: ``LedgerServiceImpl.validate_transactions`` followed by
+  ``PostgresTransactionRepository.add_many``, which sends the rows with
+  ``execute_batch`` and folds each (date, account) into the balance
+  snapshots with its own statements. Only the first ``--baseline-entries``
+  entries are loaded this way, as the full set takes too long;
+* ``COPY``: ``PostgresBulkLoader``, which runs the same validation, streams
+  the rows into staging tables with ``copy_expert`` and merges them, and
+  the snapshots, in one statement.
+
+Rates are entries plus transactions written per second, validation included.
+Needs a throwaway database, whose ledger tables are replaced, e.g.
+``docker run --rm -e POSTGRES_PASSWORD=pw -p 5432:5432 postgres:16``.
+
+Usage:
+    python benchmarks/bench_postgres_copy.py --postgres-url postgresql://...
+        [--entries 1000000] [--baseline-entries 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from collections.abc import Callable
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import (
+    SyntheticLedger,
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+    timed,
+)
+
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.postgres import (
+    PostgresAccountRepository,
+    PostgresBulkLoader,
+    PostgresDatabase,
+    PostgresEntityRepository,
+    PostgresTransactionRepository,
+)
+from family_office_ledger.services.ledger import LedgerServiceImpl
+
+
+def _transactions(ledger: SyntheticLedger, count: int) -> list[Transaction]:
+    rng = random.Random(7)
+    txns = []
+    for i in range(count):
+        debit, credit = rng.sample(ledger.account_ids, 2)
+        amount = Money(Decimal(rng.randint(100, 1_000_000)) / 100)
+        txn = Transaction(
+            transaction_date=ledger.start_date + timedelta(days=i % 365),
+            memo=f"bulk {i}",
+        )
+        txn.add_entry(Entry(account_id=debit, debit_amount=amount))
+        txn.add_entry(Entry(account_id=credit, credit_amount=amount))
+        txns.append(txn)
+    return txns
+
+
+def _run(
+    label: str,
+    db: PostgresDatabase,
+    ledger: SyntheticLedger,
+    txns: list[Transaction],
+    load: Callable[[list[Transaction]], None],
+) -> None:
+    copy_ledger_to_postgres(ledger, db)
+    elapsed, _ = timed(lambda: load(txns), repeat=1)
+    rows = len(txns) * 3
+    mismatches = db.verify_balance_snapshots()
+    assert not mismatches, mismatches[:3]
+    print(
+        f"  {label:<9} {len(txns) * 2:>10,} entries  {elapsed:8.2f}s  "
+        f"{rows / elapsed:>10,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postgres-url", required=True)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--baseline-entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", transactions=0)
+        db = PostgresDatabase(args.postgres_url)
+        db.initialize()
+        try:
+            txn_repo = PostgresTransactionRepository(db)
+            ledger_service = LedgerServiceImpl(
+                txn_repo, PostgresAccountRepository(db), PostgresEntityRepository(db)
+            )
+            loader = PostgresBulkLoader(db, ledger_service.validate_transactions)
+            txns = _transactions(ledger, args.entries // 2)
+
+            def add_many(batch: list[Transaction]) -> None:
+                ledger_service.validate_transactions(batch)
+                txn_repo.add_many(batch)
+
+            print(f"Postgres, bulk load of {args.entries:,} entries")
+            _run(
+                "add_many",
+                db,
+                ledger,
+                txns[: args.baseline_entries // 2],
+                add_many,
+            )
+            _run("COPY", db, ledger, txns, loader.load)
+        finally:
+            db.close()
+            ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Benchmark native UUID/DATE/NUMERIC columns against the old TEXT schema.
+
+Loads the synthetic ledger into the native schema created by
+``PostgresDatabase.initialize()`` and into a copy of it, in a ``legacy_text``
+schema, where every id, date, timestamp and amount column is TEXT with the
+same keys and indexes, as databases created by earlier versions are. Then
+reports:
+
+* the heap and index size of the ledger tables in both schemas;
+* the best latency of a one-month range scan (transaction ids and dates in
+  keyset order, hydrated to ``UUID``/``date`` as the repositories do, which
+  the TEXT schema has to parse in Python) and of a one-month server-side sum
+  of the debits posted, which needs a ``::numeric`` cast per row on the TEXT
+  schema;
+* how long ``PostgresDatabase.migrate_to_native_types`` takes to convert
+  the TEXT copy in place.
+
+Needs a throwaway database, whose ledger tables are replaced, e.g.
+``docker run --rm -e POSTGRES_PASSWORD=pw -p 5432:5432 postgres:16``.
+
+Usage:
+    python benchmarks/bench_postgres_native_types.py --postgres-url postgresql://...
+        [--transactions 200000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import psycopg2
+import psycopg2.extensions
+from _ledger_fixtures import (
+    SyntheticLedger,
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+    timed,
+)
+
+from family_office_ledger.repositories.postgres import PostgresDatabase
+
+_TABLES = ("transactions", "entries", "account_balance_snapshots")
+_LEGACY_TABLES = ("entities", "accounts", *_TABLES)
+_NATIVE_TYPES = ("uuid", "date", "timestamp with time zone", "numeric")
+_LEGACY_SCHEMA = "legacy_text"
+
+
+def _create_legacy_copy(conn: psycopg2.extensions.connection) -> None:
+    """Copy the ledger tables into ``legacy_text`` with TEXT columns."""
+    with conn.cursor() as cur:
+        cur.execute(f"DROP SCHEMA IF EXISTS {_LEGACY_SCHEMA} CASCADE")
+        cur.execute(f"CREATE SCHEMA {_LEGACY_SCHEMA}")
+        for table in _LEGACY_TABLES:
+            cur.execute(
+                """
+                SELECT column_name, data_type FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s
+                ORDER BY ordinal_position
+                """,
+                (table,),
+            )
+            columns = ", ".join(
+                f"{name}::text AS {name}" if data_type in _NATIVE_TYPES else name
+                for name, data_type in cur.fetchall()
+            )
+            cur.execute(
+                f"CREATE TABLE {_LEGACY_SCHEMA}.{table} AS "
+                f"SELECT {columns} FROM public.{table}"
+            )
+            cur.execute(
+                """
+                SELECT pg_get_constraintdef(c.oid) FROM pg_constraint c
+                WHERE c.conrelid = %s::regclass AND c.contype = 'p'
+                """,
+                (f"public.{table}",),
+            )
+            (primary_key,) = cur.fetchone()
+            cur.execute(f"ALTER TABLE {_LEGACY_SCHEMA}.{table} ADD {primary_key}")
+            cur.execute(
+                """
+                SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i
+                WHERE i.indrelid = %s::regclass AND NOT i.indisprimary
+                """,
+                (f"public.{table}",),
+            )
+            for (definition,) in cur.fetchall():
+                cur.execute(
+                    definition.replace(
+                        f" ON public.{table} ", f" ON {_LEGACY_SCHEMA}.{table} "
+                    )
+                )
+    conn.commit()
+
+
+def _vacuum(conn: psycopg2.extensions.connection, schema: str) -> None:
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        for table in _TABLES:
+            cur.execute(f"VACUUM FULL ANALYZE {schema}.{table}")
+    conn.autocommit = False
+
+
+def _sizes(
+    conn: psycopg2.extensions.connection, schema: str
+) -> dict[str, tuple[int, int]]:
+    with conn.cursor() as cur:
+        sizes = {}
+        for table in _TABLES:
+            cur.execute(
+                "SELECT pg_relation_size(%s), pg_indexes_size(%s)",
+                (f"{schema}.{table}", f"{schema}.{table}"),
+            )
+            sizes[table] = cur.fetchone()
+    conn.rollback()
+    return sizes
+
+
+def _latencies(
+    conn: psycopg2.extensions.connection,
+    schema: str,
+    ledger: SyntheticLedger,
+    repeat: int,
+    text: bool,
+) -> tuple[float, float]:
+    start = ledger.start_date + (ledger.end_date - ledger.start_date) / 2
+    window = (start, start + timedelta(days=30))
+    params = tuple(day.isoformat() for day in window) if text else window
+    cast = "::numeric" if text else ""
+    scan = f"""
+        SELECT id, transaction_date FROM {schema}.transactions
+        WHERE transaction_date >= %s AND transaction_date <= %s
+        ORDER BY transaction_date, id
+    """
+    total = f"""
+        SELECT SUM(e.debit_amount{cast}) FROM {schema}.transactions t
+        JOIN {schema}.entries e ON e.transaction_id = t.id
+        WHERE t.transaction_date >= %s AND t.transaction_date <= %s
+    """
+
+    def run(query: str) -> list[tuple[object, ...]]:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+        conn.rollback()
+        return rows
+
+    def scan_rows() -> list[tuple[object, ...]]:
+        rows = run(scan)
+        if text:
+            rows = [(UUID(txn_id), date.fromisoformat(day)) for txn_id, day in rows]
+        return rows
+
+    scan_time, _ = timed(scan_rows, repeat=repeat)
+    total_time, _ = timed(lambda: run(total), repeat=repeat)
+    return scan_time, total_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postgres-url", required=True)
+    parser.add_argument("--transactions", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", args.transactions)
+        db = PostgresDatabase(args.postgres_url)
+        db.initialize()
+        copy_ledger_to_postgres(ledger, db)
+        db.close()
+        ledger.db.close()
+
+    conn = psycopg2.connect(args.postgres_url)
+    try:
+        _create_legacy_copy(conn)
+        print(f"Postgres, {args.transactions:,} transactions")
+        print(f"  {'':<35} {'TEXT':>10} {'native':>10}")
+        for schema in (_LEGACY_SCHEMA, "public"):
+            _vacuum(conn, schema)
+        legacy_sizes = _sizes(conn, _LEGACY_SCHEMA)
+        native_sizes = _sizes(conn, "public")
+        for table in _TABLES:
+            for label, index in (("heap", 0), ("indexes", 1)):
+                print(
+                    f"  {table + ' ' + label:<35} "
+                    f"{legacy_sizes[table][index] / 2**20:>7.1f} MB "
+                    f"{native_sizes[table][index] / 2**20:>7.1f} MB"
+                )
+        legacy = _latencies(conn, _LEGACY_SCHEMA, ledger, args.repeat, text=True)
+        native = _latencies(conn, "public", ledger, args.repeat, text=False)
+        for label, index in (("30-day range scan", 0), ("30-day debit sum", 1)):
+            print(
+                f"  {label:<35} {legacy[index] * 1000:>7.2f} ms "
+                f"{native[index] * 1000:>7.2f} ms"
+            )
+    finally:
+        conn.close()
+
+    legacy_db = PostgresDatabase(
+        psycopg2.extensions.make_dsn(
+            args.postgres_url, options=f"-c search_path={_LEGACY_SCHEMA}"
+        )
+    )
+    try:
+        started = time.perf_counter()
+        copied = legacy_db.migrate_to_native_types()
+        elapsed = time.perf_counter() - started
+        mismatches = legacy_db.verify_balance_snapshots()
+        assert not mismatches, mismatches[:3]
+        print(f"  migrate_to_native_types: {copied:,} rows in {elapsed:.2f}s")
+    finally:
+        legacy_db.close()
+
+
+if __name__ == "__main__":
+    main()
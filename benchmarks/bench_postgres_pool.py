@@ -0,0 +1,152 @@
+"""Benchmark concurrent report requests against PostgreSQL.
+
+Runs ``--clients`` threads that each issue ``--requests`` net worth reports,
+the way FastAPI's threadpool serves concurrent report requests, against:
+
+* a single shared connection (the previous ``PostgresDatabase``, where every
+  thread went through one ``psycopg2`` connection and so serialized on it);
+* the pooled ``PostgresDatabase``, where each request runs inside
+  ``db.scope()`` and checks out its own connection (``max_size=--clients``).
+
+Needs a throwaway database, whose ledger tables are replaced, e.g.
+``docker run --rm -e POSTGRES_PASSWORD=pw -p 5432:5432 postgres:16``.
+
+Usage:
+    python benchmarks/bench_postgres_pool.py --postgres-url postgresql://...
+        [--transactions 20000] [--clients 16] [--requests 25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+from _ledger_fixtures import (
+    SyntheticLedger,
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+)
+
+from family_office_ledger.repositories.postgres import (
+    PostgresAccountRepository,
+    PostgresDatabase,
+    PostgresEntityRepository,
+    PostgresPositionRepository,
+    PostgresSecurityRepository,
+    PostgresTaxLotRepository,
+    PostgresTransactionRepository,
+)
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+
+class _SharedConnectionDatabase(PostgresDatabase):
+    """Every thread uses one connection, as before pooling."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(url)
+        self._shared = psycopg2.connect(
+            url, cursor_factory=psycopg2.extras.RealDictCursor
+        )
+
+    def get_connection(self) -> psycopg2.extensions.connection:
+        return self._shared
+
+    @contextlib.contextmanager
+    def scope(self) -> Iterator[None]:
+        yield
+
+    def close(self) -> None:
+        self._shared.close()
+        super().close()
+
+
+def _run(
+    label: str,
+    db: PostgresDatabase,
+    ledger: SyntheticLedger,
+    clients: int,
+    requests: int,
+) -> None:
+    reporting = ReportingServiceImpl(
+        entity_repo=PostgresEntityRepository(db),
+        account_repo=PostgresAccountRepository(db),
+        transaction_repo=PostgresTransactionRepository(db),
+        position_repo=PostgresPositionRepository(db),
+        tax_lot_repo=PostgresTaxLotRepository(db),
+        security_repo=PostgresSecurityRepository(db),
+    )
+    latencies: list[float] = []
+    lock = threading.Lock()
+    start = threading.Barrier(clients)
+
+    def client() -> None:
+        start.wait()
+        for _ in range(requests):
+            started = time.perf_counter()
+            with db.scope():
+                reporting.net_worth_report(None, ledger.end_date)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    wall = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"  {label:<18} p50 {cuts[49] * 1000:8.1f} ms  p99 {cuts[98] * 1000:8.1f} ms  "
+        f"{len(latencies) / wall:8.1f} req/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postgres-url", required=True)
+    parser.add_argument("--transactions", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", args.transactions)
+        seed = PostgresDatabase(args.postgres_url)
+        seed.initialize()
+        copy_ledger_to_postgres(ledger, seed)
+        seed.close()
+        ledger.db.close()
+
+    print(
+        f"Postgres, {args.transactions:,} transactions, "
+        f"{args.clients} clients x {args.requests} net worth reports"
+    )
+    for label, db in (
+        ("shared connection", _SharedConnectionDatabase(args.postgres_url)),
+        (
+            "pool",
+            PostgresDatabase(
+                args.postgres_url, min_size=args.clients, max_size=args.clients
+            ),
+        ),
+    ):
+        try:
+            _run(label, db, ledger, args.clients, args.requests)
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark reports served from PostgreSQL materialized views.
+
+Loads the synthetic ledger, creates the views of ``PostgresReportingViews``
+and reports the best latency of the net worth report (all entities, as of
+the last day), the balance sheet of one entity and the dashboard summary:
+
+* live: ``ReportingServiceImpl`` without views, which sums each account
+  with its own ``sum_by_account`` query and counts transactions by
+  streaming them;
+* views: the same service given the refreshed views.
+
+Also reports how long a ``REFRESH MATERIALIZED VIEW CONCURRENTLY`` of every
+view takes. Needs a throwaway database, whose ledger tables are replaced,
+e.g. ``docker run --rm -e POSTGRES_PASSWORD=pw -p 5432:5432 postgres:16``.
+
+Usage:
+    python benchmarks/bench_postgres_report_views.py --postgres-url postgresql://...
+        [--transactions 100000] [--repeat 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+from pathlib import Path
+
+from _ledger_fixtures import build_sqlite_ledger, copy_ledger_to_postgres, timed
+
+from family_office_ledger.repositories.postgres import (
+    PostgresAccountRepository,
+    PostgresDatabase,
+    PostgresEntityRepository,
+    PostgresPositionRepository,
+    PostgresReportingViews,
+    PostgresSecurityRepository,
+    PostgresTaxLotRepository,
+    PostgresTransactionRepository,
+)
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+
+def _service(
+    db: PostgresDatabase, views: PostgresReportingViews | None
+) -> ReportingServiceImpl:
+    return ReportingServiceImpl(
+        entity_repo=PostgresEntityRepository(db),
+        account_repo=PostgresAccountRepository(db),
+        transaction_repo=PostgresTransactionRepository(db),
+        position_repo=PostgresPositionRepository(db),
+        tax_lot_repo=PostgresTaxLotRepository(db),
+        security_repo=PostgresSecurityRepository(db),
+        reporting_views=views,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postgres-url", required=True)
+    parser.add_argument("--transactions", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", args.transactions)
+        db = PostgresDatabase(args.postgres_url)
+        db.initialize()
+        try:
+            copy_ledger_to_postgres(ledger, db)
+            views = PostgresReportingViews(db)
+            views.create()
+            refresh_time, _ = timed(views.refresh, repeat=3)
+
+            live, viewed = _service(db, None), _service(db, views)
+            as_of = ledger.end_date
+            reports = {
+                "net worth": lambda svc: svc.net_worth_report(None, as_of),
+                "balance sheet": lambda svc: svc.balance_sheet_report(
+                    ledger.entity_ids[0], as_of
+                ),
+                "dashboard": lambda svc: svc.dashboard_summary(None, as_of),
+            }
+            print(f"Postgres, {args.transactions:,} transactions")
+            print(f"  {'':<15} {'live':>10} {'views':>10}")
+            for label, report in reports.items():
+                live_time, expected = timed(
+                    functools.partial(report, live), args.repeat
+                )
+                view_time, actual = timed(
+                    functools.partial(report, viewed), args.repeat
+                )
+                assert actual == expected, label
+                print(
+                    f"  {label:<15} {live_time * 1000:>7.1f} ms "
+                    f"{view_time * 1000:>7.1f} ms"
+                )
+            print(f"  refresh of every view: {refresh_time * 1000:.1f} ms")
+        finally:
+            db.close()
+            ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
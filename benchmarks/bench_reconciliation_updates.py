@@ -0,0 +1,121 @@
+"""Benchmark per-action writes on a large reconciliation session.
+
+Skips matches one at a time in a session holding ``--matches`` imported
+rows, the way the ``reconcile`` CLI and API confirm loop do:
+
+* ``full replace`` saves a session that carries no persisted state, which
+  deletes and re-inserts every match row (what ``update`` always did);
+* ``delta`` goes through ``ReconciliationServiceImpl.skip_session_match``,
+  which reads only the actioned match with ``get_match`` and writes it back
+  with ``update_matches``.
+
+Usage:
+    python benchmarks/bench_reconciliation_updates.py [--matches 5000] [--actions 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+from _ledger_fixtures import build_sqlite_ledger, count_queries, timed
+
+from family_office_ledger.domain.reconciliation import (
+    ReconciliationMatch,
+    ReconciliationMatchStatus,
+    ReconciliationSession,
+)
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteReconciliationSessionRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.reconciliation import ReconciliationServiceImpl
+
+_WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+def _act(
+    label: str,
+    repo: SQLiteReconciliationSessionRepository,
+    service: ReconciliationServiceImpl,
+    session: ReconciliationSession,
+    match_ids: list[UUID],
+) -> None:
+    for match_id in match_ids:
+        if label == "delta":
+            service.skip_session_match(session.id, match_id)
+            continue
+        loaded = repo.get(session.id)
+        assert loaded is not None
+        match = next(m for m in loaded.matches if m.id == match_id)
+        match.status = ReconciliationMatchStatus.SKIPPED
+        match.actioned_at = datetime.now(UTC)
+        repo.update(
+            ReconciliationSession(
+                account_id=loaded.account_id,
+                file_name=loaded.file_name,
+                file_format=loaded.file_format,
+                id=loaded.id,
+                matches=loaded.matches,
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=5_000)
+    parser.add_argument("--actions", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"SQLite on disk, {args.matches:,} matches, {args.actions} actions")
+    for label in ("full replace", "delta"):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = build_sqlite_ledger(Path(tmp) / "bench.db", transactions=0)
+            assert ledger.cash_account_id is not None
+            repo = SQLiteReconciliationSessionRepository(ledger.db)
+            service = ReconciliationServiceImpl(
+                SQLiteTransactionRepository(ledger.db),
+                SQLiteAccountRepository(ledger.db),
+                repo,
+            )
+            session = ReconciliationSession(
+                account_id=ledger.cash_account_id,
+                file_name="statement.csv",
+                file_format="csv",
+            )
+            session.matches = [
+                ReconciliationMatch(
+                    session_id=session.id,
+                    imported_id=f"imp_{i}",
+                    imported_date=date(2024, 1, 1) + timedelta(days=i % 365),
+                    imported_amount=Decimal(i % 1000 + 1),
+                )
+                for i in range(args.matches)
+            ]
+            repo.add(session)
+            match_ids = [m.id for m in session.matches[: args.actions]]
+
+            with count_queries(ledger.db.get_connection()) as statements:
+                elapsed, _ = timed(
+                    functools.partial(_act, label, repo, service, session, match_ids),
+                    repeat=1,
+                )
+            writes = sum(s.lstrip().startswith(_WRITES) for s in statements)
+            loaded = repo.get(session.id)
+            assert loaded is not None
+            assert loaded.skipped_count == args.actions, loaded.skipped_count
+            print(
+                f"  {label:<13} {elapsed / args.actions * 1000:8.2f} ms/action  "
+                f"{writes / args.actions:>8,.0f} row writes/action"
+            )
+            ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark repeated dashboard loads with and without the report cache.
+
+Builds the synthetic ledger and loads the dashboard summary of every entity
+``--loads`` times three ways:
+
+* uncached: ``ReportingServiceImpl.dashboard_summary`` on every load, as
+  the report endpoints did before the cache;
+* cached: ``ReportCache.get_or_compute`` keyed by the ledger version, so
+  only the first load computes the report;
+* invalidated: five loads, each after posting a transaction, so each one
+  reads a new version and recomputes, the worst case for the cache.
+
+Usage:
+    python benchmarks/bench_report_cache.py [--transactions 20000]
+        [--loads 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from _ledger_fixtures import SyntheticLedger, build_sqlite_ledger, timed
+
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteEntityRepository,
+    SQLiteLedgerVersionRepository,
+    SQLitePositionRepository,
+    SQLiteSecurityRepository,
+    SQLiteTaxLotRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.report_cache import ReportCache
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+
+def _uncached(
+    service: ReportingServiceImpl, ledger: SyntheticLedger, loads: int
+) -> Any:
+    report = None
+    for _ in range(loads):
+        report = service.dashboard_summary(None, ledger.end_date)
+    return report
+
+
+def _cached(
+    service: ReportingServiceImpl,
+    versions: SQLiteLedgerVersionRepository,
+    cache: ReportCache,
+    ledger: SyntheticLedger,
+    loads: int,
+) -> Any:
+    report = None
+    for _ in range(loads):
+        report = cache.get_or_compute(
+            "dashboard",
+            {"as_of_date": ledger.end_date, "entity_ids": None},
+            versions.ledger_version(),
+            lambda: service.dashboard_summary(None, ledger.end_date),
+        )
+    return report
+
+
+def _invalidated(
+    service: ReportingServiceImpl,
+    versions: SQLiteLedgerVersionRepository,
+    transaction_repo: SQLiteTransactionRepository,
+    cache: ReportCache,
+    ledger: SyntheticLedger,
+    loads: int,
+) -> Any:
+    cash = ledger.cash_account_id
+    assert cash is not None
+    other = next(a for a in ledger.account_ids if a != cash)
+    day = ledger.end_date - timedelta(days=1)
+    for _ in range(loads):
+        txn = Transaction(transaction_date=day, memo="bench")
+        txn.add_entry(Entry(account_id=cash, debit_amount=Money(Decimal("1"))))
+        txn.add_entry(Entry(account_id=other, credit_amount=Money(Decimal("1"))))
+        transaction_repo.add(txn)
+        cache.get_or_compute(
+            "dashboard",
+            {"as_of_date": ledger.end_date, "entity_ids": None},
+            versions.ledger_version(),
+            lambda: service.dashboard_summary(None, ledger.end_date),
+        )
+    return cache.stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=20_000)
+    parser.add_argument("--loads", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "bench.db", args.transactions)
+        db = ledger.db
+        transaction_repo = SQLiteTransactionRepository(db)
+        service = ReportingServiceImpl(
+            SQLiteEntityRepository(db),
+            SQLiteAccountRepository(db),
+            transaction_repo,
+            SQLitePositionRepository(db),
+            SQLiteTaxLotRepository(db),
+            SQLiteSecurityRepository(db),
+        )
+        versions = SQLiteLedgerVersionRepository(db)
+
+        uncached_time, uncached = timed(
+            lambda: _uncached(service, ledger, args.loads), args.repeat
+        )
+        cached_time, cached = timed(
+            lambda: _cached(service, versions, ReportCache(), ledger, args.loads),
+            args.repeat,
+        )
+        assert cached == uncached
+        invalidated_time, stats = timed(
+            lambda: _invalidated(
+                service, versions, transaction_repo, ReportCache(), ledger, 5
+            ),
+            args.repeat,
+        )
+        db.close()
+
+    print(
+        f"{len(ledger.entity_ids)} entities, {ledger.transaction_count:,} "
+        f"transactions, {args.loads} dashboard loads"
+    )
+    print(f"  uncached          {uncached_time * 1000:>9.1f} ms")
+    print(f"  cached            {cached_time * 1000:>9.1f} ms")
+    print(f"  write + load x5   {invalidated_time * 1000:>9.1f} ms  ({stats})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark concurrent report reads during ingestion writes.
+
+Runs writer threads that post transactions one ``add`` at a time while
+reader threads repeatedly aggregate the busy cash account, against:
+
+* a single shared connection in rollback-journal mode, serialized with a
+  lock (the previous ``SQLiteDatabase`` behaviour under FastAPI's threadpool);
+* the pooled ``SQLiteDatabase``: one WAL connection per thread for writers
+  and read-only connections from ``SQLiteDatabase.reader()`` for readers.
+
+Usage:
+    python benchmarks/bench_sqlite_concurrency.py [--transactions 50000]
+        [--writers 2] [--readers 6] [--writes-per-thread 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from _ledger_fixtures import SyntheticLedger, build_sqlite_ledger
+
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.repositories.sqlite import (
+    SQLiteDatabase,
+    SQLiteTransactionRepository,
+)
+
+
+class _SharedConnectionDatabase(SQLiteDatabase):
+    """One rollback-journal connection shared by every thread."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, check_same_thread=False)
+        self._shared = sqlite3.connect(str(path), check_same_thread=False)
+        self._shared.row_factory = sqlite3.Row
+        self._shared.execute("PRAGMA journal_mode = DELETE")
+        self.lock = threading.Lock()
+
+    def get_connection(self) -> sqlite3.Connection:
+        return self._shared
+
+    def reader(self) -> SQLiteDatabase:
+        return self
+
+
+def _posting(ledger: SyntheticLedger, rng: random.Random) -> Transaction:
+    assert ledger.cash_account_id is not None
+    amount = Money(Decimal(rng.randint(1, 100_000)) / 100)
+    txn = Transaction(
+        transaction_date=ledger.end_date + timedelta(days=rng.randint(0, 30))
+    )
+    txn.add_entry(Entry(account_id=ledger.cash_account_id, debit_amount=amount))
+    txn.add_entry(
+        Entry(
+            account_id=ledger.account_ids[rng.randrange(1, len(ledger.account_ids))],
+            credit_amount=amount,
+        )
+    )
+    return txn
+
+
+def _run(
+    label: str,
+    db: SQLiteDatabase,
+    ledger: SyntheticLedger,
+    writers: int,
+    readers: int,
+    writes_per_thread: int,
+) -> None:
+    lock = getattr(db, "lock", None)
+    guard = (lambda: lock) if lock is not None else contextlib.nullcontext
+    assert ledger.cash_account_id is not None
+    account_id = ledger.cash_account_id
+    writers_done = threading.Event()
+    latencies: list[float] = []
+    errors: list[str] = []
+    results_lock = threading.Lock()
+
+    def write(seed: int) -> None:
+        repo = SQLiteTransactionRepository(db)
+        rng = random.Random(seed)
+        for _ in range(writes_per_thread):
+            try:
+                with guard():
+                    repo.add(_posting(ledger, rng))
+            except sqlite3.OperationalError as exc:
+                with results_lock:
+                    errors.append(str(exc))
+
+    def read() -> None:
+        repo = SQLiteTransactionRepository(db.reader())
+        while not writers_done.is_set():
+            started = time.perf_counter()
+            try:
+                with guard():
+                    list(repo.sum_by_account([account_id], start=ledger.start_date))
+            except sqlite3.OperationalError as exc:
+                with results_lock:
+                    errors.append(str(exc))
+                continue
+            with results_lock:
+                latencies.append(time.perf_counter() - started)
+
+    @contextlib.contextmanager
+    def threads() -> Iterator[list[threading.Thread]]:
+        writer_threads = [
+            threading.Thread(target=write, args=(n,)) for n in range(writers)
+        ]
+        reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+        for thread in reader_threads + writer_threads:
+            thread.start()
+        yield writer_threads
+        writers_done.set()
+        for thread in reader_threads:
+            thread.join()
+
+    started = time.perf_counter()
+    with threads() as writer_threads:
+        for thread in writer_threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    writes = writers * writes_per_thread - len(errors)
+    p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+    p95 = (
+        statistics.quantiles(latencies, n=20)[-1] * 1000
+        if len(latencies) > 1
+        else float("nan")
+    )
+    print(
+        f"  {label:<18} {writes / elapsed:>8,.0f} writes/s  "
+        f"{len(latencies) / elapsed:>8,.1f} reads/s  "
+        f"read p50 {p50:7.1f}ms  p95 {p95:7.1f}ms  errors {len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=50_000)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=6)
+    parser.add_argument("--writes-per-thread", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"SQLite, {args.transactions:,} transactions, "
+        f"{args.writers} writer / {args.readers} reader threads"
+    )
+    for label in ("shared connection", "pooled WAL"):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.db"
+            ledger = build_sqlite_ledger(path, args.transactions)
+            ledger.db.close()
+            db: SQLiteDatabase = (
+                _SharedConnectionDatabase(path)
+                if label == "shared connection"
+                else SQLiteDatabase(path)
+            )
+            _run(label, db, ledger, args.writers, args.readers, args.writes_per_thread)
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark batched entry hydration for transaction list queries.
+
+Compares the previous per-row hydration (one ``SELECT ... FROM entries``
+per transaction) with ``SQLiteTransactionRepository.list_by_account``,
+which loads the entries for the whole result set in chunked ``IN`` queries.
+
+Usage:
+    python benchmarks/bench_transaction_hydration.py [--transactions 100000]
+    python benchmarks/bench_transaction_hydration.py --postgres-url postgresql://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from _ledger_fixtures import (
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+    count_queries,
+    timed,
+)
+
+from family_office_ledger.repositories.sqlite import SQLiteTransactionRepository
+
+
+def _per_row_list_by_account(repo: SQLiteTransactionRepository, account_id: str) -> int:
+    """Reproduce the old N+1 access pattern: one entry query per transaction."""
+    conn = repo._db.get_connection()
+    rows = conn.execute(
+        "SELECT DISTINCT t.* FROM transactions t "
+        "JOIN entries e ON t.id = e.transaction_id "
+        "WHERE e.account_id = ? ORDER BY t.transaction_date",
+        (account_id,),
+    ).fetchall()
+    loaded = 0
+    for row in rows:
+        entry_rows = conn.execute(
+            "SELECT * FROM entries WHERE transaction_id = ?", (row["id"],)
+        ).fetchall()
+        entries = [repo._row_to_entry(entry_row) for entry_row in entry_rows]
+        repo._row_to_transaction(row, entries)
+        loaded += 1
+    return loaded
+
+
+def run_sqlite(transactions: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "bench.db", transactions)
+        repo = SQLiteTransactionRepository(ledger.db)
+        conn = ledger.db.get_connection()
+        account_id = ledger.cash_account_id
+        assert account_id is not None
+
+        with count_queries(conn) as legacy_queries:
+            legacy_time, _ = timed(
+                lambda: _per_row_list_by_account(repo, str(account_id)), repeat=1
+            )
+        with count_queries(conn) as batched_queries:
+            batched_time, result = timed(
+                lambda: list(repo.list_by_account(account_id)), repeat=1
+            )
+
+        print(f"SQLite, {transactions:,} transactions on one account")
+        print(
+            f"  per-row hydration: {len(legacy_queries):>8,} queries  {legacy_time:8.3f}s"
+        )
+        print(
+            f"  batched hydration: {len(batched_queries):>8,} queries  {batched_time:8.3f}s"
+        )
+        print(f"  rows returned:     {len(result):>8,}")  # type: ignore[arg-type]
+
+
+def run_postgres(url: str, transactions: int) -> None:
+    from family_office_ledger.repositories.postgres import (
+        PostgresDatabase,
+        PostgresTransactionRepository,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", transactions)
+        db = PostgresDatabase(url)
+        db.initialize()
+        copy_ledger_to_postgres(ledger, db)
+
+        repo = PostgresTransactionRepository(db)
+        account_id = ledger.cash_account_id
+        assert account_id is not None
+        batched_time, result = timed(
+            lambda: list(repo.list_by_account(account_id)), repeat=1
+        )
+        print(f"Postgres, {transactions:,} transactions on one account")
+        print(f"  batched hydration: {2:>8,} queries  {batched_time:8.3f}s")
+        print(f"  per-row hydration would issue {len(result) + 1:,} queries")  # type: ignore[arg-type]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=100_000)
+    parser.add_argument("--postgres-url", default=None)
+    args = parser.parse_args()
+
+    run_sqlite(args.transactions)
+    if args.postgres_url:
+        run_postgres(args.postgres_url, args.transactions)
+
+
+if __name__ == "__main__":
+    main()
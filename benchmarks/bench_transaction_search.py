@@ -0,0 +1,143 @@
+"""Benchmark full-text transaction search.
+
+Gives every transaction of a synthetic ledger a memo drawn from a small
+vocabulary plus a unique invoice reference, then compares a ``LIKE '%…%'``
+scan over memo, reference and category with
+``SQLiteTransactionRepository.search``, which reads the ``transactions_fts``
+index. Both return 50 matches: the scan stops at the first 50 it finds,
+while ``search`` ranks every match. The common word is in about one memo in
+eight, the reference on exactly one transaction.
+
+Usage:
+    python benchmarks/bench_transaction_search.py [--transactions 1000000]
+    python benchmarks/bench_transaction_search.py --postgres-url postgresql://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import tempfile
+from pathlib import Path
+
+from _ledger_fixtures import build_sqlite_ledger, copy_ledger_to_postgres, timed
+
+from family_office_ledger.repositories.sqlite import (
+    SQLiteDatabase,
+    SQLiteTransactionRepository,
+)
+
+_WORDS = [
+    "rent",
+    "payroll",
+    "dividend",
+    "interest",
+    "wire",
+    "transfer",
+    "invoice",
+    "refund",
+    "insurance",
+    "legal",
+    "audit",
+    "consulting",
+    "travel",
+    "utilities",
+    "software",
+    "custody",
+    "management",
+    "fee",
+    "tax",
+    "escrow",
+    "distribution",
+    "capital",
+    "call",
+    "subscription",
+    "redemption",
+]
+
+
+def _write_memos(db: SQLiteDatabase, seed: int = 11) -> None:
+    """Replace the synthetic memos; the triggers keep the index in sync."""
+    rng = random.Random(seed)
+    conn = db.get_connection()
+    rowids = [row[0] for row in conn.execute("SELECT rowid FROM transactions")]
+    conn.executemany(
+        "UPDATE transactions SET memo = ?, reference = ? WHERE rowid = ?",
+        (
+            (" ".join(rng.sample(_WORDS, 3)), f"INV-{rowid:08d}", rowid)
+            for rowid in rowids
+        ),
+    )
+    conn.commit()
+
+
+def _like_scan(db: SQLiteDatabase, term: str, limit: int = 50) -> int:
+    """The query a search endpoint without the index would run."""
+    pattern = f"%{term}%"
+    conn = db.get_connection()
+    rows = conn.execute(
+        "SELECT id FROM transactions "
+        "WHERE memo LIKE ? OR reference LIKE ? OR category LIKE ? LIMIT ?",
+        (pattern, pattern, pattern, limit),
+    ).fetchall()
+    return len(rows)
+
+
+def run_sqlite(transactions: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "bench.db", transactions)
+        _write_memos(ledger.db)
+        repo = SQLiteTransactionRepository(ledger.db)
+
+        print(f"SQLite, {transactions:,} transactions")
+        print(f"  {'query':<16} {'LIKE scan':>10} {'FTS5':>10}")
+        for term in ("escrow", f"INV-{transactions // 2:08d}"):
+            scan_time, _ = timed(functools.partial(_like_scan, ledger.db, term), repeat)
+            search_time, found = timed(functools.partial(repo.search, term), repeat)
+            assert found, term
+            print(
+                f"  {term:<16} {scan_time * 1000:>7.1f} ms "
+                f"{search_time * 1000:>7.1f} ms"
+            )
+        ledger.db.close()
+
+
+def run_postgres(url: str, transactions: int, repeat: int) -> None:
+    from family_office_ledger.repositories.postgres import (
+        PostgresDatabase,
+        PostgresTransactionRepository,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "seed.db", transactions)
+        _write_memos(ledger.db)
+        db = PostgresDatabase(url)
+        db.initialize()
+        copy_ledger_to_postgres(ledger, db)
+        with db.get_connection().cursor() as cur:
+            cur.execute("ANALYZE transactions")
+        db.get_connection().commit()
+
+        repo = PostgresTransactionRepository(db)
+        print(f"Postgres, {transactions:,} transactions")
+        for term in ("escrow", f"INV-{transactions // 2:08d}"):
+            search_time, found = timed(functools.partial(repo.search, term), repeat)
+            assert found, term
+            print(f"  {term:<16} {search_time * 1000:>7.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--postgres-url", default=None)
+    args = parser.parse_args()
+
+    run_sqlite(args.transactions, args.repeat)
+    if args.postgres_url:
+        run_postgres(args.postgres_url, args.transactions, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
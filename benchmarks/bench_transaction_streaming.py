@@ -0,0 +1,70 @@
+"""Benchmark peak memory of single-pass transaction reads.
+
+Sums the debits posted to the busy cash account two ways:
+
+* ``list_by_account``, which materializes every hydrated transaction
+  before the first one is consumed;
+* ``iter_by_account``, which fetches rows in ``fetchmany`` chunks and
+  hydrates entries one chunk at a time.
+
+Peak Python allocations are measured with ``tracemalloc``.
+
+Usage:
+    python benchmarks/bench_transaction_streaming.py [--transactions 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterable
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+from _ledger_fixtures import build_sqlite_ledger
+
+from family_office_ledger.domain.transactions import Transaction
+from family_office_ledger.repositories.sqlite import SQLiteTransactionRepository
+
+
+def _debits(transactions: Iterable[Transaction], account_id: UUID) -> Decimal:
+    total = Decimal("0")
+    for txn in transactions:
+        for entry in txn.entries:
+            if entry.account_id == account_id:
+                total += entry.debit_amount.amount
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(Path(tmp) / "bench.db", args.transactions)
+        repo = SQLiteTransactionRepository(ledger.db)
+        account_id = ledger.cash_account_id
+        assert account_id is not None
+
+        print(f"SQLite, {args.transactions:,} transactions on one account")
+        totals = set()
+        for label, read in (
+            ("list_by_account", repo.list_by_account),
+            ("iter_by_account", repo.iter_by_account),
+        ):
+            tracemalloc.start()
+            started = time.perf_counter()
+            totals.add(_debits(read(account_id), account_id))
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {label:<16} peak {peak / 2**20:8.1f} MiB  {elapsed:8.3f}s")
+        assert len(totals) == 1, totals
+
+
+if __name__ == "__main__":
+    main()
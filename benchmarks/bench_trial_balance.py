@@ -0,0 +1,155 @@
+"""Benchmark the trial balance against per-account balance queries.
+
+Builds a ledger with many accounts and computes every account's as-of
+totals two ways:
+
+* ``sum_by_account`` once per account of each entity, the access pattern
+  of the net worth and balance sheet reports;
+* ``ReportingServiceImpl.trial_balance``, which streams all of them from one
+  ``iter_account_totals`` query.
+
+Usage:
+    python benchmarks/bench_trial_balance.py [--accounts 20000]
+    python benchmarks/bench_trial_balance.py --postgres-url postgresql://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from _ledger_fixtures import (
+    SyntheticLedger,
+    build_sqlite_ledger,
+    copy_ledger_to_postgres,
+    timed,
+)
+
+from family_office_ledger.repositories.interfaces import (
+    AccountRepository,
+    EntityRepository,
+    TransactionRepository,
+)
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteEntityRepository,
+    SQLitePositionRepository,
+    SQLiteSecurityRepository,
+    SQLiteTaxLotRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+_ENTITIES = 20
+
+
+def _per_account(
+    account_repo: AccountRepository,
+    transaction_repo: TransactionRepository,
+    ledger: SyntheticLedger,
+) -> Decimal:
+    as_of = ledger.end_date - timedelta(days=1)
+    debits = Decimal("0")
+    for entity_id in ledger.entity_ids:
+        for account in account_repo.list_by_entity(entity_id):
+            for totals in transaction_repo.sum_by_account([account.id], as_of=as_of):
+                debits += totals.debit_total
+    return debits
+
+
+def _trial_balance(service: ReportingServiceImpl, ledger: SyntheticLedger) -> Decimal:
+    report = service.trial_balance(ledger.end_date - timedelta(days=1))
+    for _ in report:
+        pass
+    assert report.is_balanced
+    return sum((debits for debits, _ in report.totals.values()), Decimal("0"))
+
+
+def _run(
+    label: str,
+    ledger: SyntheticLedger,
+    entity_repo: EntityRepository,
+    account_repo: AccountRepository,
+    transaction_repo: TransactionRepository,
+    repeat: int,
+    sqlite_db: Any,
+) -> None:
+    # Positions, lots and securities are not read by the trial balance.
+    service = ReportingServiceImpl(
+        entity_repo,
+        account_repo,
+        transaction_repo,
+        SQLitePositionRepository(sqlite_db),
+        SQLiteTaxLotRepository(sqlite_db),
+        SQLiteSecurityRepository(sqlite_db),
+    )
+    per_account_time, per_account = timed(
+        functools.partial(_per_account, account_repo, transaction_repo, ledger), repeat
+    )
+    trial_time, trial = timed(
+        functools.partial(_trial_balance, service, ledger), repeat
+    )
+    assert per_account == trial, (per_account, trial)
+    print(
+        f"{label}, {len(ledger.account_ids):,} accounts, "
+        f"{ledger.transaction_count:,} transactions"
+    )
+    print(f"  per-account sum_by_account {per_account_time * 1000:>9.1f} ms")
+    print(f"  trial_balance              {trial_time * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=20_000)
+    parser.add_argument("--transactions", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--postgres-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = build_sqlite_ledger(
+            Path(tmp) / "bench.db",
+            args.transactions,
+            entities=_ENTITIES,
+            accounts_per_entity=args.accounts // _ENTITIES,
+        )
+        _run(
+            "SQLite",
+            ledger,
+            SQLiteEntityRepository(ledger.db),
+            SQLiteAccountRepository(ledger.db),
+            SQLiteTransactionRepository(ledger.db),
+            args.repeat,
+            ledger.db,
+        )
+
+        if args.postgres_url:
+            from family_office_ledger.repositories.postgres import (
+                PostgresAccountRepository,
+                PostgresDatabase,
+                PostgresEntityRepository,
+                PostgresTransactionRepository,
+            )
+
+            db = PostgresDatabase(args.postgres_url)
+            db.initialize()
+            copy_ledger_to_postgres(ledger, db)
+            _run(
+                "Postgres",
+                ledger,
+                PostgresEntityRepository(db),
+                PostgresAccountRepository(db),
+                PostgresTransactionRepository(db),
+                args.repeat,
+                ledger.db,
+            )
+        ledger.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -71,21 +71,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("application_stopped")
 
 
-def get_db() -> SQLiteDatabase:
+async def get_db() -> AsyncGenerator[SQLiteDatabase, None]:
     """Get the database instance (legacy compatibility).
 
     This function is used as a FastAPI dependency and can be overridden
     in tests using app.dependency_overrides.
 
     Prefer using get_database() from container module for new code.
+
+    A Postgres database is yielded inside a connection scope, so each
+    request checks out at most one pooled connection and returns it when
+    the request finishes. The dependency is async so that the scope is set
+    in the request's context, which FastAPI copies into the worker thread
+    running a sync endpoint.
     """
     db = get_database()
     # Type narrowing for backward compatibility
     if isinstance(db, SQLiteDatabase):
-        return db
-    # For Postgres, this would need different handling
-    # For now, assume SQLite for backward compatibility
-    return db  # type: ignore
+        yield db
+        return
+    # For Postgres, routes still expect the SQLiteDatabase type
+    with db.scope():
+        yield db
 
 
 async def log_request_middleware(request: Request, call_next):
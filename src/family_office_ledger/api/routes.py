@@ -1,11 +1,13 @@
 """API routes for Family Office Ledger."""
 
-from datetime import date
+import base64
+import binascii
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from family_office_ledger.api.schemas import (
     AccountCreate,
@@ -27,6 +29,7 @@ from family_office_ledger.api.schemas import (
     BudgetVarianceResponse,
     CapitalAccountResponse,
     CategorizeTransactionRequest,
+    ClosingBalanceResponse,
     ConcentrationReportResponse,
     CreateSessionRequest,
     CreateTransferSessionRequest,
@@ -59,14 +62,20 @@ from family_office_ledger.api.schemas import (
     MarkQSBSRequest,
     MatchListResponse,
     MatchResponse,
+    NetWorthSeriesPointResponse,
+    NetWorthSeriesResponse,
     PartnershipCapitalAccountsResponse,
     PerformanceMetricsResponse,
     PerformanceReportResponse,
+    PeriodCloseCreate,
+    PeriodCloseResponse,
     PortfolioSummaryResponse,
+    PostingResultResponse,
     QSBSHoldingResponse,
     QSBSSummaryResponse,
     RecurringExpenseListResponse,
     RecurringExpenseResponse,
+    ReportCacheStatsResponse,
     ReportResponse,
     ScheduleDResponse,
     SecurityResponse,
@@ -74,23 +83,32 @@ from family_office_ledger.api.schemas import (
     SessionSummaryResponse,
     TaxDocumentsResponse,
     TaxDocumentSummaryResponse,
+    TransactionBatchCreate,
+    TransactionBatchResponse,
     TransactionCreate,
+    TransactionPageResponse,
     TransactionResponse,
+    TransactionSearchResponse,
     TransferMatchListResponse,
     TransferMatchResponse,
     TransferSessionResponse,
     TransferSummaryResponse,
+    TrialBalanceLineResponse,
+    TrialBalanceResponse,
+    TrialBalanceTotalResponse,
     VendorCreate,
     VendorListResponse,
     VendorResponse,
     VendorUpdate,
 )
+from family_office_ledger.container import get_container
 from family_office_ledger.domain.audit import AuditAction, AuditEntityType
 from family_office_ledger.domain.budgets import Budget, BudgetLineItem
 from family_office_ledger.domain.entities import Account, Entity
 from family_office_ledger.domain.exchange_rates import ExchangeRate, ExchangeRateSource
 from family_office_ledger.domain.households import Household, HouseholdMember
 from family_office_ledger.domain.ownership import EntityOwnership, SelfOwnershipError
+from family_office_ledger.domain.periods import PeriodClose, PeriodClosedError
 from family_office_ledger.domain.reconciliation import (
     ReconciliationMatch,
     ReconciliationMatchStatus,
@@ -114,6 +132,7 @@ from family_office_ledger.domain.value_objects import (
     Money,
 )
 from family_office_ledger.domain.vendors import Vendor
+from family_office_ledger.repositories.identity_map import IdentityMap
 from family_office_ledger.repositories.interfaces import (
     AccountRepository,
     EntityRepository,
@@ -127,6 +146,8 @@ from family_office_ledger.repositories.sqlite import (
     SQLiteEntityRepository,
     SQLiteExchangeRateRepository,
     SQLiteHouseholdRepository,
+    SQLiteLedgerVersionRepository,
+    SQLitePeriodCloseRepository,
     SQLitePositionRepository,
     SQLiteReconciliationSessionRepository,
     SQLiteSecurityRepository,
@@ -134,15 +155,28 @@ from family_office_ledger.repositories.sqlite import (
     SQLiteTransactionRepository,
     SQLiteVendorRepository,
 )
+from family_office_ledger.repositories.sqlite_async import (
+    AsyncSQLiteAccountRepository,
+    AsyncSQLiteDatabase,
+    AsyncSQLiteEntityRepository,
+    AsyncSQLiteLedgerVersionRepository,
+    AsyncSQLitePeriodCloseRepository,
+    AsyncSQLiteTransactionRepository,
+)
 from family_office_ledger.services.audit import AuditService
 from family_office_ledger.services.budget import BudgetServiceImpl
-from family_office_ledger.services.currency import (
-    CurrencyServiceImpl,
-    ExchangeRateNotFoundError,
-)
+from family_office_ledger.services.currency import CurrencyServiceImpl
 from family_office_ledger.services.expense import ExpenseServiceImpl
-from family_office_ledger.services.interfaces import LedgerService, ReportingService
-from family_office_ledger.services.ledger import LedgerServiceImpl
+from family_office_ledger.services.interfaces import (
+    AsyncLedgerService,
+    AsyncReportingService,
+    ReportingService,
+    SeriesFrequency,
+)
+from family_office_ledger.services.ledger import (
+    AsyncLedgerServiceImpl,
+    LedgerServiceImpl,
+)
 from family_office_ledger.services.ownership_graph import (
     CycleDetectedError,
     OwnershipGraphService,
@@ -158,7 +192,11 @@ from family_office_ledger.services.reconciliation import (
     SessionExistsError,
     SessionNotFoundError,
 )
-from family_office_ledger.services.reporting import ReportingServiceImpl
+from family_office_ledger.services.report_cache import ReportCache
+from family_office_ledger.services.reporting import (
+    AsyncReportingServiceImpl,
+    ReportingServiceImpl,
+)
 from family_office_ledger.services.tax_documents import TaxDocumentService
 from family_office_ledger.services.transfer_matching import (
     TransferMatchingService,
@@ -207,22 +245,28 @@ def get_ledger_service(
     entity_repo: EntityRepository,
     account_repo: AccountRepository,
     transaction_repo: TransactionRepository,
-) -> LedgerService:
+) -> LedgerServiceImpl:
     """Get ledger service instance."""
     return LedgerServiceImpl(
         transaction_repo=transaction_repo,
         account_repo=account_repo,
         entity_repo=entity_repo,
+        period_close_repo=SQLitePeriodCloseRepository(db),
+        unit_of_work=db.unit_of_work,
     )
 
 
 def get_reporting_service(db: SQLiteDatabase) -> ReportingService:
-    entity_repo = SQLiteEntityRepository(db)
-    account_repo = SQLiteAccountRepository(db)
+    # Reports only read, so they run on read-only connections that are not
+    # blocked by a concurrent import.
+    db = db.reader()
+    identity_map = IdentityMap()
+    entity_repo = identity_map.entities(SQLiteEntityRepository(db))
+    account_repo = identity_map.accounts(SQLiteAccountRepository(db))
     transaction_repo = SQLiteTransactionRepository(db)
     position_repo = SQLitePositionRepository(db)
     tax_lot_repo = SQLiteTaxLotRepository(db)
-    security_repo = SQLiteSecurityRepository(db)
+    security_repo = identity_map.securities(SQLiteSecurityRepository(db))
     budget_repo = SQLiteBudgetRepository(db)
     vendor_repo = SQLiteVendorRepository(db)
 
@@ -239,6 +283,49 @@ def get_reporting_service(db: SQLiteDatabase) -> ReportingService:
         tax_lot_repo=tax_lot_repo,
         security_repo=security_repo,
         budget_service=budget_service,
+        period_close_repo=SQLitePeriodCloseRepository(db),
+    )
+
+
+def get_report_cache(db: Annotated[SQLiteDatabase, Depends()]) -> ReportCache:
+    """Get the container's report cache for ``db``."""
+    return get_container().report_cache_for(db)
+
+
+def bypass_report_cache(
+    cache_control: Annotated[str | None, Header()] = None,
+) -> bool:
+    """Whether the request asked for a fresh report with ``Cache-Control: no-cache``."""
+    return cache_control is not None and "no-cache" in cache_control.lower()
+
+
+def _ledger_version(db: SQLiteDatabase, entity_ids: list[UUID] | None) -> int:
+    """Version of the data of ``entity_ids``; read it before computing a report."""
+    return SQLiteLedgerVersionRepository(db.reader()).ledger_version(entity_ids)
+
+
+async def get_async_database(
+    db: Annotated[SQLiteDatabase, Depends()],
+) -> AsyncSQLiteDatabase:
+    """Get the aiosqlite counterpart of the request's database."""
+    return db.async_database()
+
+
+def get_async_ledger_service(db: AsyncSQLiteDatabase) -> AsyncLedgerService:
+    """Get async ledger service instance."""
+    return AsyncLedgerServiceImpl(
+        transaction_repo=AsyncSQLiteTransactionRepository(db),
+        account_repo=AsyncSQLiteAccountRepository(db),
+        period_close_repo=AsyncSQLitePeriodCloseRepository(db),
+    )
+
+
+def get_async_reporting_service(db: AsyncSQLiteDatabase) -> AsyncReportingService:
+    """Get async reporting service instance."""
+    return AsyncReportingServiceImpl(
+        entity_repo=AsyncSQLiteEntityRepository(db),
+        account_repo=AsyncSQLiteAccountRepository(db),
+        transaction_repo=AsyncSQLiteTransactionRepository(db),
     )
 
 
@@ -269,6 +356,26 @@ def _entity_to_response(entity: Entity) -> EntityResponse:
     )
 
 
+def _period_close_to_response(period_close: PeriodClose) -> PeriodCloseResponse:
+    """Convert PeriodClose domain object to response schema."""
+    return PeriodCloseResponse(
+        id=period_close.id,
+        entity_id=period_close.entity_id,
+        period_end=period_close.period_end,
+        closing_transaction_id=period_close.closing_transaction_id,
+        closed_at=period_close.closed_at,
+        balances=[
+            ClosingBalanceResponse(
+                account_id=totals.account_id,
+                currency=totals.currency,
+                debit_total=str(totals.debit_total),
+                credit_total=str(totals.credit_total),
+            )
+            for totals in period_close.balances
+        ],
+    )
+
+
 def _account_to_response(account: Account) -> AccountResponse:
     """Convert Account domain object to response schema."""
     return AccountResponse(
@@ -317,6 +424,67 @@ def _transaction_to_response(txn: Transaction) -> TransactionResponse:
     )
 
 
+def _transaction_from_payload(payload: TransactionCreate) -> Transaction:
+    """Build an unposted Transaction from its create schema."""
+    entries = [
+        Entry(
+            account_id=entry_data.account_id,
+            debit_amount=Money(
+                Decimal(entry_data.debit_amount), entry_data.debit_currency
+            ),
+            credit_amount=Money(
+                Decimal(entry_data.credit_amount), entry_data.credit_currency
+            ),
+            memo=entry_data.memo,
+        )
+        for entry_data in payload.entries
+    ]
+    return Transaction(
+        transaction_date=payload.transaction_date,
+        entries=entries,
+        memo=payload.memo,
+        reference=payload.reference,
+    )
+
+
+def _encode_transaction_cursor(txn: Transaction) -> str:
+    """Encode the ``(transaction_date, id)`` keyset position of ``txn``."""
+    raw = f"{txn.transaction_date.isoformat()}|{txn.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_transaction_cursor(cursor: str) -> tuple[date, UUID]:
+    """Decode a cursor from ``_encode_transaction_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        txn_date, txn_id = raw.split("|")
+        return date.fromisoformat(txn_date), UUID(txn_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+
+def _encode_match_cursor(match: ReconciliationMatch) -> str:
+    """Encode the ``(created_at, id)`` keyset position of ``match``."""
+    raw = f"{match.created_at.isoformat()}|{match.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_match_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from ``_encode_match_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, match_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(match_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+
 # Health endpoint
 @health_router.get("/health", response_model=HealthResponse)
 def health_check() -> HealthResponse:
@@ -378,6 +546,72 @@ def get_entity(
     return _entity_to_response(entity)
 
 
+@entity_router.post(
+    "/{entity_id}/period-closes",
+    response_model=PeriodCloseResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def close_fiscal_year(
+    entity_id: UUID,
+    payload: PeriodCloseCreate,
+    db: Annotated[SQLiteDatabase, Depends()],
+) -> PeriodCloseResponse:
+    """Close a fiscal year, rolling income and expense into equity.
+
+    Postings and reversals dated on or before the end of a closed year are
+    rejected afterwards.
+    """
+    entity_repo = get_entity_repository(db)
+    if entity_repo.get(entity_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Entity {entity_id} not found",
+        )
+    ledger_service = get_ledger_service(
+        db,
+        entity_repo,
+        get_account_repository(db),
+        get_transaction_repository(db),
+    )
+    try:
+        period_close = ledger_service.close_fiscal_year(
+            entity_id,
+            payload.fiscal_year,
+            retained_earnings_account_id=payload.retained_earnings_account_id,
+        )
+    except PeriodClosedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        ) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return _period_close_to_response(period_close)
+
+
+@entity_router.get(
+    "/{entity_id}/period-closes", response_model=list[PeriodCloseResponse]
+)
+def list_period_closes(
+    entity_id: UUID,
+    db: Annotated[SQLiteDatabase, Depends()],
+) -> list[PeriodCloseResponse]:
+    """List an entity's closed fiscal periods, oldest first."""
+    ledger_service = get_ledger_service(
+        db,
+        get_entity_repository(db),
+        get_account_repository(db),
+        get_transaction_repository(db),
+    )
+    return [
+        _period_close_to_response(period_close)
+        for period_close in ledger_service.list_period_closes(entity_id)
+    ]
+
+
 # Account endpoints
 @account_router.post(
     "",
@@ -445,42 +679,17 @@ def list_accounts(
     response_model=TransactionResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def post_transaction(
+async def post_transaction(
     payload: TransactionCreate,
-    db: Annotated[SQLiteDatabase, Depends()],
+    db: Annotated[AsyncSQLiteDatabase, Depends(get_async_database)],
 ) -> TransactionResponse:
     """Post a new transaction."""
-    entity_repo = get_entity_repository(db)
-    account_repo = get_account_repository(db)
-    transaction_repo = get_transaction_repository(db)
-    ledger_service = get_ledger_service(db, entity_repo, account_repo, transaction_repo)
-
-    # Create entries
-    entries: list[Entry] = []
-    for entry_data in payload.entries:
-        entry = Entry(
-            account_id=entry_data.account_id,
-            debit_amount=Money(
-                Decimal(entry_data.debit_amount), entry_data.debit_currency
-            ),
-            credit_amount=Money(
-                Decimal(entry_data.credit_amount), entry_data.credit_currency
-            ),
-            memo=entry_data.memo,
-        )
-        entries.append(entry)
-
-    # Create transaction
-    txn = Transaction(
-        transaction_date=payload.transaction_date,
-        entries=entries,
-        memo=payload.memo,
-        reference=payload.reference,
-    )
+    ledger_service = get_async_ledger_service(db)
+    txn = _transaction_from_payload(payload)
 
     # Post via ledger service
     try:
-        ledger_service.post_transaction(txn)
+        await ledger_service.post_transaction(txn)
     except UnbalancedTransactionError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -495,148 +704,380 @@ def post_transaction(
     return _transaction_to_response(txn)
 
 
-@transaction_router.get("", response_model=list[TransactionResponse])
-def list_transactions(
-    db: Annotated[SQLiteDatabase, Depends()],
+@transaction_router.post(
+    "/batch",
+    response_model=TransactionBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def post_transaction_batch(
+    payload: TransactionBatchCreate,
+    response: Response,
+    db: Annotated[SQLiteDatabase, Depends()],
+) -> TransactionBatchResponse:
+    """Post several transactions, validated together and written at once.
+
+    Responds 422 when a strict batch is rejected; the results then say
+    which transactions were invalid.
+    """
+    ledger_service = get_ledger_service(
+        db,
+        get_entity_repository(db),
+        get_account_repository(db),
+        get_transaction_repository(db),
+    )
+    txns = [_transaction_from_payload(t) for t in payload.transactions]
+    results = ledger_service.post_transactions(txns, strict=payload.strict)
+
+    posted = sum(result.posted for result in results)
+    if payload.strict and posted < len(results):
+        response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    return TransactionBatchResponse(
+        posted=posted,
+        failed=sum(result.error is not None for result in results),
+        results=[
+            PostingResultResponse(
+                transaction_id=result.transaction_id,
+                posted=result.posted,
+                error=result.error,
+            )
+            for result in results
+        ],
+    )
+
+
+@transaction_router.get("", response_model=TransactionPageResponse)
+async def list_transactions(
+    db: Annotated[AsyncSQLiteDatabase, Depends(get_async_database)],
     account_id: UUID | None = Query(default=None),
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-) -> list[TransactionResponse]:
-    """List transactions with optional filters."""
-    transaction_repo = get_transaction_repository(db)
-
-    if account_id:
-        transactions = list(
-            transaction_repo.list_by_account(
-                account_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
-        )
-    elif start_date and end_date:
-        transactions = list(transaction_repo.list_by_date_range(start_date, end_date))
-    else:
-        # Return empty list if no filter provided (for safety)
-        transactions = []
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> TransactionPageResponse:
+    """List transactions ordered by date, one keyset page at a time.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to fetch the
+    following page.
+    """
+    transaction_repo = AsyncSQLiteTransactionRepository(db)
+    after = _decode_transaction_cursor(cursor) if cursor else None
+
+    # Fetch one extra row to learn whether another page follows.
+    transactions = await transaction_repo.list_page(
+        account_id=account_id,
+        start_date=start_date,
+        end_date=end_date,
+        after=after,
+        limit=limit + 1,
+    )
+    next_cursor = None
+    if len(transactions) > limit:
+        transactions = transactions[:limit]
+        next_cursor = _encode_transaction_cursor(transactions[-1])
+
+    return TransactionPageResponse(
+        transactions=[_transaction_to_response(t) for t in transactions],
+        next_cursor=next_cursor,
+        limit=limit,
+    )
+
+
+@transaction_router.get("/search", response_model=TransactionSearchResponse)
+def search_transactions(
+    db: Annotated[SQLiteDatabase, Depends()],
+    q: str = Query(..., min_length=1),
+    limit: int = Query(default=50, ge=1, le=500),
+) -> TransactionSearchResponse:
+    """Search transaction memos, references and categories.
 
-    return [_transaction_to_response(t) for t in transactions]
+    Every word of ``q`` must start a word of one of those fields; results
+    are ranked by relevance, memo matches first.
+    """
+    transaction_repo = get_transaction_repository(db.reader())
+    transactions = transaction_repo.search(q, limit=limit)
+    return TransactionSearchResponse(
+        query=q,
+        transactions=[_transaction_to_response(t) for t in transactions],
+        total=len(transactions),
+    )
 
 
 # Report endpoints
 @report_router.get("/net-worth", response_model=ReportResponse)
-def net_worth_report(
-    db: Annotated[SQLiteDatabase, Depends()],
+async def net_worth_report(
+    db: Annotated[AsyncSQLiteDatabase, Depends(get_async_database)],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     as_of_date: date = Query(...),
     entity_ids: list[UUID] | None = Query(default=None),
 ) -> ReportResponse:
     """Generate net worth report."""
-    reporting_service = get_reporting_service(db)
+    reporting_service = get_async_reporting_service(db)
 
-    report_data = reporting_service.net_worth_report(
-        entity_ids=entity_ids,
-        as_of_date=as_of_date,
+    async def build() -> ReportResponse:
+        report_data = await reporting_service.net_worth_report(
+            entity_ids=entity_ids,
+            as_of_date=as_of_date,
+        )
+        return ReportResponse(
+            report_name=report_data["report_name"],
+            as_of_date=report_data["as_of_date"],
+            data=_serialize_report_data(report_data["data"]),
+            totals=_serialize_totals(report_data["totals"]),
+        )
+
+    return await cache.get_or_compute_async(
+        "net_worth",
+        {"as_of_date": as_of_date, "entity_ids": entity_ids},
+        await AsyncSQLiteLedgerVersionRepository(db).ledger_version(entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
-    return ReportResponse(
-        report_name=report_data["report_name"],
-        as_of_date=report_data["as_of_date"],
-        data=_serialize_report_data(report_data["data"]),
-        totals=_serialize_totals(report_data["totals"]),
+
+@report_router.get("/net-worth/series", response_model=NetWorthSeriesResponse)
+def net_worth_series_report(
+    db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
+    start_date: Annotated[date, Query()],
+    end_date: Annotated[date, Query()],
+    frequency: Annotated[SeriesFrequency, Query()] = SeriesFrequency.MONTHLY,
+    entity_ids: Annotated[list[UUID] | None, Query()] = None,
+) -> NetWorthSeriesResponse:
+    """Net worth at the end of each period from start_date to end_date."""
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+
+    def build() -> NetWorthSeriesResponse:
+        report_data = get_reporting_service(db).net_worth_series(
+            frequency.sample_dates(start_date, end_date),
+            entity_ids=entity_ids,
+        )
+        return NetWorthSeriesResponse(
+            report_name=report_data["report_name"],
+            start_date=start_date,
+            end_date=end_date,
+            frequency=frequency.value,
+            points=[
+                NetWorthSeriesPointResponse(
+                    as_of_date=point["as_of_date"],
+                    total_assets=str(point["total_assets"]),
+                    total_liabilities=str(point["total_liabilities"]),
+                    net_worth=str(point["net_worth"]),
+                )
+                for point in report_data["data"]
+            ],
+        )
+
+    return cache.get_or_compute(
+        "net_worth_series",
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+            "frequency": frequency.value,
+            "entity_ids": entity_ids,
+        },
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
 @report_router.get("/balance-sheet/{entity_id}", response_model=BalanceSheetResponse)
-def balance_sheet_report(
+async def balance_sheet_report(
     entity_id: UUID,
-    db: Annotated[SQLiteDatabase, Depends()],
+    db: Annotated[AsyncSQLiteDatabase, Depends(get_async_database)],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     as_of_date: date = Query(...),
 ) -> BalanceSheetResponse:
     """Generate balance sheet for an entity."""
-    entity_repo = get_entity_repository(db)
-    entity = entity_repo.get(entity_id)
-    if entity is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Entity {entity_id} not found",
-        )
 
-    reporting_service = get_reporting_service(db)
+    async def build() -> BalanceSheetResponse:
+        entity = await AsyncSQLiteEntityRepository(db).get(entity_id)
+        if entity is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Entity {entity_id} not found",
+            )
+        report_data = await get_async_reporting_service(db).balance_sheet_report(
+            entity_id=entity_id,
+            as_of_date=as_of_date,
+        )
+        return BalanceSheetResponse(
+            report_name=report_data["report_name"],
+            as_of_date=report_data["as_of_date"],
+            data=_serialize_nested_report_data(report_data["data"]),
+            totals=_serialize_totals(report_data["totals"]),
+        )
 
-    report_data = reporting_service.balance_sheet_report(
-        entity_id=entity_id,
-        as_of_date=as_of_date,
+    return await cache.get_or_compute_async(
+        "balance_sheet",
+        {"entity_id": entity_id, "as_of_date": as_of_date},
+        await AsyncSQLiteLedgerVersionRepository(db).ledger_version([entity_id]),
+        build,
+        bypass=bypass_cache,
     )
 
-    return BalanceSheetResponse(
-        report_name=report_data["report_name"],
-        as_of_date=report_data["as_of_date"],
-        data=_serialize_nested_report_data(report_data["data"]),
-        totals=_serialize_totals(report_data["totals"]),
+
+@report_router.get("/trial-balance", response_model=TrialBalanceResponse)
+def trial_balance_report(
+    db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
+    as_of_date: Annotated[date, Query()],
+    entity_ids: Annotated[list[UUID] | None, Query()] = None,
+) -> TrialBalanceResponse:
+    """Debit and credit totals per account and currency as of a date."""
+
+    def build() -> TrialBalanceResponse:
+        trial_balance = get_reporting_service(db).trial_balance(
+            as_of_date=as_of_date,
+            entity_ids=entity_ids,
+        )
+        lines = [
+            TrialBalanceLineResponse(
+                account_id=line.account_id,
+                account_name=line.account_name,
+                entity_id=line.entity_id,
+                account_type=line.account_type.value,
+                currency=line.currency,
+                debit_total=str(line.debit_total),
+                credit_total=str(line.credit_total),
+                net_balance=str(line.net_balance),
+            )
+            for line in trial_balance
+        ]
+        return TrialBalanceResponse(
+            report_name="Trial Balance",
+            as_of_date=as_of_date,
+            lines=lines,
+            totals=[
+                TrialBalanceTotalResponse(
+                    currency=currency,
+                    debit_total=str(debits),
+                    credit_total=str(credits),
+                )
+                for currency, (debits, credits) in sorted(trial_balance.totals.items())
+            ],
+            is_balanced=trial_balance.is_balanced,
+        )
+
+    return cache.get_or_compute(
+        "trial_balance",
+        {"as_of_date": as_of_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
 @report_router.get("/summary-by-type", response_model=ReportResponse)
 def transaction_summary_by_type(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     start_date: date = Query(...),
     end_date: date = Query(...),
     entity_ids: list[UUID] | None = Query(default=None),
 ) -> ReportResponse:
-    reporting_service = get_reporting_service(db)
-
-    report_data = reporting_service.transaction_summary_by_type(
-        entity_ids=entity_ids,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    def build() -> ReportResponse:
+        report_data = get_reporting_service(db).transaction_summary_by_type(
+            entity_ids=entity_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return ReportResponse(
+            report_name=report_data["report_name"],
+            data=_serialize_report_data(report_data["data"]),
+            totals=_serialize_totals(report_data["totals"]),
+        )
 
-    return ReportResponse(
-        report_name=report_data["report_name"],
-        data=_serialize_report_data(report_data["data"]),
-        totals=_serialize_totals(report_data["totals"]),
+    return cache.get_or_compute(
+        "transaction_summary_by_type",
+        {"start_date": start_date, "end_date": end_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
 @report_router.get("/summary-by-entity", response_model=ReportResponse)
 def transaction_summary_by_entity(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     start_date: date = Query(...),
     end_date: date = Query(...),
     entity_ids: list[UUID] | None = Query(default=None),
 ) -> ReportResponse:
-    reporting_service = get_reporting_service(db)
-
-    report_data = reporting_service.transaction_summary_by_entity(
-        entity_ids=entity_ids,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    def build() -> ReportResponse:
+        report_data = get_reporting_service(db).transaction_summary_by_entity(
+            entity_ids=entity_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return ReportResponse(
+            report_name=report_data["report_name"],
+            data=_serialize_report_data(report_data["data"]),
+            totals=_serialize_totals(report_data["totals"]),
+        )
 
-    return ReportResponse(
-        report_name=report_data["report_name"],
-        data=_serialize_report_data(report_data["data"]),
-        totals=_serialize_totals(report_data["totals"]),
+    return cache.get_or_compute(
+        "transaction_summary_by_entity",
+        {"start_date": start_date, "end_date": end_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
 @report_router.get("/dashboard", response_model=ReportResponse)
-def dashboard_summary(
-    db: Annotated[SQLiteDatabase, Depends()],
+async def dashboard_summary(
+    db: Annotated[AsyncSQLiteDatabase, Depends(get_async_database)],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     as_of_date: date = Query(...),
     entity_ids: list[UUID] | None = Query(default=None),
 ) -> ReportResponse:
-    reporting_service = get_reporting_service(db)
+    reporting_service = get_async_reporting_service(db)
 
-    report_data = reporting_service.dashboard_summary(
-        entity_ids=entity_ids,
-        as_of_date=as_of_date,
+    async def build() -> ReportResponse:
+        report_data = await reporting_service.dashboard_summary(
+            entity_ids=entity_ids,
+            as_of_date=as_of_date,
+        )
+        return ReportResponse(
+            report_name=report_data["report_name"],
+            as_of_date=report_data["as_of_date"],
+            data=_serialize_dashboard_data(report_data["data"]),
+            totals={},
+        )
+
+    return await cache.get_or_compute_async(
+        "dashboard",
+        {"as_of_date": as_of_date, "entity_ids": entity_ids},
+        await AsyncSQLiteLedgerVersionRepository(db).ledger_version(entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
-    return ReportResponse(
-        report_name=report_data["report_name"],
-        as_of_date=report_data["as_of_date"],
-        data=_serialize_dashboard_data(report_data["data"]),
-        totals={},
+
+@report_router.get("/cache", response_model=ReportCacheStatsResponse)
+def report_cache_stats(
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+) -> ReportCacheStatsResponse:
+    """Hit, miss and eviction counts of the report cache."""
+    return ReportCacheStatsResponse(
+        entries=len(cache),
+        max_entries=cache.max_entries,
+        hits=cache.stats.hits,
+        misses=cache.stats.misses,
+        evictions=cache.stats.evictions,
     )
 
 
@@ -804,16 +1245,23 @@ def list_matches(
     ),
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
 ) -> MatchListResponse:
-    """List matches for a session with pagination."""
+    """List matches for a session with pagination.
+
+    Pass ``next_cursor`` from a response as ``cursor`` to seek to the
+    following page instead of counting rows with ``offset``.
+    """
     reconciliation_service = get_reconciliation_service(db)
+    after = _decode_match_cursor(cursor) if cursor else None
 
     try:
         matches, total = reconciliation_service.list_matches(
             session_id=session_id,
             status=match_status,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
+            after=after,
         )
     except SessionNotFoundError as e:
         raise HTTPException(
@@ -821,11 +1269,13 @@ def list_matches(
             detail=str(e),
         ) from e
 
+    page = matches[:limit]
     return MatchListResponse(
-        matches=[_reconciliation_match_to_response(m) for m in matches],
+        matches=[_reconciliation_match_to_response(m) for m in page],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=_encode_match_cursor(page[-1]) if len(matches) > limit else None,
     )
 
     return MatchListResponse(
@@ -1189,7 +1639,7 @@ def get_transfer_summary(
 
 # QSBS Endpoints
 def get_qsbs_service(db: SQLiteDatabase) -> QSBSService:
-    security_repo = SQLiteSecurityRepository(db)
+    security_repo = IdentityMap().securities(SQLiteSecurityRepository(db))
     position_repo = SQLitePositionRepository(db)
     tax_lot_repo = SQLiteTaxLotRepository(db)
     return QSBSService(
@@ -1311,10 +1761,11 @@ def get_qsbs_summary(
 
 
 def get_tax_document_service(db: SQLiteDatabase) -> TaxDocumentService:
-    entity_repo = SQLiteEntityRepository(db)
+    identity_map = IdentityMap()
+    entity_repo = identity_map.entities(SQLiteEntityRepository(db))
     position_repo = SQLitePositionRepository(db)
     tax_lot_repo = SQLiteTaxLotRepository(db)
-    security_repo = SQLiteSecurityRepository(db)
+    security_repo = identity_map.securities(SQLiteSecurityRepository(db))
     return TaxDocumentService(
         entity_repo=entity_repo,
         position_repo=position_repo,
@@ -1443,22 +1894,30 @@ def generate_tax_documents(
 def get_tax_summary(
     entity_id: UUID,
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     tax_year: int = Query(..., ge=2000, le=2100),
 ) -> TaxDocumentSummaryResponse:
-    tax_service = get_tax_document_service(db)
-
-    try:
-        summary = tax_service.get_tax_document_summary(
-            entity_id=entity_id,
-            tax_year=tax_year,
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+    def build() -> TaxDocumentSummaryResponse:
+        try:
+            summary = get_tax_document_service(db).get_tax_document_summary(
+                entity_id=entity_id,
+                tax_year=tax_year,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e),
+            ) from e
+        return _tax_summary_to_response(summary)
 
-    return _tax_summary_to_response(summary)
+    return cache.get_or_compute(
+        "tax_summary",
+        {"entity_id": entity_id, "tax_year": tax_year},
+        _ledger_version(db, [entity_id]),
+        build,
+        bypass=bypass_cache,
+    )
 
 
 @tax_router.get(
@@ -1467,24 +1926,33 @@ def get_tax_summary(
 def export_form_8949_csv(
     entity_id: UUID,
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     tax_year: int = Query(..., ge=2000, le=2100),
 ) -> Any:
     from fastapi.responses import Response
 
-    tax_service = get_tax_document_service(db)
-
-    try:
-        form_8949, _, _ = tax_service.generate_from_entity(
-            entity_id=entity_id,
-            tax_year=tax_year,
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+    def build() -> str:
+        tax_service = get_tax_document_service(db)
+        try:
+            form_8949, _, _ = tax_service.generate_from_entity(
+                entity_id=entity_id,
+                tax_year=tax_year,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e),
+            ) from e
+        return tax_service.export_form_8949_csv(form_8949)
 
-    csv_content = tax_service.export_form_8949_csv(form_8949)
+    csv_content = cache.get_or_compute(
+        "form_8949_csv",
+        {"entity_id": entity_id, "tax_year": tax_year},
+        _ledger_version(db, [entity_id]),
+        build,
+        bypass=bypass_cache,
+    )
 
     return Response(
         content=csv_content,
@@ -1502,29 +1970,39 @@ def export_form_8949_csv(
 def get_schedule_d(
     entity_id: UUID,
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     tax_year: int = Query(..., ge=2000, le=2100),
 ) -> ScheduleDResponse:
-    tax_service = get_tax_document_service(db)
-
-    try:
-        form_8949, _, _ = tax_service.generate_from_entity(
-            entity_id=entity_id,
-            tax_year=tax_year,
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+    def build() -> ScheduleDResponse:
+        tax_service = get_tax_document_service(db)
+        try:
+            form_8949, _, _ = tax_service.generate_from_entity(
+                entity_id=entity_id,
+                tax_year=tax_year,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e),
+            ) from e
+        schedule_d = tax_service.generate_schedule_d(form_8949)
+        return _schedule_d_to_response(schedule_d)
 
-    schedule_d = tax_service.generate_schedule_d(form_8949)
-    return _schedule_d_to_response(schedule_d)
+    return cache.get_or_compute(
+        "schedule_d",
+        {"entity_id": entity_id, "tax_year": tax_year},
+        _ledger_version(db, [entity_id]),
+        build,
+        bypass=bypass_cache,
+    )
 
 
 def get_portfolio_analytics_service(db: SQLiteDatabase) -> PortfolioAnalyticsService:
-    entity_repo = SQLiteEntityRepository(db)
+    identity_map = IdentityMap()
+    entity_repo = identity_map.entities(SQLiteEntityRepository(db))
     position_repo = SQLitePositionRepository(db)
-    security_repo = SQLiteSecurityRepository(db)
+    security_repo = identity_map.securities(SQLiteSecurityRepository(db))
     return PortfolioAnalyticsService(
         entity_repo=entity_repo,
         position_repo=position_repo,
@@ -1538,36 +2016,45 @@ def get_portfolio_analytics_service(db: SQLiteDatabase) -> PortfolioAnalyticsSer
 )
 def get_asset_allocation(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     entity_ids: list[UUID] | None = Query(default=None),
     as_of_date: date | None = Query(default=None),
 ) -> AssetAllocationReportResponse:
     from datetime import date as dt_date
 
-    service = get_portfolio_analytics_service(db)
     effective_date = as_of_date or dt_date.today()
 
-    report = service.asset_allocation_report(
-        entity_ids=entity_ids,
-        as_of_date=effective_date,
-    )
-
-    return AssetAllocationReportResponse(
-        as_of_date=report.as_of_date,
-        entity_names=report.entity_names,
-        allocations=[
-            AssetAllocationResponse(
-                asset_class=a.asset_class.value,
-                market_value=str(a.market_value.amount),
-                cost_basis=str(a.cost_basis.amount),
-                unrealized_gain=str(a.unrealized_gain.amount),
-                allocation_percent=str(a.allocation_percent),
-                position_count=a.position_count,
-            )
-            for a in report.allocations
-        ],
-        total_market_value=str(report.total_market_value.amount),
-        total_cost_basis=str(report.total_cost_basis.amount),
-        total_unrealized_gain=str(report.total_unrealized_gain.amount),
+    def build() -> AssetAllocationReportResponse:
+        report = get_portfolio_analytics_service(db).asset_allocation_report(
+            entity_ids=entity_ids,
+            as_of_date=effective_date,
+        )
+        return AssetAllocationReportResponse(
+            as_of_date=report.as_of_date,
+            entity_names=report.entity_names,
+            allocations=[
+                AssetAllocationResponse(
+                    asset_class=a.asset_class.value,
+                    market_value=str(a.market_value.amount),
+                    cost_basis=str(a.cost_basis.amount),
+                    unrealized_gain=str(a.unrealized_gain.amount),
+                    allocation_percent=str(a.allocation_percent),
+                    position_count=a.position_count,
+                )
+                for a in report.allocations
+            ],
+            total_market_value=str(report.total_market_value.amount),
+            total_cost_basis=str(report.total_cost_basis.amount),
+            total_unrealized_gain=str(report.total_unrealized_gain.amount),
+        )
+
+    return cache.get_or_compute(
+        "asset_allocation",
+        {"as_of_date": effective_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
@@ -1577,42 +2064,51 @@ def get_asset_allocation(
 )
 def get_concentration_report(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     entity_ids: list[UUID] | None = Query(default=None),
     as_of_date: date | None = Query(default=None),
     top_n: int = Query(default=20, ge=1, le=100),
 ) -> ConcentrationReportResponse:
     from datetime import date as dt_date
 
-    service = get_portfolio_analytics_service(db)
     effective_date = as_of_date or dt_date.today()
 
-    report = service.concentration_report(
-        entity_ids=entity_ids,
-        as_of_date=effective_date,
-        top_n=top_n,
-    )
-
-    return ConcentrationReportResponse(
-        as_of_date=report.as_of_date,
-        entity_names=report.entity_names,
-        holdings=[
-            HoldingConcentrationResponse(
-                security_id=h.security_id,
-                security_symbol=h.security_symbol,
-                security_name=h.security_name,
-                asset_class=h.asset_class.value,
-                market_value=str(h.market_value.amount),
-                cost_basis=str(h.cost_basis.amount),
-                unrealized_gain=str(h.unrealized_gain.amount),
-                concentration_percent=str(h.concentration_percent),
-                position_count=h.position_count,
-            )
-            for h in report.holdings
-        ],
-        total_market_value=str(report.total_market_value.amount),
-        top_5_concentration=str(report.top_5_concentration),
-        top_10_concentration=str(report.top_10_concentration),
-        largest_single_holding=str(report.largest_single_holding),
+    def build() -> ConcentrationReportResponse:
+        report = get_portfolio_analytics_service(db).concentration_report(
+            entity_ids=entity_ids,
+            as_of_date=effective_date,
+            top_n=top_n,
+        )
+        return ConcentrationReportResponse(
+            as_of_date=report.as_of_date,
+            entity_names=report.entity_names,
+            holdings=[
+                HoldingConcentrationResponse(
+                    security_id=h.security_id,
+                    security_symbol=h.security_symbol,
+                    security_name=h.security_name,
+                    asset_class=h.asset_class.value,
+                    market_value=str(h.market_value.amount),
+                    cost_basis=str(h.cost_basis.amount),
+                    unrealized_gain=str(h.unrealized_gain.amount),
+                    concentration_percent=str(h.concentration_percent),
+                    position_count=h.position_count,
+                )
+                for h in report.holdings
+            ],
+            total_market_value=str(report.total_market_value.amount),
+            top_5_concentration=str(report.top_5_concentration),
+            top_10_concentration=str(report.top_10_concentration),
+            largest_single_holding=str(report.largest_single_holding),
+        )
+
+    return cache.get_or_compute(
+        "concentration",
+        {"as_of_date": effective_date, "entity_ids": entity_ids, "top_n": top_n},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
@@ -1622,37 +2118,47 @@ def get_concentration_report(
 )
 def get_performance_report(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     start_date: date = Query(...),
     end_date: date = Query(...),
     entity_ids: list[UUID] | None = Query(default=None),
 ) -> PerformanceReportResponse:
-    service = get_portfolio_analytics_service(db)
-
-    report = service.performance_report(
-        entity_ids=entity_ids,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    def build() -> PerformanceReportResponse:
+        report = get_portfolio_analytics_service(db).performance_report(
+            entity_ids=entity_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return PerformanceReportResponse(
+            start_date=report.start_date,
+            end_date=report.end_date,
+            entity_names=report.entity_names,
+            metrics=[
+                PerformanceMetricsResponse(
+                    entity_name=m.entity_name,
+                    start_value=str(m.start_value.amount),
+                    end_value=str(m.end_value.amount),
+                    net_contributions=str(m.net_contributions.amount),
+                    total_return_amount=str(m.total_return_amount.amount),
+                    total_return_percent=str(m.total_return_percent),
+                    unrealized_gain=str(m.unrealized_gain.amount),
+                    unrealized_gain_percent=str(m.unrealized_gain_percent),
+                )
+                for m in report.metrics
+            ],
+            portfolio_total_return_amount=str(
+                report.portfolio_total_return_amount.amount
+            ),
+            portfolio_total_return_percent=str(report.portfolio_total_return_percent),
+        )
 
-    return PerformanceReportResponse(
-        start_date=report.start_date,
-        end_date=report.end_date,
-        entity_names=report.entity_names,
-        metrics=[
-            PerformanceMetricsResponse(
-                entity_name=m.entity_name,
-                start_value=str(m.start_value.amount),
-                end_value=str(m.end_value.amount),
-                net_contributions=str(m.net_contributions.amount),
-                total_return_amount=str(m.total_return_amount.amount),
-                total_return_percent=str(m.total_return_percent),
-                unrealized_gain=str(m.unrealized_gain.amount),
-                unrealized_gain_percent=str(m.unrealized_gain_percent),
-            )
-            for m in report.metrics
-        ],
-        portfolio_total_return_amount=str(report.portfolio_total_return_amount.amount),
-        portfolio_total_return_percent=str(report.portfolio_total_return_percent),
+    return cache.get_or_compute(
+        "performance",
+        {"start_date": start_date, "end_date": end_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
@@ -1662,32 +2168,42 @@ def get_performance_report(
 )
 def get_portfolio_summary(
     db: Annotated[SQLiteDatabase, Depends()],
+    cache: Annotated[ReportCache, Depends(get_report_cache)],
+    bypass_cache: Annotated[bool, Depends(bypass_report_cache)],
     entity_ids: list[UUID] | None = Query(default=None),
     as_of_date: date | None = Query(default=None),
 ) -> PortfolioSummaryResponse:
     from datetime import date as dt_date
 
-    service = get_portfolio_analytics_service(db)
     effective_date = as_of_date or dt_date.today()
 
-    summary = service.get_portfolio_summary(
-        entity_ids=entity_ids,
-        as_of_date=effective_date,
-    )
+    def build() -> PortfolioSummaryResponse:
+        summary = get_portfolio_analytics_service(db).get_portfolio_summary(
+            entity_ids=entity_ids,
+            as_of_date=effective_date,
+        )
+        return PortfolioSummaryResponse(
+            as_of_date=effective_date,
+            total_market_value=summary["total_market_value"],
+            total_cost_basis=summary["total_cost_basis"],
+            total_unrealized_gain=summary["total_unrealized_gain"],
+            asset_allocation=summary["asset_allocation"],
+            top_holdings=summary["top_holdings"],
+            concentration_metrics=summary["concentration_metrics"],
+        )
 
-    return PortfolioSummaryResponse(
-        as_of_date=effective_date,
-        total_market_value=summary["total_market_value"],
-        total_cost_basis=summary["total_cost_basis"],
-        total_unrealized_gain=summary["total_unrealized_gain"],
-        asset_allocation=summary["asset_allocation"],
-        top_holdings=summary["top_holdings"],
-        concentration_metrics=summary["concentration_metrics"],
+    return cache.get_or_compute(
+        "portfolio_summary",
+        {"as_of_date": effective_date, "entity_ids": entity_ids},
+        _ledger_version(db, entity_ids),
+        build,
+        bypass=bypass_cache,
     )
 
 
 def get_audit_service(db: SQLiteDatabase) -> AuditService:
-    return AuditService(db)
+    """Get the container's audit service (and background writer) for ``db``."""
+    return get_container().audit_service_for(db)
 
 
 def _audit_entry_to_response(entry: Any) -> AuditEntryResponse:
@@ -1817,8 +2333,8 @@ def get_audit_summary(
 
 
 def get_currency_service(db: SQLiteDatabase) -> CurrencyServiceImpl:
-    repo = SQLiteExchangeRateRepository(db)
-    return CurrencyServiceImpl(repo)
+    """Get the container's currency service, and its rate cache, for ``db``."""
+    return get_container().currency_service_for(db)
 
 
 def _exchange_rate_to_response(rate: ExchangeRate) -> ExchangeRateResponse:
@@ -1935,17 +2451,14 @@ def delete_exchange_rate(
     rate_id: UUID,
     db: Annotated[SQLiteDatabase, Depends()],
 ) -> None:
-    repo = SQLiteExchangeRateRepository(db)
+    currency_service = get_currency_service(db)
 
-    rate = repo.get(rate_id)
-    if rate is None:
+    if not currency_service.delete_rate(rate_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Exchange rate {rate_id} not found",
         )
 
-    repo.delete(rate_id)
-
 
 @currency_router.post(
     "/convert",
@@ -1959,20 +2472,25 @@ def convert_currency(
 
     original = Money(Decimal(payload.amount), payload.from_currency)
 
-    try:
-        converted = currency_service.convert(
-            original, payload.to_currency, payload.as_of_date
-        )
-    except ExchangeRateNotFoundError as e:
+    resolved = currency_service.resolve_rate(
+        payload.from_currency, payload.to_currency, payload.as_of_date
+    )
+    if resolved is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+            detail=(
+                f"No exchange rate found for {payload.from_currency}/"
+                f"{payload.to_currency} on {payload.as_of_date}"
+            ),
+        )
+    converted = Money(resolved.apply(original.amount), payload.to_currency)
 
-    rate = currency_service.get_rate(
-        payload.from_currency, payload.to_currency, payload.as_of_date
-    )
-    rate_str = str(rate.rate) if rate else "inverse"
+    if len(resolved.legs) == 1 and resolved.legs[0].inverted:
+        rate_str = "inverse"
+    elif len(resolved.legs) == 1:
+        rate_str = str(resolved.legs[0].exchange_rate.rate)
+    else:
+        rate_str = str(resolved.rate)
 
     return CurrencyConvertResponse(
         original_amount=payload.amount,
@@ -1981,6 +2499,8 @@ def convert_currency(
         converted_currency=payload.to_currency,
         rate_used=rate_str,
         as_of_date=payload.as_of_date,
+        rate_path=list(resolved.path),
+        rate_ids=[leg.exchange_rate.id for leg in resolved.legs],
     )
 
 
@@ -2533,6 +3053,7 @@ def get_ownership_graph_service(db: SQLiteDatabase) -> OwnershipGraphService:
         entity_repo,
         account_repo,
         transaction_repo,
+        period_close_repo=SQLitePeriodCloseRepository(db),
     )
 
 
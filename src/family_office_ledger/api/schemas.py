@@ -35,6 +35,33 @@ class EntityResponse(BaseModel):
     updated_at: datetime
 
 
+class PeriodCloseCreate(BaseModel):
+    """Schema for closing an entity's fiscal year."""
+
+    fiscal_year: int = Field(..., ge=1, le=9999)
+    retained_earnings_account_id: UUID | None = None
+
+
+class ClosingBalanceResponse(BaseModel):
+    """Schema for the frozen totals of one account and currency."""
+
+    account_id: UUID
+    currency: str
+    debit_total: str
+    credit_total: str
+
+
+class PeriodCloseResponse(BaseModel):
+    """Schema for a closed fiscal period."""
+
+    id: UUID
+    entity_id: UUID
+    period_end: date
+    closing_transaction_id: UUID | None = None
+    closed_at: datetime
+    balances: list[ClosingBalanceResponse]
+
+
 # Account Schemas
 class AccountCreate(BaseModel):
     """Schema for creating an account."""
@@ -103,6 +130,32 @@ class TransactionCreate(BaseModel):
     reference: str = ""
 
 
+class TransactionBatchCreate(BaseModel):
+    """Schema for posting several transactions in one request.
+
+    With ``strict`` set, one invalid transaction rejects the whole batch.
+    """
+
+    transactions: list[TransactionCreate] = Field(..., min_length=1)
+    strict: bool = True
+
+
+class PostingResultResponse(BaseModel):
+    """Schema for the outcome of one transaction of a batch."""
+
+    transaction_id: UUID
+    posted: bool
+    error: str | None = None
+
+
+class TransactionBatchResponse(BaseModel):
+    """Schema for batch posting response, one result per transaction."""
+
+    posted: int
+    failed: int
+    results: list[PostingResultResponse]
+
+
 class TransactionResponse(BaseModel):
     """Schema for transaction response."""
 
@@ -118,6 +171,26 @@ class TransactionResponse(BaseModel):
     entries: list[EntryResponse]
 
 
+class TransactionPageResponse(BaseModel):
+    """Schema for keyset-paginated transaction list response.
+
+    ``next_cursor`` is an opaque token for the following page, or None
+    once the listing is exhausted.
+    """
+
+    transactions: list[TransactionResponse]
+    next_cursor: str | None
+    limit: int
+
+
+class TransactionSearchResponse(BaseModel):
+    """Schema for full-text transaction search results, best match first."""
+
+    query: str
+    transactions: list[TransactionResponse]
+    total: int
+
+
 # Report Schemas
 class ReportRequest(BaseModel):
     """Schema for report request parameters."""
@@ -135,6 +208,35 @@ class ReportResponse(BaseModel):
     totals: dict[str, Any]
 
 
+class ReportCacheStatsResponse(BaseModel):
+    """Schema for the report cache counters."""
+
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class NetWorthSeriesPointResponse(BaseModel):
+    """Schema for the net worth totals on one date of a series."""
+
+    as_of_date: date
+    total_assets: str
+    total_liabilities: str
+    net_worth: str
+
+
+class NetWorthSeriesResponse(BaseModel):
+    """Schema for net worth series report response."""
+
+    report_name: str
+    start_date: date
+    end_date: date
+    frequency: str
+    points: list[NetWorthSeriesPointResponse]
+
+
 class BalanceSheetResponse(BaseModel):
     """Schema for balance sheet report response."""
 
@@ -144,6 +246,40 @@ class BalanceSheetResponse(BaseModel):
     totals: dict[str, Any]
 
 
+class TrialBalanceLineResponse(BaseModel):
+    """Schema for one account and currency of a trial balance."""
+
+    account_id: UUID
+    account_name: str
+    entity_id: UUID
+    account_type: str
+    currency: str
+    debit_total: str
+    credit_total: str
+    net_balance: str
+
+
+class TrialBalanceTotalResponse(BaseModel):
+    """Schema for the debit and credit totals of one currency."""
+
+    currency: str
+    debit_total: str
+    credit_total: str
+
+
+class TrialBalanceResponse(BaseModel):
+    """Schema for trial balance report response.
+
+    ``is_balanced`` is False when debits and credits differ in any currency.
+    """
+
+    report_name: str
+    as_of_date: date
+    lines: list[TrialBalanceLineResponse]
+    totals: list[TrialBalanceTotalResponse]
+    is_balanced: bool
+
+
 # Health check
 class HealthResponse(BaseModel):
     """Schema for health check response."""
@@ -197,6 +333,7 @@ class MatchListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class SessionSummaryResponse(BaseModel):
@@ -521,6 +658,8 @@ class CurrencyConvertResponse(BaseModel):
     converted_currency: str
     rate_used: str
     as_of_date: date
+    rate_path: list[str] = Field(default_factory=list)
+    rate_ids: list[UUID] = Field(default_factory=list)
 
 
 # Vendor Schemas
@@ -52,6 +52,8 @@ from family_office_ledger.cli._main import (
     cmd_reconcile_reject,
     cmd_reconcile_skip,
     cmd_reconcile_summary,
+    cmd_snapshots_rebuild,
+    cmd_snapshots_verify,
     cmd_status,
     cmd_tax_export,
     cmd_tax_generate,
@@ -148,4 +150,7 @@ __all__ = [
     "cmd_ownership_delete",
     "cmd_ownership_tree",
     "cmd_ownership_look_through",
+    # Snapshot commands
+    "cmd_snapshots_rebuild",
+    "cmd_snapshots_verify",
 ]
@@ -12,6 +12,7 @@ from family_office_ledger.domain.ownership import EntityOwnership, SelfOwnership
 from family_office_ledger.domain.reconciliation import ReconciliationMatchStatus
 from family_office_ledger.domain.transfer_matching import TransferMatchStatus
 from family_office_ledger.domain.vendors import Vendor
+from family_office_ledger.repositories.identity_map import IdentityMap
 from family_office_ledger.repositories.sqlite import (
     SQLiteAccountRepository,
     SQLiteBudgetRepository,
@@ -20,6 +21,7 @@ from family_office_ledger.repositories.sqlite import (
     SQLiteEntityRepository,
     SQLiteExchangeRateRepository,
     SQLiteHouseholdRepository,
+    SQLitePeriodCloseRepository,
     SQLitePositionRepository,
     SQLiteReconciliationSessionRepository,
     SQLiteSecurityRepository,
@@ -80,6 +82,8 @@ def create_app(db_path: Path | None = None) -> tuple[SQLiteDatabase, LedgerServi
         transaction_repo=transaction_repo,
         account_repo=account_repo,
         entity_repo=entity_repo,
+        period_close_repo=SQLitePeriodCloseRepository(db),
+        unit_of_work=db.unit_of_work,
     )
 
     return db, ledger_service
@@ -168,6 +172,7 @@ def cmd_ingest(args: argparse.Namespace) -> int:
             transaction_repo=transaction_repo,
             account_repo=account_repo,
             entity_repo=entity_repo,
+            period_close_repo=SQLitePeriodCloseRepository(db),
         )
         lot_matching_service = LotMatchingServiceImpl(
             position_repo=position_repo,
@@ -185,6 +190,7 @@ def cmd_ingest(args: argparse.Namespace) -> int:
             ledger_service=ledger_service,
             lot_matching_service=lot_matching_service,
             transaction_classifier=transaction_classifier,
+            unit_of_work=db.unit_of_work,
         )
 
         # Ingest the file
@@ -890,7 +896,8 @@ def cmd_qsbs_summary(args: argparse.Namespace) -> int:
             as_of_date = dt_date.fromisoformat(args.as_of)
 
         db = SQLiteDatabase(str(db_path))
-        security_repo = SQLiteSecurityRepository(db)
+        identity_map = IdentityMap()
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         position_repo = SQLitePositionRepository(db)
         tax_lot_repo = SQLiteTaxLotRepository(db)
         service = QSBSService(security_repo, position_repo, tax_lot_repo)
@@ -938,10 +945,11 @@ def cmd_tax_generate(args: argparse.Namespace) -> int:
 
     try:
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
         tax_lot_repo = SQLiteTaxLotRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = TaxDocumentService(
             entity_repo, position_repo, tax_lot_repo, security_repo
         )
@@ -992,10 +1000,11 @@ def cmd_tax_summary(args: argparse.Namespace) -> int:
 
     try:
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
         tax_lot_repo = SQLiteTaxLotRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = TaxDocumentService(
             entity_repo, position_repo, tax_lot_repo, security_repo
         )
@@ -1044,10 +1053,11 @@ def cmd_tax_export(args: argparse.Namespace) -> int:
 
     try:
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
         tax_lot_repo = SQLiteTaxLotRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = TaxDocumentService(
             entity_repo, position_repo, tax_lot_repo, security_repo
         )
@@ -1088,9 +1098,10 @@ def cmd_portfolio_allocation(args: argparse.Namespace) -> int:
             as_of_date = dt_date.fromisoformat(args.as_of)
 
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = PortfolioAnalyticsService(entity_repo, position_repo, security_repo)
 
         report = service.asset_allocation_report(entity_ids, as_of_date)
@@ -1138,9 +1149,10 @@ def cmd_portfolio_concentration(args: argparse.Namespace) -> int:
             as_of_date = dt_date.fromisoformat(args.as_of)
 
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = PortfolioAnalyticsService(entity_repo, position_repo, security_repo)
 
         report = service.concentration_report(entity_ids, as_of_date, top_n=args.top_n)
@@ -1188,9 +1200,10 @@ def cmd_portfolio_summary(args: argparse.Namespace) -> int:
             as_of_date = dt_date.fromisoformat(args.as_of)
 
         db = SQLiteDatabase(str(db_path))
-        entity_repo = SQLiteEntityRepository(db)
+        identity_map = IdentityMap()
+        entity_repo = identity_map.entities(SQLiteEntityRepository(db))
         position_repo = SQLitePositionRepository(db)
-        security_repo = SQLiteSecurityRepository(db)
+        security_repo = identity_map.securities(SQLiteSecurityRepository(db))
         service = PortfolioAnalyticsService(entity_repo, position_repo, security_repo)
 
         summary = service.get_portfolio_summary(entity_ids, as_of_date)
@@ -2459,6 +2472,64 @@ def cmd_ownership_look_through(args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_snapshots_rebuild(args: argparse.Namespace) -> int:
+    """Regenerate account balance snapshots from entries."""
+    db_path = Path(args.database) if args.database else get_default_db_path()
+    if not db_path.exists():
+        print(f"Error: Database not found at {db_path}")
+        return 1
+
+    try:
+        db = SQLiteDatabase(str(db_path))
+        db.initialize()
+        written = db.rebuild_balance_snapshots()
+        print(f"Rebuilt {written} balance snapshots")
+        return 0
+
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+def cmd_snapshots_verify(args: argparse.Namespace) -> int:
+    """Compare account balance snapshots against a full recompute."""
+    db_path = Path(args.database) if args.database else get_default_db_path()
+    if not db_path.exists():
+        print(f"Error: Database not found at {db_path}")
+        return 1
+
+    try:
+        db = SQLiteDatabase(str(db_path))
+        db.initialize()
+        discrepancies = db.verify_balance_snapshots()
+        if not discrepancies:
+            print("Balance snapshots match a full recompute")
+            return 0
+
+        print(f"Found {len(discrepancies)} balance snapshot discrepancies:")
+        print("-" * 70)
+        for d in discrepancies[: args.limit]:
+            stored = (
+                f"debit={d.stored[0]} credit={d.stored[1]}" if d.stored else "missing"
+            )
+            expected = (
+                f"debit={d.expected[0]} credit={d.expected[1]}"
+                if d.expected
+                else "none"
+            )
+            print(f"  {d.account_id} {d.currency} {d.snapshot_date}")
+            print(f"    stored:   {stored}")
+            print(f"    expected: {expected}")
+        if len(discrepancies) > args.limit:
+            print(f"  ... and {len(discrepancies) - args.limit} more")
+        print("Run 'fol snapshots rebuild' to regenerate them")
+        return 1
+
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         prog="fol",
@@ -3236,6 +3307,32 @@ def main(argv: list[str] | None = None) -> int:
     )
     ownership_look_through_parser.set_defaults(func=cmd_ownership_look_through)
 
+    # snapshots command group
+    snapshots_parser = subparsers.add_parser(
+        "snapshots", help="Account balance snapshot maintenance"
+    )
+    snapshots_subparsers = snapshots_parser.add_subparsers(
+        dest="snapshots_command", help="Snapshot subcommands"
+    )
+
+    # snapshots rebuild
+    snapshots_rebuild_parser = snapshots_subparsers.add_parser(
+        "rebuild", help="Regenerate balance snapshots from entries"
+    )
+    snapshots_rebuild_parser.set_defaults(func=cmd_snapshots_rebuild)
+
+    # snapshots verify
+    snapshots_verify_parser = snapshots_subparsers.add_parser(
+        "verify", help="Diff balance snapshots against a full recompute"
+    )
+    snapshots_verify_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum discrepancies to print (default: 20)",
+    )
+    snapshots_verify_parser.set_defaults(func=cmd_snapshots_verify)
+
     args = parser.parse_args(argv)
 
     if args.command is None:
@@ -3296,6 +3393,12 @@ def main(argv: list[str] | None = None) -> int:
         budget_parser.print_help()
         return 0
 
+    if args.command == "snapshots" and (
+        not hasattr(args, "snapshots_command") or args.snapshots_command is None
+    ):
+        snapshots_parser.print_help()
+        return 0
+
     result: int = args.func(args)
     return result
 
@@ -76,6 +76,27 @@ class Settings(BaseSettings):
         default=Path("family_office_ledger.db"),
         description="SQLite database file path (when database_type=sqlite)",
     )
+    database_pool_min_size: int = Field(
+        default=1, ge=0, description="Postgres connections kept open when idle"
+    )
+    database_pool_max_size: int = Field(
+        default=10, ge=1, description="Most Postgres connections open at once"
+    )
+    database_pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for a free Postgres connection",
+    )
+
+    # Report cache
+    report_cache_max_entries: int = Field(
+        default=256, ge=1, description="Report results kept in memory per database"
+    )
+    report_cache_path: Path | None = Field(
+        default=None,
+        description="File the report cache is saved to on shutdown and loaded "
+        "from on startup; belongs to one database",
+    )
 
     # Logging
     log_level: LogLevel = LogLevel.INFO
@@ -18,6 +18,7 @@ Usage:
     ledger = container.ledger_service
 """
 
+import threading
 from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
@@ -26,11 +27,14 @@ from family_office_ledger.logging_config import get_logger
 
 if TYPE_CHECKING:
     from family_office_ledger.repositories.interfaces import LedgerRepository
+    from family_office_ledger.repositories.sqlite import SQLiteDatabase
     from family_office_ledger.services.audit import AuditService
+    from family_office_ledger.services.currency import CurrencyServiceImpl
     from family_office_ledger.services.ledger import LedgerService
     from family_office_ledger.services.lot_matching import LotMatchingService
     from family_office_ledger.services.qsbs import QSBSService
     from family_office_ledger.services.reconciliation import ReconciliationService
+    from family_office_ledger.services.report_cache import ReportCache
     from family_office_ledger.services.reporting import ReportingService
 
 logger = get_logger(__name__)
@@ -57,6 +61,10 @@ class Container:
         self._settings = settings or get_settings()
         self._database: LedgerRepository | None = None
         self._initialized = False
+        self._audit_services: dict[SQLiteDatabase, AuditService] = {}
+        self._currency_services: dict[SQLiteDatabase, CurrencyServiceImpl] = {}
+        self._report_caches: dict[SQLiteDatabase, ReportCache] = {}
+        self._services_lock = threading.Lock()
         logger.debug(
             "container_created",
             database_type=self._settings.database_type.value,
@@ -85,9 +93,10 @@ class Container:
     def _create_sqlite_database(self) -> "LedgerRepository":
         """Create and initialize SQLite database.
 
-        Note: check_same_thread=False is required for FastAPI because
-        the database is created during lifespan startup but accessed
-        from worker threads handling requests.
+        File-backed databases give each FastAPI worker thread its own WAL
+        connection. check_same_thread=False only matters for ``:memory:``
+        databases, whose single connection is created during lifespan
+        startup but accessed from worker threads handling requests.
         """
         from family_office_ledger.repositories.sqlite import SQLiteDatabase
 
@@ -99,7 +108,12 @@ class Container:
         return db
 
     def _create_postgres_database(self) -> "LedgerRepository":
-        """Create and initialize PostgreSQL database."""
+        """Create and initialize PostgreSQL database.
+
+        Connections come from a pool sized by ``database_pool_min_size`` and
+        ``database_pool_max_size``; the one used for schema setup is
+        returned to it before the database is handed out.
+        """
         from family_office_ledger.repositories.postgres import PostgresDatabase
 
         url = self._settings.database_url
@@ -114,8 +128,14 @@ class Container:
             host=url.split("@")[-1].split("/")[0] if "@" in url else "localhost",
         )
 
-        db = PostgresDatabase(url)
-        db.initialize()
+        db = PostgresDatabase(
+            url,
+            min_size=self._settings.database_pool_min_size,
+            max_size=self._settings.database_pool_max_size,
+            timeout=self._settings.database_pool_timeout,
+        )
+        with db.connection():
+            db.initialize()
         return db
 
     @cached_property
@@ -153,23 +173,90 @@ class Container:
 
         return ReportingService(self.database)
 
-    @cached_property
+    @property
     def audit_service(self) -> "AuditService":
         """Get the audit service for change tracking."""
+        return self.audit_service_for(self.database)
+
+    def audit_service_for(self, database: "SQLiteDatabase") -> "AuditService":
+        """Get the audit service writing to ``database``.
+
+        There is one service, and so one background writer, per database;
+        ``close()`` flushes and closes all of them.
+        """
         from family_office_ledger.services.audit import AuditService
 
-        return AuditService(self.database)
+        with self._services_lock:
+            service = self._audit_services.get(database)
+            if service is None:
+                service = AuditService(database)
+                self._audit_services[database] = service
+            return service
+
+    def currency_service_for(self, database: "SQLiteDatabase") -> "CurrencyServiceImpl":
+        """Get the currency service reading rates from ``database``.
+
+        One service per database, so its exchange-rate cache is shared by
+        every request. The service watches the database's exchange-rate
+        ledger version, so rate writes from anywhere invalidate the cache.
+        """
+        from family_office_ledger.repositories.sqlite import (
+            SQLiteExchangeRateRepository,
+            SQLiteLedgerVersionRepository,
+        )
+        from family_office_ledger.services.currency import CurrencyServiceImpl
+
+        with self._services_lock:
+            service = self._currency_services.get(database)
+            if service is None:
+                service = CurrencyServiceImpl(
+                    SQLiteExchangeRateRepository(database),
+                    ledger_versions=SQLiteLedgerVersionRepository(database),
+                )
+                self._currency_services[database] = service
+            return service
+
+    def report_cache_for(self, database: "SQLiteDatabase") -> "ReportCache":
+        """Get the cache of report results computed from ``database``.
+
+        One cache per database, shared by every request. Entries are keyed
+        by the database's ledger versions, so writes invalidate them; with
+        ``report_cache_path`` set they are saved by ``close()``.
+        """
+        from family_office_ledger.services.report_cache import ReportCache
+
+        with self._services_lock:
+            cache = self._report_caches.get(database)
+            if cache is None:
+                cache = ReportCache(
+                    max_entries=self._settings.report_cache_max_entries,
+                    path=self._settings.report_cache_path,
+                )
+                self._report_caches[database] = cache
+            return cache
 
     def close(self) -> None:
         """Close all resources held by the container.
 
-        Should be called during application shutdown.
+        Should be called during application shutdown. Buffered audit
+        entries are flushed and report caches saved before the database is
+        closed.
         """
-        if self._database is not None:
+        with self._services_lock:
+            audit_services, self._audit_services = self._audit_services, {}
+            report_caches, self._report_caches = self._report_caches, {}
+            self._currency_services = {}
+        for audit_service in audit_services.values():
+            audit_service.close()
+        for report_cache in report_caches.values():
+            report_cache.save()
+        # ``database`` is a cached_property, so it lives in the instance dict.
+        database = self.__dict__.get("database", self._database)
+        if database is not None:
             logger.info("closing_database_connection")
             # The database may have a close method
-            if hasattr(self._database, "close"):
-                self._database.close()  # type: ignore
+            if hasattr(database, "close"):
+                database.close()  # type: ignore
 
     def __enter__(self) -> "Container":
         """Enter context manager."""
@@ -15,13 +15,20 @@ from family_office_ledger.domain.documents import Document, TaxDocLine
 from family_office_ledger.domain.entities import Account, Entity, Position, Security
 from family_office_ledger.domain.exchange_rates import ExchangeRate, ExchangeRateSource
 from family_office_ledger.domain.households import Household, HouseholdMember
+from family_office_ledger.domain.periods import PeriodClose
 from family_office_ledger.domain.reconciliation import (
     ReconciliationMatch,
+    ReconciliationMatchChanges,
     ReconciliationMatchStatus,
     ReconciliationSession,
     ReconciliationSessionStatus,
 )
-from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    Entry,
+    TaxLot,
+    Transaction,
+)
 from family_office_ledger.domain.transfer_matching import (
     TransferMatch,
     TransferMatchingSession,
@@ -39,6 +46,7 @@ from family_office_ledger.domain.vendors import Vendor
 
 __all__ = [
     "Account",
+    "AccountTotals",
     "AuditAction",
     "AuditEntityType",
     "AuditEntry",
@@ -59,10 +67,12 @@ __all__ = [
     "HouseholdMember",
     "LotSelection",
     "Money",
+    "PeriodClose",
     "Position",
     "Price",
     "Quantity",
     "ReconciliationMatch",
+    "ReconciliationMatchChanges",
     "ReconciliationMatchStatus",
     "ReconciliationSession",
     "ReconciliationSessionStatus",
@@ -0,0 +1,72 @@
+"""Closed fiscal periods and their frozen closing balances."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+from family_office_ledger.domain.transactions import AccountTotals
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class PeriodClosedError(Exception):
+    """Raised when a posting falls inside an entity's closed fiscal period."""
+
+    def __init__(self, entity_id: UUID, closed_through: date, txn_date: date) -> None:
+        self.entity_id = entity_id
+        self.closed_through = closed_through
+        self.txn_date = txn_date
+        super().__init__(
+            f"Period closed through {closed_through} for entity {entity_id}: "
+            f"cannot post on {txn_date}"
+        )
+
+
+def check_period_open(
+    txn_date: date,
+    account_ids: Iterable[UUID],
+    closed: Mapping[UUID, tuple[UUID, date]],
+) -> None:
+    """Raise ``PeriodClosedError`` if ``txn_date`` is in a closed period.
+
+    ``closed`` maps account ids to their entity and the end of that entity's
+    last closed period; accounts of entities without one are left out.
+    """
+    for account_id in account_ids:
+        found = closed.get(account_id)
+        if found is not None and txn_date <= found[1]:
+            raise PeriodClosedError(found[0], found[1], txn_date)
+
+
+def fiscal_year_end(fiscal_year_end: date, year: int) -> date:
+    """The end of ``year``'s fiscal year for an entity's ``fiscal_year_end``.
+
+    Only the month and day of ``fiscal_year_end`` are used; a February 29
+    year end falls on February 28 in other years.
+    """
+    try:
+        return fiscal_year_end.replace(year=year)
+    except ValueError:
+        return date(year, 2, 28)
+
+
+@dataclass
+class PeriodClose:
+    """A closed fiscal period of one entity.
+
+    ``balances`` are the debit and credit totals of every account of the
+    entity with activity, per currency, at the end of ``period_end``, after
+    the closing transaction rolled income and expense into equity. Nothing
+    dated on or before ``period_end`` may be posted once the period is
+    closed, so these totals never change.
+    """
+
+    entity_id: UUID
+    period_end: date
+    id: UUID = field(default_factory=uuid4)
+    closing_transaction_id: UUID | None = None
+    balances: list[AccountTotals] = field(default_factory=list)
+    closed_at: datetime = field(default_factory=_utc_now)
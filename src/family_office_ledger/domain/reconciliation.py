@@ -48,6 +48,33 @@ class ReconciliationMatch:
     status: ReconciliationMatchStatus = ReconciliationMatchStatus.PENDING
     actioned_at: datetime | None = None
     created_at: datetime = field(default_factory=_utc_now)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_dirty", False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dirty", True)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether a field changed since the match was last loaded or saved."""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        """Record the current field values as persisted."""
+        object.__setattr__(self, "_dirty", False)
+
+
+@dataclass
+class ReconciliationMatchChanges:
+    """Matches added, changed or removed since a session was last persisted."""
+
+    added: list[ReconciliationMatch] = field(default_factory=list)
+    changed: list[ReconciliationMatch] = field(default_factory=list)
+    removed_ids: list[UUID] = field(default_factory=list)
 
 
 @dataclass
@@ -66,6 +93,51 @@ class ReconciliationSession:
     matches: list[ReconciliationMatch] = field(default_factory=list)
     created_at: datetime = field(default_factory=_utc_now)
     closed_at: datetime | None = None
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    _persisted_match_ids: set[UUID] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_dirty", False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dirty", True)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether a session field changed since it was last loaded or saved."""
+        return self._dirty
+
+    @property
+    def is_persisted(self) -> bool:
+        """Whether a repository has recorded which matches are stored."""
+        return self._persisted_match_ids is not None
+
+    def mark_clean(self) -> None:
+        """Record the session and all of its matches as persisted."""
+        object.__setattr__(self, "_dirty", False)
+        object.__setattr__(self, "_persisted_match_ids", {m.id for m in self.matches})
+        for match in self.matches:
+            match.mark_clean()
+
+    def match_changes(self) -> ReconciliationMatchChanges:
+        """Diff the matches against the state recorded by ``mark_clean``.
+
+        Every match counts as added for a session that was never persisted.
+        """
+        persisted = self._persisted_match_ids or set()
+        changes = ReconciliationMatchChanges()
+        for match in self.matches:
+            if match.id not in persisted:
+                changes.added.append(match)
+            elif match.is_dirty:
+                changes.changed.append(match)
+        current = {m.id for m in self.matches}
+        changes.removed_ids = [i for i in persisted if i not in current]
+        return changes
 
     @property
     def pending_count(self) -> int:
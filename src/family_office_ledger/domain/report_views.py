@@ -0,0 +1,44 @@
+"""Read models served by precomputed reporting views."""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from family_office_ledger.domain.value_objects import Money
+
+
+@dataclass(frozen=True)
+class EntityBalance:
+    """Asset and liability totals of one entity's accounts in one currency.
+
+    ``total_liabilities`` adds up the absolute balance of each liability
+    account, as the net worth report does.
+    """
+
+    entity_id: UUID
+    currency: str
+    total_assets: Decimal = Decimal("0")
+    total_liabilities: Decimal = Decimal("0")
+
+
+@dataclass(frozen=True)
+class EntityActivity:
+    """Number of accounts of an entity and of transactions touching them."""
+
+    entity_id: UUID
+    account_count: int = 0
+    transaction_count: int = 0
+
+
+@dataclass(frozen=True)
+class PositionValue:
+    """A position with the names of its account and security resolved."""
+
+    position_id: UUID
+    entity_id: UUID
+    account_name: str
+    security_symbol: str
+    security_name: str
+    quantity: Decimal
+    cost_basis: Money
+    market_value: Money
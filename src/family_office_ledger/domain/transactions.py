@@ -1,9 +1,16 @@
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
-from family_office_ledger.domain.value_objects import AcquisitionType, Money, Quantity
+from family_office_ledger.domain.value_objects import (
+    AcquisitionType,
+    Currency,
+    Money,
+    Quantity,
+    from_minor_units,
+)
 
 
 def _utc_now() -> datetime:
@@ -14,7 +21,11 @@ class UnbalancedTransactionError(Exception):
     """Raised when a transaction is not balanced (debits != credits)."""
 
     def __init__(
-        self, message: str | None = None, txn_id: UUID | None = None, debits: Money | None = None, credits: Money | None = None
+        self,
+        message: str | None = None,
+        txn_id: UUID | None = None,
+        debits: Money | None = None,
+        credits: Money | None = None,
     ) -> None:
         """Initialize UnbalancedTransactionError.
 
@@ -74,6 +85,35 @@ class Entry:
         return self.credit_amount.is_positive and self.debit_amount.is_zero
 
 
+@dataclass(frozen=True)
+class AccountTotals:
+    """Debit and credit totals for one account in one currency."""
+
+    account_id: UUID
+    currency: str
+    debit_total: Decimal = Decimal("0")
+    credit_total: Decimal = Decimal("0")
+
+    @property
+    def balance(self) -> Decimal:
+        return self.debit_total - self.credit_total
+
+
+@dataclass(frozen=True)
+class BalanceSnapshotDiscrepancy:
+    """A stored balance snapshot that differs from a full recompute.
+
+    ``stored`` is None for snapshots missing from the table and
+    ``expected`` is None for snapshots that should not exist.
+    """
+
+    account_id: UUID
+    currency: str
+    snapshot_date: date
+    stored: tuple[Decimal, Decimal] | None
+    expected: tuple[Decimal, Decimal] | None
+
+
 @dataclass
 class Transaction:
     transaction_date: date
@@ -138,6 +178,145 @@ class Transaction:
     def account_ids(self) -> set[UUID]:
         return {entry.account_id for entry in self.entries}
 
+    def totals_by_account(self) -> list[AccountTotals]:
+        """Debit and credit totals of this transaction per account and currency.
+
+        Zero amounts are ignored, so an entry only contributes to the
+        currency of the side it actually posts.
+        """
+        totals: dict[tuple[UUID, str], list[Decimal]] = {}
+        for entry in self.entries:
+            for index, money in enumerate((entry.debit_amount, entry.credit_amount)):
+                if money.is_zero:
+                    continue
+                currency = (
+                    money.currency.value
+                    if isinstance(money.currency, Currency)
+                    else money.currency
+                )
+                key = (entry.account_id, currency)
+                totals.setdefault(key, [Decimal("0"), Decimal("0")])[index] += (
+                    money.amount
+                )
+        return [
+            AccountTotals(account_id, currency, debit_total, credit_total)
+            for (account_id, currency), (debit_total, credit_total) in totals.items()
+        ]
+
+
+def totals_by_date(
+    transactions: Iterable[Transaction],
+) -> dict[date, list[AccountTotals]]:
+    """Merge ``totals_by_account`` of several transactions per transaction date."""
+    merged: dict[date, dict[tuple[UUID, str], list[Decimal]]] = {}
+    for txn in transactions:
+        day = merged.setdefault(txn.transaction_date, {})
+        for totals in txn.totals_by_account():
+            running = day.setdefault(
+                (totals.account_id, totals.currency), [Decimal("0"), Decimal("0")]
+            )
+            running[0] += totals.debit_total
+            running[1] += totals.credit_total
+    return {
+        txn_date: [
+            AccountTotals(account_id, currency, debit_total, credit_total)
+            for (account_id, currency), (debit_total, credit_total) in day.items()
+        ]
+        for txn_date, day in merged.items()
+    }
+
+
+class AccountTotalsAccumulator:
+    """Running debit and credit totals per account and currency.
+
+    Repositories feed it the ``GROUP BY`` sums of the scaled-integer amount
+    columns with ``add_minor`` and, for entries whose amounts could not be
+    scaled, the Decimal amounts with ``add``. Zero amounts are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[tuple[UUID, str], list[Decimal]] = {}
+
+    def add(
+        self,
+        account_id: UUID,
+        currency: str,
+        debit: Decimal = Decimal("0"),
+        credit: Decimal = Decimal("0"),
+    ) -> None:
+        if not debit and not credit:
+            return
+        running = self._totals.setdefault(
+            (account_id, currency), [Decimal("0"), Decimal("0")]
+        )
+        running[0] += debit
+        running[1] += credit
+
+    def add_minor(
+        self,
+        account_id: UUID,
+        debit_currency: str,
+        credit_currency: str,
+        debit_minor: int | None,
+        credit_minor: int | None,
+    ) -> None:
+        """Add sums of ``to_minor_units`` amounts; None sums nothing."""
+        self.add(account_id, debit_currency, debit=from_minor_units(debit_minor or 0))
+        self.add(
+            account_id, credit_currency, credit=from_minor_units(credit_minor or 0)
+        )
+
+    def totals(self) -> list[AccountTotals]:
+        return [
+            AccountTotals(account_id, currency, debit_total, credit_total)
+            for (account_id, currency), (debit_total, credit_total) in (
+                self._totals.items()
+            )
+        ]
+
+
+@dataclass(frozen=True)
+class SnapshotChanges:
+    """Balance snapshot rows of one account and currency to write.
+
+    ``upserts`` are ``(snapshot_date, debit_total, credit_total)`` rows to
+    insert or overwrite; ``delete_day`` is set when the posting day is left
+    without activity and its snapshot must be removed.
+    """
+
+    upserts: list[tuple[date, Decimal, Decimal]]
+    delete_day: bool
+
+
+def balance_snapshot_changes(
+    totals: AccountTotals,
+    day: date,
+    sign: int,
+    later: Sequence[tuple[date, Decimal, Decimal]],
+    previous: tuple[Decimal, Decimal] | None,
+) -> SnapshotChanges:
+    """How posting ``totals`` on ``day`` changes the running balance snapshots.
+
+    ``later`` are the snapshots of the same account and currency on or after
+    ``day`` in date order, and ``previous`` the totals of the last one before
+    it. The snapshot for ``day`` starts from ``previous`` if it is missing,
+    and every snapshot from ``day`` on is shifted by the totals times
+    ``sign`` (-1 takes a posting back out), so backdated postings stay
+    consistent. A snapshot for ``day`` left equal to ``previous`` is deleted.
+    """
+    debit = totals.debit_total * sign
+    credit = totals.credit_total * sign
+    base = previous if previous is not None else (Decimal("0"), Decimal("0"))
+    if not later or later[0][0] != day:
+        later = [(day, *base), *later]
+    shifted = [
+        (d, debit_total + debit, credit_total + credit)
+        for d, debit_total, credit_total in later
+    ]
+    if shifted[0][1:] == base:
+        return SnapshotChanges(shifted[1:], delete_day=True)
+    return SnapshotChanges(shifted, delete_day=False)
+
 
 @dataclass
 class TaxLot:
@@ -224,6 +224,34 @@ class Money:
         return cls(Decimal("0"), currency)
 
 
+# Amounts are persisted alongside their Decimal text as integers scaled by
+# 10**MINOR_UNIT_SCALE so balances can be aggregated exactly in SQL.
+MINOR_UNIT_SCALE = 6
+_MINOR_UNIT_FACTOR = Decimal(10) ** MINOR_UNIT_SCALE
+_MAX_MINOR_UNITS = 2**63 - 1
+
+
+def to_minor_units(amount: Decimal) -> int | None:
+    """Scale ``amount`` to an integer number of minor units.
+
+    Returns None when the amount has more than ``MINOR_UNIT_SCALE`` decimal
+    places or does not fit in a signed 64-bit integer, in which case callers
+    must fall back to the Decimal text column.
+    """
+    scaled = amount * _MINOR_UNIT_FACTOR
+    if scaled != scaled.to_integral_value() or abs(scaled) > _MAX_MINOR_UNITS:
+        return None
+    return int(scaled)
+
+
+def from_minor_units(value: int) -> Decimal:
+    """Convert a scaled integer produced by :func:`to_minor_units` to Decimal."""
+    amount = Decimal(value).scaleb(-MINOR_UNIT_SCALE)
+    if amount == amount.to_integral_value():
+        return amount.quantize(Decimal("1"))
+    return amount.normalize()
+
+
 @dataclass(frozen=True, slots=True)
 class Quantity:
     value: Decimal
@@ -286,4 +314,7 @@ __all__ = [
     "ExpenseCategory",
     "Money",
     "Quantity",
+    "MINOR_UNIT_SCALE",
+    "to_minor_units",
+    "from_minor_units",
 ]
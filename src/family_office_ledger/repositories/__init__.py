@@ -1,3 +1,10 @@
+from family_office_ledger.repositories.identity_map import (
+    CachingAccountRepository,
+    CachingEntityRepository,
+    CachingSecurityRepository,
+    IdentityMap,
+    IdentityMapStats,
+)
 from family_office_ledger.repositories.interfaces import (
     AccountRepository,
     EntityRepository,
@@ -32,6 +39,11 @@ __all__ = [
     "TaxLotRepository",
     "TransactionRepository",
     "VendorRepository",
+    "CachingAccountRepository",
+    "CachingEntityRepository",
+    "CachingSecurityRepository",
+    "IdentityMap",
+    "IdentityMapStats",
     "SQLiteAccountRepository",
     "SQLiteDatabase",
     "SQLiteEntityRepository",
@@ -48,11 +60,13 @@ __all__ = [
 try:
     from family_office_ledger.repositories.postgres import (
         PostgresAccountRepository,
+        PostgresBulkLoader,
         PostgresDatabase,
         PostgresEntityRepository,
         PostgresHouseholdRepository,
         PostgresPositionRepository,
         PostgresReconciliationSessionRepository,
+        PostgresReportingViews,
         PostgresSecurityRepository,
         PostgresTaxLotRepository,
         PostgresTransactionRepository,
@@ -60,11 +74,13 @@ try:
 
     __all__ += [
         "PostgresAccountRepository",
+        "PostgresBulkLoader",
         "PostgresDatabase",
         "PostgresEntityRepository",
         "PostgresHouseholdRepository",
         "PostgresPositionRepository",
         "PostgresReconciliationSessionRepository",
+        "PostgresReportingViews",
         "PostgresSecurityRepository",
         "PostgresTaxLotRepository",
         "PostgresTransactionRepository",
@@ -0,0 +1,252 @@
+"""Request-scoped identity map for entity, account and security lookups.
+
+Reports resolve the account and security of every position they touch,
+so the same few rows are fetched over and over within one request. An
+``IdentityMap`` lives for a single API request or CLI command and wraps
+the lookup repositories in read-through caches: the first ``get`` for an
+id reaches the database, later ones return the very same instance.
+
+Usage:
+    identity_map = IdentityMap()
+    account_repo = identity_map.accounts(SQLiteAccountRepository(db))
+    security_repo = identity_map.securities(SQLiteSecurityRepository(db))
+    ...
+    identity_map.stats  # IdentityMapStats(hits=..., misses=...)
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Protocol, TypeVar
+from uuid import UUID
+
+from family_office_ledger.domain.entities import Account, Entity, Security
+from family_office_ledger.repositories.interfaces import (
+    AccountRepository,
+    EntityRepository,
+    SecurityRepository,
+)
+
+
+class _Identified(Protocol):
+    id: UUID
+
+
+T = TypeVar("T", bound=_Identified)
+
+
+@dataclass
+class IdentityMapStats:
+    """Lookup counters for one identity map."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+
+class IdentityMap:
+    """Cache of loaded domain objects keyed by kind and id.
+
+    Not thread-safe; create one per request or command and drop it at the
+    end. Misses are remembered too, so repeatedly asking for an unknown id
+    only queries once.
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[str, UUID], object | None] = {}
+        self.stats = IdentityMapStats()
+
+    def get(self, kind: str, obj_id: UUID, load: Callable[[], T | None]) -> T | None:
+        """Return the cached object for ``obj_id``, calling ``load`` on a miss."""
+        key = (kind, obj_id)
+        if key in self._objects:
+            self.stats.hits += 1
+            return self._objects[key]  # type: ignore[return-value]
+        self.stats.misses += 1
+        obj = load()
+        self._objects[key] = obj
+        return obj
+
+    def get_many(
+        self,
+        kind: str,
+        obj_ids: Iterable[UUID],
+        load_many: Callable[[list[UUID]], dict[UUID, T]],
+    ) -> dict[UUID, T]:
+        """Return cached objects for ``obj_ids``, loading all misses at once."""
+        found: dict[UUID, T] = {}
+        missing: list[UUID] = []
+        for obj_id in dict.fromkeys(obj_ids):
+            key = (kind, obj_id)
+            if key not in self._objects:
+                missing.append(obj_id)
+                continue
+            self.stats.hits += 1
+            obj = self._objects[key]
+            if obj is not None:
+                found[obj_id] = obj  # type: ignore[assignment]
+        if missing:
+            self.stats.misses += len(missing)
+            loaded = load_many(missing)
+            for obj_id in missing:
+                self._objects[(kind, obj_id)] = loaded.get(obj_id)
+            found.update(loaded)
+        return found
+
+    def register(self, kind: str, obj: T) -> T:
+        """Return the mapped instance for ``obj``, mapping ``obj`` if unseen."""
+        existing = self._objects.get((kind, obj.id))
+        if existing is not None:
+            return existing  # type: ignore[return-value]
+        self._objects[(kind, obj.id)] = obj
+        return obj
+
+    def put(self, kind: str, obj: T) -> None:
+        """Map ``obj``, replacing any instance previously loaded for its id."""
+        self._objects[(kind, obj.id)] = obj
+
+    def evict(self, kind: str, obj_id: UUID) -> None:
+        self._objects.pop((kind, obj_id), None)
+
+    def clear(self) -> None:
+        self._objects.clear()
+
+    def entities(self, repo: EntityRepository) -> "CachingEntityRepository":
+        return CachingEntityRepository(repo, self)
+
+    def accounts(self, repo: AccountRepository) -> "CachingAccountRepository":
+        return CachingAccountRepository(repo, self)
+
+    def securities(self, repo: SecurityRepository) -> "CachingSecurityRepository":
+        return CachingSecurityRepository(repo, self)
+
+
+class CachingEntityRepository(EntityRepository):
+    """Read-through ``EntityRepository`` backed by an ``IdentityMap``."""
+
+    _KIND = "entity"
+
+    def __init__(self, inner: EntityRepository, identity_map: IdentityMap) -> None:
+        self._inner = inner
+        self._map = identity_map
+
+    def _register(self, entities: Iterable[Entity]) -> list[Entity]:
+        return [self._map.register(self._KIND, entity) for entity in entities]
+
+    def add(self, entity: Entity) -> None:
+        self._inner.add(entity)
+        self._map.put(self._KIND, entity)
+
+    def get(self, entity_id: UUID) -> Entity | None:
+        return self._map.get(self._KIND, entity_id, lambda: self._inner.get(entity_id))
+
+    def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        return self._map.get_many(self._KIND, entity_ids, self._inner.get_many)
+
+    def get_by_name(self, name: str) -> Entity | None:
+        entity = self._inner.get_by_name(name)
+        return self._map.register(self._KIND, entity) if entity else None
+
+    def list_all(self) -> Iterable[Entity]:
+        return self._register(self._inner.list_all())
+
+    def list_active(self) -> Iterable[Entity]:
+        return self._register(self._inner.list_active())
+
+    def update(self, entity: Entity) -> None:
+        self._inner.update(entity)
+        self._map.put(self._KIND, entity)
+
+    def delete(self, entity_id: UUID) -> None:
+        self._inner.delete(entity_id)
+        self._map.evict(self._KIND, entity_id)
+
+
+class CachingAccountRepository(AccountRepository):
+    """Read-through ``AccountRepository`` backed by an ``IdentityMap``."""
+
+    _KIND = "account"
+
+    def __init__(self, inner: AccountRepository, identity_map: IdentityMap) -> None:
+        self._inner = inner
+        self._map = identity_map
+
+    def _register(self, accounts: Iterable[Account]) -> list[Account]:
+        return [self._map.register(self._KIND, account) for account in accounts]
+
+    def add(self, account: Account) -> None:
+        self._inner.add(account)
+        self._map.put(self._KIND, account)
+
+    def get(self, account_id: UUID) -> Account | None:
+        return self._map.get(
+            self._KIND, account_id, lambda: self._inner.get(account_id)
+        )
+
+    def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        return self._map.get_many(self._KIND, account_ids, self._inner.get_many)
+
+    def get_by_name(self, name: str, entity_id: UUID) -> Account | None:
+        account = self._inner.get_by_name(name, entity_id)
+        return self._map.register(self._KIND, account) if account else None
+
+    def list_by_entity(self, entity_id: UUID) -> Iterable[Account]:
+        return self._register(self._inner.list_by_entity(entity_id))
+
+    def list_investment_accounts(
+        self, entity_id: UUID | None = None
+    ) -> Iterable[Account]:
+        return self._register(self._inner.list_investment_accounts(entity_id))
+
+    def update(self, account: Account) -> None:
+        self._inner.update(account)
+        self._map.put(self._KIND, account)
+
+    def delete(self, account_id: UUID) -> None:
+        self._inner.delete(account_id)
+        self._map.evict(self._KIND, account_id)
+
+
+class CachingSecurityRepository(SecurityRepository):
+    """Read-through ``SecurityRepository`` backed by an ``IdentityMap``."""
+
+    _KIND = "security"
+
+    def __init__(self, inner: SecurityRepository, identity_map: IdentityMap) -> None:
+        self._inner = inner
+        self._map = identity_map
+
+    def _register(self, securities: Iterable[Security]) -> list[Security]:
+        return [self._map.register(self._KIND, security) for security in securities]
+
+    def add(self, security: Security) -> None:
+        self._inner.add(security)
+        self._map.put(self._KIND, security)
+
+    def get(self, security_id: UUID) -> Security | None:
+        return self._map.get(
+            self._KIND, security_id, lambda: self._inner.get(security_id)
+        )
+
+    def get_many(self, security_ids: Iterable[UUID]) -> dict[UUID, Security]:
+        return self._map.get_many(self._KIND, security_ids, self._inner.get_many)
+
+    def get_by_symbol(self, symbol: str) -> Security | None:
+        security = self._inner.get_by_symbol(symbol)
+        return self._map.register(self._KIND, security) if security else None
+
+    def get_by_cusip(self, cusip: str) -> Security | None:
+        security = self._inner.get_by_cusip(cusip)
+        return self._map.register(self._KIND, security) if security else None
+
+    def list_all(self) -> Iterable[Security]:
+        return self._register(self._inner.list_all())
+
+    def list_qsbs_eligible(self) -> Iterable[Security]:
+        return self._register(self._inner.list_qsbs_eligible())
+
+    def update(self, security: Security) -> None:
+        self._inner.update(security)
+        self._map.put(self._KIND, security)
@@ -1,6 +1,9 @@
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from datetime import date
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import groupby
 from uuid import UUID
 
 from family_office_ledger.domain.budgets import Budget, BudgetLineItem
@@ -8,10 +11,85 @@ from family_office_ledger.domain.entities import Account, Entity, Position, Secu
 from family_office_ledger.domain.exchange_rates import ExchangeRate
 from family_office_ledger.domain.households import Household, HouseholdMember
 from family_office_ledger.domain.ownership import EntityOwnership
-from family_office_ledger.domain.reconciliation import ReconciliationSession
-from family_office_ledger.domain.transactions import TaxLot, Transaction
+from family_office_ledger.domain.periods import PeriodClose
+from family_office_ledger.domain.reconciliation import (
+    ReconciliationMatch,
+    ReconciliationMatchStatus,
+    ReconciliationSession,
+)
+from family_office_ledger.domain.report_views import (
+    EntityActivity,
+    EntityBalance,
+    PositionValue,
+)
+from family_office_ledger.domain.transactions import AccountTotals, TaxLot, Transaction
 from family_office_ledger.domain.vendors import Vendor
 
+# Ledger version scope of writes not tied to one entity: securities and
+# exchange rates.
+GLOBAL_LEDGER_SCOPE = "global"
+# Ledger version scope bumped, besides the global one, on exchange rate
+# writes only, so rate caches can tell rate changes from security changes.
+EXCHANGE_RATE_SCOPE = "exchange_rates"
+
+
+def _get_each[T](get: Callable[[UUID], T | None], ids: Iterable[UUID]) -> dict[UUID, T]:
+    found: dict[UUID, T] = {}
+    for obj_id in ids:
+        obj = get(obj_id)
+        if obj is not None:
+            found[obj_id] = obj
+    return found
+
+
+def _search_terms(text: str) -> list[str]:
+    """Split a search query or field into lower-case words."""
+    return re.findall(r"\w+", text.lower())
+
+
+def _matches_terms(terms: list[str], *fields: str | None) -> bool:
+    """Whether every term starts a word of one of ``fields``."""
+    words = [word for value in fields if value for word in _search_terms(value)]
+    return all(any(word.startswith(term) for word in words) for term in terms)
+
+
+def _carry_forward(
+    opening: Iterable[AccountTotals], activity: Iterable[AccountTotals]
+) -> list[AccountTotals]:
+    """Add ``activity`` to ``opening`` totals per account and currency."""
+    totals: dict[tuple[UUID, str], AccountTotals] = {}
+    for part in (opening, activity):
+        for item in part:
+            key = (item.account_id, item.currency)
+            previous = totals.get(key, AccountTotals(*key))
+            totals[key] = AccountTotals(
+                account_id=item.account_id,
+                currency=item.currency,
+                debit_total=previous.debit_total + item.debit_total,
+                credit_total=previous.credit_total + item.credit_total,
+            )
+    return list(totals.values())
+
+
+def _totals_change(
+    earlier: Iterable[AccountTotals], later: Iterable[AccountTotals]
+) -> list[AccountTotals]:
+    """Subtract ``earlier`` from ``later`` totals per account and currency.
+
+    Pairs whose totals did not change are left out.
+    """
+    change = {(item.account_id, item.currency): item for item in later}
+    for item in earlier:
+        key = (item.account_id, item.currency)
+        current = change.get(key, AccountTotals(*key))
+        change[key] = AccountTotals(
+            account_id=item.account_id,
+            currency=item.currency,
+            debit_total=current.debit_total - item.debit_total,
+            credit_total=current.credit_total - item.credit_total,
+        )
+    return [item for item in change.values() if item.debit_total or item.credit_total]
+
 
 class EntityRepository(ABC):
     @abstractmethod
@@ -22,6 +100,15 @@ class EntityRepository(ABC):
     def get(self, entity_id: UUID) -> Entity | None:
         pass
 
+    def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        """Return the stored objects for ``entity_ids``, keyed by id.
+
+        Ids with no stored object are left out. This default calls ``get``
+        once per id; SQL-backed repositories override it with one chunked
+        query.
+        """
+        return _get_each(self.get, entity_ids)
+
     @abstractmethod
     def get_by_name(self, name: str) -> Entity | None:
         pass
@@ -52,6 +139,9 @@ class HouseholdRepository(ABC):
     def get(self, household_id: UUID) -> Household | None:
         pass
 
+    def get_many(self, household_ids: Iterable[UUID]) -> dict[UUID, Household]:
+        return _get_each(self.get, household_ids)
+
     @abstractmethod
     def get_by_name(self, name: str) -> Household | None:
         pass
@@ -110,6 +200,9 @@ class AccountRepository(ABC):
     def get(self, account_id: UUID) -> Account | None:
         pass
 
+    def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        return _get_each(self.get, account_ids)
+
     @abstractmethod
     def get_by_name(self, name: str, entity_id: UUID) -> Account | None:
         pass
@@ -142,6 +235,9 @@ class SecurityRepository(ABC):
     def get(self, security_id: UUID) -> Security | None:
         pass
 
+    def get_many(self, security_ids: Iterable[UUID]) -> dict[UUID, Security]:
+        return _get_each(self.get, security_ids)
+
     @abstractmethod
     def get_by_symbol(self, symbol: str) -> Security | None:
         pass
@@ -168,10 +264,22 @@ class PositionRepository(ABC):
     def add(self, position: Position) -> None:
         pass
 
+    def add_many(self, positions: Iterable[Position]) -> None:
+        """Add several positions at once.
+
+        SQL-backed repositories override this with one batched insert that
+        is committed together.
+        """
+        for position in positions:
+            self.add(position)
+
     @abstractmethod
     def get(self, position_id: UUID) -> Position | None:
         pass
 
+    def get_many(self, position_ids: Iterable[UUID]) -> dict[UUID, Position]:
+        return _get_each(self.get, position_ids)
+
     @abstractmethod
     def get_by_account_and_security(
         self, account_id: UUID, security_id: UUID
@@ -200,10 +308,25 @@ class TransactionRepository(ABC):
     def add(self, txn: Transaction) -> None:
         pass
 
+    def add_many(self, txns: Iterable[Transaction]) -> None:
+        """Add several transactions at once.
+
+        SQL-backed repositories override this with one batched insert that
+        is committed together. They also reject a batch with a transaction
+        dated inside a closed period of an account's entity, and an
+        ``update`` moving a transaction into or out of one, with
+        ``PeriodClosedError``, whichever service writes it.
+        """
+        for txn in txns:
+            self.add(txn)
+
     @abstractmethod
     def get(self, txn_id: UUID) -> Transaction | None:
         pass
 
+    def get_many(self, txn_ids: Iterable[UUID]) -> dict[UUID, Transaction]:
+        return _get_each(self.get, txn_ids)
+
     @abstractmethod
     def list_by_account(
         self,
@@ -228,6 +351,79 @@ class TransactionRepository(ABC):
     ) -> Iterable[Transaction]:
         pass
 
+    def iter_by_account(
+        self,
+        account_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        """Stream the results of ``list_by_account`` for single-pass readers.
+
+        SQL-backed repositories fetch and hydrate rows in fixed-size chunks
+        instead of materializing the whole result.
+        """
+        yield from self.list_by_account(account_id, start_date, end_date)
+
+    def iter_by_entity(
+        self,
+        entity_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        """Stream the results of ``list_by_entity`` for single-pass readers."""
+        yield from self.list_by_entity(entity_id, start_date, end_date)
+
+    def iter_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> Iterator[Transaction]:
+        """Stream the results of ``list_by_date_range`` for single-pass readers."""
+        yield from self.list_by_date_range(start_date, end_date)
+
+    def list_page(
+        self,
+        account_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        """Return one keyset page of transactions ordered by ``(date, id)``.
+
+        ``after`` is the ``(transaction_date, id)`` of the last transaction
+        on the previous page; only transactions sorting strictly after it
+        are returned. Ids are compared as strings, matching the ``TEXT``
+        primary key ordering of the SQL repositories, which override this
+        with a ``WHERE (transaction_date, id) > (?, ?)`` seek.
+        """
+        if account_id is not None:
+            txns = self.list_by_account(account_id, start_date, end_date)
+        else:
+            txns = self.list_by_date_range(start_date or date.min, end_date or date.max)
+        page = sorted(txns, key=lambda txn: (txn.transaction_date, str(txn.id)))
+        if after is not None:
+            cursor = (after[0], str(after[1]))
+            page = [txn for txn in page if (txn.transaction_date, str(txn.id)) > cursor]
+        return page[:limit]
+
+    def search(self, query: str, limit: int = 50) -> list[Transaction]:
+        """Return up to ``limit`` transactions matching ``query``, best first.
+
+        Every word of ``query`` must start a word of the transaction's memo,
+        reference or category. This default scans every transaction and
+        returns the newest matches; SQL-backed repositories override it with
+        a full-text index and rank the most recent matches by relevance.
+        """
+        terms = _search_terms(query)
+        if not terms:
+            return []
+        matches = [
+            txn
+            for txn in self.list_by_date_range(date.min, date.max)
+            if _matches_terms(terms, txn.memo, txn.reference, txn.category)
+        ]
+        matches.sort(key=lambda txn: (txn.transaction_date, str(txn.id)), reverse=True)
+        return matches[:limit]
+
     @abstractmethod
     def get_reversals(self, txn_id: UUID) -> Iterable[Transaction]:
         pass
@@ -236,20 +432,157 @@ class TransactionRepository(ABC):
     def update(self, txn: Transaction) -> None:
         pass
 
+    def sum_by_account(
+        self,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+        start: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Return debit/credit totals per account and currency.
+
+        Only entries dated between ``start`` and ``as_of`` (both inclusive,
+        either may be None) are counted. Zero amounts do not contribute a
+        currency, and accounts without activity are omitted.
+
+        This default hydrates each account's transactions; SQL-backed
+        repositories override it with a single aggregate query.
+        """
+        totals: dict[tuple[UUID, str], list[Decimal]] = {}
+        for account_id in account_ids:
+            for txn in self.list_by_account(
+                account_id, start_date=start, end_date=as_of
+            ):
+                for txn_totals in txn.totals_by_account():
+                    if txn_totals.account_id != account_id:
+                        continue
+                    running = totals.setdefault(
+                        (account_id, txn_totals.currency),
+                        [Decimal("0"), Decimal("0")],
+                    )
+                    running[0] += txn_totals.debit_total
+                    running[1] += txn_totals.credit_total
+        return [
+            AccountTotals(
+                account_id=account_id,
+                currency=currency,
+                debit_total=debit_total,
+                credit_total=credit_total,
+            )
+            for (account_id, currency), (debit_total, credit_total) in totals.items()
+        ]
+
+    def iter_account_totals(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[AccountTotals]:
+        """Stream ``sum_by_account`` totals up to ``as_of``, by account and currency.
+
+        Meant for reads spanning many accounts at once: SQL-backed
+        repositories answer with one query read through a cursor instead of
+        materializing the totals.
+        """
+        yield from sorted(
+            self.sum_by_account(account_ids, as_of=as_of),
+            key=lambda totals: (totals.account_id, totals.currency),
+        )
+
+    def sum_by_account_since(
+        self,
+        opening: Iterable[AccountTotals],
+        opening_date: date,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Return ``sum_by_account`` totals carried forward from ``opening``.
+
+        ``opening`` holds totals at the end of ``opening_date``, such as the
+        frozen balances of a closed period; totals of other accounts are
+        ignored. Only entries dated after ``opening_date`` (and up to
+        ``as_of``) are read, so the cost follows the activity since then
+        rather than the whole history.
+        """
+        ids = set(account_ids)
+        activity = self.sum_by_account(
+            ids, as_of=as_of, start=opening_date + timedelta(days=1)
+        )
+        return _carry_forward(
+            (totals for totals in opening if totals.account_id in ids), activity
+        )
+
+    def iter_balance_history(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[tuple[date, AccountTotals]]:
+        """Stream running totals up to ``as_of`` in date order.
+
+        Yields ``(day, totals)`` for every day an account's activity in a
+        currency changed, where ``totals`` are the cumulative totals at the
+        end of that day. This default folds the transactions of the date
+        range; SQL-backed repositories read the balance snapshots, which
+        hold the same running totals, with one ordered query.
+        """
+        wanted = set(account_ids)
+        running: dict[tuple[UUID, str], AccountTotals] = {}
+        txns = sorted(
+            self.iter_by_date_range(date.min, as_of or date.max),
+            key=lambda txn: txn.transaction_date,
+        )
+        for day, day_txns in groupby(txns, key=lambda txn: txn.transaction_date):
+            changed: dict[tuple[UUID, str], AccountTotals] = {}
+            for txn in day_txns:
+                for txn_totals in txn.totals_by_account():
+                    if txn_totals.account_id not in wanted:
+                        continue
+                    key = (txn_totals.account_id, txn_totals.currency)
+                    previous = running.get(key, AccountTotals(*key))
+                    running[key] = changed[key] = AccountTotals(
+                        account_id=txn_totals.account_id,
+                        currency=txn_totals.currency,
+                        debit_total=previous.debit_total + txn_totals.debit_total,
+                        credit_total=previous.credit_total + txn_totals.credit_total,
+                    )
+            for totals in changed.values():
+                yield day, totals
+
 
 class TaxLotRepository(ABC):
     @abstractmethod
     def add(self, lot: TaxLot) -> None:
         pass
 
+    def add_many(self, lots: Iterable[TaxLot]) -> None:
+        """Add several tax lots at once.
+
+        SQL-backed repositories override this with one batched insert that
+        is committed together.
+        """
+        for lot in lots:
+            self.add(lot)
+
     @abstractmethod
     def get(self, lot_id: UUID) -> TaxLot | None:
         pass
 
+    def get_many(self, lot_ids: Iterable[UUID]) -> dict[UUID, TaxLot]:
+        return _get_each(self.get, lot_ids)
+
     @abstractmethod
     def list_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         pass
 
+    def list_by_positions(
+        self, position_ids: Iterable[UUID]
+    ) -> dict[UUID, list[TaxLot]]:
+        """Return the lots of each position, ordered by acquisition date.
+
+        Positions without lots are left out. SQL-backed repositories
+        override this with chunked queries instead of one per position.
+        """
+        lots_by_position: dict[UUID, list[TaxLot]] = {}
+        for position_id in position_ids:
+            lots = list(self.list_by_position(position_id))
+            if lots:
+                lots_by_position[position_id] = lots
+        return lots_by_position
+
     @abstractmethod
     def list_open_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         pass
@@ -275,7 +608,8 @@ class ReconciliationSessionRepository(ABC):
     """Repository interface for reconciliation sessions.
 
     Manages persistence of reconciliation sessions and their associated matches.
-    Sessions are eagerly loaded with all matches.
+    ``get`` eagerly loads every match; the match-level methods page and count
+    matches without materializing the whole session.
     """
 
     @abstractmethod
@@ -283,11 +617,73 @@ class ReconciliationSessionRepository(ABC):
         """Add a new reconciliation session with all its matches."""
         pass
 
+    def add_many(self, sessions: Iterable[ReconciliationSession]) -> None:
+        """Add several sessions with their matches in one batch."""
+        for session in sessions:
+            self.add(session)
+
     @abstractmethod
     def get(self, session_id: UUID) -> ReconciliationSession | None:
         """Get a session by ID, including all matches."""
         pass
 
+    def get_many(
+        self, session_ids: Iterable[UUID]
+    ) -> dict[UUID, ReconciliationSession]:
+        """Get sessions by ID, including all matches, keyed by ID."""
+        return _get_each(self.get, session_ids)
+
+    def get_without_matches(self, session_id: UUID) -> ReconciliationSession | None:
+        """Get a session by ID without loading its matches.
+
+        The returned session has an empty ``matches`` list; saving it with
+        ``update`` only writes the session row.
+        """
+        session = self.get(session_id)
+        if session is not None:
+            session.matches = []
+            session.mark_clean()
+        return session
+
+    def get_match(self, session_id: UUID, match_id: UUID) -> ReconciliationMatch | None:
+        """Get one match of a session."""
+        session = self.get(session_id)
+        if session is None:
+            return None
+        return next((m for m in session.matches if m.id == match_id), None)
+
+    def list_matches(
+        self,
+        session_id: UUID,
+        status: ReconciliationMatchStatus | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[ReconciliationMatch]:
+        """List a page of a session's matches ordered by ``(created_at, id)``.
+
+        ``after`` is the ``(created_at, id)`` of the last match on the
+        previous page and is applied before ``offset``.
+        """
+        session = self.get(session_id)
+        if session is None:
+            return []
+        matches = sorted(session.matches, key=lambda m: (m.created_at, str(m.id)))
+        if status is not None:
+            matches = [m for m in matches if m.status == status]
+        if after is not None:
+            position = (after[0], str(after[1]))
+            matches = [m for m in matches if (m.created_at, str(m.id)) > position]
+        return matches[offset : offset + limit]
+
+    def count_matches(self, session_id: UUID) -> dict[ReconciliationMatchStatus, int]:
+        """Count a session's matches per status, including zero counts."""
+        counts = dict.fromkeys(ReconciliationMatchStatus, 0)
+        session = self.get(session_id)
+        for match in session.matches if session is not None else []:
+            counts[match.status] += 1
+        return counts
+
     @abstractmethod
     def get_pending_for_account(self, account_id: UUID) -> ReconciliationSession | None:
         """Get the pending session for an account, if one exists."""
@@ -295,8 +691,45 @@ class ReconciliationSessionRepository(ABC):
 
     @abstractmethod
     def update(self, session: ReconciliationSession) -> None:
-        """Update a session and all its matches (full replace)."""
-        pass
+        """Update a session, writing only the matches that changed.
+
+        Sessions that were not loaded or added through a repository have no
+        recorded match state and get all of their matches replaced.
+        """
+        pass
+
+    def update_matches(self, matches: Iterable[ReconciliationMatch]) -> None:
+        """Write back matches changed outside of their loaded session.
+
+        SQL-backed repositories override this with one UPDATE per match
+        instead of reloading and saving each session.
+        """
+        by_session: dict[UUID, dict[UUID, ReconciliationMatch]] = {}
+        for match in matches:
+            by_session.setdefault(match.session_id, {})[match.id] = match
+        for session_id, changed in by_session.items():
+            session = self.get(session_id)
+            if session is None:
+                continue
+            session.matches = [changed.get(m.id, m) for m in session.matches]
+            self.update(session)
+
+    def update_match_status(
+        self,
+        session_id: UUID,
+        match_id: UUID,
+        status: ReconciliationMatchStatus,
+        actioned_at: datetime | None = None,
+    ) -> None:
+        """Set the status and action time of one match."""
+        session = self.get(session_id)
+        if session is None:
+            return
+        for match in session.matches:
+            if match.id == match_id:
+                match.status = status
+                match.actioned_at = actioned_at
+        self.update(session)
 
     @abstractmethod
     def delete(self, session_id: UUID) -> None:
@@ -322,6 +755,10 @@ class ExchangeRateRepository(ABC):
         """Get exchange rate by ID."""
         pass
 
+    def get_many(self, rate_ids: Iterable[UUID]) -> dict[UUID, ExchangeRate]:
+        """Get exchange rates by ID, keyed by ID."""
+        return _get_each(self.get, rate_ids)
+
     @abstractmethod
     def get_rate(
         self,
@@ -357,6 +794,11 @@ class ExchangeRateRepository(ABC):
         """List all exchange rates for a specific date."""
         pass
 
+    @abstractmethod
+    def list_currency_pairs(self) -> list[tuple[str, str]]:
+        """List every (from_currency, to_currency) pair that has a rate."""
+        pass
+
     @abstractmethod
     def delete(self, rate_id: UUID) -> None:
         """Delete an exchange rate."""
@@ -376,6 +818,10 @@ class VendorRepository(ABC):
         """Get vendor by ID."""
         pass
 
+    def get_many(self, vendor_ids: Iterable[UUID]) -> dict[UUID, Vendor]:
+        """Get vendors by ID, keyed by ID."""
+        return _get_each(self.get, vendor_ids)
+
     @abstractmethod
     def update(self, vendor: Vendor) -> None:
         """Update an existing vendor."""
@@ -401,6 +847,24 @@ class VendorRepository(ABC):
         """Search vendors by name pattern."""
         pass
 
+    def search(self, query: str, limit: int = 50) -> list[Vendor]:
+        """Search active vendors by the words of their name and notes.
+
+        Every word of ``query`` must start a word of the name or notes.
+        Results are ranked by relevance in SQL-backed repositories; this
+        default scans every vendor and orders matches by name.
+        """
+        terms = _search_terms(query)
+        if not terms:
+            return []
+        matches = [
+            vendor
+            for vendor in self.list_all()
+            if _matches_terms(terms, vendor.name, vendor.notes)
+        ]
+        matches.sort(key=lambda vendor: vendor.name)
+        return matches[:limit]
+
     @abstractmethod
     def get_by_tax_id(self, tax_id: str) -> Vendor | None:
         """Get vendor by tax ID."""
@@ -416,6 +880,9 @@ class BudgetRepository(ABC):
     def get(self, budget_id: UUID) -> Budget | None:
         pass
 
+    def get_many(self, budget_ids: Iterable[UUID]) -> dict[UUID, Budget]:
+        return _get_each(self.get, budget_ids)
+
     @abstractmethod
     def update(self, budget: Budget) -> None:
         pass
@@ -460,6 +927,9 @@ class EntityOwnershipRepository(ABC):
     def get(self, ownership_id: UUID) -> EntityOwnership | None:
         pass
 
+    def get_many(self, ownership_ids: Iterable[UUID]) -> dict[UUID, EntityOwnership]:
+        return _get_each(self.get, ownership_ids)
+
     @abstractmethod
     def list_by_owner(
         self, owner_entity_id: UUID, as_of_date: date | None = None
@@ -483,3 +953,196 @@ class EntityOwnershipRepository(ABC):
     @abstractmethod
     def delete(self, ownership_id: UUID) -> None:
         pass
+
+
+class PeriodCloseRepository(ABC):
+    @abstractmethod
+    def add(self, period_close: PeriodClose) -> None:
+        """Store a closed period together with its closing balances."""
+        pass
+
+    @abstractmethod
+    def get(self, period_close_id: UUID) -> PeriodClose | None:
+        pass
+
+    @abstractmethod
+    def get_latest(
+        self, entity_id: UUID, as_of_date: date | None = None
+    ) -> PeriodClose | None:
+        """The entity's last period closed on or before ``as_of_date``."""
+        pass
+
+    @abstractmethod
+    def list_by_entity(self, entity_id: UUID) -> Iterable[PeriodClose]:
+        """The entity's closed periods, oldest first."""
+        pass
+
+    def closed_through(self, entity_ids: Iterable[UUID]) -> dict[UUID, date]:
+        """The end of the last closed period of each entity.
+
+        Entities without a closed period are left out. SQL-backed
+        repositories answer with one query instead of a ``get_latest`` per
+        entity, without loading the closing balances.
+        """
+        closed: dict[UUID, date] = {}
+        for entity_id in set(entity_ids):
+            latest = self.get_latest(entity_id)
+            if latest is not None:
+                closed[entity_id] = latest.period_end
+        return closed
+
+
+class LedgerVersionRepository(ABC):
+    """Monotonic version counters of the data the reports read.
+
+    Repositories bump the counter of every entity whose entities, accounts,
+    transactions, positions, tax lots, ownership or period closes they
+    write, and the ``GLOBAL_LEDGER_SCOPE`` counter on security and exchange
+    rate writes, in the same database transaction as the write. Exchange
+    rate writes also bump ``EXCHANGE_RATE_SCOPE``.
+    """
+
+    @abstractmethod
+    def ledger_version(self, entity_ids: Iterable[UUID] | None = None) -> int:
+        """A version that grows whenever data of ``entity_ids`` changes.
+
+        The sum of the counters of the entities and the global scope, or of
+        every counter if ``entity_ids`` is None. Counters only grow, so the
+        sum changes with any of them.
+        """
+        pass
+
+    @abstractmethod
+    def scope_version(self, scope: str) -> int:
+        """The counter of one scope, such as ``EXCHANGE_RATE_SCOPE``; 0 if unset."""
+        pass
+
+
+class ReportingViewRepository(ABC):
+    """Balances and position values precomputed for the reports.
+
+    The data is only as current as the last refresh, reported by
+    ``refreshed_at``; readers decide how stale is acceptable.
+    """
+
+    @abstractmethod
+    def refreshed_at(self) -> datetime | None:
+        """When the views were last refreshed, or None if never."""
+        pass
+
+    @abstractmethod
+    def account_balances(
+        self, account_ids: Iterable[UUID], as_of: date
+    ) -> dict[UUID, Decimal]:
+        """Debits minus credits per account up to ``as_of``, all currencies added.
+
+        Accounts without activity are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def entity_balances(
+        self, entity_ids: Iterable[UUID], as_of: date
+    ) -> list[EntityBalance]:
+        pass
+
+    @abstractmethod
+    def entity_activity(self, entity_ids: Iterable[UUID]) -> dict[UUID, EntityActivity]:
+        pass
+
+    @abstractmethod
+    def position_values(self, entity_ids: Iterable[UUID]) -> list[PositionValue]:
+        pass
+
+
+class AsyncEntityRepository(ABC):
+    """Coroutine counterpart of the ``EntityRepository`` reads."""
+
+    @abstractmethod
+    async def get(self, entity_id: UUID) -> Entity | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        pass
+
+    @abstractmethod
+    async def list_all(self) -> list[Entity]:
+        pass
+
+
+class AsyncAccountRepository(ABC):
+    """Coroutine counterpart of the ``AccountRepository`` reads."""
+
+    @abstractmethod
+    async def get(self, account_id: UUID) -> Account | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        pass
+
+    @abstractmethod
+    async def list_by_entity(self, entity_id: UUID) -> list[Account]:
+        pass
+
+
+class AsyncPeriodCloseRepository(ABC):
+    """Coroutine counterpart of the ``PeriodCloseRepository`` lock check."""
+
+    @abstractmethod
+    async def closed_through(self, entity_ids: Iterable[UUID]) -> dict[UUID, date]:
+        """See ``PeriodCloseRepository.closed_through``."""
+        pass
+
+
+class AsyncLedgerVersionRepository(ABC):
+    """Coroutine counterpart of ``LedgerVersionRepository``."""
+
+    @abstractmethod
+    async def ledger_version(self, entity_ids: Iterable[UUID] | None = None) -> int:
+        """See ``LedgerVersionRepository.ledger_version``."""
+        pass
+
+
+class AsyncTransactionRepository(ABC):
+    """Coroutine counterpart of the ``TransactionRepository`` methods used
+    to post transactions and serve the dashboard reports."""
+
+    async def add(self, txn: Transaction) -> None:
+        await self.add_many([txn])
+
+    @abstractmethod
+    async def add_many(self, txns: Iterable[Transaction]) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, txn_id: UUID) -> Transaction | None:
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self,
+        account_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        """See ``TransactionRepository.list_page``."""
+        pass
+
+    @abstractmethod
+    async def count_by_entity(self, entity_id: UUID) -> int:
+        """Number of transactions with an entry in one of the entity's accounts."""
+        pass
+
+    @abstractmethod
+    async def sum_by_account(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> list[AccountTotals]:
+        """Debit/credit totals per account and currency up to ``as_of``.
+
+        See ``TransactionRepository.sum_by_account``.
+        """
+        pass
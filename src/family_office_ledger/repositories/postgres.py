@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import functools
 import json
-from collections.abc import Iterable
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any
-from uuid import UUID
+from enum import Enum
+from typing import Any, TextIO, cast
+from uuid import UUID, uuid4
 
 import psycopg2
 import psycopg2.extras
@@ -17,13 +24,28 @@ from family_office_ledger.domain.entities import Account, Entity, Position, Secu
 from family_office_ledger.domain.exchange_rates import ExchangeRate, ExchangeRateSource
 from family_office_ledger.domain.households import Household, HouseholdMember
 from family_office_ledger.domain.ownership import EntityOwnership, SelfOwnershipError
+from family_office_ledger.domain.periods import PeriodClose, check_period_open
 from family_office_ledger.domain.reconciliation import (
     ReconciliationMatch,
     ReconciliationMatchStatus,
     ReconciliationSession,
     ReconciliationSessionStatus,
 )
-from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+from family_office_ledger.domain.report_views import (
+    EntityActivity,
+    EntityBalance,
+    PositionValue,
+)
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    AccountTotalsAccumulator,
+    BalanceSnapshotDiscrepancy,
+    Entry,
+    TaxLot,
+    Transaction,
+    balance_snapshot_changes,
+    totals_by_date,
+)
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
     AccountType,
@@ -33,78 +55,887 @@ from family_office_ledger.domain.value_objects import (
     Money,
     Quantity,
     TaxTreatment,
+    to_minor_units,
 )
 from family_office_ledger.domain.vendors import Vendor
+from family_office_ledger.logging_config import get_logger
 from family_office_ledger.repositories.interfaces import (
+    EXCHANGE_RATE_SCOPE,
+    GLOBAL_LEDGER_SCOPE,
     AccountRepository,
     BudgetRepository,
     EntityOwnershipRepository,
     EntityRepository,
     ExchangeRateRepository,
     HouseholdRepository,
+    LedgerVersionRepository,
+    PeriodCloseRepository,
     PositionRepository,
     ReconciliationSessionRepository,
+    ReportingViewRepository,
     SecurityRepository,
     TaxLotRepository,
     TransactionRepository,
     VendorRepository,
+    _carry_forward,
+    _search_terms,
+    _totals_change,
+)
+
+logger = get_logger(__name__)
+
+# UUID columns are read back as ``uuid.UUID`` and UUID parameters, including
+# lists of them bound to ``= ANY(%s)``, are sent as ``uuid`` / ``uuid[]``.
+psycopg2.extras.register_uuid()  # type: ignore[no-untyped-call]
+
+# Rows fetched per round trip by the streaming ``iter_by_*`` readers.
+_STREAM_CHUNK_SIZE = 1000
+
+# Native type of every id, date, timestamp and amount column. Databases
+# created before these types were used store them all as TEXT and are
+# converted by ``PostgresDatabase.migrate_to_native_types``.
+_NATIVE_COLUMN_TYPES: dict[str, dict[str, str]] = {
+    "entities": {
+        "id": "UUID",
+        "fiscal_year_end": "DATE",
+        "formation_date": "DATE",
+        "created_at": "TIMESTAMPTZ",
+        "updated_at": "TIMESTAMPTZ",
+    },
+    "households": {
+        "id": "UUID",
+        "primary_contact_entity_id": "UUID",
+        "created_at": "TIMESTAMPTZ",
+        "updated_at": "TIMESTAMPTZ",
+    },
+    "household_members": {
+        "id": "UUID",
+        "household_id": "UUID",
+        "entity_id": "UUID",
+        "effective_start_date": "DATE",
+        "effective_end_date": "DATE",
+        "created_at": "TIMESTAMPTZ",
+    },
+    "entity_ownership": {
+        "id": "UUID",
+        "owner_entity_id": "UUID",
+        "owned_entity_id": "UUID",
+        "ownership_fraction": "NUMERIC(28,10)",
+        "effective_start_date": "DATE",
+        "effective_end_date": "DATE",
+        "created_at": "TIMESTAMPTZ",
+        "updated_at": "TIMESTAMPTZ",
+    },
+    "accounts": {"id": "UUID", "entity_id": "UUID", "created_at": "TIMESTAMPTZ"},
+    "securities": {"id": "UUID", "qsbs_qualification_date": "DATE"},
+    "positions": {
+        "id": "UUID",
+        "account_id": "UUID",
+        "security_id": "UUID",
+        "quantity": "NUMERIC(28,10)",
+        "cost_basis_amount": "NUMERIC(28,10)",
+        "market_value_amount": "NUMERIC(28,10)",
+    },
+    "transactions": {
+        "id": "UUID",
+        "transaction_date": "DATE",
+        "posted_date": "DATE",
+        "created_by": "UUID",
+        "created_at": "TIMESTAMPTZ",
+        "reverses_transaction_id": "UUID",
+        "vendor_id": "UUID",
+    },
+    "tax_lots": {
+        "id": "UUID",
+        "position_id": "UUID",
+        "acquisition_date": "DATE",
+        "cost_per_share_amount": "NUMERIC(28,10)",
+        "original_quantity": "NUMERIC(28,10)",
+        "remaining_quantity": "NUMERIC(28,10)",
+        "disposition_date": "DATE",
+        "wash_sale_adjustment_amount": "NUMERIC(28,10)",
+        "created_at": "TIMESTAMPTZ",
+    },
+    "entries": {
+        "id": "UUID",
+        "transaction_id": "UUID",
+        "account_id": "UUID",
+        "debit_amount": "NUMERIC(28,10)",
+        "credit_amount": "NUMERIC(28,10)",
+        "tax_lot_id": "UUID",
+    },
+    "reconciliation_sessions": {
+        "id": "UUID",
+        "account_id": "UUID",
+        "created_at": "TIMESTAMPTZ",
+        "closed_at": "TIMESTAMPTZ",
+    },
+    "reconciliation_matches": {
+        "id": "UUID",
+        "session_id": "UUID",
+        "imported_date": "DATE",
+        "imported_amount": "NUMERIC(28,10)",
+        "suggested_ledger_txn_id": "UUID",
+        "actioned_at": "TIMESTAMPTZ",
+        "created_at": "TIMESTAMPTZ",
+    },
+    "exchange_rates": {
+        "id": "UUID",
+        "rate": "NUMERIC(28,10)",
+        "effective_date": "DATE",
+        "created_at": "TIMESTAMPTZ",
+    },
+    "vendors": {
+        "id": "UUID",
+        "default_account_id": "UUID",
+        "created_at": "TIMESTAMPTZ",
+        "updated_at": "TIMESTAMPTZ",
+    },
+    "budgets": {
+        "id": "UUID",
+        "entity_id": "UUID",
+        "start_date": "DATE",
+        "end_date": "DATE",
+        "created_at": "TIMESTAMPTZ",
+        "updated_at": "TIMESTAMPTZ",
+    },
+    "budget_line_items": {
+        "id": "UUID",
+        "budget_id": "UUID",
+        "budgeted_amount": "NUMERIC(28,10)",
+        "account_id": "UUID",
+    },
+    "account_balance_snapshots": {
+        "account_id": "UUID",
+        "snapshot_date": "DATE",
+        "debit_total": "NUMERIC(28,10)",
+        "credit_total": "NUMERIC(28,10)",
+    },
+}
+
+
+def _numeric(value: Decimal) -> Decimal:
+    """Drop the trailing zeros ``NUMERIC(28,10)`` pads every value with."""
+    if value == value.to_integral_value():
+        return value.quantize(Decimal(1))
+    return value.normalize()
+
+
+def _daily_totals_sql(entries: str, transactions: str) -> str:
+    """SELECT of the posted debit and credit totals per account, currency and day.
+
+    Only the side of an entry that carries an amount counts, in its own
+    currency, as in ``Transaction.totals_by_account``.
+    """
+    return f"""
+        SELECT account_id, currency, snapshot_date,
+               SUM(debit) AS debit, SUM(credit) AS credit
+        FROM (
+            SELECT e.account_id, e.debit_currency AS currency,
+                   t.transaction_date AS snapshot_date,
+                   e.debit_amount AS debit, 0 AS credit
+            FROM {entries} e JOIN {transactions} t ON t.id = e.transaction_id
+            WHERE e.debit_amount <> 0
+            UNION ALL
+            SELECT e.account_id, e.credit_currency, t.transaction_date,
+                   0, e.credit_amount
+            FROM {entries} e JOIN {transactions} t ON t.id = e.transaction_id
+            WHERE e.credit_amount <> 0
+        ) posted
+        GROUP BY account_id, currency, snapshot_date
+    """
+
+
+# Running (account, currency, date) totals, as stored in
+# ``account_balance_snapshots``, recomputed from the entries.
+_RUNNING_TOTALS_SQL = f"""
+    SELECT account_id, currency, snapshot_date,
+           SUM(debit) OVER running AS debit_total,
+           SUM(credit) OVER running AS credit_total
+    FROM ({_daily_totals_sql("entries", "transactions")}) daily
+    WINDOW running AS (PARTITION BY account_id, currency ORDER BY snapshot_date)
+"""
+
+
+def _search_document(column: str, weight: str) -> str:
+    """Weighted tsvector of ``column``, split into words like ``_search_terms``.
+
+    Punctuation becomes spaces first, so "INV-42" is indexed as "inv" and
+    "42" rather than as one hyphenated word.
+    """
+    text = f"regexp_replace({column}, '\\W+', ' ', 'g')"
+    return f"setweight(to_tsvector('simple', {text}), '{weight}')"
+
+
+# Matches ranked by ``PostgresTransactionRepository.search``: the most
+# recent ones, so a common word costs a bounded number of ``ts_rank`` calls.
+_SEARCH_CANDIDATES = 1000
+
+# Full-text documents of transactions and vendors. The GIN indexes created
+# in ``initialize`` are over these exact expressions, so queries must repeat
+# them verbatim to use the indexes.
+_TRANSACTION_SEARCH_VECTOR = "({})".format(
+    " || ".join(
+        [
+            _search_document("memo", "A"),
+            _search_document("reference", "B"),
+            _search_document("coalesce(category, '')", "C"),
+        ]
+    )
+)
+_VENDOR_SEARCH_VECTOR = "({})".format(
+    " || ".join(
+        [
+            _search_document("name", "A"),
+            _search_document("coalesce(notes, '')", "B"),
+        ]
+    )
 )
 
 
-class PostgresDatabase:
-    """PostgreSQL database connection manager."""
+def _tsquery(query: str) -> str | None:
+    """``to_tsquery`` text requiring a word prefix per query word.
+
+    Returns None when ``query`` has no words. Only word characters reach
+    the tsquery, so operators in user input are never parsed as syntax.
+    """
+    terms = _search_terms(query)
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _fetch_dicts(cur: psycopg2.extensions.cursor) -> list[dict[str, Any]]:
+    """``cur.fetchall()``, typed as the dicts ``RealDictCursor`` returns."""
+    return cast(list[dict[str, Any]], cur.fetchall())
+
+
+def _fetch_dict(cur: psycopg2.extensions.cursor) -> dict[str, Any] | None:
+    """``cur.fetchone()``, typed as the dict ``RealDictCursor`` returns."""
+    return cast("dict[str, Any] | None", cur.fetchone())
+
+
+# Snapshots of one (account_id, currency) on or after, and just before, a day.
+_LATER_SNAPSHOTS_SQL = """
+    SELECT snapshot_date, debit_total, credit_total
+    FROM account_balance_snapshots
+    WHERE account_id = %s AND currency = %s AND snapshot_date >= %s
+    ORDER BY snapshot_date
+"""
+
+_PREVIOUS_SNAPSHOT_SQL = """
+    SELECT debit_total, credit_total FROM account_balance_snapshots
+    WHERE account_id = %s AND currency = %s AND snapshot_date < %s
+    ORDER BY snapshot_date DESC LIMIT 1
+"""
+
+
+def _check_periods_open(
+    cur: psycopg2.extensions.cursor,
+    postings: Iterable[tuple[date, list[UUID]]],
+    account_ids: Iterable[UUID],
+) -> None:
+    """Reject postings, ``(date, account ids)`` pairs, inside a closed period.
 
-    def __init__(self, connection_string: str) -> None:
+    Reads the end of the last closed period of the entity of each of
+    ``account_ids`` and raises ``PeriodClosedError`` for the first posting
+    dated on or before it.
+    """
+    cur.execute(
+        """
+        SELECT a.id, a.entity_id, MAX(pc.period_end) AS period_end
+        FROM accounts a JOIN period_closes pc ON pc.entity_id = a.entity_id
+        WHERE a.id = ANY(%s::uuid[])
+        GROUP BY a.id, a.entity_id
+        """,
+        ([str(account_id) for account_id in account_ids],),
+    )
+    closed = {
+        row["id"]: (row["entity_id"], row["period_end"]) for row in _fetch_dicts(cur)
+    }
+    if not closed:
+        return
+    for txn_date, posted in postings:
+        check_period_open(txn_date, posted, closed)
+
+
+# Scopes whose ledger version a write bumps, selected from ids bound as a
+# text array: the ids themselves (entities or ``GLOBAL_LEDGER_SCOPE``), or
+# the entities owning the accounts, positions, transaction entries or
+# ownership edges with those ids.
+_ENTITY_SCOPES_SQL = "SELECT unnest(%(ids)s::text[]) AS scope"
+
+_ACCOUNT_SCOPES_SQL = """
+    SELECT entity_id::text AS scope FROM accounts WHERE id = ANY(%(ids)s::uuid[])
+"""
+
+_POSITION_SCOPES_SQL = """
+    SELECT a.entity_id::text AS scope FROM positions p
+    JOIN accounts a ON a.id = p.account_id
+    WHERE p.id = ANY(%(ids)s::uuid[])
+"""
+
+_TRANSACTION_SCOPES_SQL = """
+    SELECT a.entity_id::text AS scope FROM entries e
+    JOIN accounts a ON a.id = e.account_id
+    WHERE e.transaction_id = ANY(%(ids)s::uuid[])
+"""
+
+_OWNERSHIP_SCOPES_SQL = """
+    SELECT owner_entity_id::text AS scope FROM entity_ownership
+    WHERE id = ANY(%(ids)s::uuid[])
+    UNION
+    SELECT owned_entity_id::text FROM entity_ownership
+    WHERE id = ANY(%(ids)s::uuid[])
+"""
+
+
+def _bump_ledger_versions(
+    cur: psycopg2.extensions.cursor, scopes_sql: str, ids: Iterable[object]
+) -> None:
+    """Bump the ledger version of each scope ``scopes_sql`` selects for ``ids``.
+
+    Repositories call this on the writing cursor before committing, so a
+    version only moves together with the data it covers. Rows are upserted
+    in scope order, so concurrent writers lock them in the same order.
+    """
+    cur.execute(
+        f"""
+        INSERT INTO ledger_versions (scope, version)
+        SELECT DISTINCT scope, 1 FROM ({scopes_sql}) scopes
+        WHERE scope IS NOT NULL ORDER BY scope
+        ON CONFLICT (scope) DO UPDATE SET version = ledger_versions.version + 1
+        """,
+        {"ids": [str(key) for key in ids]},
+    )
+
+
+def _select_by_ids(
+    conn: psycopg2.extensions.connection,
+    table: str,
+    ids: Iterable[UUID],
+    column: str = "id",
+) -> list[dict[str, Any]]:
+    """Fetch the rows of ``table`` whose ``column`` is in ``ids``.
+
+    The ids are bound as a single array parameter to ``= ANY(%s)``.
+    """
+    keys = list(dict.fromkeys(ids))
+    if not keys:
+        return []
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT * FROM {table} WHERE {column} = ANY(%s)", (keys,))
+        return _fetch_dicts(cur)
+
+
+# Column order of the ``*_row`` tuples below, shared by the INSERTs of the
+# ``add_many`` methods and the COPY statements of ``PostgresBulkLoader``.
+_POSITION_COLUMNS = (
+    "id",
+    "account_id",
+    "security_id",
+    "quantity",
+    "cost_basis_amount",
+    "cost_basis_currency",
+    "market_value_amount",
+    "market_value_currency",
+)
+_TRANSACTION_COLUMNS = (
+    "id",
+    "transaction_date",
+    "posted_date",
+    "memo",
+    "reference",
+    "created_by",
+    "created_at",
+    "is_reversed",
+    "reverses_transaction_id",
+    "category",
+    "tags",
+    "vendor_id",
+    "is_recurring",
+    "recurring_frequency",
+)
+_ENTRY_COLUMNS = (
+    "id",
+    "transaction_id",
+    "account_id",
+    "debit_amount",
+    "debit_currency",
+    "credit_amount",
+    "credit_currency",
+    "memo",
+    "tax_lot_id",
+    "category",
+    "debit_amount_minor",
+    "credit_amount_minor",
+)
+_TAX_LOT_COLUMNS = (
+    "id",
+    "position_id",
+    "acquisition_date",
+    "cost_per_share_amount",
+    "cost_per_share_currency",
+    "original_quantity",
+    "remaining_quantity",
+    "acquisition_type",
+    "disposition_date",
+    "is_covered",
+    "wash_sale_disallowed",
+    "wash_sale_adjustment_amount",
+    "wash_sale_adjustment_currency",
+    "reference",
+    "created_at",
+)
+
+
+def _position_row(position: Position) -> tuple[Any, ...]:
+    return (
+        position.id,
+        position.account_id,
+        position.security_id,
+        position.quantity.value,
+        position.cost_basis.amount,
+        position.cost_basis.currency,
+        position.market_value.amount,
+        position.market_value.currency,
+    )
+
+
+def _transaction_row(txn: Transaction) -> tuple[Any, ...]:
+    return (
+        txn.id,
+        txn.transaction_date,
+        txn.posted_date,
+        txn.memo,
+        txn.reference,
+        txn.created_by,
+        txn.created_at,
+        txn.is_reversed,
+        txn.reverses_transaction_id,
+        txn.category,
+        json.dumps(txn.tags) if txn.tags else None,
+        txn.vendor_id,
+        txn.is_recurring,
+        txn.recurring_frequency,
+    )
+
+
+def _entry_row(txn: Transaction, entry: Entry) -> tuple[Any, ...]:
+    return (
+        entry.id,
+        txn.id,
+        entry.account_id,
+        entry.debit_amount.amount,
+        entry.debit_amount.currency,
+        entry.credit_amount.amount,
+        entry.credit_amount.currency,
+        entry.memo,
+        entry.tax_lot_id,
+        entry.category,
+        to_minor_units(entry.debit_amount.amount),
+        to_minor_units(entry.credit_amount.amount),
+    )
+
+
+def _tax_lot_row(lot: TaxLot) -> tuple[Any, ...]:
+    return (
+        lot.id,
+        lot.position_id,
+        lot.acquisition_date,
+        lot.cost_per_share.amount,
+        lot.cost_per_share.currency,
+        lot.original_quantity.value,
+        lot.remaining_quantity.value,
+        lot.acquisition_type.value,
+        lot.disposition_date,
+        lot.is_covered,
+        lot.wash_sale_disallowed,
+        lot.wash_sale_adjustment.amount,
+        lot.wash_sale_adjustment.currency,
+        lot.reference,
+        lot.created_at,
+    )
+
+
+class PostgresConnectionPool:
+    """Thread-safe pool of psycopg2 connections.
+
+    At most ``max_size`` connections are open at once; ``checkout`` blocks
+    for up to ``timeout`` seconds when all of them are in use and then
+    raises ``TimeoutError``. The first checkout opens ``min_size``
+    connections, and idle connections beyond that are closed once they have
+    gone unused for ``max_idle`` seconds. A connection that has been idle for
+    ``health_check_interval`` seconds is pinged with ``SELECT 1`` before it
+    is handed out, and broken connections are replaced transparently.
+    Returned connections are rolled back if they still hold a transaction.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], psycopg2.extensions.connection],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        max_idle: float = 600.0,
+    ) -> None:
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size")
+        self._connect = connect
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+        self._max_idle = max_idle
+        self._cond = threading.Condition()
+        # Idle connections with the monotonic time they were returned, LIFO.
+        self._idle: list[tuple[psycopg2.extensions.connection, float]] = []
+        self._size = 0
+        self._filled = False
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Connections currently open, idle or checked out."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def checkout(self) -> psycopg2.extensions.connection:
+        """Take a healthy connection from the pool, opening one if needed."""
+        if not self._filled:
+            self._fill()
+        deadline = time.monotonic() + self._timeout
+        while True:
+            conn, idle_since = self._acquire(deadline)
+            if conn is None:
+                return self._open()
+            if self._is_healthy(conn, idle_since):
+                return conn
+            self._discard(conn)
+
+    def checkin(self, conn: psycopg2.extensions.connection) -> None:
+        """Return a connection, rolling back any transaction it left open."""
+        if not conn.closed and (
+            conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        ):
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                conn.close()
+        if conn.closed or self._closed:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Check out a connection for the duration of the block."""
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed on return."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            conn.close()
+
+    def _fill(self) -> None:
+        with self._cond:
+            if self._filled:
+                return
+            self._filled = True
+            missing = max(0, self._min_size - self._size)
+            self._size += missing
+        opened: list[tuple[psycopg2.extensions.connection, float]] = []
+        try:
+            for _ in range(missing):
+                opened.append((self._connect(), time.monotonic()))
+        finally:
+            with self._cond:
+                if len(opened) < missing:
+                    # Warm the pool again on the next checkout.
+                    self._filled = False
+                self._size -= missing - len(opened)
+                self._idle.extend(opened)
+                self._cond.notify_all()
+
+    def _acquire(
+        self, deadline: float
+    ) -> tuple[psycopg2.extensions.connection | None, float]:
+        """Pop an idle connection, or reserve a slot for a new one (None)."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                self._trim_idle()
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self._max_size:
+                    self._size += 1
+                    return None, 0.0
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No Postgres connection available after {self._timeout}s "
+                        f"(max_size={self._max_size})"
+                    )
+                self._cond.wait(remaining)
+
+    def _trim_idle(self) -> None:
+        """Close the oldest idle connections above ``min_size``; lock held."""
+        cutoff = time.monotonic() - self._max_idle
+        while self._idle and self._size > self._min_size and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.pop(0)
+            self._size -= 1
+            conn.close()
+
+    def _open(self) -> psycopg2.extensions.connection:
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _is_healthy(
+        self, conn: psycopg2.extensions.connection, idle_since: float
+    ) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self._health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def _discard(self, conn: psycopg2.extensions.connection) -> None:
+        if not conn.closed:
+            conn.close()
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+
+class _ConnectionScope:
+    """The pooled connection held by one unit of work, and its nesting."""
+
+    __slots__ = ("connection", "unit_of_work_depth")
+
+    def __init__(self) -> None:
+        self.connection: psycopg2.extensions.connection | None = None
+        self.unit_of_work_depth = 0
+
+
+def _connect(connection_string: str) -> psycopg2.extensions.connection:
+    conn = psycopg2.connect(
+        connection_string, cursor_factory=psycopg2.extras.RealDictCursor
+    )
+    # TIMESTAMPTZ values are read back as UTC datetimes, as they are written.
+    with conn.cursor() as cur:
+        cur.execute("SET TIME ZONE 'UTC'")
+    conn.commit()
+    return conn
+
+
+class PostgresDatabase:
+    """PostgreSQL database connection manager.
+
+    Connections come from a :class:`PostgresConnectionPool`. Wrap each unit
+    of work (an API request, a CLI command, a report) in :meth:`scope`,
+    :meth:`connection` or :meth:`unit_of_work`: the first repository call
+    inside the block checks out a connection, every later call uses it, and
+    it goes back to the pool when the block exits, so concurrent requests
+    never share a transaction. The scope lives in a context variable, so it
+    is also seen by sync code that the block hands to a worker thread (as
+    FastAPI does with sync endpoints). ``get_connection()`` outside any
+    scope pins a connection to the calling thread until :meth:`release` or
+    :meth:`close`, as the single shared connection used to be held.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
         self._connection_string = connection_string
-        self._connection: psycopg2.extensions.connection | None = None
+        self._pool = PostgresConnectionPool(
+            functools.partial(_connect, connection_string),
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            health_check_interval=health_check_interval,
+        )
+        self._scope: contextvars.ContextVar[_ConnectionScope | None] = (
+            contextvars.ContextVar(f"postgres_scope_{id(self)}", default=None)
+        )
+        self._local = threading.local()
+
+    @property
+    def pool(self) -> PostgresConnectionPool:
+        return self._pool
+
+    def _current_scope(self) -> _ConnectionScope:
+        scope = self._scope.get()
+        if scope is None:
+            scope = getattr(self._local, "scope", None)
+            if scope is None:
+                scope = self._local.scope = _ConnectionScope()
+        return scope
+
+    @property
+    def _unit_of_work_depth(self) -> int:
+        return self._current_scope().unit_of_work_depth
+
+    @_unit_of_work_depth.setter
+    def _unit_of_work_depth(self, depth: int) -> None:
+        self._current_scope().unit_of_work_depth = depth
 
     def get_connection(self) -> psycopg2.extensions.connection:
-        """Get or create the database connection."""
-        if self._connection is None or self._connection.closed:
-            self._connection = psycopg2.connect(
-                self._connection_string,
-                cursor_factory=psycopg2.extras.RealDictCursor,
-            )
-        return self._connection
+        """Get the current scope's connection, checking one out if needed."""
+        scope = self._current_scope()
+        conn = scope.connection
+        if conn is None or conn.closed:
+            if conn is not None:
+                self._pool.checkin(conn)
+            conn = scope.connection = self._pool.checkout()
+        return conn
+
+    @contextlib.contextmanager
+    def scope(self) -> Iterator[None]:
+        """Share one lazily checked-out connection across the block.
+
+        Nested scopes join the enclosing one, which returns the connection.
+        """
+        if self._scope.get() is not None:
+            yield
+            return
+        scope = _ConnectionScope()
+        token = self._scope.set(scope)
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+            if scope.connection is not None:
+                self._pool.checkin(scope.connection)
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Check out a connection for the block, as :meth:`scope` does."""
+        with self.scope():
+            yield self.get_connection()
+
+    def release(self) -> None:
+        """Return the connection pinned to the calling thread, if any."""
+        scope: _ConnectionScope | None = getattr(self._local, "scope", None)
+        if scope is not None and scope.connection is not None:
+            conn, scope.connection = scope.connection, None
+            self._pool.checkin(conn)
+
+    def reader(self) -> PostgresDatabase:
+        """Return the database used for report queries.
+
+        PostgreSQL readers already see a consistent MVCC snapshot without
+        blocking writers, so this is the database itself.
+        """
+        return self
+
+    def commit(self) -> None:
+        """Commit pending writes unless a unit of work is open.
+
+        Repositories call this instead of ``conn.commit()`` so that writes
+        issued inside :meth:`unit_of_work` are committed once, at its end.
+        """
+        if self._unit_of_work_depth == 0:
+            self.get_connection().commit()
+
+    @contextlib.contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group repository writes into a single database transaction.
+
+        Commits when the outermost block exits normally and rolls back every
+        write made inside it if an exception escapes. Nested blocks join the
+        enclosing unit of work. One pooled connection serves the whole block.
+        """
+        with self.connection() as conn:
+            self._unit_of_work_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._unit_of_work_depth -= 1
+                if self._unit_of_work_depth == 0:
+                    conn.rollback()
+                raise
+            self._unit_of_work_depth -= 1
+            if self._unit_of_work_depth == 0:
+                conn.commit()
 
     def initialize(self) -> None:
-        """Create all database tables."""
+        """Create all database tables.
+
+        Tables created by earlier versions, which stored ids, dates and
+        amounts as TEXT, are first converted with
+        :meth:`migrate_to_native_types`, so new tables can reference them.
+        """
+        self.migrate_to_native_types()
         conn = self.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 """
                 -- Entities table
                 CREATE TABLE IF NOT EXISTS entities (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     name TEXT NOT NULL UNIQUE,
                     entity_type TEXT NOT NULL,
-                    fiscal_year_end TEXT NOT NULL,
+                    fiscal_year_end DATE NOT NULL,
                     is_active BOOLEAN NOT NULL DEFAULT TRUE,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
+                    created_at TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL
                 );
 
                 -- Households table
                 CREATE TABLE IF NOT EXISTS households (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     name TEXT NOT NULL UNIQUE,
-                    primary_contact_entity_id TEXT,
+                    primary_contact_entity_id UUID,
                     is_active BOOLEAN NOT NULL DEFAULT TRUE,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL,
                     FOREIGN KEY (primary_contact_entity_id) REFERENCES entities(id)
                 );
 
                 -- Household members table
                 CREATE TABLE IF NOT EXISTS household_members (
-                    id TEXT PRIMARY KEY,
-                    household_id TEXT NOT NULL,
-                    entity_id TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    household_id UUID NOT NULL,
+                    entity_id UUID NOT NULL,
                     role TEXT,
                     display_name TEXT,
-                    effective_start_date TEXT,
-                    effective_end_date TEXT,
-                    created_at TEXT NOT NULL,
+                    effective_start_date DATE,
+                    effective_end_date DATE,
+                    created_at TIMESTAMPTZ NOT NULL,
                     UNIQUE(household_id, entity_id, effective_start_date),
                     FOREIGN KEY (household_id) REFERENCES households(id),
                     FOREIGN KEY (entity_id) REFERENCES entities(id)
@@ -114,17 +945,17 @@ class PostgresDatabase:
 
                 -- Entity ownership edges table
                 CREATE TABLE IF NOT EXISTS entity_ownership (
-                    id TEXT PRIMARY KEY,
-                    owner_entity_id TEXT NOT NULL,
-                    owned_entity_id TEXT NOT NULL,
-                    ownership_fraction TEXT NOT NULL,
-                    effective_start_date TEXT NOT NULL,
-                    effective_end_date TEXT,
+                    id UUID PRIMARY KEY,
+                    owner_entity_id UUID NOT NULL,
+                    owned_entity_id UUID NOT NULL,
+                    ownership_fraction NUMERIC(28,10) NOT NULL,
+                    effective_start_date DATE NOT NULL,
+                    effective_end_date DATE,
                     ownership_basis TEXT NOT NULL DEFAULT 'percent',
                     ownership_type TEXT NOT NULL DEFAULT 'beneficial',
                     notes TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL,
                     FOREIGN KEY (owner_entity_id) REFERENCES entities(id),
                     FOREIGN KEY (owned_entity_id) REFERENCES entities(id),
                     CHECK (owner_entity_id != owned_entity_id)
@@ -135,42 +966,42 @@ class PostgresDatabase:
 
                 -- Accounts table
                 CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     name TEXT NOT NULL,
-                    entity_id TEXT NOT NULL,
+                    entity_id UUID NOT NULL,
                     account_type TEXT NOT NULL,
                     sub_type TEXT NOT NULL,
                     currency TEXT NOT NULL DEFAULT 'USD',
                     is_investment_account BOOLEAN NOT NULL DEFAULT FALSE,
                     is_active BOOLEAN NOT NULL DEFAULT TRUE,
-                    created_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
                     UNIQUE(name, entity_id),
                     FOREIGN KEY (entity_id) REFERENCES entities(id)
                 );
 
                 -- Securities table
                 CREATE TABLE IF NOT EXISTS securities (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     symbol TEXT NOT NULL UNIQUE,
                     name TEXT NOT NULL,
                     cusip TEXT,
                     isin TEXT,
                     asset_class TEXT NOT NULL,
                     is_qsbs_eligible BOOLEAN NOT NULL DEFAULT FALSE,
-                    qsbs_qualification_date TEXT,
+                    qsbs_qualification_date DATE,
                     issuer TEXT,
                     is_active BOOLEAN NOT NULL DEFAULT TRUE
                 );
 
                 -- Positions table
                 CREATE TABLE IF NOT EXISTS positions (
-                    id TEXT PRIMARY KEY,
-                    account_id TEXT NOT NULL,
-                    security_id TEXT NOT NULL,
-                    quantity TEXT NOT NULL,
-                    cost_basis_amount TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    account_id UUID NOT NULL,
+                    security_id UUID NOT NULL,
+                    quantity NUMERIC(28,10) NOT NULL,
+                    cost_basis_amount NUMERIC(28,10) NOT NULL,
                     cost_basis_currency TEXT NOT NULL,
-                    market_value_amount TEXT NOT NULL,
+                    market_value_amount NUMERIC(28,10) NOT NULL,
                     market_value_currency TEXT NOT NULL,
                     UNIQUE(account_id, security_id),
                     FOREIGN KEY (account_id) REFERENCES accounts(id),
@@ -179,49 +1010,49 @@ class PostgresDatabase:
 
                 -- Transactions table
                 CREATE TABLE IF NOT EXISTS transactions (
-                    id TEXT PRIMARY KEY,
-                    transaction_date TEXT NOT NULL,
-                    posted_date TEXT,
+                    id UUID PRIMARY KEY,
+                    transaction_date DATE NOT NULL,
+                    posted_date DATE,
                     memo TEXT NOT NULL DEFAULT '',
                     reference TEXT NOT NULL DEFAULT '',
-                    created_by TEXT,
-                    created_at TEXT NOT NULL,
+                    created_by UUID,
+                    created_at TIMESTAMPTZ NOT NULL,
                     is_reversed BOOLEAN NOT NULL DEFAULT FALSE,
-                    reverses_transaction_id TEXT,
+                    reverses_transaction_id UUID,
                     FOREIGN KEY (reverses_transaction_id) REFERENCES transactions(id)
                 );
 
                 -- Tax lots table (must be before entries due to FK)
                 CREATE TABLE IF NOT EXISTS tax_lots (
-                    id TEXT PRIMARY KEY,
-                    position_id TEXT NOT NULL,
-                    acquisition_date TEXT NOT NULL,
-                    cost_per_share_amount TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    position_id UUID NOT NULL,
+                    acquisition_date DATE NOT NULL,
+                    cost_per_share_amount NUMERIC(28,10) NOT NULL,
                     cost_per_share_currency TEXT NOT NULL,
-                    original_quantity TEXT NOT NULL,
-                    remaining_quantity TEXT NOT NULL,
+                    original_quantity NUMERIC(28,10) NOT NULL,
+                    remaining_quantity NUMERIC(28,10) NOT NULL,
                     acquisition_type TEXT NOT NULL,
-                    disposition_date TEXT,
+                    disposition_date DATE,
                     is_covered BOOLEAN NOT NULL DEFAULT TRUE,
                     wash_sale_disallowed BOOLEAN NOT NULL DEFAULT FALSE,
-                    wash_sale_adjustment_amount TEXT NOT NULL,
+                    wash_sale_adjustment_amount NUMERIC(28,10) NOT NULL,
                     wash_sale_adjustment_currency TEXT NOT NULL,
                     reference TEXT NOT NULL DEFAULT '',
-                    created_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
                     FOREIGN KEY (position_id) REFERENCES positions(id)
                 );
 
                 -- Entries table (for transaction entries)
                 CREATE TABLE IF NOT EXISTS entries (
-                    id TEXT PRIMARY KEY,
-                    transaction_id TEXT NOT NULL,
-                    account_id TEXT NOT NULL,
-                    debit_amount TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    transaction_id UUID NOT NULL,
+                    account_id UUID NOT NULL,
+                    debit_amount NUMERIC(28,10) NOT NULL,
                     debit_currency TEXT NOT NULL,
-                    credit_amount TEXT NOT NULL,
+                    credit_amount NUMERIC(28,10) NOT NULL,
                     credit_currency TEXT NOT NULL,
                     memo TEXT NOT NULL DEFAULT '',
-                    tax_lot_id TEXT,
+                    tax_lot_id UUID,
                     FOREIGN KEY (transaction_id) REFERENCES transactions(id) ON DELETE CASCADE,
                     FOREIGN KEY (account_id) REFERENCES accounts(id),
                     FOREIGN KEY (tax_lot_id) REFERENCES tax_lots(id)
@@ -229,96 +1060,125 @@ class PostgresDatabase:
 
                 -- Reconciliation sessions table
                 CREATE TABLE IF NOT EXISTS reconciliation_sessions (
-                    id TEXT PRIMARY KEY,
-                    account_id TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    account_id UUID NOT NULL,
                     file_name TEXT NOT NULL,
                     file_format TEXT NOT NULL,
                     status TEXT NOT NULL DEFAULT 'pending',
-                    created_at TEXT NOT NULL,
-                    closed_at TEXT
+                    created_at TIMESTAMPTZ NOT NULL,
+                    closed_at TIMESTAMPTZ
                 );
 
                 -- Reconciliation matches table
                 CREATE TABLE IF NOT EXISTS reconciliation_matches (
-                    id TEXT PRIMARY KEY,
-                    session_id TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    session_id UUID NOT NULL,
                     imported_id TEXT NOT NULL,
-                    imported_date TEXT NOT NULL,
-                    imported_amount TEXT NOT NULL,
+                    imported_date DATE NOT NULL,
+                    imported_amount NUMERIC(28,10) NOT NULL,
                     imported_description TEXT NOT NULL DEFAULT '',
-                    suggested_ledger_txn_id TEXT,
+                    suggested_ledger_txn_id UUID,
                     confidence_score INTEGER NOT NULL DEFAULT 0,
                     status TEXT NOT NULL DEFAULT 'pending',
-                    actioned_at TEXT,
-                    created_at TEXT NOT NULL,
+                    actioned_at TIMESTAMPTZ,
+                    created_at TIMESTAMPTZ NOT NULL,
                     FOREIGN KEY (session_id) REFERENCES reconciliation_sessions(id) ON DELETE CASCADE
                 );
 
                 -- Exchange rates table
                 CREATE TABLE IF NOT EXISTS exchange_rates (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     from_currency TEXT NOT NULL,
                     to_currency TEXT NOT NULL,
-                    rate TEXT NOT NULL,
-                    effective_date TEXT NOT NULL,
+                    rate NUMERIC(28,10) NOT NULL,
+                    effective_date DATE NOT NULL,
                     source TEXT NOT NULL,
-                    created_at TEXT NOT NULL
+                    created_at TIMESTAMPTZ NOT NULL
                 );
 
                 -- Vendors table
                 CREATE TABLE IF NOT EXISTS vendors (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     name TEXT NOT NULL,
                     category TEXT,
                     tax_id TEXT,
                     is_1099_eligible BOOLEAN NOT NULL DEFAULT FALSE,
-                    default_account_id TEXT,
+                    default_account_id UUID,
                     default_category TEXT,
                     contact_email TEXT,
                     contact_phone TEXT,
                     notes TEXT DEFAULT '',
                     is_active BOOLEAN NOT NULL DEFAULT TRUE,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
+                    created_at TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL
                 );
 
                 -- Budgets table
                 CREATE TABLE IF NOT EXISTS budgets (
-                    id TEXT PRIMARY KEY,
+                    id UUID PRIMARY KEY,
                     name TEXT NOT NULL,
-                    entity_id TEXT NOT NULL,
+                    entity_id UUID NOT NULL,
                     period_type TEXT NOT NULL,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
+                    start_date DATE NOT NULL,
+                    end_date DATE NOT NULL,
                     is_active BOOLEAN NOT NULL DEFAULT TRUE,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL,
                     FOREIGN KEY (entity_id) REFERENCES entities(id)
                 );
 
                 -- Budget line items table
                 CREATE TABLE IF NOT EXISTS budget_line_items (
-                    id TEXT PRIMARY KEY,
-                    budget_id TEXT NOT NULL,
+                    id UUID PRIMARY KEY,
+                    budget_id UUID NOT NULL,
                     category TEXT NOT NULL,
-                    budgeted_amount TEXT NOT NULL,
+                    budgeted_amount NUMERIC(28,10) NOT NULL,
                     budgeted_currency TEXT NOT NULL,
-                    account_id TEXT,
+                    account_id UUID,
                     notes TEXT DEFAULT '',
                     FOREIGN KEY (budget_id) REFERENCES budgets(id) ON DELETE CASCADE
                 );
 
+                -- Closed fiscal periods and their frozen closing balances
+                CREATE TABLE IF NOT EXISTS period_closes (
+                    id UUID PRIMARY KEY,
+                    entity_id UUID NOT NULL,
+                    period_end DATE NOT NULL,
+                    closing_transaction_id UUID,
+                    closed_at TIMESTAMPTZ NOT NULL,
+                    FOREIGN KEY (entity_id) REFERENCES entities(id)
+                );
+
+                -- Counters bumped by every write the reports can observe
+                CREATE TABLE IF NOT EXISTS ledger_versions (
+                    scope TEXT PRIMARY KEY,
+                    version BIGINT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS period_closing_balances (
+                    period_close_id UUID NOT NULL,
+                    account_id UUID NOT NULL,
+                    currency TEXT NOT NULL,
+                    debit_total NUMERIC(28,10) NOT NULL,
+                    credit_total NUMERIC(28,10) NOT NULL,
+                    PRIMARY KEY (period_close_id, account_id, currency),
+                    FOREIGN KEY (period_close_id) REFERENCES period_closes(id) ON DELETE CASCADE
+                );
+
                 -- Indexes for common queries
                 CREATE INDEX IF NOT EXISTS idx_accounts_entity_id ON accounts(entity_id);
                 CREATE INDEX IF NOT EXISTS idx_positions_account_id ON positions(account_id);
                 CREATE INDEX IF NOT EXISTS idx_positions_security_id ON positions(security_id);
                 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date);
+                CREATE INDEX IF NOT EXISTS idx_transactions_date_id ON transactions(transaction_date, id);
                 CREATE INDEX IF NOT EXISTS idx_entries_transaction_id ON entries(transaction_id);
                 CREATE INDEX IF NOT EXISTS idx_entries_account_id ON entries(account_id);
                 CREATE INDEX IF NOT EXISTS idx_tax_lots_position_id ON tax_lots(position_id);
                 CREATE INDEX IF NOT EXISTS idx_tax_lots_acquisition_date ON tax_lots(acquisition_date);
                 CREATE INDEX IF NOT EXISTS idx_reconciliation_sessions_account_id ON reconciliation_sessions(account_id);
                 CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_id ON reconciliation_matches(session_id);
+                CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_status ON reconciliation_matches(session_id, status, created_at, id);
+                CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_created ON reconciliation_matches(session_id, created_at, id);
                 CREATE INDEX IF NOT EXISTS idx_exchange_rates_pair_date ON exchange_rates(from_currency, to_currency, effective_date);
                 CREATE INDEX IF NOT EXISTS idx_exchange_rates_date ON exchange_rates(effective_date);
                 CREATE INDEX IF NOT EXISTS idx_vendors_name ON vendors(name);
@@ -328,6 +1188,7 @@ class PostgresDatabase:
                 CREATE INDEX IF NOT EXISTS idx_budgets_entity ON budgets(entity_id);
                 CREATE INDEX IF NOT EXISTS idx_budgets_dates ON budgets(start_date, end_date);
                 CREATE INDEX IF NOT EXISTS idx_budget_line_items_budget ON budget_line_items(budget_id);
+                CREATE INDEX IF NOT EXISTS idx_period_closes_entity_end ON period_closes(entity_id, period_end);
                 """
             )
 
@@ -335,26 +1196,394 @@ class PostgresDatabase:
                 """
                 ALTER TABLE transactions ADD COLUMN IF NOT EXISTS category TEXT;
                 ALTER TABLE transactions ADD COLUMN IF NOT EXISTS tags TEXT;
-                ALTER TABLE transactions ADD COLUMN IF NOT EXISTS vendor_id TEXT;
+                ALTER TABLE transactions ADD COLUMN IF NOT EXISTS vendor_id UUID;
                 ALTER TABLE transactions ADD COLUMN IF NOT EXISTS is_recurring BOOLEAN DEFAULT FALSE;
                 ALTER TABLE transactions ADD COLUMN IF NOT EXISTS recurring_frequency TEXT;
 
                 ALTER TABLE entries ADD COLUMN IF NOT EXISTS category TEXT;
+                -- Insertion order, so entries hydrate in the order they were posted
+                ALTER TABLE entries ADD COLUMN IF NOT EXISTS seq BIGSERIAL;
 
                 ALTER TABLE entities ADD COLUMN IF NOT EXISTS tax_treatment TEXT;
                 ALTER TABLE entities ADD COLUMN IF NOT EXISTS tax_id TEXT;
                 ALTER TABLE entities ADD COLUMN IF NOT EXISTS tax_id_type TEXT;
-                ALTER TABLE entities ADD COLUMN IF NOT EXISTS formation_date TEXT;
+                ALTER TABLE entities ADD COLUMN IF NOT EXISTS formation_date DATE;
                 ALTER TABLE entities ADD COLUMN IF NOT EXISTS jurisdiction TEXT;
                 """
             )
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_transactions_search
+                    ON transactions USING GIN ({_TRANSACTION_SEARCH_VECTOR});
+                CREATE INDEX IF NOT EXISTS idx_vendors_search
+                    ON vendors USING GIN ({_VENDOR_SEARCH_VECTOR});
+                """
+            )
+
+            cur.execute(
+                """
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'entries' AND column_name = 'debit_amount_minor'
+                """
+            )
+            added_minor_units = cur.fetchone() is None
+            cur.execute(
+                """
+                ALTER TABLE entries ADD COLUMN IF NOT EXISTS debit_amount_minor BIGINT;
+                ALTER TABLE entries ADD COLUMN IF NOT EXISTS credit_amount_minor BIGINT;
+                CREATE INDEX IF NOT EXISTS idx_entries_account_amounts ON entries(
+                    account_id, transaction_id, debit_currency, credit_currency,
+                    debit_amount_minor, credit_amount_minor
+                );
+                """
+            )
+
+            cur.execute("SELECT to_regclass('account_balance_snapshots') AS name")
+            row = _fetch_dict(cur)
+            created_snapshots = row is None or row["name"] is None
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS account_balance_snapshots (
+                    account_id UUID NOT NULL,
+                    currency TEXT NOT NULL,
+                    snapshot_date DATE NOT NULL,
+                    debit_total NUMERIC(28,10) NOT NULL,
+                    credit_total NUMERIC(28,10) NOT NULL,
+                    PRIMARY KEY (account_id, currency, snapshot_date)
+                )
+                """
+            )
+        conn.commit()
+        if added_minor_units:
+            self.backfill_entry_minor_units()
+        if created_snapshots:
+            self.rebuild_balance_snapshots()
+
+    def migrate_to_native_types(self, batch_size: int = 5000) -> int:
+        """Convert TEXT id, date, timestamp and amount columns in place.
+
+        Runs as an expand/contract migration so the ledger stays writable
+        while the data is copied:
+
+        1. every TEXT column listed in ``_NATIVE_COLUMN_TYPES`` gets a
+           ``<column>__native`` shadow column of its native type, kept in
+           step with writes by a ``BEFORE INSERT OR UPDATE`` trigger;
+        2. existing rows are copied into the shadow columns in primary-key
+           order, committing every ``batch_size`` rows;
+        3. one short transaction drops the TEXT columns, renames the shadow
+           columns into place and recreates the indexes and constraints that
+           covered them. Foreign keys come back ``NOT VALID`` and are
+           validated afterwards, which does not block writes.
+
+        Interrupted runs resume from step 1. Returns the number of rows
+        copied, 0 when the schema is already native.
+        """
+        conn = self.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT table_name, column_name, is_nullable FROM information_schema.columns
+                WHERE table_schema = current_schema() AND data_type = 'text'
+                """
+            )
+            legacy: dict[str, dict[str, bool]] = {}
+            for row in _fetch_dicts(cur):
+                native = _NATIVE_COLUMN_TYPES.get(row["table_name"], {})
+                if row["column_name"] in native:
+                    legacy.setdefault(row["table_name"], {})[row["column_name"]] = (
+                        row["is_nullable"] == "NO"
+                    )
+        conn.commit()
+        if not legacy:
+            return 0
+
+        for table, columns in legacy.items():
+            self._add_native_shadow_columns(table, list(columns))
+        copied = sum(
+            self._backfill_native_columns(table, list(columns), batch_size)
+            for table, columns in legacy.items()
+        )
+
+        with conn.cursor() as cur:
+            constraints, indexes = self._native_dependents(cur, legacy)
+            for constraint in constraints:
+                if constraint["contype"] == "f":
+                    cur.execute(
+                        f"ALTER TABLE {constraint['table_name']} "
+                        f"DROP CONSTRAINT {constraint['conname']}"
+                    )
+            for table, columns in legacy.items():
+                cur.execute(f"DROP TRIGGER {table}__native_sync ON {table}")
+                cur.execute(f"DROP FUNCTION {table}__native_sync()")
+                for column, not_null in columns.items():
+                    cur.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+                    cur.execute(
+                        f"ALTER TABLE {table} RENAME COLUMN {column}__native TO {column}"
+                    )
+                    if not_null:
+                        cur.execute(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"
+                        )
+            for constraint in sorted(constraints, key=lambda c: c["contype"] == "f"):
+                not_valid = " NOT VALID" if constraint["contype"] == "f" else ""
+                cur.execute(
+                    f"ALTER TABLE {constraint['table_name']} ADD CONSTRAINT "
+                    f"{constraint['conname']} {constraint['definition']}{not_valid}"
+                )
+            for index in indexes:
+                cur.execute(index["definition"])
+        conn.commit()
+
+        with conn.cursor() as cur:
+            for constraint in constraints:
+                if constraint["contype"] == "f":
+                    cur.execute(
+                        f"ALTER TABLE {constraint['table_name']} "
+                        f"VALIDATE CONSTRAINT {constraint['conname']}"
+                    )
+        conn.commit()
+        return copied
+
+    def _add_native_shadow_columns(self, table: str, columns: list[str]) -> None:
+        native = _NATIVE_COLUMN_TYPES[table]
+        conn = self.get_connection()
+        with conn.cursor() as cur:
+            for column in columns:
+                cur.execute(
+                    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS "
+                    f"{column}__native {native[column]}"
+                )
+            assignments = "".join(
+                f"NEW.{column}__native := NULLIF(NEW.{column}, '')::{native[column]};\n"
+                for column in columns
+            )
+            cur.execute(
+                f"""
+                CREATE OR REPLACE FUNCTION {table}__native_sync() RETURNS trigger
+                LANGUAGE plpgsql AS $$
+                BEGIN
+                {assignments}RETURN NEW;
+                END
+                $$
+                """
+            )
+            cur.execute(f"DROP TRIGGER IF EXISTS {table}__native_sync ON {table}")
+            cur.execute(
+                f"""
+                CREATE TRIGGER {table}__native_sync
+                BEFORE INSERT OR UPDATE OF {", ".join(columns)} ON {table}
+                FOR EACH ROW EXECUTE FUNCTION {table}__native_sync()
+                """
+            )
+        conn.commit()
+
+    def _backfill_native_columns(
+        self, table: str, columns: list[str], batch_size: int
+    ) -> int:
+        native = _NATIVE_COLUMN_TYPES[table]
+        conn = self.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT a.attname FROM pg_index i
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                WHERE i.indrelid = %s::regclass AND i.indisprimary
+                ORDER BY array_position(i.indkey::int2[], a.attnum)
+                """,
+                (table,),
+            )
+            key = ", ".join(row["attname"] for row in _fetch_dicts(cur))
+        conn.commit()
+        assignments = ", ".join(
+            f"{column}__native = NULLIF({column}, '')::{native[column]}"
+            for column in columns
+        )
+        copied = 0
+        lower: tuple[Any, ...] | None = None
+        while True:
+            with conn.cursor(cursor_factory=psycopg2.extensions.cursor) as cur:
+                after = f"WHERE ({key}) > %s" if lower is not None else ""
+                params: tuple[Any, ...] = (lower,) if lower is not None else ()
+                cur.execute(
+                    f"SELECT {key} FROM {table} {after} "
+                    f"ORDER BY {key} OFFSET %s LIMIT 1",
+                    (*params, batch_size - 1),
+                )
+                upper = cur.fetchone()
+                bounds = [f"({key}) > %s"] if lower is not None else []
+                if upper is not None:
+                    bounds.append(f"({key}) <= %s")
+                    params = (*params, upper)
+                where = f"WHERE {' AND '.join(bounds)}" if bounds else ""
+                cur.execute(f"UPDATE {table} SET {assignments} {where}", params)
+                copied += cur.rowcount
+            conn.commit()
+            if upper is None:
+                return copied
+            lower = upper
+
+    @staticmethod
+    def _native_dependents(
+        cur: Any, legacy: dict[str, dict[str, bool]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Constraints and indexes that cover a column about to be converted."""
+        cur.execute(
+            """
+            SELECT c.conrelid::regclass::text AS table_name, c.conname, c.contype,
+                   pg_get_constraintdef(c.oid) AS definition,
+                   ARRAY(
+                       SELECT a.attname FROM pg_attribute a
+                       WHERE a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey)
+                   ) AS columns,
+                   c.confrelid::regclass::text AS ref_table_name,
+                   ARRAY(
+                       SELECT a.attname FROM pg_attribute a
+                       WHERE a.attrelid = c.confrelid AND a.attnum = ANY(c.confkey)
+                   ) AS ref_columns
+            FROM pg_constraint c
+            JOIN pg_namespace n ON n.oid = c.connamespace
+            WHERE n.nspname = current_schema() AND c.contype IN ('p', 'u', 'f', 'c')
+            """
+        )
+        constraints = [
+            row
+            for row in cur.fetchall()
+            if set(row["columns"]) & set(legacy.get(row["table_name"], ()))
+            or set(row["ref_columns"]) & set(legacy.get(row["ref_table_name"], ()))
+        ]
+        cur.execute(
+            """
+            SELECT t.relname AS table_name, pg_get_indexdef(i.indexrelid) AS definition,
+                   ARRAY(
+                       SELECT a.attname FROM pg_attribute a
+                       WHERE a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                   ) AS columns
+            FROM pg_index i
+            JOIN pg_class t ON t.oid = i.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = current_schema()
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint c
+                  WHERE c.conindid = i.indexrelid AND c.contype IN ('p', 'u')
+              )
+            """
+        )
+        indexes = [
+            row
+            for row in cur.fetchall()
+            if set(row["columns"]) & set(legacy.get(row["table_name"], ()))
+        ]
+        return constraints, indexes
+
+    def backfill_entry_minor_units(self, batch_size: int = 5000) -> int:
+        """Populate ``entries.*_amount_minor`` from the NUMERIC amount columns.
+
+        Rows are walked in primary-key order and committed every
+        ``batch_size`` rows so large ledgers do not hold one long write
+        transaction. Amounts that cannot be represented exactly stay NULL.
+        Returns the number of rows updated.
+        """
+        conn = self.get_connection()
+        updated = 0
+        last_id = UUID(int=0)
+        while True:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT id, debit_amount, credit_amount FROM entries
+                    WHERE id > %s
+                      AND (debit_amount_minor IS NULL OR credit_amount_minor IS NULL)
+                    ORDER BY id LIMIT %s
+                    """,
+                    (last_id, batch_size),
+                )
+                rows = _fetch_dicts(cur)
+                if not rows:
+                    return updated
+                psycopg2.extras.execute_batch(
+                    cur,
+                    "UPDATE entries SET debit_amount_minor = %s, "
+                    "credit_amount_minor = %s WHERE id = %s",
+                    [
+                        (
+                            to_minor_units(_numeric(row["debit_amount"])),
+                            to_minor_units(_numeric(row["credit_amount"])),
+                            row["id"],
+                        )
+                        for row in rows
+                    ],
+                )
+            conn.commit()
+            updated += len(rows)
+            last_id = rows[-1]["id"]
+
+    def rebuild_balance_snapshots(self) -> int:
+        """Regenerate ``account_balance_snapshots`` from the entries table.
+
+        The table is cleared and refilled by one ``INSERT ... SELECT`` in a
+        single transaction, so readers never observe a partially rebuilt
+        table. Returns the number of snapshot rows written.
+        """
+        conn = self.get_connection()
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM account_balance_snapshots")
+            cur.execute(
+                f"""
+                INSERT INTO account_balance_snapshots
+                    (account_id, currency, snapshot_date, debit_total, credit_total)
+                {_RUNNING_TOTALS_SQL}
+                """
+            )
+            written = cur.rowcount
         conn.commit()
+        return written
+
+    def verify_balance_snapshots(self) -> list[BalanceSnapshotDiscrepancy]:
+        """Diff ``account_balance_snapshots`` against a full recompute."""
+        conn = self.get_connection()
+        with conn.cursor() as cur:
+            cur.execute("SELECT * FROM account_balance_snapshots")
+            stored = {
+                (row["account_id"], row["currency"], row["snapshot_date"]): (
+                    _numeric(row["debit_total"]),
+                    _numeric(row["credit_total"]),
+                )
+                for row in _fetch_dicts(cur)
+            }
+            cur.execute(_RUNNING_TOTALS_SQL)
+            expected = _fetch_dicts(cur)
+        discrepancies: list[BalanceSnapshotDiscrepancy] = []
+        for row in expected:
+            key = (row["account_id"], row["currency"], row["snapshot_date"])
+            totals = (_numeric(row["debit_total"]), _numeric(row["credit_total"]))
+            actual = stored.pop(key, None)
+            if actual != totals:
+                discrepancies.append(
+                    BalanceSnapshotDiscrepancy(
+                        account_id=key[0],
+                        currency=key[1],
+                        snapshot_date=key[2],
+                        stored=actual,
+                        expected=totals,
+                    )
+                )
+        for (account_id, currency, snapshot_date), actual in stored.items():
+            discrepancies.append(
+                BalanceSnapshotDiscrepancy(
+                    account_id=account_id,
+                    currency=currency,
+                    snapshot_date=snapshot_date,
+                    stored=actual,
+                    expected=None,
+                )
+            )
+        return discrepancies
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Return this thread's connection and close the pool."""
+        self.release()
+        self._pool.close()
 
 
 class PostgresEntityRepository(EntityRepository):
@@ -373,33 +1602,36 @@ class PostgresEntityRepository(EntityRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(entity.id),
+                    entity.id,
                     entity.name,
                     entity.entity_type.value,
-                    entity.fiscal_year_end.isoformat(),
+                    entity.fiscal_year_end,
                     entity.is_active,
-                    entity.created_at.isoformat(),
-                    entity.updated_at.isoformat(),
+                    entity.created_at,
+                    entity.updated_at,
                     entity.tax_treatment.value if entity.tax_treatment else None,
                     entity.tax_id,
                     entity.tax_id_type,
-                    entity.formation_date.isoformat()
-                    if entity.formation_date
-                    else None,
+                    entity.formation_date,
                     entity.jurisdiction,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [entity.id])
+        self._db.commit()
 
     def get(self, entity_id: UUID) -> Entity | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM entities WHERE id = %s", (str(entity_id),))
+            cur.execute("SELECT * FROM entities WHERE id = %s", (entity_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_entity(row)
 
+    def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        rows = _select_by_ids(self._db.get_connection(), "entities", entity_ids)
+        return {obj.id: obj for obj in map(self._row_to_entity, rows)}
+
     def get_by_name(self, name: str) -> Entity | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -444,52 +1676,45 @@ class PostgresEntityRepository(EntityRepository):
                 (
                     entity.name,
                     entity.entity_type.value,
-                    entity.fiscal_year_end.isoformat(),
+                    entity.fiscal_year_end,
                     entity.is_active,
-                    entity.updated_at.isoformat(),
+                    entity.updated_at,
                     entity.tax_treatment.value if entity.tax_treatment else None,
                     entity.tax_id,
                     entity.tax_id_type,
-                    entity.formation_date.isoformat()
-                    if entity.formation_date
-                    else None,
+                    entity.formation_date,
                     entity.jurisdiction,
-                    str(entity.id),
+                    entity.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [entity.id])
+        self._db.commit()
 
     def delete(self, entity_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM entities WHERE id = %s", (str(entity_id),))
-        conn.commit()
+            cur.execute("DELETE FROM entities WHERE id = %s", (entity_id,))
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [entity_id])
+        self._db.commit()
 
     def _row_to_entity(self, row: Any) -> Entity:
         tax_treatment_val = row.get("tax_treatment")
-        formation_date_val = row.get("formation_date")
         entity = Entity(
             name=row["name"],
             entity_type=EntityType(row["entity_type"]),
-            id=UUID(row["id"]),
-            fiscal_year_end=date.fromisoformat(row["fiscal_year_end"]),
+            id=row["id"],
+            fiscal_year_end=row["fiscal_year_end"],
             is_active=bool(row["is_active"]),
             tax_treatment=TaxTreatment(tax_treatment_val)
             if tax_treatment_val
             else None,
             tax_id=row.get("tax_id"),
             tax_id_type=row.get("tax_id_type"),
-            formation_date=date.fromisoformat(formation_date_val)
-            if formation_date_val
-            else None,
+            formation_date=row.get("formation_date"),
             jurisdiction=row.get("jurisdiction"),
         )
-        object.__setattr__(
-            entity, "created_at", datetime.fromisoformat(row["created_at"])
-        )
-        object.__setattr__(
-            entity, "updated_at", datetime.fromisoformat(row["updated_at"])
-        )
+        object.__setattr__(entity, "created_at", row["created_at"])
+        object.__setattr__(entity, "updated_at", row["updated_at"])
         return entity
 
 
@@ -506,27 +1731,29 @@ class PostgresHouseholdRepository(HouseholdRepository):
                 VALUES (%s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(household.id),
+                    household.id,
                     household.name,
-                    str(household.primary_contact_entity_id)
-                    if household.primary_contact_entity_id
-                    else None,
+                    household.primary_contact_entity_id,
                     household.is_active,
-                    household.created_at.isoformat(),
-                    household.updated_at.isoformat(),
+                    household.created_at,
+                    household.updated_at,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def get(self, household_id: UUID) -> Household | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM households WHERE id = %s", (str(household_id),))
+            cur.execute("SELECT * FROM households WHERE id = %s", (household_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_household(row)
 
+    def get_many(self, household_ids: Iterable[UUID]) -> dict[UUID, Household]:
+        rows = _select_by_ids(self._db.get_connection(), "households", household_ids)
+        return {obj.id: obj for obj in map(self._row_to_household, rows)}
+
     def get_by_name(self, name: str) -> Household | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -564,37 +1791,29 @@ class PostgresHouseholdRepository(HouseholdRepository):
                 """,
                 (
                     household.name,
-                    str(household.primary_contact_entity_id)
-                    if household.primary_contact_entity_id
-                    else None,
+                    household.primary_contact_entity_id,
                     household.is_active,
-                    household.updated_at.isoformat(),
-                    str(household.id),
+                    household.updated_at,
+                    household.id,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, household_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM households WHERE id = %s", (str(household_id),))
-        conn.commit()
+            cur.execute("DELETE FROM households WHERE id = %s", (household_id,))
+        self._db.commit()
 
     def _row_to_household(self, row: Any) -> Household:
         household = Household(
             name=row["name"],
-            id=UUID(row["id"]),
-            primary_contact_entity_id=UUID(row["primary_contact_entity_id"])
-            if row["primary_contact_entity_id"]
-            else None,
+            id=row["id"],
+            primary_contact_entity_id=row["primary_contact_entity_id"],
             is_active=bool(row["is_active"]),
         )
-        object.__setattr__(
-            household, "created_at", datetime.fromisoformat(row["created_at"])
-        )
-        object.__setattr__(
-            household, "updated_at", datetime.fromisoformat(row["updated_at"])
-        )
+        object.__setattr__(household, "created_at", row["created_at"])
+        object.__setattr__(household, "updated_at", row["updated_at"])
         return household
 
     def add_member(self, member: HouseholdMember) -> None:
@@ -607,28 +1826,22 @@ class PostgresHouseholdRepository(HouseholdRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(member.id),
-                    str(member.household_id),
-                    str(member.entity_id),
+                    member.id,
+                    member.household_id,
+                    member.entity_id,
                     member.role,
                     member.display_name,
-                    member.effective_start_date.isoformat()
-                    if member.effective_start_date
-                    else None,
-                    member.effective_end_date.isoformat()
-                    if member.effective_end_date
-                    else None,
-                    member.created_at.isoformat(),
+                    member.effective_start_date,
+                    member.effective_end_date,
+                    member.created_at,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def get_member(self, member_id: UUID) -> HouseholdMember | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT * FROM household_members WHERE id = %s", (str(member_id),)
-            )
+            cur.execute("SELECT * FROM household_members WHERE id = %s", (member_id,))
             row = cur.fetchone()
         if row is None:
             return None
@@ -642,7 +1855,7 @@ class PostgresHouseholdRepository(HouseholdRepository):
             if as_of_date is None:
                 cur.execute(
                     "SELECT * FROM household_members WHERE household_id = %s",
-                    (str(household_id),),
+                    (household_id,),
                 )
             else:
                 cur.execute(
@@ -652,7 +1865,7 @@ class PostgresHouseholdRepository(HouseholdRepository):
                     AND (effective_start_date IS NULL OR effective_start_date <= %s)
                     AND (effective_end_date IS NULL OR %s < effective_end_date)
                     """,
-                    (str(household_id), as_of_date.isoformat(), as_of_date.isoformat()),
+                    (household_id, as_of_date, as_of_date),
                 )
             rows = cur.fetchall()
         return [self._row_to_member(row) for row in rows]
@@ -665,7 +1878,7 @@ class PostgresHouseholdRepository(HouseholdRepository):
             if as_of_date is None:
                 cur.execute(
                     "SELECT * FROM household_members WHERE entity_id = %s",
-                    (str(entity_id),),
+                    (entity_id,),
                 )
             else:
                 cur.execute(
@@ -675,7 +1888,7 @@ class PostgresHouseholdRepository(HouseholdRepository):
                     AND (effective_start_date IS NULL OR effective_start_date <= %s)
                     AND (effective_end_date IS NULL OR %s < effective_end_date)
                     """,
-                    (str(entity_id), as_of_date.isoformat(), as_of_date.isoformat()),
+                    (entity_id, as_of_date, as_of_date),
                 )
             rows = cur.fetchall()
         return [self._row_to_member(row) for row in rows]
@@ -695,46 +1908,34 @@ class PostgresHouseholdRepository(HouseholdRepository):
                 WHERE id = %s
                 """,
                 (
-                    str(member.household_id),
-                    str(member.entity_id),
+                    member.household_id,
+                    member.entity_id,
                     member.role,
                     member.display_name,
-                    member.effective_start_date.isoformat()
-                    if member.effective_start_date
-                    else None,
-                    member.effective_end_date.isoformat()
-                    if member.effective_end_date
-                    else None,
-                    str(member.id),
+                    member.effective_start_date,
+                    member.effective_end_date,
+                    member.id,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def remove_member(self, member_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "DELETE FROM household_members WHERE id = %s", (str(member_id),)
-            )
-        conn.commit()
+            cur.execute("DELETE FROM household_members WHERE id = %s", (member_id,))
+        self._db.commit()
 
     def _row_to_member(self, row: Any) -> HouseholdMember:
         member = HouseholdMember(
-            household_id=UUID(row["household_id"]),
-            entity_id=UUID(row["entity_id"]),
-            id=UUID(row["id"]),
+            household_id=row["household_id"],
+            entity_id=row["entity_id"],
+            id=row["id"],
             role=row["role"],
             display_name=row["display_name"],
-            effective_start_date=date.fromisoformat(row["effective_start_date"])
-            if row["effective_start_date"]
-            else None,
-            effective_end_date=date.fromisoformat(row["effective_end_date"])
-            if row["effective_end_date"]
-            else None,
-        )
-        object.__setattr__(
-            member, "created_at", datetime.fromisoformat(row["created_at"])
+            effective_start_date=row["effective_start_date"],
+            effective_end_date=row["effective_end_date"],
         )
+        object.__setattr__(member, "created_at", row["created_at"])
         return member
 
 
@@ -752,34 +1953,39 @@ class PostgresAccountRepository(AccountRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(account.id),
+                    account.id,
                     account.name,
-                    str(account.entity_id),
+                    account.entity_id,
                     account.account_type.value,
                     account.sub_type.value,
                     account.currency,
                     account.is_investment_account,
                     account.is_active,
-                    account.created_at.isoformat(),
+                    account.created_at,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [account.entity_id])
+        self._db.commit()
 
     def get(self, account_id: UUID) -> Account | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM accounts WHERE id = %s", (str(account_id),))
+            cur.execute("SELECT * FROM accounts WHERE id = %s", (account_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_account(row)
 
+    def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        rows = _select_by_ids(self._db.get_connection(), "accounts", account_ids)
+        return {obj.id: obj for obj in map(self._row_to_account, rows)}
+
     def get_by_name(self, name: str, entity_id: UUID) -> Account | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM accounts WHERE name = %s AND entity_id = %s",
-                (name, str(entity_id)),
+                (name, entity_id),
             )
             row = cur.fetchone()
         if row is None:
@@ -789,9 +1995,7 @@ class PostgresAccountRepository(AccountRepository):
     def list_by_entity(self, entity_id: UUID) -> Iterable[Account]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT * FROM accounts WHERE entity_id = %s", (str(entity_id),)
-            )
+            cur.execute("SELECT * FROM accounts WHERE entity_id = %s", (entity_id,))
             rows = cur.fetchall()
         return [self._row_to_account(row) for row in rows]
 
@@ -805,7 +2009,7 @@ class PostgresAccountRepository(AccountRepository):
             else:
                 cur.execute(
                     "SELECT * FROM accounts WHERE is_investment_account = TRUE AND entity_id = %s",
-                    (str(entity_id),),
+                    (entity_id,),
                 )
             rows = cur.fetchall()
         return [self._row_to_account(row) for row in rows]
@@ -827,29 +2031,31 @@ class PostgresAccountRepository(AccountRepository):
                 """,
                 (
                     account.name,
-                    str(account.entity_id),
+                    account.entity_id,
                     account.account_type.value,
                     account.sub_type.value,
                     account.currency,
                     account.is_investment_account,
                     account.is_active,
-                    str(account.id),
+                    account.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [account.entity_id])
+        self._db.commit()
 
     def delete(self, account_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM accounts WHERE id = %s", (str(account_id),))
-        conn.commit()
+            _bump_ledger_versions(cur, _ACCOUNT_SCOPES_SQL, [account_id])
+            cur.execute("DELETE FROM accounts WHERE id = %s", (account_id,))
+        self._db.commit()
 
     def _row_to_account(self, row: Any) -> Account:
         account = Account(
             name=row["name"],
-            entity_id=UUID(row["entity_id"]),
+            entity_id=row["entity_id"],
             account_type=AccountType(row["account_type"]),
-            id=UUID(row["id"]),
+            id=row["id"],
             sub_type=AccountSubType(row["sub_type"]),
             currency=row["currency"],
             is_active=bool(row["is_active"]),
@@ -857,9 +2063,7 @@ class PostgresAccountRepository(AccountRepository):
         # Override is_investment_account to match stored value
         account.is_investment_account = bool(row["is_investment_account"])
         # Set created_at directly
-        object.__setattr__(
-            account, "created_at", datetime.fromisoformat(row["created_at"])
-        )
+        object.__setattr__(account, "created_at", row["created_at"])
         return account
 
 
@@ -879,31 +2083,34 @@ class PostgresSecurityRepository(SecurityRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(security.id),
+                    security.id,
                     security.symbol,
                     security.name,
                     security.cusip,
                     security.isin,
                     security.asset_class.value,
                     security.is_qsbs_eligible,
-                    security.qsbs_qualification_date.isoformat()
-                    if security.qsbs_qualification_date
-                    else None,
+                    security.qsbs_qualification_date,
                     security.issuer,
                     security.is_active,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE])
+        self._db.commit()
 
     def get(self, security_id: UUID) -> Security | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM securities WHERE id = %s", (str(security_id),))
+            cur.execute("SELECT * FROM securities WHERE id = %s", (security_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_security(row)
 
+    def get_many(self, security_ids: Iterable[UUID]) -> dict[UUID, Security]:
+        rows = _select_by_ids(self._db.get_connection(), "securities", security_ids)
+        return {obj.id: obj for obj in map(self._row_to_security, rows)}
+
     def get_by_symbol(self, symbol: str) -> Security | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -960,28 +2167,25 @@ class PostgresSecurityRepository(SecurityRepository):
                     security.isin,
                     security.asset_class.value,
                     security.is_qsbs_eligible,
-                    security.qsbs_qualification_date.isoformat()
-                    if security.qsbs_qualification_date
-                    else None,
+                    security.qsbs_qualification_date,
                     security.issuer,
                     security.is_active,
-                    str(security.id),
+                    security.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE])
+        self._db.commit()
 
     def _row_to_security(self, row: Any) -> Security:
         return Security(
             symbol=row["symbol"],
             name=row["name"],
-            id=UUID(row["id"]),
+            id=row["id"],
             cusip=row["cusip"],
             isin=row["isin"],
             asset_class=AssetClass(row["asset_class"]),
             is_qsbs_eligible=bool(row["is_qsbs_eligible"]),
-            qsbs_qualification_date=date.fromisoformat(row["qsbs_qualification_date"])
-            if row["qsbs_qualification_date"]
-            else None,
+            qsbs_qualification_date=row["qsbs_qualification_date"],
             issuer=row["issuer"],
             is_active=bool(row["is_active"]),
         )
@@ -994,37 +2198,40 @@ class PostgresPositionRepository(PositionRepository):
         self._db = database
 
     def add(self, position: Position) -> None:
-        conn = self._db.get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
+        self.add_many([position])
+
+    def add_many(self, positions: Iterable[Position]) -> None:
+        positions = list(positions)
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            psycopg2.extras.execute_batch(
+                cur,
                 """
                 INSERT INTO positions (id, account_id, security_id, quantity,
                                        cost_basis_amount, cost_basis_currency,
                                        market_value_amount, market_value_currency)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """,
-                (
-                    str(position.id),
-                    str(position.account_id),
-                    str(position.security_id),
-                    str(position.quantity.value),
-                    str(position.cost_basis.amount),
-                    position.cost_basis.currency,
-                    str(position.market_value.amount),
-                    position.market_value.currency,
-                ),
+                [_position_row(position) for position in positions],
+            )
+            _bump_ledger_versions(
+                cur,
+                _ACCOUNT_SCOPES_SQL,
+                {position.account_id for position in positions},
             )
-        conn.commit()
 
     def get(self, position_id: UUID) -> Position | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM positions WHERE id = %s", (str(position_id),))
+            cur.execute("SELECT * FROM positions WHERE id = %s", (position_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_position(row)
 
+    def get_many(self, position_ids: Iterable[UUID]) -> dict[UUID, Position]:
+        rows = _select_by_ids(self._db.get_connection(), "positions", position_ids)
+        return {obj.id: obj for obj in map(self._row_to_position, rows)}
+
     def get_by_account_and_security(
         self, account_id: UUID, security_id: UUID
     ) -> Position | None:
@@ -1032,7 +2239,7 @@ class PostgresPositionRepository(PositionRepository):
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM positions WHERE account_id = %s AND security_id = %s",
-                (str(account_id), str(security_id)),
+                (account_id, security_id),
             )
             row = cur.fetchone()
         if row is None:
@@ -1042,9 +2249,7 @@ class PostgresPositionRepository(PositionRepository):
     def list_by_account(self, account_id: UUID) -> Iterable[Position]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT * FROM positions WHERE account_id = %s", (str(account_id),)
-            )
+            cur.execute("SELECT * FROM positions WHERE account_id = %s", (account_id,))
             rows = cur.fetchall()
         return [self._row_to_position(row) for row in rows]
 
@@ -1052,7 +2257,7 @@ class PostgresPositionRepository(PositionRepository):
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
-                "SELECT * FROM positions WHERE security_id = %s", (str(security_id),)
+                "SELECT * FROM positions WHERE security_id = %s", (security_id,)
             )
             rows = cur.fetchall()
         return [self._row_to_position(row) for row in rows]
@@ -1066,7 +2271,7 @@ class PostgresPositionRepository(PositionRepository):
                 JOIN accounts a ON p.account_id = a.id
                 WHERE a.entity_id = %s
                 """,
-                (str(entity_id),),
+                (entity_id,),
             )
             rows = cur.fetchall()
         return [self._row_to_position(row) for row in rows]
@@ -1087,34 +2292,35 @@ class PostgresPositionRepository(PositionRepository):
                 WHERE id = %s
                 """,
                 (
-                    str(position.account_id),
-                    str(position.security_id),
-                    str(position.quantity.value),
-                    str(position.cost_basis.amount),
+                    position.account_id,
+                    position.security_id,
+                    position.quantity.value,
+                    position.cost_basis.amount,
                     position.cost_basis.currency,
-                    str(position.market_value.amount),
+                    position.market_value.amount,
                     position.market_value.currency,
-                    str(position.id),
+                    position.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _ACCOUNT_SCOPES_SQL, [position.account_id])
+        self._db.commit()
 
     def _row_to_position(self, row: Any) -> Position:
         position = Position(
-            account_id=UUID(row["account_id"]),
-            security_id=UUID(row["security_id"]),
-            id=UUID(row["id"]),
+            account_id=row["account_id"],
+            security_id=row["security_id"],
+            id=row["id"],
         )
         # Update internal state
         position.update_from_lots(
-            total_quantity=Quantity(Decimal(row["quantity"])),
+            total_quantity=Quantity(_numeric(row["quantity"])),
             total_cost=Money(
-                Decimal(row["cost_basis_amount"]), row["cost_basis_currency"]
+                _numeric(row["cost_basis_amount"]), row["cost_basis_currency"]
             ),
         )
         # Set market value directly using internal attribute
         position._market_value = Money(
-            Decimal(row["market_value_amount"]), row["market_value_currency"]
+            _numeric(row["market_value_amount"]), row["market_value_currency"]
         )
         return position
 
@@ -1126,64 +2332,58 @@ class PostgresTransactionRepository(TransactionRepository):
         self._db = database
 
     def add(self, txn: Transaction) -> None:
-        conn = self._db.get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
+        self.add_many([txn])
+
+    def add_many(self, txns: Iterable[Transaction]) -> None:
+        txns = list(txns)
+        if not txns:
+            return
+        account_ids = {entry.account_id for txn in txns for entry in txn.entries}
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            _check_periods_open(
+                cur,
+                (
+                    (txn.transaction_date, [entry.account_id for entry in txn.entries])
+                    for txn in txns
+                ),
+                account_ids,
+            )
+            psycopg2.extras.execute_batch(
+                cur,
                 """
                 INSERT INTO transactions (id, transaction_date, posted_date, memo, reference,
                                           created_by, created_at, is_reversed, reverses_transaction_id,
                                           category, tags, vendor_id, is_recurring, recurring_frequency)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
-                (
-                    str(txn.id),
-                    txn.transaction_date.isoformat(),
-                    txn.posted_date.isoformat() if txn.posted_date else None,
-                    txn.memo,
-                    txn.reference,
-                    str(txn.created_by) if txn.created_by else None,
-                    txn.created_at.isoformat(),
-                    txn.is_reversed,
-                    str(txn.reverses_transaction_id)
-                    if txn.reverses_transaction_id
-                    else None,
-                    txn.category,
-                    json.dumps(txn.tags) if txn.tags else None,
-                    str(txn.vendor_id) if txn.vendor_id else None,
-                    txn.is_recurring,
-                    txn.recurring_frequency,
-                ),
+                [_transaction_row(txn) for txn in txns],
             )
-            for entry in txn.entries:
-                cur.execute(
-                    """
-                    INSERT INTO entries (id, transaction_id, account_id, debit_amount, debit_currency,
-                                         credit_amount, credit_currency, memo, tax_lot_id, category)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        str(entry.id),
-                        str(txn.id),
-                        str(entry.account_id),
-                        str(entry.debit_amount.amount),
-                        entry.debit_amount.currency,
-                        str(entry.credit_amount.amount),
-                        entry.credit_amount.currency,
-                        entry.memo,
-                        str(entry.tax_lot_id) if entry.tax_lot_id else None,
-                        entry.category,
-                    ),
-                )
-        conn.commit()
+            psycopg2.extras.execute_batch(
+                cur,
+                """
+                INSERT INTO entries (id, transaction_id, account_id, debit_amount, debit_currency,
+                                     credit_amount, credit_currency, memo, tax_lot_id, category,
+                                     debit_amount_minor, credit_amount_minor)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                [_entry_row(txn, entry) for txn in txns for entry in txn.entries],
+            )
+            for snapshot_date, totals in totals_by_date(txns).items():
+                self._apply_balance_snapshots(cur, totals, snapshot_date)
+            _bump_ledger_versions(cur, _ACCOUNT_SCOPES_SQL, account_ids)
 
     def get(self, txn_id: UUID) -> Transaction | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM transactions WHERE id = %s", (str(txn_id),))
+            cur.execute("SELECT * FROM transactions WHERE id = %s", (txn_id,))
             row = cur.fetchone()
         if row is None:
             return None
-        return self._row_to_transaction(row)
+        return self._rows_to_transactions([row])[0]
+
+    def get_many(self, txn_ids: Iterable[UUID]) -> dict[UUID, Transaction]:
+        rows = _select_by_ids(self._db.get_connection(), "transactions", txn_ids)
+        return {txn.id: txn for txn in self._rows_to_transactions(rows)}
 
     def list_by_account(
         self,
@@ -1192,25 +2392,18 @@ class PostgresTransactionRepository(TransactionRepository):
         end_date: date | None = None,
     ) -> Iterable[Transaction]:
         conn = self._db.get_connection()
-        query = """
-            SELECT DISTINCT t.* FROM transactions t
-            JOIN entries e ON t.id = e.transaction_id
-            WHERE e.account_id = %s
-        """
-        params: list[str] = [str(account_id)]
-
-        if start_date is not None:
-            query += " AND t.transaction_date >= %s"
-            params.append(start_date.isoformat())
-        if end_date is not None:
-            query += " AND t.transaction_date <= %s"
-            params.append(end_date.isoformat())
-
-        query += " ORDER BY t.transaction_date"
         with conn.cursor() as cur:
-            cur.execute(query, params)
+            cur.execute(*self._account_query(account_id, start_date, end_date))
             rows = cur.fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
+
+    def iter_by_account(
+        self,
+        account_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._account_query(account_id, start_date, end_date))
 
     def list_by_entity(
         self,
@@ -1219,56 +2412,196 @@ class PostgresTransactionRepository(TransactionRepository):
         end_date: date | None = None,
     ) -> Iterable[Transaction]:
         conn = self._db.get_connection()
-        query = """
-            SELECT DISTINCT t.* FROM transactions t
-            JOIN entries e ON t.id = e.transaction_id
-            JOIN accounts a ON e.account_id = a.id
-            WHERE a.entity_id = %s
-        """
-        params: list[str] = [str(entity_id)]
-
-        if start_date is not None:
-            query += " AND t.transaction_date >= %s"
-            params.append(start_date.isoformat())
-        if end_date is not None:
-            query += " AND t.transaction_date <= %s"
-            params.append(end_date.isoformat())
-
-        query += " ORDER BY t.transaction_date"
         with conn.cursor() as cur:
-            cur.execute(query, params)
+            cur.execute(*self._entity_query(entity_id, start_date, end_date))
             rows = cur.fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
+
+    def iter_by_entity(
+        self,
+        entity_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._entity_query(entity_id, start_date, end_date))
 
     def list_by_date_range(
         self, start_date: date, end_date: date
     ) -> Iterable[Transaction]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT * FROM transactions
-                WHERE transaction_date >= %s AND transaction_date <= %s
-                ORDER BY transaction_date
-                """,
-                (start_date.isoformat(), end_date.isoformat()),
-            )
+            cur.execute(*self._date_range_query(start_date, end_date))
             rows = cur.fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
 
-    def get_reversals(self, txn_id: UUID) -> Iterable[Transaction]:
-        conn = self._db.get_connection()
+    def iter_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._date_range_query(start_date, end_date))
+
+    def list_page(
+        self,
+        account_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        if account_id is not None:
+            query, params = self._account_query(account_id, start_date, end_date, after)
+        else:
+            query, params = self._date_range_query(start_date, end_date, after)
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(query + f" LIMIT {int(limit)}", params)
+            rows = cur.fetchall()
+        return self._rows_to_transactions(rows)
+
+    @staticmethod
+    def _filter_query(
+        query: str,
+        params: list[Any],
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None,
+    ) -> tuple[str, list[Any]]:
+        """Append the date window, keyset seek and ordering shared by listings.
+
+        The ``(transaction_date, id)`` row comparison is answered from
+        ``idx_transactions_date_id`` instead of skipping earlier rows.
+        """
+        if start_date is not None:
+            query += " AND t.transaction_date >= %s"
+            params.append(start_date)
+        if end_date is not None:
+            query += " AND t.transaction_date <= %s"
+            params.append(end_date)
+        if after is not None:
+            query += " AND (t.transaction_date, t.id) > (%s, %s)"
+            params.extend(after)
+
+        query += " ORDER BY t.transaction_date, t.id"
+        return query, params
+
+    @classmethod
+    def _date_range_query(
+        cls,
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None = None,
+    ) -> tuple[str, list[Any]]:
+        query = "SELECT t.* FROM transactions t WHERE TRUE"
+        return cls._filter_query(query, [], start_date, end_date, after)
+
+    @classmethod
+    def _account_query(
+        cls,
+        account_id: UUID,
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None = None,
+    ) -> tuple[str, list[Any]]:
+        query = """
+            SELECT DISTINCT t.* FROM transactions t
+            JOIN entries e ON t.id = e.transaction_id
+            WHERE e.account_id = %s
+        """
+        return cls._filter_query(query, [account_id], start_date, end_date, after)
+
+    @classmethod
+    def _entity_query(
+        cls, entity_id: UUID, start_date: date | None, end_date: date | None
+    ) -> tuple[str, list[Any]]:
+        query = """
+            SELECT DISTINCT t.* FROM transactions t
+            JOIN entries e ON t.id = e.transaction_id
+            JOIN accounts a ON e.account_id = a.id
+            WHERE a.entity_id = %s
+        """
+        return cls._filter_query(query, [entity_id], start_date, end_date, None)
+
+    def _stream(self, query: str, params: list[Any]) -> Iterator[Transaction]:
+        """Yield transactions for ``query`` through a server-side cursor.
+
+        Rows arrive ``_STREAM_CHUNK_SIZE`` at a time and each chunk's entries
+        are loaded with one query. The cursor is declared ``WITH HOLD`` so
+        commits made by the consumer while iterating do not invalidate it.
+        """
+        conn = self._db.get_connection()
+        cur = conn.cursor(name=f"txn_stream_{uuid4().hex}", withhold=True)
+        cur.itersize = _STREAM_CHUNK_SIZE
+        try:
+            cur.execute(query, params)
+            while rows := cur.fetchmany(_STREAM_CHUNK_SIZE):
+                yield from self._rows_to_transactions(rows)
+        finally:
+            cur.close()
+
+    def search(self, query: str, limit: int = 50) -> list[Transaction]:
+        """Rank matches with ``idx_transactions_search``, memo hits first.
+
+        Only the ``_SEARCH_CANDIDATES`` latest-dated matches are ranked.
+        """
+        tsquery = _tsquery(query)
+        if tsquery is None:
+            return []
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT hits.* FROM (
+                    SELECT t.*, query FROM transactions t,
+                         to_tsquery('simple', %s) query
+                    WHERE {_TRANSACTION_SEARCH_VECTOR} @@ query
+                    ORDER BY t.transaction_date DESC, t.id DESC
+                    LIMIT %s
+                ) hits
+                ORDER BY ts_rank({_TRANSACTION_SEARCH_VECTOR}, hits.query) DESC,
+                         hits.transaction_date DESC
+                LIMIT %s
+                """,
+                (tsquery, _SEARCH_CANDIDATES, limit),
+            )
+            rows = _fetch_dicts(cur)
+        return self._rows_to_transactions(rows)
+
+    def get_reversals(self, txn_id: UUID) -> Iterable[Transaction]:
+        conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM transactions WHERE reverses_transaction_id = %s",
-                (str(txn_id),),
+                (txn_id,),
             )
             rows = cur.fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
 
     def update(self, txn: Transaction) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
+            cur.execute(
+                "SELECT transaction_date FROM transactions WHERE id = %s",
+                (txn.id,),
+            )
+            previous = _fetch_dict(cur)
+            if previous is not None:
+                previous_date = previous["transaction_date"]
+                if previous_date != txn.transaction_date:
+                    # See ``SQLiteTransactionRepository.update``.
+                    account_ids = [entry.account_id for entry in txn.entries]
+                    _check_periods_open(
+                        cur,
+                        [
+                            (previous_date, account_ids),
+                            (txn.transaction_date, account_ids),
+                        ],
+                        account_ids,
+                    )
+                    self._apply_balance_snapshots(
+                        cur, txn.totals_by_account(), previous_date, sign=-1
+                    )
+                    self._apply_balance_snapshots(
+                        cur, txn.totals_by_account(), txn.transaction_date
+                    )
             cur.execute(
                 """
                 UPDATE transactions SET
@@ -1287,66 +2620,339 @@ class PostgresTransactionRepository(TransactionRepository):
                 WHERE id = %s
                 """,
                 (
-                    txn.transaction_date.isoformat(),
-                    txn.posted_date.isoformat() if txn.posted_date else None,
+                    txn.transaction_date,
+                    txn.posted_date,
                     txn.memo,
                     txn.reference,
-                    str(txn.created_by) if txn.created_by else None,
+                    txn.created_by,
                     txn.is_reversed,
-                    str(txn.reverses_transaction_id)
-                    if txn.reverses_transaction_id
-                    else None,
+                    txn.reverses_transaction_id,
                     txn.category,
                     json.dumps(txn.tags) if txn.tags else None,
-                    str(txn.vendor_id) if txn.vendor_id else None,
+                    txn.vendor_id,
                     txn.is_recurring,
                     txn.recurring_frequency,
-                    str(txn.id),
+                    txn.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _TRANSACTION_SCOPES_SQL, [txn.id])
+        self._db.commit()
+
+    def sum_by_account(
+        self,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+        start: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Aggregate debit/credit totals per account and currency in SQL.
+
+        As-of totals (no ``start``) are read from the latest balance
+        snapshot on or before ``as_of``. Windowed totals sum the
+        scaled-integer amount columns with a single ``GROUP BY`` query, as
+        in ``SQLiteTransactionRepository.sum_by_account``; entries whose
+        amounts could not be scaled exactly are summed from their NUMERIC
+        columns.
+        """
+        ids = list(dict.fromkeys(account_ids))
+        if not ids:
+            return []
+        if start is None:
+            return self._snapshot_totals(ids, as_of)
+        date_filter = " AND t.transaction_date >= %s"
+        date_params: list[date] = [start]
+        if as_of is not None:
+            date_filter += " AND t.transaction_date <= %s"
+            date_params.append(as_of)
+
+        totals = AccountTotalsAccumulator()
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT e.account_id, e.debit_currency, e.credit_currency,
+                       SUM(e.debit_amount_minor) AS debit_minor,
+                       SUM(e.credit_amount_minor) AS credit_minor,
+                       COUNT(*) FILTER (
+                           WHERE e.debit_amount_minor IS NULL
+                              OR e.credit_amount_minor IS NULL
+                       ) AS unscaled
+                FROM entries e JOIN transactions t ON t.id = e.transaction_id
+                WHERE e.account_id = ANY(%s){date_filter}
+                GROUP BY e.account_id, e.debit_currency, e.credit_currency
+                """,
+                (ids, *date_params),
+            )
+            unscaled_accounts: list[UUID] = []
+            for row in _fetch_dicts(cur):
+                # SUM over BIGINT is NUMERIC in PostgreSQL.
+                totals.add_minor(
+                    row["account_id"],
+                    row["debit_currency"],
+                    row["credit_currency"],
+                    None if row["debit_minor"] is None else int(row["debit_minor"]),
+                    None if row["credit_minor"] is None else int(row["credit_minor"]),
+                )
+                if row["unscaled"]:
+                    unscaled_accounts.append(row["account_id"])
+            if unscaled_accounts:
+                cur.execute(
+                    f"""
+                    SELECT e.account_id, e.debit_amount, e.debit_currency,
+                           e.credit_amount, e.credit_currency,
+                           e.debit_amount_minor, e.credit_amount_minor
+                    FROM entries e JOIN transactions t ON t.id = e.transaction_id
+                    WHERE e.account_id = ANY(%s){date_filter}
+                      AND (e.debit_amount_minor IS NULL
+                           OR e.credit_amount_minor IS NULL)
+                    """,
+                    (list(dict.fromkeys(unscaled_accounts)), *date_params),
+                )
+                for row in _fetch_dicts(cur):
+                    if row["debit_amount_minor"] is None:
+                        totals.add(
+                            row["account_id"],
+                            row["debit_currency"],
+                            debit=_numeric(row["debit_amount"]),
+                        )
+                    if row["credit_amount_minor"] is None:
+                        totals.add(
+                            row["account_id"],
+                            row["credit_currency"],
+                            credit=_numeric(row["credit_amount"]),
+                        )
+        return totals.totals()
+
+    def iter_account_totals(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[AccountTotals]:
+        """Read the latest balance snapshots on or before ``as_of`` in one query.
+
+        Rows come through a server-side cursor, as in ``_stream``.
+        """
+        date_filter = " AND snapshot_date <= %s" if as_of is not None else ""
+        date_params = [as_of] if as_of is not None else []
+        conn = self._db.get_connection()
+        cur = conn.cursor(name=f"totals_stream_{uuid4().hex}", withhold=True)
+        cur.itersize = _STREAM_CHUNK_SIZE
+        try:
+            cur.execute(
+                f"""
+                SELECT DISTINCT ON (account_id, currency)
+                       account_id, currency, debit_total, credit_total
+                FROM account_balance_snapshots
+                WHERE account_id = ANY(%s){date_filter}
+                ORDER BY account_id, currency, snapshot_date DESC
+                """,
+                (list(account_ids), *date_params),
+            )
+            while rows := cur.fetchmany(_STREAM_CHUNK_SIZE):
+                for row in cast(list[dict[str, Any]], rows):
+                    yield AccountTotals(
+                        account_id=row["account_id"],
+                        currency=row["currency"],
+                        debit_total=_numeric(row["debit_total"]),
+                        credit_total=_numeric(row["credit_total"]),
+                    )
+        finally:
+            cur.close()
+
+    def sum_by_account_since(
+        self,
+        opening: Iterable[AccountTotals],
+        opening_date: date,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Carry ``opening`` forward by the change in balance snapshots.
+
+        See ``SQLiteTransactionRepository.sum_by_account_since``.
+        """
+        ids = set(account_ids)
+        activity = _totals_change(
+            self.sum_by_account(ids, as_of=opening_date),
+            self.sum_by_account(ids, as_of=as_of),
+        )
+        return _carry_forward(
+            (totals for totals in opening if totals.account_id in ids), activity
+        )
 
-    def _row_to_transaction(self, row: Any) -> Transaction:
+    def iter_balance_history(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[tuple[date, AccountTotals]]:
+        """Read the balance snapshots up to ``as_of`` in date order, in one query."""
+        date_filter = " AND snapshot_date <= %s" if as_of is not None else ""
+        date_params = [as_of] if as_of is not None else []
+        conn = self._db.get_connection()
+        cur = conn.cursor(name=f"history_stream_{uuid4().hex}", withhold=True)
+        cur.itersize = _STREAM_CHUNK_SIZE
+        try:
+            cur.execute(
+                f"""
+                SELECT account_id, currency, snapshot_date, debit_total, credit_total
+                FROM account_balance_snapshots
+                WHERE account_id = ANY(%s){date_filter}
+                ORDER BY snapshot_date
+                """,
+                (list(account_ids), *date_params),
+            )
+            while rows := cur.fetchmany(_STREAM_CHUNK_SIZE):
+                for row in cast(list[dict[str, Any]], rows):
+                    yield (
+                        row["snapshot_date"],
+                        AccountTotals(
+                            account_id=row["account_id"],
+                            currency=row["currency"],
+                            debit_total=_numeric(row["debit_total"]),
+                            credit_total=_numeric(row["credit_total"]),
+                        ),
+                    )
+        finally:
+            cur.close()
+
+    def _snapshot_totals(
+        self, ids: list[UUID], as_of: date | None
+    ) -> list[AccountTotals]:
+        date_filter = " AND snapshot_date <= %s" if as_of is not None else ""
+        date_params = [as_of] if as_of is not None else []
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM entries WHERE transaction_id = %s", (row["id"],))
-            entry_rows = cur.fetchall()
-        entries = [self._row_to_entry(entry_row) for entry_row in entry_rows]
+            cur.execute(
+                f"""
+                SELECT DISTINCT ON (account_id, currency)
+                       account_id, currency, debit_total, credit_total
+                FROM account_balance_snapshots
+                WHERE account_id = ANY(%s){date_filter}
+                ORDER BY account_id, currency, snapshot_date DESC
+                """,
+                (ids, *date_params),
+            )
+            rows = _fetch_dicts(cur)
+        return [
+            AccountTotals(
+                account_id=row["account_id"],
+                currency=row["currency"],
+                debit_total=_numeric(row["debit_total"]),
+                credit_total=_numeric(row["credit_total"]),
+            )
+            for row in rows
+        ]
 
+    def _apply_balance_snapshots(
+        self,
+        cur: Any,
+        account_totals: Iterable[AccountTotals],
+        snapshot_date: date,
+        sign: int = 1,
+    ) -> None:
+        """Fold posted totals into the running balance snapshots without committing.
+
+        See ``balance_snapshot_changes`` for how each account's snapshots
+        change. The snapshots are read and rewritten, so each account and
+        currency is locked for the rest of the transaction first; keys are
+        locked in sorted order so concurrent postings cannot deadlock.
+        """
+        for totals in sorted(
+            account_totals, key=lambda t: (str(t.account_id), t.currency)
+        ):
+            key = (totals.account_id, totals.currency, snapshot_date)
+            cur.execute(
+                "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                (f"{totals.account_id}:{totals.currency}",),
+            )
+            cur.execute(_LATER_SNAPSHOTS_SQL, key)
+            later = [
+                (row["snapshot_date"], row["debit_total"], row["credit_total"])
+                for row in _fetch_dicts(cur)
+            ]
+            cur.execute(_PREVIOUS_SNAPSHOT_SQL, key)
+            previous = _fetch_dict(cur)
+            changes = balance_snapshot_changes(
+                totals,
+                snapshot_date,
+                sign,
+                later,
+                (
+                    (previous["debit_total"], previous["credit_total"])
+                    if previous is not None
+                    else None
+                ),
+            )
+            if changes.upserts:
+                psycopg2.extras.execute_batch(
+                    cur,
+                    """
+                    INSERT INTO account_balance_snapshots
+                        (account_id, currency, snapshot_date, debit_total, credit_total)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT (account_id, currency, snapshot_date) DO UPDATE
+                    SET debit_total = EXCLUDED.debit_total,
+                        credit_total = EXCLUDED.credit_total
+                    """,
+                    [
+                        (totals.account_id, totals.currency, *row)
+                        for row in changes.upserts
+                    ],
+                )
+            if changes.delete_day:
+                cur.execute(
+                    """
+                    DELETE FROM account_balance_snapshots
+                    WHERE account_id = %s AND currency = %s AND snapshot_date = %s
+                    """,
+                    key,
+                )
+
+    def _rows_to_transactions(self, rows: list[Any]) -> list[Transaction]:
+        """Hydrate transaction rows, loading all of their entries in one query."""
+        if not rows:
+            return []
+        conn = self._db.get_connection()
+        entries_by_txn: dict[UUID, list[Entry]] = {row["id"]: [] for row in rows}
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT * FROM entries WHERE transaction_id = ANY(%s) "
+                "ORDER BY transaction_id, seq",
+                (list(entries_by_txn),),
+            )
+            for entry_row in _fetch_dicts(cur):
+                entries_by_txn[entry_row["transaction_id"]].append(
+                    self._row_to_entry(entry_row)
+                )
+        return [
+            self._row_to_transaction(row, entries_by_txn[row["id"]]) for row in rows
+        ]
+
+    def _row_to_transaction(self, row: Any, entries: list[Entry]) -> Transaction:
         tags_raw = row.get("tags")
         tags: list[str] = json.loads(tags_raw) if tags_raw else []
 
         txn = Transaction(
-            transaction_date=date.fromisoformat(row["transaction_date"]),
+            transaction_date=row["transaction_date"],
             entries=entries,
-            id=UUID(row["id"]),
-            posted_date=date.fromisoformat(row["posted_date"])
-            if row["posted_date"]
-            else None,
+            id=row["id"],
+            posted_date=row["posted_date"],
             memo=row["memo"],
             reference=row["reference"],
-            created_by=UUID(row["created_by"]) if row["created_by"] else None,
+            created_by=row["created_by"],
             is_reversed=bool(row["is_reversed"]),
-            reverses_transaction_id=UUID(row["reverses_transaction_id"])
-            if row["reverses_transaction_id"]
-            else None,
+            reverses_transaction_id=row["reverses_transaction_id"],
             category=row.get("category"),
             tags=tags,
-            vendor_id=UUID(row["vendor_id"]) if row.get("vendor_id") else None,
+            vendor_id=row.get("vendor_id"),
             is_recurring=bool(row.get("is_recurring", False)),
             recurring_frequency=row.get("recurring_frequency"),
         )
-        object.__setattr__(txn, "created_at", datetime.fromisoformat(row["created_at"]))
+        object.__setattr__(txn, "created_at", row["created_at"])
         return txn
 
     def _row_to_entry(self, row: Any) -> Entry:
         return Entry(
-            account_id=UUID(row["account_id"]),
-            id=UUID(row["id"]),
-            debit_amount=Money(Decimal(row["debit_amount"]), row["debit_currency"]),
-            credit_amount=Money(Decimal(row["credit_amount"]), row["credit_currency"]),
+            account_id=row["account_id"],
+            id=row["id"],
+            debit_amount=Money(_numeric(row["debit_amount"]), row["debit_currency"]),
+            credit_amount=Money(_numeric(row["credit_amount"]), row["credit_currency"]),
             memo=row["memo"],
-            tax_lot_id=UUID(row["tax_lot_id"]) if row["tax_lot_id"] else None,
+            tax_lot_id=row["tax_lot_id"],
             category=row.get("category"),
         )
 
@@ -1358,9 +2964,13 @@ class PostgresTaxLotRepository(TaxLotRepository):
         self._db = database
 
     def add(self, lot: TaxLot) -> None:
-        conn = self._db.get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
+        self.add_many([lot])
+
+    def add_many(self, lots: Iterable[TaxLot]) -> None:
+        lots = list(lots)
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            psycopg2.extras.execute_batch(
+                cur,
                 """
                 INSERT INTO tax_lots (id, position_id, acquisition_date, cost_per_share_amount,
                                       cost_per_share_currency, original_quantity, remaining_quantity,
@@ -1369,55 +2979,59 @@ class PostgresTaxLotRepository(TaxLotRepository):
                                       wash_sale_adjustment_currency, reference, created_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
-                (
-                    str(lot.id),
-                    str(lot.position_id),
-                    lot.acquisition_date.isoformat(),
-                    str(lot.cost_per_share.amount),
-                    lot.cost_per_share.currency,
-                    str(lot.original_quantity.value),
-                    str(lot.remaining_quantity.value),
-                    lot.acquisition_type.value,
-                    lot.disposition_date.isoformat() if lot.disposition_date else None,
-                    lot.is_covered,
-                    lot.wash_sale_disallowed,
-                    str(lot.wash_sale_adjustment.amount),
-                    lot.wash_sale_adjustment.currency,
-                    lot.reference,
-                    lot.created_at.isoformat(),
-                ),
+                [_tax_lot_row(lot) for lot in lots],
+            )
+            _bump_ledger_versions(
+                cur, _POSITION_SCOPES_SQL, {lot.position_id for lot in lots}
             )
-        conn.commit()
 
     def get(self, lot_id: UUID) -> TaxLot | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM tax_lots WHERE id = %s", (str(lot_id),))
+            cur.execute("SELECT * FROM tax_lots WHERE id = %s", (lot_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_tax_lot(row)
 
+    def get_many(self, lot_ids: Iterable[UUID]) -> dict[UUID, TaxLot]:
+        rows = _select_by_ids(self._db.get_connection(), "tax_lots", lot_ids)
+        return {obj.id: obj for obj in map(self._row_to_tax_lot, rows)}
+
     def list_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM tax_lots WHERE position_id = %s ORDER BY acquisition_date",
-                (str(position_id),),
+                (position_id,),
             )
             rows = cur.fetchall()
         return [self._row_to_tax_lot(row) for row in rows]
 
+    def list_by_positions(
+        self, position_ids: Iterable[UUID]
+    ) -> dict[UUID, list[TaxLot]]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "tax_lots", position_ids, column="position_id"
+        )
+        lots_by_position: dict[UUID, list[TaxLot]] = {}
+        for row in rows:
+            lot = self._row_to_tax_lot(row)
+            lots_by_position.setdefault(lot.position_id, []).append(lot)
+        for lots in lots_by_position.values():
+            lots.sort(key=lambda lot: lot.acquisition_date)
+        return lots_by_position
+
     def list_open_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 """
                 SELECT * FROM tax_lots
-                WHERE position_id = %s AND CAST(remaining_quantity AS DECIMAL) > 0
+                WHERE position_id = %s AND remaining_quantity > 0
                 ORDER BY acquisition_date
                 """,
-                (str(position_id),),
+                (position_id,),
             )
             rows = cur.fetchall()
         return [self._row_to_tax_lot(row) for row in rows]
@@ -1433,7 +3047,7 @@ class PostgresTaxLotRepository(TaxLotRepository):
                 WHERE position_id = %s AND acquisition_date >= %s AND acquisition_date <= %s
                 ORDER BY acquisition_date
                 """,
-                (str(position_id), start_date.isoformat(), end_date.isoformat()),
+                (position_id, start_date, end_date),
             )
             rows = cur.fetchall()
         return [self._row_to_tax_lot(row) for row in rows]
@@ -1453,7 +3067,7 @@ class PostgresTaxLotRepository(TaxLotRepository):
                 WHERE position_id = %s AND acquisition_date >= %s AND acquisition_date <= %s
                 ORDER BY acquisition_date
                 """,
-                (str(position_id), start_date.isoformat(), end_date.isoformat()),
+                (position_id, start_date, end_date),
             )
             rows = cur.fetchall()
         return [self._row_to_tax_lot(row) for row in rows]
@@ -1480,52 +3094,604 @@ class PostgresTaxLotRepository(TaxLotRepository):
                 WHERE id = %s
                 """,
                 (
-                    str(lot.position_id),
-                    lot.acquisition_date.isoformat(),
-                    str(lot.cost_per_share.amount),
+                    lot.position_id,
+                    lot.acquisition_date,
+                    lot.cost_per_share.amount,
                     lot.cost_per_share.currency,
-                    str(lot.original_quantity.value),
-                    str(lot.remaining_quantity.value),
+                    lot.original_quantity.value,
+                    lot.remaining_quantity.value,
                     lot.acquisition_type.value,
-                    lot.disposition_date.isoformat() if lot.disposition_date else None,
+                    lot.disposition_date,
                     lot.is_covered,
                     lot.wash_sale_disallowed,
-                    str(lot.wash_sale_adjustment.amount),
+                    lot.wash_sale_adjustment.amount,
                     lot.wash_sale_adjustment.currency,
                     lot.reference,
-                    str(lot.id),
+                    lot.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _POSITION_SCOPES_SQL, [lot.position_id])
+        self._db.commit()
 
     def _row_to_tax_lot(self, row: Any) -> TaxLot:
         lot = TaxLot(
-            position_id=UUID(row["position_id"]),
-            acquisition_date=date.fromisoformat(row["acquisition_date"]),
+            position_id=row["position_id"],
+            acquisition_date=row["acquisition_date"],
             cost_per_share=Money(
-                Decimal(row["cost_per_share_amount"]), row["cost_per_share_currency"]
+                _numeric(row["cost_per_share_amount"]), row["cost_per_share_currency"]
             ),
-            original_quantity=Quantity(Decimal(row["original_quantity"])),
-            id=UUID(row["id"]),
+            original_quantity=Quantity(_numeric(row["original_quantity"])),
+            id=row["id"],
             acquisition_type=AcquisitionType(row["acquisition_type"]),
-            disposition_date=date.fromisoformat(row["disposition_date"])
-            if row["disposition_date"]
-            else None,
+            disposition_date=row["disposition_date"],
             is_covered=bool(row["is_covered"]),
             wash_sale_disallowed=bool(row["wash_sale_disallowed"]),
             wash_sale_adjustment=Money(
-                Decimal(row["wash_sale_adjustment_amount"]),
+                _numeric(row["wash_sale_adjustment_amount"]),
                 row["wash_sale_adjustment_currency"],
             ),
             reference=row["reference"],
         )
         # Set remaining_quantity (it's set in __post_init__ to original_quantity)
-        lot.remaining_quantity = Quantity(Decimal(row["remaining_quantity"]))
+        lot.remaining_quantity = Quantity(_numeric(row["remaining_quantity"]))
         # Set created_at directly
-        object.__setattr__(lot, "created_at", datetime.fromisoformat(row["created_at"]))
+        object.__setattr__(lot, "created_at", row["created_at"])
         return lot
 
 
+def _copy_field(value: Any) -> str:
+    """Render one value in the text format of ``COPY ... FROM STDIN``."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, Enum):
+        value = value.value
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _CopyStream:
+    """File-like reader that renders rows for ``copy_expert`` on demand.
+
+    Rows are formatted as psycopg2 asks for the next chunk, so a load never
+    holds the whole COPY payload in memory.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(rows)
+        self._pending = ""
+        self.row_count = 0
+
+    def read(self, size: int = -1) -> str:
+        lines: list[str] = []
+        buffered = len(self._pending)
+        while size < 0 or buffered < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = "\t".join(map(_copy_field, row)) + "\n"
+            lines.append(line)
+            buffered += len(line)
+            self.row_count += 1
+        data = self._pending + "".join(lines)
+        if size < 0:
+            self._pending = ""
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+
+@dataclass(frozen=True)
+class BulkLoadResult:
+    """Rows written by one :meth:`PostgresBulkLoader.load` call."""
+
+    transactions: int = 0
+    entries: int = 0
+    tax_lots: int = 0
+    positions: int = 0
+
+    @property
+    def total_rows(self) -> int:
+        return self.transactions + self.entries + self.tax_lots + self.positions
+
+
+class PostgresBulkLoader:
+    """Load large batches of ledger rows through ``COPY ... FROM STDIN``.
+
+    Positions, tax lots, transactions and entries are streamed with
+    ``copy_expert`` into temporary staging tables and then merged into the
+    ledger tables, together with the running balance snapshots, by a single
+    statement. A load is therefore all-or-nothing and costs a handful of
+    round trips however many rows it carries, where ``add_many`` sends a
+    batch of INSERTs per page of rows and updates the snapshots per account
+    and date.
+
+    ``validate`` receives every transaction before anything is sent and
+    must raise to reject the load; pass
+    ``LedgerServiceImpl.validate_transactions`` so a bulk load accepts
+    exactly what ``post_transaction`` would. When ``views`` is given, the
+    rows written by each load are reported to its
+    :meth:`PostgresReportingViews.note_writes` once the load has committed.
+    """
+
+    _STAGING = (
+        ("staging_positions", "positions", _POSITION_COLUMNS),
+        ("staging_tax_lots", "tax_lots", _TAX_LOT_COLUMNS),
+        ("staging_transactions", "transactions", _TRANSACTION_COLUMNS),
+        ("staging_entries", "entries", _ENTRY_COLUMNS),
+    )
+
+    # Entities owning the staged entries, positions and tax lots, read
+    # before the staging tables are dropped at commit.
+    _STAGED_SCOPES_SQL = """
+        SELECT a.entity_id::text AS scope FROM accounts a
+        WHERE a.id IN (
+            SELECT account_id FROM staging_entries
+            UNION SELECT account_id FROM staging_positions
+        )
+        UNION
+        SELECT a.entity_id::text FROM positions p
+        JOIN accounts a ON a.id = p.account_id
+        WHERE p.id IN (SELECT position_id FROM staging_tax_lots)
+    """
+
+    def __init__(
+        self,
+        database: PostgresDatabase,
+        validate: Callable[[Sequence[Transaction]], None],
+        views: PostgresReportingViews | None = None,
+    ) -> None:
+        self._db = database
+        self._validate = validate
+        self._views = views
+
+    def load(
+        self,
+        transactions: Iterable[Transaction] = (),
+        tax_lots: Iterable[TaxLot] = (),
+        positions: Iterable[Position] = (),
+    ) -> BulkLoadResult:
+        """Validate and write ``transactions``, ``tax_lots`` and ``positions``.
+
+        Rows whose id already exists make the whole load fail, as they would
+        with ``add_many``. Returns the number of rows merged per table.
+        """
+        txns = list(transactions)
+        self._validate(txns)
+        rows: dict[str, Iterable[tuple[Any, ...]]] = {
+            "staging_positions": map(_position_row, positions),
+            "staging_tax_lots": map(_tax_lot_row, tax_lots),
+            "staging_transactions": map(_transaction_row, txns),
+            "staging_entries": (
+                _entry_row(txn, entry) for txn in txns for entry in txn.entries
+            ),
+        }
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            for staging, table, columns in self._STAGING:
+                cur.execute(
+                    f"CREATE TEMP TABLE {staging} "
+                    f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                # copy_expert only calls read(); the stubs want a full TextIO.
+                cur.copy_expert(
+                    f"COPY {staging} ({', '.join(columns)}) FROM STDIN",
+                    cast(TextIO, _CopyStream(rows[staging])),
+                )
+            cur.execute(self._merge_sql())
+            merged = _fetch_dict(cur)
+            _bump_ledger_versions(cur, self._STAGED_SCOPES_SQL, ())
+        assert merged is not None
+        result = BulkLoadResult(
+            transactions=merged["transactions"],
+            entries=merged["entries"],
+            tax_lots=merged["tax_lots"],
+            positions=merged["positions"],
+        )
+        if self._views is not None:
+            self._views.note_writes(result.total_rows)
+        return result
+
+    @classmethod
+    def _merge_sql(cls) -> str:
+        """One statement that moves the staged rows into the ledger tables.
+
+        Foreign keys are checked at the end of the statement, so entries may
+        reference tax lots and transactions inserted alongside them. Balance
+        snapshots are folded in the same way as
+        ``PostgresTransactionRepository._apply_balance_snapshots`` does for
+        each posting: every snapshot on or after a staged date is shifted by
+        the staged totals up to that date, and a missing snapshot for a
+        staged date starts from the latest earlier one.
+        """
+        inserts = ",\n".join(
+            f"""
+            new_{table} AS (
+                INSERT INTO {table} ({", ".join(columns)})
+                SELECT {", ".join(columns)} FROM {staging}
+                RETURNING 1
+            )"""
+            for staging, table, columns in cls._STAGING
+        )
+        return f"""
+            WITH {inserts},
+            delta AS ({_daily_totals_sql("staging_entries", "staging_transactions")}),
+            affected AS (
+                SELECT account_id, currency, snapshot_date FROM delta
+                UNION
+                SELECT s.account_id, s.currency, s.snapshot_date
+                FROM account_balance_snapshots s
+                JOIN (
+                    SELECT account_id, currency, MIN(snapshot_date) AS first_date
+                    FROM delta GROUP BY account_id, currency
+                ) f ON f.account_id = s.account_id AND f.currency = s.currency
+                WHERE s.snapshot_date >= f.first_date
+            ),
+            new_snapshots AS (
+                INSERT INTO account_balance_snapshots
+                    (account_id, currency, snapshot_date, debit_total, credit_total)
+                SELECT a.account_id, a.currency, a.snapshot_date,
+                       COALESCE(prev.debit_total, 0) + added.debit,
+                       COALESCE(prev.credit_total, 0) + added.credit
+                FROM affected a
+                CROSS JOIN LATERAL (
+                    SELECT SUM(d.debit) AS debit, SUM(d.credit) AS credit
+                    FROM delta d
+                    WHERE d.account_id = a.account_id AND d.currency = a.currency
+                      AND d.snapshot_date <= a.snapshot_date
+                ) added
+                LEFT JOIN LATERAL (
+                    SELECT s.debit_total, s.credit_total
+                    FROM account_balance_snapshots s
+                    WHERE s.account_id = a.account_id AND s.currency = a.currency
+                      AND s.snapshot_date <= a.snapshot_date
+                    ORDER BY s.snapshot_date DESC LIMIT 1
+                ) prev ON TRUE
+                ON CONFLICT (account_id, currency, snapshot_date) DO UPDATE
+                SET debit_total = EXCLUDED.debit_total,
+                    credit_total = EXCLUDED.credit_total
+                RETURNING 1
+            )
+            SELECT (SELECT COUNT(*) FROM new_transactions) AS transactions,
+                   (SELECT COUNT(*) FROM new_entries) AS entries,
+                   (SELECT COUNT(*) FROM new_tax_lots) AS tax_lots,
+                   (SELECT COUNT(*) FROM new_positions) AS positions,
+                   (SELECT COUNT(*) FROM new_snapshots) AS snapshots
+        """
+
+
+def _entity_balances_sql(where: str) -> str:
+    """SELECT of ``EntityBalance`` rows from ``mv_account_daily_balances``.
+
+    Each account's balance is taken from its latest row matching ``where``
+    and added up across currencies, as ``sum_by_account`` totals are by the
+    live reports; assets and liabilities are then totalled per entity and
+    account currency.
+    """
+    return f"""
+        SELECT entity_id, account_currency AS currency,
+               COALESCE(SUM(balance) FILTER (WHERE account_type = 'asset'), 0)
+                   AS total_assets,
+               COALESCE(SUM(ABS(balance)) FILTER (WHERE account_type = 'liability'), 0)
+                   AS total_liabilities
+        FROM (
+            SELECT entity_id, account_id, account_type, account_currency,
+                   SUM(balance) AS balance
+            FROM (
+                SELECT DISTINCT ON (account_id, currency)
+                       entity_id, account_id, account_type, account_currency, balance
+                FROM mv_account_daily_balances
+                WHERE {where}
+                ORDER BY account_id, currency, balance_date DESC
+            ) latest
+            GROUP BY entity_id, account_id, account_type, account_currency
+        ) account_balances
+        GROUP BY entity_id, account_currency
+    """
+
+
+class PostgresReportingViews(ReportingViewRepository):
+    """Materialized views read by the net worth, balance sheet, dashboard and
+    position reports instead of aggregating per account in Python.
+
+    :meth:`create` builds, from the ledger tables:
+
+    * ``mv_account_daily_balances``: the running balance of each account
+      and currency on every day with activity;
+    * ``mv_entity_balances``: the latest asset and liability totals per
+      entity and account currency;
+    * ``mv_entity_activity``: account and transaction counts per entity;
+    * ``mv_position_values``: positions with their account and security.
+
+    The views are optional: nothing reads them until a
+    ``ReportingServiceImpl`` is given this repository, and it falls back to
+    live computation when :meth:`refreshed_at` is too old. :meth:`refresh`
+    runs ``REFRESH MATERIALIZED VIEW CONCURRENTLY``, so reports keep reading
+    the previous contents meanwhile. Call it on a schedule
+    (:meth:`start_refresh_schedule`) or after large writes
+    (:meth:`note_writes`, which ``PostgresBulkLoader`` calls).
+    """
+
+    # (name, query, unique key); listed in refresh order, as
+    # mv_entity_balances is computed from mv_account_daily_balances.
+    _VIEWS = (
+        (
+            "mv_account_daily_balances",
+            f"""
+            SELECT a.entity_id, r.account_id, a.account_type,
+                   a.currency AS account_currency, r.currency,
+                   r.snapshot_date AS balance_date,
+                   r.debit_total - r.credit_total AS balance
+            FROM ({_RUNNING_TOTALS_SQL}) r JOIN accounts a ON a.id = r.account_id
+            """,
+            ("account_id", "currency", "balance_date"),
+        ),
+        (
+            "mv_entity_balances",
+            _entity_balances_sql("TRUE"),
+            ("entity_id", "currency"),
+        ),
+        (
+            "mv_entity_activity",
+            """
+            SELECT e.id AS entity_id,
+                   (SELECT COUNT(*) FROM accounts a WHERE a.entity_id = e.id)
+                       AS account_count,
+                   (
+                       SELECT COUNT(DISTINCT en.transaction_id)
+                       FROM entries en JOIN accounts a ON a.id = en.account_id
+                       WHERE a.entity_id = e.id
+                   ) AS transaction_count
+            FROM entities e
+            """,
+            ("entity_id",),
+        ),
+        (
+            "mv_position_values",
+            """
+            SELECT p.id AS position_id, a.entity_id, a.name AS account_name,
+                   s.symbol AS security_symbol, s.name AS security_name,
+                   p.quantity, p.cost_basis_amount, p.cost_basis_currency,
+                   p.market_value_amount, p.market_value_currency
+            FROM positions p
+            JOIN accounts a ON a.id = p.account_id
+            LEFT JOIN securities s ON s.id = p.security_id
+            """,
+            ("position_id",),
+        ),
+    )
+
+    def __init__(
+        self, database: PostgresDatabase, *, refresh_after_rows: int = 10_000
+    ) -> None:
+        self._db = database
+        self._refresh_after_rows = refresh_after_rows
+        self._pending_rows = 0
+        self._lock = threading.Lock()
+        self._schedule: tuple[threading.Thread, threading.Event] | None = None
+
+    def create(self) -> None:
+        """Create and populate the views if they do not exist yet."""
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS materialized_view_refreshes (
+                    view_name TEXT PRIMARY KEY,
+                    refreshed_at TIMESTAMPTZ NOT NULL
+                )
+                """
+            )
+            for name, query, key in self._VIEWS:
+                cur.execute(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {query}")
+                # REFRESH ... CONCURRENTLY needs a unique index on plain columns.
+                cur.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {name}_key "
+                    f"ON {name} ({', '.join(key)})"
+                )
+            cur.execute(
+                """
+                CREATE INDEX IF NOT EXISTS mv_account_daily_balances_entity
+                    ON mv_account_daily_balances (entity_id);
+                CREATE INDEX IF NOT EXISTS mv_account_daily_balances_date
+                    ON mv_account_daily_balances (balance_date);
+                CREATE INDEX IF NOT EXISTS mv_position_values_entity
+                    ON mv_position_values (entity_id);
+                """
+            )
+            self._record_refresh(cur)
+
+    def refresh(self, concurrently: bool = True) -> None:
+        """Recompute every view from the ledger tables, in one transaction."""
+        with self._lock:
+            self._pending_rows = 0
+        mode = " CONCURRENTLY" if concurrently else ""
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            for name, _, _ in self._VIEWS:
+                cur.execute(f"REFRESH MATERIALIZED VIEW{mode} {name}")
+            self._record_refresh(cur)
+            # Reports served from the views change with them.
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE])
+
+    def note_writes(self, rows: int) -> None:
+        """Count ``rows`` written and refresh once ``refresh_after_rows`` add up."""
+        with self._lock:
+            self._pending_rows += rows
+            due = self._pending_rows >= self._refresh_after_rows
+        if due:
+            self.refresh()
+
+    def start_refresh_schedule(self, interval: float) -> None:
+        """Refresh every ``interval`` seconds on a daemon thread.
+
+        Each refresh checks out its own pooled connection. Failures are
+        logged and retried on the next tick.
+        """
+        if self._schedule is not None:
+            raise RuntimeError("The refresh schedule is already running")
+        stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    with self._db.scope():
+                        self.refresh()
+                except psycopg2.Error as exc:
+                    logger.warning("reporting_view_refresh_failed", error=str(exc))
+
+        thread = threading.Thread(
+            target=run, name="reporting-view-refresh", daemon=True
+        )
+        self._schedule = (thread, stop)
+        thread.start()
+
+    def stop_refresh_schedule(self) -> None:
+        """Stop the schedule started by :meth:`start_refresh_schedule`."""
+        if self._schedule is None:
+            return
+        thread, stop = self._schedule
+        self._schedule = None
+        stop.set()
+        thread.join()
+
+    def _record_refresh(self, cur: Any) -> None:
+        psycopg2.extras.execute_batch(
+            cur,
+            """
+            INSERT INTO materialized_view_refreshes (view_name, refreshed_at)
+            VALUES (%s, now())
+            ON CONFLICT (view_name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+            """,
+            [(name,) for name, _, _ in self._VIEWS],
+        )
+
+    def refreshed_at(self) -> datetime | None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT to_regclass('materialized_view_refreshes') IS NOT NULL AS ready"
+            )
+            row = _fetch_dict(cur)
+            assert row is not None
+            if not row["ready"]:
+                return None
+            cur.execute(
+                """
+                SELECT COUNT(*) AS views, MIN(refreshed_at) AS refreshed_at
+                FROM materialized_view_refreshes WHERE view_name = ANY(%s)
+                """,
+                ([name for name, _, _ in self._VIEWS],),
+            )
+            row = _fetch_dict(cur)
+        assert row is not None
+        if row["views"] < len(self._VIEWS):
+            return None
+        refreshed_at: datetime = row["refreshed_at"]
+        return refreshed_at
+
+    def account_balances(
+        self, account_ids: Iterable[UUID], as_of: date
+    ) -> dict[UUID, Decimal]:
+        ids = list(dict.fromkeys(account_ids))
+        if not ids:
+            return {}
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT account_id, SUM(balance) AS balance
+                FROM (
+                    SELECT DISTINCT ON (account_id, currency) account_id, balance
+                    FROM mv_account_daily_balances
+                    WHERE account_id = ANY(%s) AND balance_date <= %s
+                    ORDER BY account_id, currency, balance_date DESC
+                ) latest
+                GROUP BY account_id
+                """,
+                (ids, as_of),
+            )
+            rows = _fetch_dicts(cur)
+        return {row["account_id"]: _numeric(row["balance"]) for row in rows}
+
+    def entity_balances(
+        self, entity_ids: Iterable[UUID], as_of: date
+    ) -> list[EntityBalance]:
+        """Read ``mv_entity_balances`` unless ``as_of`` precedes later activity.
+
+        Earlier dates are totalled from ``mv_account_daily_balances``.
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return []
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT MAX(balance_date) AS through FROM mv_account_daily_balances"
+            )
+            row = _fetch_dict(cur)
+            assert row is not None
+            through = row["through"]
+            if through is None or as_of >= through:
+                cur.execute(
+                    "SELECT * FROM mv_entity_balances WHERE entity_id = ANY(%s)",
+                    (ids,),
+                )
+            else:
+                cur.execute(
+                    _entity_balances_sql("entity_id = ANY(%s) AND balance_date <= %s"),
+                    (ids, as_of),
+                )
+            rows = _fetch_dicts(cur)
+        return [
+            EntityBalance(
+                entity_id=row["entity_id"],
+                currency=row["currency"],
+                total_assets=_numeric(row["total_assets"]),
+                total_liabilities=_numeric(row["total_liabilities"]),
+            )
+            for row in rows
+        ]
+
+    def entity_activity(self, entity_ids: Iterable[UUID]) -> dict[UUID, EntityActivity]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "mv_entity_activity", entity_ids, "entity_id"
+        )
+        return {
+            row["entity_id"]: EntityActivity(
+                entity_id=row["entity_id"],
+                account_count=row["account_count"],
+                transaction_count=row["transaction_count"],
+            )
+            for row in rows
+        }
+
+    def position_values(self, entity_ids: Iterable[UUID]) -> list[PositionValue]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "mv_position_values", entity_ids, "entity_id"
+        )
+        return [
+            PositionValue(
+                position_id=row["position_id"],
+                entity_id=row["entity_id"],
+                account_name=row["account_name"],
+                security_symbol=row["security_symbol"] or "Unknown",
+                security_name=row["security_name"] or "Unknown",
+                quantity=_numeric(row["quantity"]),
+                cost_basis=Money(
+                    _numeric(row["cost_basis_amount"]), row["cost_basis_currency"]
+                ),
+                market_value=Money(
+                    _numeric(row["market_value_amount"]), row["market_value_currency"]
+                ),
+            )
+            for row in rows
+        ]
+
+
 class PostgresReconciliationSessionRepository(ReconciliationSessionRepository):
     """PostgreSQL implementation of ReconciliationSessionRepository."""
 
@@ -1533,192 +3699,331 @@ class PostgresReconciliationSessionRepository(ReconciliationSessionRepository):
         self._db = database
 
     def add(self, session: ReconciliationSession) -> None:
-        conn = self._db.get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
+        self.add_many([session])
+
+    def add_many(self, sessions: Iterable[ReconciliationSession]) -> None:
+        sessions = list(sessions)
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            psycopg2.extras.execute_batch(
+                cur,
                 """
                 INSERT INTO reconciliation_sessions (id, account_id, file_name, file_format,
                                                       status, created_at, closed_at)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """,
-                (
-                    str(session.id),
-                    str(session.account_id),
-                    session.file_name,
-                    session.file_format,
-                    session.status.value,
-                    session.created_at.isoformat(),
-                    session.closed_at.isoformat() if session.closed_at else None,
-                ),
-            )
-            for match in session.matches:
-                cur.execute(
-                    """
-                    INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
-                                                         imported_amount, imported_description,
-                                                         suggested_ledger_txn_id, confidence_score,
-                                                         status, actioned_at, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
+                [
                     (
-                        str(match.id),
-                        str(session.id),
-                        match.imported_id,
-                        match.imported_date.isoformat(),
-                        str(match.imported_amount),
-                        match.imported_description,
-                        str(match.suggested_ledger_txn_id)
-                        if match.suggested_ledger_txn_id
-                        else None,
-                        match.confidence_score,
-                        match.status.value,
-                        match.actioned_at.isoformat() if match.actioned_at else None,
-                        match.created_at.isoformat(),
-                    ),
+                        session.id,
+                        session.account_id,
+                        session.file_name,
+                        session.file_format,
+                        session.status.value,
+                        session.created_at,
+                        session.closed_at,
+                    )
+                    for session in sessions
+                ],
+            )
+            self._insert_matches(
+                cur,
+                [
+                    (session.id, match)
+                    for session in sessions
+                    for match in session.matches
+                ],
+            )
+        for session in sessions:
+            session.mark_clean()
+
+    def _insert_matches(
+        self, cur: Any, matches: list[tuple[UUID, ReconciliationMatch]]
+    ) -> None:
+        psycopg2.extras.execute_batch(
+            cur,
+            """
+            INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
+                                                 imported_amount, imported_description,
+                                                 suggested_ledger_txn_id, confidence_score,
+                                                 status, actioned_at, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            [
+                (
+                    match.id,
+                    session_id,
+                    match.imported_id,
+                    match.imported_date,
+                    match.imported_amount,
+                    match.imported_description,
+                    match.suggested_ledger_txn_id,
+                    match.confidence_score,
+                    match.status.value,
+                    match.actioned_at,
+                    match.created_at,
                 )
-        conn.commit()
+                for session_id, match in matches
+            ],
+        )
+
+    def _update_matches(self, cur: Any, matches: list[ReconciliationMatch]) -> None:
+        psycopg2.extras.execute_batch(
+            cur,
+            """
+            UPDATE reconciliation_matches SET
+                imported_id = %s,
+                imported_date = %s,
+                imported_amount = %s,
+                imported_description = %s,
+                suggested_ledger_txn_id = %s,
+                confidence_score = %s,
+                status = %s,
+                actioned_at = %s
+            WHERE id = %s
+            """,
+            [
+                (
+                    match.imported_id,
+                    match.imported_date,
+                    match.imported_amount,
+                    match.imported_description,
+                    match.suggested_ledger_txn_id,
+                    match.confidence_score,
+                    match.status.value,
+                    match.actioned_at,
+                    match.id,
+                )
+                for match in matches
+            ],
+        )
 
     def get(self, session_id: UUID) -> ReconciliationSession | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM reconciliation_sessions WHERE id = %s",
-                (str(session_id),),
+                (session_id,),
             )
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_session(row)
 
-    def get_pending_for_account(self, account_id: UUID) -> ReconciliationSession | None:
+    def get_many(
+        self, session_ids: Iterable[UUID]
+    ) -> dict[UUID, ReconciliationSession]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "reconciliation_sessions", session_ids
+        )
+        return {obj.id: obj for obj in map(self._row_to_session, rows)}
+
+    def get_without_matches(self, session_id: UUID) -> ReconciliationSession | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
-                "SELECT * FROM reconciliation_sessions WHERE account_id = %s AND status = %s",
-                (str(account_id), ReconciliationSessionStatus.PENDING.value),
+                "SELECT * FROM reconciliation_sessions WHERE id = %s",
+                (session_id,),
             )
             row = cur.fetchone()
         if row is None:
             return None
-        return self._row_to_session(row)
+        return self._row_to_session(row, matches=[])
 
-    def update(self, session: ReconciliationSession) -> None:
+    def get_match(self, session_id: UUID, match_id: UUID) -> ReconciliationMatch | None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT * FROM reconciliation_matches WHERE id = %s AND session_id = %s",
+                (match_id, session_id),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return None
+        return self._row_to_match(row)
+
+    def list_matches(
+        self,
+        session_id: UUID,
+        status: ReconciliationMatchStatus | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[ReconciliationMatch]:
+        query = "SELECT * FROM reconciliation_matches WHERE session_id = %s"
+        params: list[Any] = [session_id]
+        if status is not None:
+            query += " AND status = %s"
+            params.append(status.value)
+        if after is not None:
+            query += " AND (created_at, id) > (%s, %s)"
+            params.extend(after)
+        query += " ORDER BY created_at, id LIMIT %s OFFSET %s"
+        params.extend([limit, offset])
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+        return [self._row_to_match(row) for row in rows]
+
+    def count_matches(self, session_id: UUID) -> dict[ReconciliationMatchStatus, int]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 """
-                UPDATE reconciliation_sessions SET
-                    account_id = %s,
-                    file_name = %s,
-                    file_format = %s,
-                    status = %s,
-                    closed_at = %s
-                WHERE id = %s
+                SELECT status, COUNT(*) AS cnt FROM reconciliation_matches
+                WHERE session_id = %s
+                GROUP BY status
                 """,
-                (
-                    str(session.account_id),
-                    session.file_name,
-                    session.file_format,
-                    session.status.value,
-                    session.closed_at.isoformat() if session.closed_at else None,
-                    str(session.id),
-                ),
+                (session_id,),
             )
+            rows = _fetch_dicts(cur)
+        counts = dict.fromkeys(ReconciliationMatchStatus, 0)
+        counts.update(
+            {ReconciliationMatchStatus(row["status"]): row["cnt"] for row in rows}
+        )
+        return counts
+
+    def get_pending_for_account(self, account_id: UUID) -> ReconciliationSession | None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
             cur.execute(
-                "DELETE FROM reconciliation_matches WHERE session_id = %s",
-                (str(session.id),),
+                "SELECT * FROM reconciliation_sessions WHERE account_id = %s AND status = %s",
+                (account_id, ReconciliationSessionStatus.PENDING.value),
             )
-            for match in session.matches:
+            row = cur.fetchone()
+        if row is None:
+            return None
+        return self._row_to_session(row)
+
+    def update(self, session: ReconciliationSession) -> None:
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            if session.is_dirty or not session.is_persisted:
                 cur.execute(
                     """
-                    INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
-                                                         imported_amount, imported_description,
-                                                         suggested_ledger_txn_id, confidence_score,
-                                                         status, actioned_at, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    UPDATE reconciliation_sessions SET
+                        account_id = %s,
+                        file_name = %s,
+                        file_format = %s,
+                        status = %s,
+                        closed_at = %s
+                    WHERE id = %s
                     """,
                     (
-                        str(match.id),
-                        str(session.id),
-                        match.imported_id,
-                        match.imported_date.isoformat(),
-                        str(match.imported_amount),
-                        match.imported_description,
-                        str(match.suggested_ledger_txn_id)
-                        if match.suggested_ledger_txn_id
-                        else None,
-                        match.confidence_score,
-                        match.status.value,
-                        match.actioned_at.isoformat() if match.actioned_at else None,
-                        match.created_at.isoformat(),
+                        session.account_id,
+                        session.file_name,
+                        session.file_format,
+                        session.status.value,
+                        session.closed_at,
+                        session.id,
                     ),
                 )
-        conn.commit()
+            if not session.is_persisted:
+                cur.execute(
+                    "DELETE FROM reconciliation_matches WHERE session_id = %s",
+                    (session.id,),
+                )
+            changes = session.match_changes()
+            if changes.removed_ids:
+                cur.execute(
+                    "DELETE FROM reconciliation_matches WHERE id = ANY(%s)",
+                    (list(changes.removed_ids),),
+                )
+            if changes.changed:
+                self._update_matches(cur, changes.changed)
+            if changes.added:
+                self._insert_matches(
+                    cur, [(session.id, match) for match in changes.added]
+                )
+        session.mark_clean()
+
+    def update_matches(self, matches: Iterable[ReconciliationMatch]) -> None:
+        matches = list(matches)
+        with self._db.unit_of_work(), self._db.get_connection().cursor() as cur:
+            self._update_matches(cur, matches)
+        for match in matches:
+            match.mark_clean()
+
+    def update_match_status(
+        self,
+        session_id: UUID,
+        match_id: UUID,
+        status: ReconciliationMatchStatus,
+        actioned_at: datetime | None = None,
+    ) -> None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE reconciliation_matches SET status = %s, actioned_at = %s
+                WHERE id = %s AND session_id = %s
+                """,
+                (
+                    status.value,
+                    actioned_at,
+                    match_id,
+                    session_id,
+                ),
+            )
+        self._db.commit()
 
     def delete(self, session_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
-                "DELETE FROM reconciliation_sessions WHERE id = %s", (str(session_id),)
+                "DELETE FROM reconciliation_sessions WHERE id = %s", (session_id,)
             )
-        conn.commit()
+        self._db.commit()
 
     def list_by_account(self, account_id: UUID) -> list[ReconciliationSession]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM reconciliation_sessions WHERE account_id = %s",
-                (str(account_id),),
+                (account_id,),
             )
             rows = cur.fetchall()
         return [self._row_to_session(row) for row in rows]
 
-    def _row_to_session(self, row: Any) -> ReconciliationSession:
-        conn = self._db.get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT * FROM reconciliation_matches WHERE session_id = %s ORDER BY created_at ASC",
-                (row["id"],),
-            )
-            match_rows = cur.fetchall()
-        matches = [self._row_to_match(match_row) for match_row in match_rows]
+    def _row_to_session(
+        self, row: Any, matches: list[ReconciliationMatch] | None = None
+    ) -> ReconciliationSession:
+        if matches is None:
+            conn = self._db.get_connection()
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT * FROM reconciliation_matches WHERE session_id = %s ORDER BY created_at ASC, id ASC",
+                    (row["id"],),
+                )
+                match_rows = cur.fetchall()
+            matches = [self._row_to_match(match_row) for match_row in match_rows]
 
         session = ReconciliationSession(
-            account_id=UUID(row["account_id"]),
+            account_id=row["account_id"],
             file_name=row["file_name"],
             file_format=row["file_format"],
-            id=UUID(row["id"]),
+            id=row["id"],
             status=ReconciliationSessionStatus(row["status"]),
             matches=matches,
-            closed_at=datetime.fromisoformat(row["closed_at"])
-            if row["closed_at"]
-            else None,
-        )
-        object.__setattr__(
-            session, "created_at", datetime.fromisoformat(row["created_at"])
+            closed_at=row["closed_at"],
         )
+        object.__setattr__(session, "created_at", row["created_at"])
+        session.mark_clean()
         return session
 
     def _row_to_match(self, row: Any) -> ReconciliationMatch:
         match = ReconciliationMatch(
-            session_id=UUID(row["session_id"]),
+            session_id=row["session_id"],
             imported_id=row["imported_id"],
-            imported_date=date.fromisoformat(row["imported_date"]),
-            imported_amount=Decimal(row["imported_amount"]),
-            id=UUID(row["id"]),
+            imported_date=row["imported_date"],
+            imported_amount=_numeric(row["imported_amount"]),
+            id=row["id"],
             imported_description=row["imported_description"],
-            suggested_ledger_txn_id=UUID(row["suggested_ledger_txn_id"])
-            if row["suggested_ledger_txn_id"]
-            else None,
+            suggested_ledger_txn_id=row["suggested_ledger_txn_id"],
             confidence_score=row["confidence_score"],
             status=ReconciliationMatchStatus(row["status"]),
-            actioned_at=datetime.fromisoformat(row["actioned_at"])
-            if row["actioned_at"]
-            else None,
-        )
-        object.__setattr__(
-            match, "created_at", datetime.fromisoformat(row["created_at"])
+            actioned_at=row["actioned_at"],
         )
+        object.__setattr__(match, "created_at", row["created_at"])
+        match.mark_clean()
         return match
 
 
@@ -1738,26 +4043,33 @@ class PostgresExchangeRateRepository(ExchangeRateRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(rate.id),
+                    rate.id,
                     rate.from_currency,
                     rate.to_currency,
-                    str(rate.rate),
-                    rate.effective_date.isoformat(),
+                    rate.rate,
+                    rate.effective_date,
                     rate.source.value,
-                    rate.created_at.isoformat(),
+                    rate.created_at,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(
+                cur, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE, EXCHANGE_RATE_SCOPE]
+            )
+        self._db.commit()
 
     def get(self, rate_id: UUID) -> ExchangeRate | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM exchange_rates WHERE id = %s", (str(rate_id),))
+            cur.execute("SELECT * FROM exchange_rates WHERE id = %s", (rate_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_exchange_rate(row)
 
+    def get_many(self, rate_ids: Iterable[UUID]) -> dict[UUID, ExchangeRate]:
+        rows = _select_by_ids(self._db.get_connection(), "exchange_rates", rate_ids)
+        return {obj.id: obj for obj in map(self._row_to_exchange_rate, rows)}
+
     def get_rate(
         self,
         from_currency: str,
@@ -1771,7 +4083,7 @@ class PostgresExchangeRateRepository(ExchangeRateRepository):
                 SELECT * FROM exchange_rates
                 WHERE from_currency = %s AND to_currency = %s AND effective_date = %s
                 """,
-                (from_currency, to_currency, effective_date.isoformat()),
+                (from_currency, to_currency, effective_date),
             )
             row = cur.fetchone()
         if row is None:
@@ -1811,14 +4123,14 @@ class PostgresExchangeRateRepository(ExchangeRateRepository):
             SELECT * FROM exchange_rates
             WHERE from_currency = %s AND to_currency = %s
         """
-        params: list[str] = [from_currency, to_currency]
+        params: list[Any] = [from_currency, to_currency]
 
         if start_date is not None:
             query += " AND effective_date >= %s"
-            params.append(start_date.isoformat())
+            params.append(start_date)
         if end_date is not None:
             query += " AND effective_date <= %s"
-            params.append(end_date.isoformat())
+            params.append(end_date)
 
         query += " ORDER BY effective_date"
         with conn.cursor() as cur:
@@ -1831,30 +4143,41 @@ class PostgresExchangeRateRepository(ExchangeRateRepository):
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM exchange_rates WHERE effective_date = %s",
-                (effective_date.isoformat(),),
+                (effective_date,),
             )
             rows = cur.fetchall()
         return [self._row_to_exchange_rate(row) for row in rows]
 
+    def list_currency_pairs(self) -> list[tuple[str, str]]:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT DISTINCT from_currency, to_currency FROM exchange_rates "
+                "ORDER BY from_currency, to_currency"
+            )
+            rows = _fetch_dicts(cur)
+        return [(row["from_currency"], row["to_currency"]) for row in rows]
+
     def delete(self, rate_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM exchange_rates WHERE id = %s", (str(rate_id),))
-        conn.commit()
+            cur.execute("DELETE FROM exchange_rates WHERE id = %s", (rate_id,))
+            _bump_ledger_versions(
+                cur, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE, EXCHANGE_RATE_SCOPE]
+            )
+        self._db.commit()
 
     def _row_to_exchange_rate(self, row: Any) -> ExchangeRate:
         rate = ExchangeRate(
             from_currency=row["from_currency"],
             to_currency=row["to_currency"],
-            rate=Decimal(row["rate"]),
-            effective_date=date.fromisoformat(row["effective_date"]),
-            id=UUID(row["id"]),
+            rate=_numeric(row["rate"]),
+            effective_date=row["effective_date"],
+            id=row["id"],
             source=ExchangeRateSource(row["source"]),
         )
         # Set created_at directly to preserve stored value
-        object.__setattr__(
-            rate, "created_at", datetime.fromisoformat(row["created_at"])
-        )
+        object.__setattr__(rate, "created_at", row["created_at"])
         return rate
 
 
@@ -1875,34 +4198,36 @@ class PostgresVendorRepository(VendorRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(vendor.id),
+                    vendor.id,
                     vendor.name,
                     vendor.category,
                     vendor.tax_id,
                     vendor.is_1099_eligible,
-                    str(vendor.default_account_id)
-                    if vendor.default_account_id
-                    else None,
+                    vendor.default_account_id,
                     vendor.default_category,
                     vendor.contact_email,
                     vendor.contact_phone,
                     vendor.notes,
                     vendor.is_active,
-                    vendor.created_at.isoformat(),
-                    vendor.updated_at.isoformat(),
+                    vendor.created_at,
+                    vendor.updated_at,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def get(self, vendor_id: UUID) -> Vendor | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM vendors WHERE id = %s", (str(vendor_id),))
+            cur.execute("SELECT * FROM vendors WHERE id = %s", (vendor_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_vendor(row)
 
+    def get_many(self, vendor_ids: Iterable[UUID]) -> dict[UUID, Vendor]:
+        rows = _select_by_ids(self._db.get_connection(), "vendors", vendor_ids)
+        return {obj.id: obj for obj in map(self._row_to_vendor, rows)}
+
     def update(self, vendor: Vendor) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -1927,25 +4252,23 @@ class PostgresVendorRepository(VendorRepository):
                     vendor.category,
                     vendor.tax_id,
                     vendor.is_1099_eligible,
-                    str(vendor.default_account_id)
-                    if vendor.default_account_id
-                    else None,
+                    vendor.default_account_id,
                     vendor.default_category,
                     vendor.contact_email,
                     vendor.contact_phone,
                     vendor.notes,
                     vendor.is_active,
-                    vendor.updated_at.isoformat(),
-                    str(vendor.id),
+                    vendor.updated_at,
+                    vendor.id,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, vendor_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM vendors WHERE id = %s", (str(vendor_id),))
-        conn.commit()
+            cur.execute("DELETE FROM vendors WHERE id = %s", (vendor_id,))
+        self._db.commit()
 
     def list_all(self, include_inactive: bool = False) -> Iterable[Vendor]:
         conn = self._db.get_connection()
@@ -1979,6 +4302,24 @@ class PostgresVendorRepository(VendorRepository):
             rows = cur.fetchall()
         return [self._row_to_vendor(row) for row in rows]
 
+    def search(self, query: str, limit: int = 50) -> list[Vendor]:
+        tsquery = _tsquery(query)
+        if tsquery is None:
+            return []
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT v.* FROM vendors v, to_tsquery('simple', %s) query
+                WHERE {_VENDOR_SEARCH_VECTOR} @@ query AND v.is_active = TRUE
+                ORDER BY ts_rank({_VENDOR_SEARCH_VECTOR}, query) DESC, v.name
+                LIMIT %s
+                """,
+                (tsquery, limit),
+            )
+            rows = _fetch_dicts(cur)
+        return [self._row_to_vendor(row) for row in rows]
+
     def get_by_tax_id(self, tax_id: str) -> Vendor | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -1991,25 +4332,19 @@ class PostgresVendorRepository(VendorRepository):
     def _row_to_vendor(self, row: Any) -> Vendor:
         vendor = Vendor(
             name=row["name"],
-            id=UUID(row["id"]),
+            id=row["id"],
             category=row["category"],
             tax_id=row["tax_id"],
             is_1099_eligible=bool(row["is_1099_eligible"]),
-            default_account_id=UUID(row["default_account_id"])
-            if row["default_account_id"]
-            else None,
+            default_account_id=row["default_account_id"],
             default_category=row["default_category"],
             contact_email=row["contact_email"],
             contact_phone=row["contact_phone"],
             notes=row["notes"] or "",
             is_active=bool(row["is_active"]),
         )
-        object.__setattr__(
-            vendor, "created_at", datetime.fromisoformat(row["created_at"])
-        )
-        object.__setattr__(
-            vendor, "updated_at", datetime.fromisoformat(row["updated_at"])
-        )
+        object.__setattr__(vendor, "created_at", row["created_at"])
+        object.__setattr__(vendor, "updated_at", row["updated_at"])
         return vendor
 
 
@@ -2029,28 +4364,32 @@ class PostgresBudgetRepository(BudgetRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(budget.id),
+                    budget.id,
                     budget.name,
-                    str(budget.entity_id),
+                    budget.entity_id,
                     budget.period_type.value,
-                    budget.start_date.isoformat(),
-                    budget.end_date.isoformat(),
+                    budget.start_date,
+                    budget.end_date,
                     budget.is_active,
-                    budget.created_at.isoformat(),
-                    budget.updated_at.isoformat(),
+                    budget.created_at,
+                    budget.updated_at,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def get(self, budget_id: UUID) -> Budget | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM budgets WHERE id = %s", (str(budget_id),))
+            cur.execute("SELECT * FROM budgets WHERE id = %s", (budget_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_budget(row)
 
+    def get_many(self, budget_ids: Iterable[UUID]) -> dict[UUID, Budget]:
+        rows = _select_by_ids(self._db.get_connection(), "budgets", budget_ids)
+        return {obj.id: obj for obj in map(self._row_to_budget, rows)}
+
     def update(self, budget: Budget) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
@@ -2068,23 +4407,23 @@ class PostgresBudgetRepository(BudgetRepository):
                 """,
                 (
                     budget.name,
-                    str(budget.entity_id),
+                    budget.entity_id,
                     budget.period_type.value,
-                    budget.start_date.isoformat(),
-                    budget.end_date.isoformat(),
+                    budget.start_date,
+                    budget.end_date,
                     budget.is_active,
-                    budget.updated_at.isoformat(),
-                    str(budget.id),
+                    budget.updated_at,
+                    budget.id,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, budget_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             # Line items deleted via CASCADE
-            cur.execute("DELETE FROM budgets WHERE id = %s", (str(budget_id),))
-        conn.commit()
+            cur.execute("DELETE FROM budgets WHERE id = %s", (budget_id,))
+        self._db.commit()
 
     def list_by_entity(
         self, entity_id: UUID, include_inactive: bool = False
@@ -2092,13 +4431,11 @@ class PostgresBudgetRepository(BudgetRepository):
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             if include_inactive:
-                cur.execute(
-                    "SELECT * FROM budgets WHERE entity_id = %s", (str(entity_id),)
-                )
+                cur.execute("SELECT * FROM budgets WHERE entity_id = %s", (entity_id,))
             else:
                 cur.execute(
                     "SELECT * FROM budgets WHERE entity_id = %s AND is_active = TRUE",
-                    (str(entity_id),),
+                    (entity_id,),
                 )
             rows = cur.fetchall()
         return [self._row_to_budget(row) for row in rows]
@@ -2114,7 +4451,7 @@ class PostgresBudgetRepository(BudgetRepository):
                 ORDER BY start_date DESC
                 LIMIT 1
                 """,
-                (str(entity_id), as_of_date.isoformat(), as_of_date.isoformat()),
+                (entity_id, as_of_date, as_of_date),
             )
             row = cur.fetchone()
         if row is None:
@@ -2131,23 +4468,23 @@ class PostgresBudgetRepository(BudgetRepository):
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(line_item.id),
-                    str(line_item.budget_id),
+                    line_item.id,
+                    line_item.budget_id,
                     line_item.category,
-                    str(line_item.budgeted_amount.amount),
+                    line_item.budgeted_amount.amount,
                     line_item.budgeted_amount.currency,
-                    str(line_item.account_id) if line_item.account_id else None,
+                    line_item.account_id,
                     line_item.notes,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def get_line_items(self, budget_id: UUID) -> Iterable[BudgetLineItem]:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT * FROM budget_line_items WHERE budget_id = %s",
-                (str(budget_id),),
+                (budget_id,),
             )
             rows = cur.fetchall()
         return [self._row_to_line_item(row) for row in rows]
@@ -2167,52 +4504,46 @@ class PostgresBudgetRepository(BudgetRepository):
                 WHERE id = %s
                 """,
                 (
-                    str(line_item.budget_id),
+                    line_item.budget_id,
                     line_item.category,
-                    str(line_item.budgeted_amount.amount),
+                    line_item.budgeted_amount.amount,
                     line_item.budgeted_amount.currency,
-                    str(line_item.account_id) if line_item.account_id else None,
+                    line_item.account_id,
                     line_item.notes,
-                    str(line_item.id),
+                    line_item.id,
                 ),
             )
-        conn.commit()
+        self._db.commit()
 
     def delete_line_item(self, line_item_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "DELETE FROM budget_line_items WHERE id = %s", (str(line_item_id),)
-            )
-        conn.commit()
+            cur.execute("DELETE FROM budget_line_items WHERE id = %s", (line_item_id,))
+        self._db.commit()
 
     def _row_to_budget(self, row: Any) -> Budget:
         budget = Budget(
             name=row["name"],
-            entity_id=UUID(row["entity_id"]),
+            entity_id=row["entity_id"],
             period_type=BudgetPeriodType(row["period_type"]),
-            start_date=date.fromisoformat(row["start_date"]),
-            end_date=date.fromisoformat(row["end_date"]),
-            id=UUID(row["id"]),
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            id=row["id"],
             is_active=bool(row["is_active"]),
         )
-        object.__setattr__(
-            budget, "created_at", datetime.fromisoformat(row["created_at"])
-        )
-        object.__setattr__(
-            budget, "updated_at", datetime.fromisoformat(row["updated_at"])
-        )
+        object.__setattr__(budget, "created_at", row["created_at"])
+        object.__setattr__(budget, "updated_at", row["updated_at"])
         return budget
 
     def _row_to_line_item(self, row: Any) -> BudgetLineItem:
         return BudgetLineItem(
-            budget_id=UUID(row["budget_id"]),
+            budget_id=row["budget_id"],
             category=row["category"],
             budgeted_amount=Money(
-                Decimal(row["budgeted_amount"]), row["budgeted_currency"]
+                _numeric(row["budgeted_amount"]), row["budgeted_currency"]
             ),
-            id=UUID(row["id"]),
-            account_id=UUID(row["account_id"]) if row["account_id"] else None,
+            id=row["id"],
+            account_id=row["account_id"],
             notes=row["notes"] or "",
         )
 
@@ -2235,34 +4566,41 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    str(ownership.id),
-                    str(ownership.owner_entity_id),
-                    str(ownership.owned_entity_id),
-                    str(ownership.ownership_fraction),
-                    ownership.effective_start_date.isoformat(),
-                    ownership.effective_end_date.isoformat()
-                    if ownership.effective_end_date
-                    else None,
+                    ownership.id,
+                    ownership.owner_entity_id,
+                    ownership.owned_entity_id,
+                    ownership.ownership_fraction,
+                    ownership.effective_start_date,
+                    ownership.effective_end_date,
                     ownership.ownership_basis,
                     ownership.ownership_type,
                     ownership.notes,
-                    ownership.created_at.isoformat(),
-                    ownership.updated_at.isoformat(),
+                    ownership.created_at,
+                    ownership.updated_at,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(
+                cur,
+                _ENTITY_SCOPES_SQL,
+                [ownership.owner_entity_id, ownership.owned_entity_id],
+            )
+        self._db.commit()
 
     def get(self, ownership_id: UUID) -> EntityOwnership | None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT * FROM entity_ownership WHERE id = %s", (str(ownership_id),)
-            )
+            cur.execute("SELECT * FROM entity_ownership WHERE id = %s", (ownership_id,))
             row = cur.fetchone()
         if row is None:
             return None
         return self._row_to_ownership(row)
 
+    def get_many(self, ownership_ids: Iterable[UUID]) -> dict[UUID, EntityOwnership]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "entity_ownership", ownership_ids
+        )
+        return {obj.id: obj for obj in map(self._row_to_ownership, rows)}
+
     def list_by_owner(
         self, owner_entity_id: UUID, as_of_date: date | None = None
     ) -> Iterable[EntityOwnership]:
@@ -2271,7 +4609,7 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
             if as_of_date is None:
                 cur.execute(
                     "SELECT * FROM entity_ownership WHERE owner_entity_id = %s",
-                    (str(owner_entity_id),),
+                    (owner_entity_id,),
                 )
             else:
                 cur.execute(
@@ -2282,9 +4620,9 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
                     AND (effective_end_date IS NULL OR effective_end_date > %s)
                     """,
                     (
-                        str(owner_entity_id),
-                        as_of_date.isoformat(),
-                        as_of_date.isoformat(),
+                        owner_entity_id,
+                        as_of_date,
+                        as_of_date,
                     ),
                 )
             return [self._row_to_ownership(row) for row in cur.fetchall()]
@@ -2297,7 +4635,7 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
             if as_of_date is None:
                 cur.execute(
                     "SELECT * FROM entity_ownership WHERE owned_entity_id = %s",
-                    (str(owned_entity_id),),
+                    (owned_entity_id,),
                 )
             else:
                 cur.execute(
@@ -2308,9 +4646,9 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
                     AND (effective_end_date IS NULL OR effective_end_date > %s)
                     """,
                     (
-                        str(owned_entity_id),
-                        as_of_date.isoformat(),
-                        as_of_date.isoformat(),
+                        owned_entity_id,
+                        as_of_date,
+                        as_of_date,
                     ),
                 )
             return [self._row_to_ownership(row) for row in cur.fetchall()]
@@ -2324,7 +4662,7 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
                 WHERE effective_start_date <= %s
                 AND (effective_end_date IS NULL OR effective_end_date > %s)
                 """,
-                (as_of_date.isoformat(), as_of_date.isoformat()),
+                (as_of_date, as_of_date),
             )
             return [self._row_to_ownership(row) for row in cur.fetchall()]
 
@@ -2342,48 +4680,193 @@ class PostgresEntityOwnershipRepository(EntityOwnershipRepository):
                 WHERE id = %s
                 """,
                 (
-                    str(ownership.owner_entity_id),
-                    str(ownership.owned_entity_id),
-                    str(ownership.ownership_fraction),
-                    ownership.effective_start_date.isoformat(),
-                    ownership.effective_end_date.isoformat()
-                    if ownership.effective_end_date
-                    else None,
+                    ownership.owner_entity_id,
+                    ownership.owned_entity_id,
+                    ownership.ownership_fraction,
+                    ownership.effective_start_date,
+                    ownership.effective_end_date,
                     ownership.ownership_basis,
                     ownership.ownership_type,
                     ownership.notes,
-                    ownership.updated_at.isoformat(),
-                    str(ownership.id),
+                    ownership.updated_at,
+                    ownership.id,
                 ),
             )
-        conn.commit()
+            _bump_ledger_versions(cur, _OWNERSHIP_SCOPES_SQL, [ownership.id])
+        self._db.commit()
 
     def delete(self, ownership_id: UUID) -> None:
         conn = self._db.get_connection()
         with conn.cursor() as cur:
-            cur.execute(
-                "DELETE FROM entity_ownership WHERE id = %s", (str(ownership_id),)
-            )
-        conn.commit()
+            _bump_ledger_versions(cur, _OWNERSHIP_SCOPES_SQL, [ownership_id])
+            cur.execute("DELETE FROM entity_ownership WHERE id = %s", (ownership_id,))
+        self._db.commit()
 
     def _row_to_ownership(self, row: Any) -> EntityOwnership:
         ownership = EntityOwnership(
-            owner_entity_id=UUID(row["owner_entity_id"]),
-            owned_entity_id=UUID(row["owned_entity_id"]),
-            ownership_fraction=Decimal(row["ownership_fraction"]),
-            effective_start_date=date.fromisoformat(row["effective_start_date"]),
-            id=UUID(row["id"]),
-            effective_end_date=date.fromisoformat(row["effective_end_date"])
-            if row["effective_end_date"]
-            else None,
+            owner_entity_id=row["owner_entity_id"],
+            owned_entity_id=row["owned_entity_id"],
+            ownership_fraction=_numeric(row["ownership_fraction"]),
+            effective_start_date=row["effective_start_date"],
+            id=row["id"],
+            effective_end_date=row["effective_end_date"],
             ownership_basis=row["ownership_basis"],
             ownership_type=row["ownership_type"],
             notes=row["notes"],
         )
-        object.__setattr__(
-            ownership, "created_at", datetime.fromisoformat(row["created_at"])
-        )
-        object.__setattr__(
-            ownership, "updated_at", datetime.fromisoformat(row["updated_at"])
-        )
+        object.__setattr__(ownership, "created_at", row["created_at"])
+        object.__setattr__(ownership, "updated_at", row["updated_at"])
         return ownership
+
+
+class PostgresPeriodCloseRepository(PeriodCloseRepository):
+    def __init__(self, db: PostgresDatabase) -> None:
+        self._db = db
+
+    def add(self, period_close: PeriodClose) -> None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO period_closes (
+                    id, entity_id, period_end, closing_transaction_id, closed_at
+                ) VALUES (%s, %s, %s, %s, %s)
+                """,
+                (
+                    period_close.id,
+                    period_close.entity_id,
+                    period_close.period_end,
+                    period_close.closing_transaction_id,
+                    period_close.closed_at,
+                ),
+            )
+            psycopg2.extras.execute_batch(
+                cur,
+                """
+                INSERT INTO period_closing_balances (
+                    period_close_id, account_id, currency, debit_total, credit_total
+                ) VALUES (%s, %s, %s, %s, %s)
+                """,
+                [
+                    (
+                        period_close.id,
+                        totals.account_id,
+                        totals.currency,
+                        totals.debit_total,
+                        totals.credit_total,
+                    )
+                    for totals in period_close.balances
+                ],
+            )
+            _bump_ledger_versions(cur, _ENTITY_SCOPES_SQL, [period_close.entity_id])
+        self._db.commit()
+
+    def get(self, period_close_id: UUID) -> PeriodClose | None:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute("SELECT * FROM period_closes WHERE id = %s", (period_close_id,))
+            row = _fetch_dict(cur)
+        return self._row_to_period_close(row) if row is not None else None
+
+    def get_latest(
+        self, entity_id: UUID, as_of_date: date | None = None
+    ) -> PeriodClose | None:
+        date_filter = " AND period_end <= %s" if as_of_date is not None else ""
+        date_params = [as_of_date] if as_of_date is not None else []
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT * FROM period_closes
+                WHERE entity_id = %s{date_filter}
+                ORDER BY period_end DESC LIMIT 1
+                """,
+                (entity_id, *date_params),
+            )
+            row = _fetch_dict(cur)
+        return self._row_to_period_close(row) if row is not None else None
+
+    def list_by_entity(self, entity_id: UUID) -> Iterable[PeriodClose]:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT * FROM period_closes WHERE entity_id = %s ORDER BY period_end",
+                (entity_id,),
+            )
+            rows = _fetch_dicts(cur)
+        return [self._row_to_period_close(row) for row in rows]
+
+    def closed_through(self, entity_ids: Iterable[UUID]) -> dict[UUID, date]:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT entity_id, MAX(period_end) AS period_end FROM period_closes
+                WHERE entity_id = ANY(%s)
+                GROUP BY entity_id
+                """,
+                (list(entity_ids),),
+            )
+            return {row["entity_id"]: row["period_end"] for row in _fetch_dicts(cur)}
+
+    def _row_to_period_close(self, row: dict[str, Any]) -> PeriodClose:
+        conn = self._db.get_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT account_id, currency, debit_total, credit_total
+                FROM period_closing_balances WHERE period_close_id = %s
+                ORDER BY account_id, currency
+                """,
+                (row["id"],),
+            )
+            balances = [
+                AccountTotals(
+                    account_id=balance["account_id"],
+                    currency=balance["currency"],
+                    debit_total=_numeric(balance["debit_total"]),
+                    credit_total=_numeric(balance["credit_total"]),
+                )
+                for balance in _fetch_dicts(cur)
+            ]
+        return PeriodClose(
+            entity_id=row["entity_id"],
+            period_end=row["period_end"],
+            id=row["id"],
+            closing_transaction_id=row["closing_transaction_id"],
+            balances=balances,
+            closed_at=row["closed_at"],
+        )
+
+
+class PostgresLedgerVersionRepository(LedgerVersionRepository):
+    def __init__(self, db: PostgresDatabase) -> None:
+        self._db = db
+
+    def ledger_version(self, entity_ids: Iterable[UUID] | None = None) -> int:
+        with self._db.get_connection().cursor() as cur:
+            if entity_ids is None:
+                cur.execute(
+                    "SELECT COALESCE(SUM(version), 0) AS version FROM ledger_versions"
+                )
+            else:
+                scopes = [str(entity_id) for entity_id in entity_ids]
+                scopes.append(GLOBAL_LEDGER_SCOPE)
+                cur.execute(
+                    """
+                    SELECT COALESCE(SUM(version), 0) AS version FROM ledger_versions
+                    WHERE scope = ANY(%s)
+                    """,
+                    (scopes,),
+                )
+            row = _fetch_dict(cur)
+        assert row is not None
+        return int(row["version"])
+
+    def scope_version(self, scope: str) -> int:
+        with self._db.get_connection().cursor() as cur:
+            cur.execute(
+                "SELECT version FROM ledger_versions WHERE scope = %s", (scope,)
+            )
+            row = _fetch_dict(cur)
+        return int(row["version"]) if row else 0
@@ -5,10 +5,12 @@ from __future__ import annotations
 import contextlib
 import json
 import sqlite3
-from collections.abc import Iterable
+import threading
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from family_office_ledger.domain.budgets import Budget, BudgetLineItem, BudgetPeriodType
@@ -16,13 +18,23 @@ from family_office_ledger.domain.entities import Account, Entity, Position, Secu
 from family_office_ledger.domain.exchange_rates import ExchangeRate, ExchangeRateSource
 from family_office_ledger.domain.households import Household, HouseholdMember
 from family_office_ledger.domain.ownership import EntityOwnership, SelfOwnershipError
+from family_office_ledger.domain.periods import PeriodClose, check_period_open
 from family_office_ledger.domain.reconciliation import (
     ReconciliationMatch,
     ReconciliationMatchStatus,
     ReconciliationSession,
     ReconciliationSessionStatus,
 )
-from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    AccountTotalsAccumulator,
+    BalanceSnapshotDiscrepancy,
+    Entry,
+    TaxLot,
+    Transaction,
+    balance_snapshot_changes,
+    totals_by_date,
+)
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
     AccountType,
@@ -32,44 +44,529 @@ from family_office_ledger.domain.value_objects import (
     Money,
     Quantity,
     TaxTreatment,
+    to_minor_units,
 )
 from family_office_ledger.domain.vendors import Vendor
 from family_office_ledger.repositories.interfaces import (
+    EXCHANGE_RATE_SCOPE,
+    GLOBAL_LEDGER_SCOPE,
     AccountRepository,
     BudgetRepository,
     EntityOwnershipRepository,
     EntityRepository,
     ExchangeRateRepository,
     HouseholdRepository,
+    LedgerVersionRepository,
+    PeriodCloseRepository,
     PositionRepository,
     ReconciliationSessionRepository,
     SecurityRepository,
     TaxLotRepository,
     TransactionRepository,
     VendorRepository,
+    _carry_forward,
+    _search_terms,
+    _totals_change,
+)
+
+if TYPE_CHECKING:
+    from family_office_ledger.repositories.sqlite_async import AsyncSQLiteDatabase
+
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+# Maximum number of bound parameters per ``IN (...)`` clause. Kept well below
+# SQLite's SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+# Rows fetched (and hydrated with one entries query) per step of the
+# streaming ``iter_by_*`` readers.
+_STREAM_CHUNK_SIZE = _IN_CLAUSE_CHUNK_SIZE
+
+# Matches ranked by ``search``: the most recently inserted ones, so a common
+# word costs a bounded number of bm25 evaluations instead of one per match.
+_SEARCH_CANDIDATES = 1000
+
+# FTS5 full-text indexes: (index, content table, indexed columns, bm25
+# column weights). Each index reads its text from the content table by rowid
+# and is kept in sync by the triggers from ``_search_index_sql``.
+_SEARCH_INDEXES = (
+    ("transactions_fts", "transactions", ("memo", "reference", "category"), "4, 2, 1"),
+    ("vendors_fts", "vendors", ("name", "notes"), "4, 1"),
 )
 
 
+def _search_index_sql(index: str, table: str, columns: tuple[str, ...]) -> str:
+    """DDL for the external-content FTS5 ``index`` over ``table``."""
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    return f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5(
+            {names}, content='{table}', content_rowid='rowid', prefix='2 3'
+        );
+        CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {index} (rowid, {names}) VALUES (new.rowid, {new});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {index} ({index}, rowid, {names})
+            VALUES ('delete', old.rowid, {old});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE OF {names} ON {table}
+        BEGIN
+            INSERT INTO {index} ({index}, rowid, {names})
+            VALUES ('delete', old.rowid, {old});
+            INSERT INTO {index} (rowid, {names}) VALUES (new.rowid, {new});
+        END;
+    """
+
+
+def _fts_match(query: str) -> str | None:
+    """FTS5 ``MATCH`` expression requiring a word prefix per query word.
+
+    Returns None when ``query`` has no words. Each word is quoted, so
+    operators and punctuation in user input are never parsed as syntax.
+    """
+    terms = _search_terms(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _select_by_ids(
+    conn: sqlite3.Connection, table: str, ids: Iterable[UUID], column: str = "id"
+) -> list[sqlite3.Row]:
+    """Fetch the rows of ``table`` whose ``column`` is in ``ids``.
+
+    Ids are bound in chunked ``IN`` queries, so any number of them costs
+    ceil(N / chunk size) round trips.
+    """
+    keys = list(dict.fromkeys(str(obj_id) for obj_id in ids))
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(keys), _IN_CLAUSE_CHUNK_SIZE):
+        chunk = keys[start : start + _IN_CLAUSE_CHUNK_SIZE]
+        placeholders = ", ".join("?" for _ in chunk)
+        rows.extend(
+            conn.execute(
+                f"SELECT * FROM {table} WHERE {column} IN ({placeholders})", chunk
+            ).fetchall()
+        )
+    return rows
+
+
+_INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (id, transaction_date, posted_date, memo, reference,
+                              created_by, created_at, is_reversed, reverses_transaction_id,
+                              category, tags, vendor_id, is_recurring, recurring_frequency)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ENTRY_SQL = """
+    INSERT INTO entries (id, transaction_id, account_id, debit_amount, debit_currency,
+                         credit_amount, credit_currency, memo, tax_lot_id, category,
+                         debit_amount_minor, credit_amount_minor)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _transaction_row(txn: Transaction) -> tuple[Any, ...]:
+    """Parameters of ``_INSERT_TRANSACTION_SQL`` for ``txn``."""
+    return (
+        str(txn.id),
+        txn.transaction_date.isoformat(),
+        txn.posted_date.isoformat() if txn.posted_date else None,
+        txn.memo,
+        txn.reference,
+        str(txn.created_by) if txn.created_by else None,
+        txn.created_at.isoformat(),
+        1 if txn.is_reversed else 0,
+        str(txn.reverses_transaction_id) if txn.reverses_transaction_id else None,
+        txn.category,
+        json.dumps(txn.tags) if txn.tags else None,
+        str(txn.vendor_id) if txn.vendor_id else None,
+        1 if txn.is_recurring else 0,
+        txn.recurring_frequency,
+    )
+
+
+def _entry_row(txn: Transaction, entry: Entry) -> tuple[Any, ...]:
+    """Parameters of ``_INSERT_ENTRY_SQL`` for ``entry`` of ``txn``."""
+    return (
+        str(entry.id),
+        str(txn.id),
+        str(entry.account_id),
+        str(entry.debit_amount.amount),
+        entry.debit_amount.currency,
+        str(entry.credit_amount.amount),
+        entry.credit_amount.currency,
+        entry.memo,
+        str(entry.tax_lot_id) if entry.tax_lot_id else None,
+        entry.category,
+        to_minor_units(entry.debit_amount.amount),
+        to_minor_units(entry.credit_amount.amount),
+    )
+
+
+# Snapshots of one (account_id, currency) on or after, and just before, a day.
+_LATER_SNAPSHOTS_SQL = """
+    SELECT snapshot_date, debit_total, credit_total
+    FROM account_balance_snapshots
+    WHERE account_id = ? AND currency = ? AND snapshot_date >= ?
+    ORDER BY snapshot_date
+"""
+
+_PREVIOUS_SNAPSHOT_SQL = """
+    SELECT debit_total, credit_total FROM account_balance_snapshots
+    WHERE account_id = ? AND currency = ? AND snapshot_date < ?
+    ORDER BY snapshot_date DESC LIMIT 1
+"""
+
+# End of each entity's last closed period; the ids are bound as a JSON array.
+_CLOSED_THROUGH_SQL = """
+    SELECT entity_id, MAX(period_end) AS period_end FROM period_closes
+    WHERE entity_id IN (SELECT value FROM json_each(?))
+    GROUP BY entity_id
+"""
+
+# The same per account: its entity and the end of that entity's last closed
+# period, for the account ids bound as a JSON array.
+_CLOSED_PERIODS_SQL = """
+    SELECT a.id, a.entity_id, MAX(pc.period_end) FROM accounts a
+    JOIN period_closes pc ON pc.entity_id = a.entity_id
+    WHERE a.id IN (SELECT value FROM json_each(?))
+    GROUP BY a.id, a.entity_id
+"""
+
+# Scopes whose ledger version a write bumps, selected from ids bound as a
+# JSON array: the ids themselves (entities or ``GLOBAL_LEDGER_SCOPE``), or
+# the entities owning the accounts, positions, transaction entries or
+# ownership edges with those ids.
+_ENTITY_SCOPES_SQL = "SELECT value AS scope FROM json_each(?)"
+
+_ACCOUNT_SCOPES_SQL = """
+    SELECT entity_id AS scope FROM accounts
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+_POSITION_SCOPES_SQL = """
+    SELECT a.entity_id AS scope FROM positions p
+    JOIN accounts a ON a.id = p.account_id
+    WHERE p.id IN (SELECT value FROM json_each(?))
+"""
+
+_TRANSACTION_SCOPES_SQL = """
+    SELECT a.entity_id AS scope FROM entries e
+    JOIN accounts a ON a.id = e.account_id
+    WHERE e.transaction_id IN (SELECT value FROM json_each(?))
+"""
+
+_OWNERSHIP_SCOPES_SQL = """
+    SELECT owner_entity_id AS scope FROM entity_ownership
+    WHERE id IN (SELECT value FROM json_each(?))
+    UNION
+    SELECT owned_entity_id FROM entity_ownership
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+# Sum of the versions of the given scopes and the global scope.
+_LEDGER_VERSION_SQL = """
+    SELECT COALESCE(SUM(version), 0) FROM ledger_versions
+    WHERE scope IN (SELECT value FROM json_each(?))
+"""
+
+
+def _ledger_version_bump(
+    scopes_sql: str, ids: Iterable[object]
+) -> tuple[str, tuple[str, ...]]:
+    """Statement bumping the ledger version of each scope ``scopes_sql``
+    selects for ``ids``, with its parameters."""
+    keys = json.dumps([str(key) for key in ids])
+    sql = f"""
+        INSERT INTO ledger_versions (scope, version)
+        SELECT DISTINCT scope, 1 FROM ({scopes_sql}) WHERE scope IS NOT NULL
+        ON CONFLICT (scope) DO UPDATE SET version = version + 1
+    """
+    return sql, (keys,) * scopes_sql.count("?")
+
+
+def _bump_ledger_versions(
+    conn: sqlite3.Connection, scopes_sql: str, ids: Iterable[object]
+) -> None:
+    """Run ``_ledger_version_bump`` on the writing connection.
+
+    Repositories call this before committing, so a version only moves
+    together with the data it covers.
+    """
+    conn.execute(*_ledger_version_bump(scopes_sql, ids))
+
+
+def _postings(txns: Iterable[Transaction]) -> Iterator[tuple[date, list[UUID]]]:
+    for txn in txns:
+        yield txn.transaction_date, [entry.account_id for entry in txn.entries]
+
+
+def _check_periods_open(
+    postings: Iterable[tuple[date, list[UUID]]], rows: Iterable[Sequence[Any]]
+) -> None:
+    """Reject postings, ``(date, account ids)`` pairs, inside a closed period.
+
+    ``rows`` are the ``_CLOSED_PERIODS_SQL`` rows of the posted accounts.
+    Raises ``PeriodClosedError`` for the first such posting.
+    """
+    closed = {
+        UUID(account_id): (UUID(entity_id), date.fromisoformat(closed_through))
+        for account_id, entity_id, closed_through in rows
+    }
+    if not closed:
+        return
+    for txn_date, account_ids in postings:
+        check_period_open(txn_date, account_ids, closed)
+
+
+def _snapshot_writes(
+    totals: AccountTotals,
+    day: str,
+    sign: int,
+    later: list[sqlite3.Row],
+    previous: sqlite3.Row | None,
+) -> list[tuple[str, list[tuple[Any, ...]]]]:
+    """Statements folding ``totals`` posted on ``day`` into the snapshots.
+
+    ``later`` and ``previous`` are the rows of ``_LATER_SNAPSHOTS_SQL`` and
+    ``_PREVIOUS_SNAPSHOT_SQL`` for the same account, currency and day; see
+    ``balance_snapshot_changes`` for how the snapshots change. Returns
+    ``(sql, parameter rows)`` pairs to run with ``executemany`` in order.
+    """
+    changes = balance_snapshot_changes(
+        totals,
+        date.fromisoformat(day),
+        sign,
+        [
+            (
+                date.fromisoformat(row["snapshot_date"]),
+                Decimal(row["debit_total"]),
+                Decimal(row["credit_total"]),
+            )
+            for row in later
+        ],
+        (
+            (Decimal(previous["debit_total"]), Decimal(previous["credit_total"]))
+            if previous is not None
+            else None
+        ),
+    )
+    account_id = str(totals.account_id)
+    writes: list[tuple[str, list[tuple[Any, ...]]]] = []
+    if changes.upserts:
+        writes.append(
+            (
+                """
+                INSERT INTO account_balance_snapshots
+                    (account_id, currency, snapshot_date, debit_total, credit_total)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (account_id, currency, snapshot_date) DO UPDATE
+                SET debit_total = excluded.debit_total,
+                    credit_total = excluded.credit_total
+                """,
+                [
+                    (
+                        account_id,
+                        totals.currency,
+                        snapshot_date.isoformat(),
+                        str(debit_total),
+                        str(credit_total),
+                    )
+                    for snapshot_date, debit_total, credit_total in changes.upserts
+                ],
+            )
+        )
+    if changes.delete_day:
+        writes.append(
+            (
+                """
+                DELETE FROM account_balance_snapshots
+                WHERE account_id = ? AND currency = ? AND snapshot_date = ?
+                """,
+                [(account_id, totals.currency, day)],
+            )
+        )
+    return writes
+
+
 class SQLiteDatabase:
-    """SQLite database connection manager."""
+    """SQLite database connection manager.
+
+    File-backed databases hand out one connection per thread, opened in WAL
+    mode with a busy timeout, so threads never share a transaction and
+    readers do not wait for a concurrent writer. Write transactions start
+    with ``BEGIN IMMEDIATE`` so that competing writers queue on the busy
+    timeout instead of failing with "database is locked" when a read
+    transaction is upgraded. ``:memory:`` databases keep a single shared
+    connection, since every new connection would see its own empty database.
+    """
 
     def __init__(
-        self, path: str | Path = ":memory:", check_same_thread: bool = True
+        self,
+        path: str | Path = ":memory:",
+        check_same_thread: bool = True,
+        *,
+        read_only: bool = False,
+        busy_timeout: float = 5.0,
+        synchronous: str = "NORMAL",
+        cache_size_kib: int = 64 * 1024,
+        mmap_size: int = 256 * 1024 * 1024,
     ) -> None:
+        if synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown synchronous mode: {synchronous}")
         self._path = str(path)
         self._check_same_thread = check_same_thread
+        self._read_only = read_only
+        self._busy_timeout = busy_timeout
+        self._synchronous = synchronous.upper()
+        self._cache_size_kib = cache_size_kib
+        self._mmap_size = mmap_size
+        self._in_memory = self._path in ("", ":memory:")
+        # Shared connection for in-memory databases only.
         self._connection: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._reader: SQLiteDatabase | None = None
+        self._async_database: AsyncSQLiteDatabase | None = None
+
+    @property
+    def _unit_of_work_depth(self) -> int:
+        return getattr(self._local, "unit_of_work_depth", 0)
+
+    @_unit_of_work_depth.setter
+    def _unit_of_work_depth(self, depth: int) -> None:
+        self._local.unit_of_work_depth = depth
+
+    @property
+    def read_only(self) -> bool:
+        """Whether connections are opened read-only."""
+        return self._read_only
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether this is a ``:memory:`` database with one shared connection."""
+        return self._in_memory
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get or create the database connection."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(
-                self._path, check_same_thread=self._check_same_thread
+        """Get or create the calling thread's database connection."""
+        if self._in_memory:
+            if self._connection is None:
+                self._connection = self.connect()
+            return self._connection
+        conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self.connect()
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def reader(self) -> SQLiteDatabase:
+        """Return a read-only view of this database for report queries.
+
+        The view opens its own per-thread connections with ``mode=ro`` and
+        ``query_only``, so long-running reads see the last committed
+        snapshot while ingestion keeps writing. In-memory databases cannot
+        be reopened and return themselves.
+        """
+        if self._in_memory or self._read_only:
+            return self
+        with self._lock:
+            if self._reader is None:
+                self._reader = SQLiteDatabase(
+                    self._path,
+                    read_only=True,
+                    busy_timeout=self._busy_timeout,
+                    synchronous=self._synchronous,
+                    cache_size_kib=self._cache_size_kib,
+                    mmap_size=self._mmap_size,
+                )
+            return self._reader
+
+    def async_database(self, readers: int = 4) -> AsyncSQLiteDatabase:
+        """Return the aiosqlite counterpart of this database.
+
+        Built on first call and reused afterwards, with ``readers``
+        read-only connections; :meth:`close` closes it as well.
+        """
+        from family_office_ledger.repositories.sqlite_async import (
+            AsyncSQLiteDatabase,
+        )
+
+        with self._lock:
+            if self._async_database is None:
+                self._async_database = AsyncSQLiteDatabase(self, readers=readers)
+            return self._async_database
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection configured like :meth:`get_connection`'s.
+
+        The connection is not pooled: the caller owns it and must close it.
+        A ``:memory:`` database opened this way is a new, empty database.
+        """
+        if self._read_only and not self._in_memory:
+            conn = sqlite3.connect(
+                f"{Path(self._path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=self._busy_timeout,
+                check_same_thread=False,
+            )
+        else:
+            conn = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                # Pooled connections are confined to their thread by
+                # get_connection(); only close() touches them from elsewhere.
+                check_same_thread=self._check_same_thread and self._in_memory,
+                isolation_level="IMMEDIATE",
             )
-            self._connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-        return self._connection
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout * 1000)}")
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._in_memory:
+            if not self._read_only:
+                conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+            conn.execute(f"PRAGMA cache_size = {-self._cache_size_kib}")
+            conn.execute(f"PRAGMA mmap_size = {self._mmap_size}")
+        if self._read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def commit(self) -> None:
+        """Commit pending writes unless a unit of work is open.
+
+        Repositories call this instead of ``conn.commit()`` so that writes
+        issued inside :meth:`unit_of_work` are committed once, at its end.
+        """
+        if self._unit_of_work_depth == 0:
+            self.get_connection().commit()
+
+    @contextlib.contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group repository writes into a single database transaction.
+
+        Commits when the outermost block exits normally and rolls back every
+        write made inside it if an exception escapes. Nested blocks join the
+        enclosing unit of work.
+        """
+        conn = self.get_connection()
+        self._unit_of_work_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._unit_of_work_depth -= 1
+            if self._unit_of_work_depth == 0:
+                conn.rollback()
+            raise
+        self._unit_of_work_depth -= 1
+        if self._unit_of_work_depth == 0:
+            conn.commit()
 
     def initialize(self) -> None:
         """Create all database tables."""
@@ -290,12 +787,15 @@ class SQLiteDatabase:
             CREATE INDEX IF NOT EXISTS idx_positions_account_id ON positions(account_id);
             CREATE INDEX IF NOT EXISTS idx_positions_security_id ON positions(security_id);
             CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date);
+            CREATE INDEX IF NOT EXISTS idx_transactions_date_id ON transactions(transaction_date, id);
             CREATE INDEX IF NOT EXISTS idx_entries_transaction_id ON entries(transaction_id);
             CREATE INDEX IF NOT EXISTS idx_entries_account_id ON entries(account_id);
             CREATE INDEX IF NOT EXISTS idx_tax_lots_position_id ON tax_lots(position_id);
             CREATE INDEX IF NOT EXISTS idx_tax_lots_acquisition_date ON tax_lots(acquisition_date);
             CREATE INDEX IF NOT EXISTS idx_reconciliation_sessions_account_id ON reconciliation_sessions(account_id);
             CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_id ON reconciliation_matches(session_id);
+            CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_status ON reconciliation_matches(session_id, status, created_at, id);
+            CREATE INDEX IF NOT EXISTS idx_reconciliation_matches_session_created ON reconciliation_matches(session_id, created_at, id);
             CREATE INDEX IF NOT EXISTS idx_exchange_rates_pair_date ON exchange_rates(from_currency, to_currency, effective_date);
             CREATE INDEX IF NOT EXISTS idx_exchange_rates_date ON exchange_rates(effective_date);
             CREATE INDEX IF NOT EXISTS idx_vendors_name ON vendors(name);
@@ -303,6 +803,33 @@ class SQLiteDatabase:
             CREATE INDEX IF NOT EXISTS idx_vendors_tax_id ON vendors(tax_id);
             CREATE INDEX IF NOT EXISTS idx_households_name ON households(name);
 
+            -- Closed fiscal periods and their frozen closing balances
+            CREATE TABLE IF NOT EXISTS period_closes (
+                id TEXT PRIMARY KEY,
+                entity_id TEXT NOT NULL,
+                period_end TEXT NOT NULL,
+                closing_transaction_id TEXT,
+                closed_at TEXT NOT NULL,
+                FOREIGN KEY (entity_id) REFERENCES entities(id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_period_closes_entity_end ON period_closes(entity_id, period_end);
+
+            CREATE TABLE IF NOT EXISTS period_closing_balances (
+                period_close_id TEXT NOT NULL,
+                account_id TEXT NOT NULL,
+                currency TEXT NOT NULL,
+                debit_total TEXT NOT NULL,
+                credit_total TEXT NOT NULL,
+                PRIMARY KEY (period_close_id, account_id, currency),
+                FOREIGN KEY (period_close_id) REFERENCES period_closes(id) ON DELETE CASCADE
+            );
+
+            -- Counters bumped by every write the reports can observe
+            CREATE TABLE IF NOT EXISTS ledger_versions (
+                scope TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            );
+
             -- Budgets table
             CREATE TABLE IF NOT EXISTS budgets (
                 id TEXT PRIMARY KEY,
@@ -351,6 +878,19 @@ class SQLiteDatabase:
                 )
         with contextlib.suppress(sqlite3.OperationalError):
             cursor.execute("ALTER TABLE entries ADD COLUMN category TEXT")
+        added_minor_units = False
+        for column in ("debit_amount_minor", "credit_amount_minor"):
+            with contextlib.suppress(sqlite3.OperationalError):
+                cursor.execute(f"ALTER TABLE entries ADD COLUMN {column} INTEGER")
+                added_minor_units = True
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entries_account_amounts ON entries(
+                account_id, transaction_id, debit_currency, credit_currency,
+                debit_amount_minor, credit_amount_minor
+            )
+            """
+        )
         entity_columns = [
             ("tax_treatment", "TEXT"),
             ("tax_id", "TEXT"),
@@ -361,13 +901,243 @@ class SQLiteDatabase:
         for column, col_type in entity_columns:
             with contextlib.suppress(sqlite3.OperationalError):
                 cursor.execute(f"ALTER TABLE entities ADD COLUMN {column} {col_type}")
+        created_snapshots = (
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'account_balance_snapshots'"
+            ).fetchone()
+            is None
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS account_balance_snapshots (
+                account_id TEXT NOT NULL,
+                currency TEXT NOT NULL,
+                snapshot_date TEXT NOT NULL,
+                debit_total TEXT NOT NULL,
+                credit_total TEXT NOT NULL,
+                PRIMARY KEY (account_id, currency, snapshot_date)
+            )
+            """
+        )
+        existing = {
+            row["name"]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
         conn.commit()
+        created_indexes = False
+        for index, table, columns, weights in _SEARCH_INDEXES:
+            if index in existing:
+                continue
+            conn.executescript(_search_index_sql(index, table, columns))
+            conn.execute(
+                f"INSERT INTO {index} ({index}, rank) VALUES ('rank', ?)",
+                (f"bm25({weights})",),
+            )
+            created_indexes = True
+        conn.commit()
+        if added_minor_units:
+            self.backfill_entry_minor_units()
+        if created_snapshots:
+            self.rebuild_balance_snapshots()
+        if created_indexes:
+            self.rebuild_search_indexes()
+
+    def backfill_entry_minor_units(self, batch_size: int = 5000) -> int:
+        """Populate ``entries.*_amount_minor`` from the Decimal text columns.
+
+        Rows are walked in rowid order and committed every ``batch_size``
+        rows so large ledgers do not hold one long write transaction.
+        Amounts that cannot be represented exactly stay NULL and are summed
+        from the text columns instead. Returns the number of rows updated.
+        """
+        conn = self.get_connection()
+        updated = 0
+        last_rowid = 0
+        while True:
+            rows = conn.execute(
+                """
+                SELECT rowid, debit_amount, credit_amount FROM entries
+                WHERE rowid > ?
+                  AND (debit_amount_minor IS NULL OR credit_amount_minor IS NULL)
+                ORDER BY rowid LIMIT ?
+                """,
+                (last_rowid, batch_size),
+            ).fetchall()
+            if not rows:
+                return updated
+            conn.executemany(
+                "UPDATE entries SET debit_amount_minor = ?, credit_amount_minor = ? "
+                "WHERE rowid = ?",
+                [
+                    (
+                        to_minor_units(Decimal(row["debit_amount"])),
+                        to_minor_units(Decimal(row["credit_amount"])),
+                        row["rowid"],
+                    )
+                    for row in rows
+                ],
+            )
+            conn.commit()
+            updated += len(rows)
+            last_rowid = rows[-1]["rowid"]
+
+    def rebuild_balance_snapshots(self, batch_size: int = 5000) -> int:
+        """Regenerate ``account_balance_snapshots`` from the entries table.
+
+        The table is cleared and refilled in a single transaction, so readers
+        never observe a partially rebuilt table. Returns the number of
+        snapshot rows written.
+        """
+        conn = self.get_connection()
+        conn.execute("DELETE FROM account_balance_snapshots")
+        written = 0
+        batch: list[tuple[str, str, str, str, str]] = []
+        for (
+            account_id,
+            currency,
+            snapshot_date,
+            debit,
+            credit,
+        ) in self._recompute_balance_snapshots():
+            batch.append((account_id, currency, snapshot_date, str(debit), str(credit)))
+            if len(batch) >= batch_size:
+                written += self._insert_balance_snapshots(conn, batch)
+                batch = []
+        written += self._insert_balance_snapshots(conn, batch)
+        conn.commit()
+        return written
+
+    def rebuild_search_indexes(self) -> None:
+        """Re-read every full-text index from its content table.
+
+        Needed after ``VACUUM``, which may renumber the rowids the indexes
+        refer to, and to index rows written before the indexes existed.
+        """
+        conn = self.get_connection()
+        for index, _, _, _ in _SEARCH_INDEXES:
+            conn.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+        conn.commit()
+
+    def verify_balance_snapshots(self) -> list[BalanceSnapshotDiscrepancy]:
+        """Diff ``account_balance_snapshots`` against a full recompute."""
+        conn = self.get_connection()
+        stored = {
+            (row["account_id"], row["currency"], row["snapshot_date"]): (
+                Decimal(row["debit_total"]),
+                Decimal(row["credit_total"]),
+            )
+            for row in conn.execute("SELECT * FROM account_balance_snapshots")
+        }
+        discrepancies: list[BalanceSnapshotDiscrepancy] = []
+        for (
+            account_id,
+            currency,
+            snapshot_date,
+            debit,
+            credit,
+        ) in self._recompute_balance_snapshots():
+            actual = stored.pop((account_id, currency, snapshot_date), None)
+            if actual != (debit, credit):
+                discrepancies.append(
+                    BalanceSnapshotDiscrepancy(
+                        account_id=UUID(account_id),
+                        currency=currency,
+                        snapshot_date=date.fromisoformat(snapshot_date),
+                        stored=actual,
+                        expected=(debit, credit),
+                    )
+                )
+        for (account_id, currency, snapshot_date), actual in stored.items():
+            discrepancies.append(
+                BalanceSnapshotDiscrepancy(
+                    account_id=UUID(account_id),
+                    currency=currency,
+                    snapshot_date=date.fromisoformat(snapshot_date),
+                    stored=actual,
+                    expected=None,
+                )
+            )
+        return discrepancies
+
+    def _recompute_balance_snapshots(
+        self,
+    ) -> Iterator[tuple[str, str, str, Decimal, Decimal]]:
+        """Yield running (account, currency, date) totals from the entries."""
+        conn = self.get_connection()
+        rows = conn.execute(
+            """
+            SELECT e.account_id, t.transaction_date, e.debit_amount, e.debit_currency,
+                   e.credit_amount, e.credit_currency
+            FROM entries e JOIN transactions t ON t.id = e.transaction_id
+            ORDER BY e.account_id, t.transaction_date
+            """
+        )
+        running: dict[str, list[Decimal]] = {}
+        touched: list[str] = []
+        current: tuple[str, str] | None = None
+        for row in rows:
+            key = (row["account_id"], row["transaction_date"])
+            if key != current:
+                if current is not None:
+                    for currency in touched:
+                        debit, credit = running[currency]
+                        yield (current[0], currency, current[1], debit, credit)
+                if current is None or current[0] != key[0]:
+                    running = {}
+                current = key
+                touched = []
+            for index, amount, currency in (
+                (0, row["debit_amount"], row["debit_currency"]),
+                (1, row["credit_amount"], row["credit_currency"]),
+            ):
+                value = Decimal(amount)
+                if not value:
+                    continue
+                running.setdefault(currency, [Decimal("0"), Decimal("0")])[index] += (
+                    value
+                )
+                if currency not in touched:
+                    touched.append(currency)
+        if current is not None:
+            for currency in touched:
+                debit, credit = running[currency]
+                yield (current[0], currency, current[1], debit, credit)
+
+    @staticmethod
+    def _insert_balance_snapshots(
+        conn: sqlite3.Connection, rows: list[tuple[str, str, str, str, str]]
+    ) -> int:
+        conn.executemany(
+            """
+            INSERT INTO account_balance_snapshots
+                (account_id, currency, snapshot_date, debit_total, credit_total)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        return len(rows)
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close every connection opened by this database and its reader."""
+        with self._lock:
+            async_database, self._async_database = self._async_database, None
+        if async_database is not None:
+            async_database.close()
         if self._connection is not None:
             self._connection.close()
             self._connection = None
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # Threads still holding a closed connection reconnect lazily.
+            self._local = threading.local()
+            reader, self._reader = self._reader, None
+        for conn in connections:
+            conn.close()
+        if reader is not None:
+            reader.close()
 
 
 class SQLiteEntityRepository(EntityRepository):
@@ -399,7 +1169,8 @@ class SQLiteEntityRepository(EntityRepository):
                 entity.jurisdiction,
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [entity.id])
+        self._db.commit()
 
     def get(self, entity_id: UUID) -> Entity | None:
         conn = self._db.get_connection()
@@ -410,6 +1181,10 @@ class SQLiteEntityRepository(EntityRepository):
             return None
         return self._row_to_entity(row)
 
+    def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        rows = _select_by_ids(self._db.get_connection(), "entities", entity_ids)
+        return {obj.id: obj for obj in map(self._row_to_entity, rows)}
+
     def get_by_name(self, name: str) -> Entity | None:
         conn = self._db.get_connection()
         row = conn.execute("SELECT * FROM entities WHERE name = ?", (name,)).fetchone()
@@ -458,14 +1233,17 @@ class SQLiteEntityRepository(EntityRepository):
                 str(entity.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [entity.id])
+        self._db.commit()
 
     def delete(self, entity_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM entities WHERE id = ?", (str(entity_id),))
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [entity_id])
+        self._db.commit()
 
-    def _row_to_entity(self, row: sqlite3.Row) -> Entity:
+    @staticmethod
+    def _row_to_entity(row: sqlite3.Row) -> Entity:
         row_keys = row.keys()
         tax_treatment_val = (
             row["tax_treatment"] if "tax_treatment" in row_keys else None
@@ -520,7 +1298,7 @@ class SQLiteHouseholdRepository(HouseholdRepository):
                 household.updated_at.isoformat(),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def get(self, household_id: UUID) -> Household | None:
         conn = self._db.get_connection()
@@ -531,6 +1309,10 @@ class SQLiteHouseholdRepository(HouseholdRepository):
             return None
         return self._row_to_household(row)
 
+    def get_many(self, household_ids: Iterable[UUID]) -> dict[UUID, Household]:
+        rows = _select_by_ids(self._db.get_connection(), "households", household_ids)
+        return {obj.id: obj for obj in map(self._row_to_household, rows)}
+
     def get_by_name(self, name: str) -> Household | None:
         conn = self._db.get_connection()
         row = conn.execute(
@@ -571,12 +1353,12 @@ class SQLiteHouseholdRepository(HouseholdRepository):
                 str(household.id),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, household_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM households WHERE id = ?", (str(household_id),))
-        conn.commit()
+        self._db.commit()
 
     def _row_to_household(self, row: sqlite3.Row) -> Household:
         household = Household(
@@ -618,7 +1400,7 @@ class SQLiteHouseholdRepository(HouseholdRepository):
                 member.created_at.isoformat(),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def get_member(self, member_id: UUID) -> HouseholdMember | None:
         conn = self._db.get_connection()
@@ -698,12 +1480,12 @@ class SQLiteHouseholdRepository(HouseholdRepository):
                 str(member.id),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def remove_member(self, member_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM household_members WHERE id = ?", (str(member_id),))
-        conn.commit()
+        self._db.commit()
 
     def _row_to_member(self, row: sqlite3.Row) -> HouseholdMember:
         member = HouseholdMember(
@@ -749,7 +1531,8 @@ class SQLiteAccountRepository(AccountRepository):
                 account.created_at.isoformat(),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [account.entity_id])
+        self._db.commit()
 
     def get(self, account_id: UUID) -> Account | None:
         conn = self._db.get_connection()
@@ -760,6 +1543,10 @@ class SQLiteAccountRepository(AccountRepository):
             return None
         return self._row_to_account(row)
 
+    def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        rows = _select_by_ids(self._db.get_connection(), "accounts", account_ids)
+        return {obj.id: obj for obj in map(self._row_to_account, rows)}
+
     def get_by_name(self, name: str, entity_id: UUID) -> Account | None:
         conn = self._db.get_connection()
         row = conn.execute(
@@ -817,14 +1604,17 @@ class SQLiteAccountRepository(AccountRepository):
                 str(account.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [account.entity_id])
+        self._db.commit()
 
     def delete(self, account_id: UUID) -> None:
         conn = self._db.get_connection()
+        _bump_ledger_versions(conn, _ACCOUNT_SCOPES_SQL, [account_id])
         conn.execute("DELETE FROM accounts WHERE id = ?", (str(account_id),))
-        conn.commit()
+        self._db.commit()
 
-    def _row_to_account(self, row: sqlite3.Row) -> Account:
+    @staticmethod
+    def _row_to_account(row: sqlite3.Row) -> Account:
         account = Account(
             name=row["name"],
             entity_id=UUID(row["entity_id"]),
@@ -872,7 +1662,8 @@ class SQLiteSecurityRepository(SecurityRepository):
                 1 if security.is_active else 0,
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE])
+        self._db.commit()
 
     def get(self, security_id: UUID) -> Security | None:
         conn = self._db.get_connection()
@@ -883,6 +1674,10 @@ class SQLiteSecurityRepository(SecurityRepository):
             return None
         return self._row_to_security(row)
 
+    def get_many(self, security_ids: Iterable[UUID]) -> dict[UUID, Security]:
+        rows = _select_by_ids(self._db.get_connection(), "securities", security_ids)
+        return {obj.id: obj for obj in map(self._row_to_security, rows)}
+
     def get_by_symbol(self, symbol: str) -> Security | None:
         conn = self._db.get_connection()
         row = conn.execute(
@@ -944,7 +1739,8 @@ class SQLiteSecurityRepository(SecurityRepository):
                 str(security.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE])
+        self._db.commit()
 
     def _row_to_security(self, row: sqlite3.Row) -> Security:
         return Security(
@@ -970,26 +1766,38 @@ class SQLitePositionRepository(PositionRepository):
         self._db = database
 
     def add(self, position: Position) -> None:
-        conn = self._db.get_connection()
-        conn.execute(
-            """
-            INSERT INTO positions (id, account_id, security_id, quantity,
-                                   cost_basis_amount, cost_basis_currency,
-                                   market_value_amount, market_value_currency)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(position.id),
-                str(position.account_id),
-                str(position.security_id),
-                str(position.quantity.value),
-                str(position.cost_basis.amount),
-                position.cost_basis.currency,
-                str(position.market_value.amount),
-                position.market_value.currency,
-            ),
-        )
-        conn.commit()
+        self.add_many([position])
+
+    def add_many(self, positions: Iterable[Position]) -> None:
+        positions = list(positions)
+        with self._db.unit_of_work():
+            conn = self._db.get_connection()
+            conn.executemany(
+                """
+                INSERT INTO positions (id, account_id, security_id, quantity,
+                                       cost_basis_amount, cost_basis_currency,
+                                       market_value_amount, market_value_currency)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(position.id),
+                        str(position.account_id),
+                        str(position.security_id),
+                        str(position.quantity.value),
+                        str(position.cost_basis.amount),
+                        position.cost_basis.currency,
+                        str(position.market_value.amount),
+                        position.market_value.currency,
+                    )
+                    for position in positions
+                ],
+            )
+            _bump_ledger_versions(
+                conn,
+                _ACCOUNT_SCOPES_SQL,
+                {position.account_id for position in positions},
+            )
 
     def get(self, position_id: UUID) -> Position | None:
         conn = self._db.get_connection()
@@ -1000,6 +1808,10 @@ class SQLitePositionRepository(PositionRepository):
             return None
         return self._row_to_position(row)
 
+    def get_many(self, position_ids: Iterable[UUID]) -> dict[UUID, Position]:
+        rows = _select_by_ids(self._db.get_connection(), "positions", position_ids)
+        return {obj.id: obj for obj in map(self._row_to_position, rows)}
+
     def get_by_account_and_security(
         self, account_id: UUID, security_id: UUID
     ) -> Position | None:
@@ -1063,7 +1875,8 @@ class SQLitePositionRepository(PositionRepository):
                 str(position.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _ACCOUNT_SCOPES_SQL, [position.account_id])
+        self._db.commit()
 
     def _row_to_position(self, row: sqlite3.Row) -> Position:
         position = Position(
@@ -1092,54 +1905,29 @@ class SQLiteTransactionRepository(TransactionRepository):
         self._db = database
 
     def add(self, txn: Transaction) -> None:
-        conn = self._db.get_connection()
-        conn.execute(
-            """
-            INSERT INTO transactions (id, transaction_date, posted_date, memo, reference,
-                                      created_by, created_at, is_reversed, reverses_transaction_id,
-                                      category, tags, vendor_id, is_recurring, recurring_frequency)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(txn.id),
-                txn.transaction_date.isoformat(),
-                txn.posted_date.isoformat() if txn.posted_date else None,
-                txn.memo,
-                txn.reference,
-                str(txn.created_by) if txn.created_by else None,
-                txn.created_at.isoformat(),
-                1 if txn.is_reversed else 0,
-                str(txn.reverses_transaction_id)
-                if txn.reverses_transaction_id
-                else None,
-                txn.category,
-                json.dumps(txn.tags) if txn.tags else None,
-                str(txn.vendor_id) if txn.vendor_id else None,
-                1 if txn.is_recurring else 0,
-                txn.recurring_frequency,
-            ),
-        )
-        for entry in txn.entries:
-            conn.execute(
-                """
-                INSERT INTO entries (id, transaction_id, account_id, debit_amount, debit_currency,
-                                     credit_amount, credit_currency, memo, tax_lot_id, category)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(entry.id),
-                    str(txn.id),
-                    str(entry.account_id),
-                    str(entry.debit_amount.amount),
-                    entry.debit_amount.currency,
-                    str(entry.credit_amount.amount),
-                    entry.credit_amount.currency,
-                    entry.memo,
-                    str(entry.tax_lot_id) if entry.tax_lot_id else None,
-                    entry.category,
+        self.add_many([txn])
+
+    def add_many(self, txns: Iterable[Transaction]) -> None:
+        txns = list(txns)
+        if not txns:
+            return
+        account_ids = {entry.account_id for txn in txns for entry in txn.entries}
+        with self._db.unit_of_work():
+            conn = self._db.get_connection()
+            _check_periods_open(
+                _postings(txns),
+                conn.execute(
+                    _CLOSED_PERIODS_SQL, (json.dumps([str(a) for a in account_ids]),)
                 ),
             )
-        conn.commit()
+            conn.executemany(_INSERT_TRANSACTION_SQL, map(_transaction_row, txns))
+            conn.executemany(
+                _INSERT_ENTRY_SQL,
+                [_entry_row(txn, entry) for txn in txns for entry in txn.entries],
+            )
+            for snapshot_date, totals in totals_by_date(txns).items():
+                self._apply_balance_snapshots(conn, totals, snapshot_date)
+            _bump_ledger_versions(conn, _ACCOUNT_SCOPES_SQL, account_ids)
 
     def get(self, txn_id: UUID) -> Transaction | None:
         conn = self._db.get_connection()
@@ -1148,7 +1936,11 @@ class SQLiteTransactionRepository(TransactionRepository):
         ).fetchone()
         if row is None:
             return None
-        return self._row_to_transaction(row)
+        return self._rows_to_transactions([row])[0]
+
+    def get_many(self, txn_ids: Iterable[UUID]) -> dict[UUID, Transaction]:
+        rows = _select_by_ids(self._db.get_connection(), "transactions", txn_ids)
+        return {txn.id: txn for txn in self._rows_to_transactions(rows)}
 
     def list_by_account(
         self,
@@ -1157,63 +1949,164 @@ class SQLiteTransactionRepository(TransactionRepository):
         end_date: date | None = None,
     ) -> Iterable[Transaction]:
         conn = self._db.get_connection()
-        query = """
-            SELECT DISTINCT t.* FROM transactions t
-            JOIN entries e ON t.id = e.transaction_id
-            WHERE e.account_id = ?
-        """
-        params: list[str] = [str(account_id)]
+        query, params = self._account_query(account_id, start_date, end_date)
+        rows = conn.execute(query, params).fetchall()
+        return self._rows_to_transactions(rows)
 
-        if start_date is not None:
-            query += " AND t.transaction_date >= ?"
-            params.append(start_date.isoformat())
-        if end_date is not None:
-            query += " AND t.transaction_date <= ?"
-            params.append(end_date.isoformat())
+    def iter_by_account(
+        self,
+        account_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._account_query(account_id, start_date, end_date))
 
-        query += " ORDER BY t.transaction_date"
+    def list_by_entity(
+        self,
+        entity_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterable[Transaction]:
+        conn = self._db.get_connection()
+        query, params = self._entity_query(entity_id, start_date, end_date)
         rows = conn.execute(query, params).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
 
-    def list_by_entity(
+    def iter_by_entity(
         self,
         entity_id: UUID,
         start_date: date | None = None,
         end_date: date | None = None,
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._entity_query(entity_id, start_date, end_date))
+
+    def list_by_date_range(
+        self, start_date: date, end_date: date
     ) -> Iterable[Transaction]:
         conn = self._db.get_connection()
-        query = """
-            SELECT DISTINCT t.* FROM transactions t
-            JOIN entries e ON t.id = e.transaction_id
-            JOIN accounts a ON e.account_id = a.id
-            WHERE a.entity_id = ?
-        """
-        params: list[str] = [str(entity_id)]
+        query, params = self._date_range_query(start_date, end_date)
+        rows = conn.execute(query, params).fetchall()
+        return self._rows_to_transactions(rows)
+
+    def iter_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> Iterator[Transaction]:
+        return self._stream(*self._date_range_query(start_date, end_date))
 
+    def list_page(
+        self,
+        account_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        if account_id is not None:
+            query, params = self._account_query(account_id, start_date, end_date, after)
+        else:
+            query, params = self._date_range_query(start_date, end_date, after)
+        query += f" LIMIT {int(limit)}"
+        rows = self._db.get_connection().execute(query, params).fetchall()
+        return self._rows_to_transactions(rows)
+
+    @staticmethod
+    def _filter_query(
+        query: str,
+        params: list[str],
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None,
+    ) -> tuple[str, list[str]]:
+        """Append the date window, keyset seek and ordering shared by listings.
+
+        The ``(transaction_date, id)`` row-value comparison lets SQLite seek
+        on ``idx_transactions_date_id`` instead of skipping earlier rows.
+        """
         if start_date is not None:
             query += " AND t.transaction_date >= ?"
             params.append(start_date.isoformat())
         if end_date is not None:
             query += " AND t.transaction_date <= ?"
             params.append(end_date.isoformat())
+        if after is not None:
+            query += " AND (t.transaction_date, t.id) > (?, ?)"
+            params.extend([after[0].isoformat(), str(after[1])])
+
+        query += " ORDER BY t.transaction_date, t.id"
+        return query, params
+
+    @classmethod
+    def _date_range_query(
+        cls,
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None = None,
+    ) -> tuple[str, list[str]]:
+        query = "SELECT t.* FROM transactions t WHERE TRUE"
+        return cls._filter_query(query, [], start_date, end_date, after)
+
+    @classmethod
+    def _account_query(
+        cls,
+        account_id: UUID,
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, UUID] | None = None,
+    ) -> tuple[str, list[str]]:
+        query = """
+            SELECT DISTINCT t.* FROM transactions t
+            JOIN entries e ON t.id = e.transaction_id
+            WHERE e.account_id = ?
+        """
+        return cls._filter_query(query, [str(account_id)], start_date, end_date, after)
 
-        query += " ORDER BY t.transaction_date"
-        rows = conn.execute(query, params).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+    @classmethod
+    def _entity_query(
+        cls, entity_id: UUID, start_date: date | None, end_date: date | None
+    ) -> tuple[str, list[str]]:
+        query = """
+            SELECT DISTINCT t.* FROM transactions t
+            JOIN entries e ON t.id = e.transaction_id
+            JOIN accounts a ON e.account_id = a.id
+            WHERE a.entity_id = ?
+        """
+        return cls._filter_query(query, [str(entity_id)], start_date, end_date, None)
 
-    def list_by_date_range(
-        self, start_date: date, end_date: date
-    ) -> Iterable[Transaction]:
+    def _stream(self, query: str, params: list[str]) -> Iterator[Transaction]:
+        """Yield transactions for ``query`` one ``fetchmany`` chunk at a time.
+
+        Only one chunk of rows and its entries is hydrated at once, so
+        memory stays flat regardless of how much history the query covers.
+        """
+        cursor = self._db.get_connection().execute(query, params)
+        try:
+            while rows := cursor.fetchmany(_STREAM_CHUNK_SIZE):
+                yield from self._rows_to_transactions(rows)
+        finally:
+            cursor.close()
+
+    def search(self, query: str, limit: int = 50) -> list[Transaction]:
+        """Rank matches with ``transactions_fts``, memo hits weighing most.
+
+        Only the ``_SEARCH_CANDIDATES`` most recently added matches are
+        ranked.
+        """
+        match = _fts_match(query)
+        if match is None:
+            return []
         conn = self._db.get_connection()
         rows = conn.execute(
             """
-            SELECT * FROM transactions
-            WHERE transaction_date >= ? AND transaction_date <= ?
-            ORDER BY transaction_date
+            SELECT t.* FROM (
+                SELECT rowid, rank FROM transactions_fts
+                WHERE transactions_fts MATCH ? ORDER BY rowid DESC LIMIT ?
+            ) hits
+            JOIN transactions t ON t.rowid = hits.rowid
+            ORDER BY hits.rank, t.transaction_date DESC LIMIT ?
             """,
-            (start_date.isoformat(), end_date.isoformat()),
+            (match, _SEARCH_CANDIDATES, limit),
         ).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
 
     def get_reversals(self, txn_id: UUID) -> Iterable[Transaction]:
         conn = self._db.get_connection()
@@ -1221,10 +2114,32 @@ class SQLiteTransactionRepository(TransactionRepository):
             "SELECT * FROM transactions WHERE reverses_transaction_id = ?",
             (str(txn_id),),
         ).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return self._rows_to_transactions(rows)
 
     def update(self, txn: Transaction) -> None:
         conn = self._db.get_connection()
+        previous = conn.execute(
+            "SELECT transaction_date FROM transactions WHERE id = ?", (str(txn.id),)
+        ).fetchone()
+        if previous is not None:
+            previous_date = date.fromisoformat(previous["transaction_date"])
+            if previous_date != txn.transaction_date:
+                # Moving a transaction into or out of a closed period
+                # changes the frozen balances; other edits are allowed.
+                account_ids = [entry.account_id for entry in txn.entries]
+                rows = conn.execute(
+                    _CLOSED_PERIODS_SQL, (json.dumps([str(a) for a in account_ids]),)
+                )
+                _check_periods_open(
+                    [(previous_date, account_ids), (txn.transaction_date, account_ids)],
+                    rows,
+                )
+                self._apply_balance_snapshots(
+                    conn, txn.totals_by_account(), previous_date, sign=-1
+                )
+                self._apply_balance_snapshots(
+                    conn, txn.totals_by_account(), txn.transaction_date
+                )
         conn.execute(
             """
             UPDATE transactions SET
@@ -1260,15 +2175,265 @@ class SQLiteTransactionRepository(TransactionRepository):
                 str(txn.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _TRANSACTION_SCOPES_SQL, [txn.id])
+        self._db.commit()
 
-    def _row_to_transaction(self, row: sqlite3.Row) -> Transaction:
+    def sum_by_account(
+        self,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+        start: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Aggregate debit/credit totals per account and currency in SQL.
+
+        As-of totals (no ``start``) are read from the latest balance
+        snapshot on or before ``as_of``. Windowed totals sum the
+        scaled-integer amount columns with one ``GROUP BY`` query per chunk
+        of account ids; entries whose amounts could not be scaled exactly
+        are summed from their Decimal text columns.
+        """
         conn = self._db.get_connection()
-        entry_rows = conn.execute(
-            "SELECT * FROM entries WHERE transaction_id = ?", (row["id"],)
-        ).fetchall()
-        entries = [self._row_to_entry(entry_row) for entry_row in entry_rows]
+        by_text = {str(account_id): account_id for account_id in account_ids}
+        ids = list(by_text)
+        if start is None:
+            return self._snapshot_totals(conn, ids, as_of)
+        date_filter = " AND t.transaction_date >= ?"
+        date_params = [start.isoformat()]
+        if as_of is not None:
+            date_filter += " AND t.transaction_date <= ?"
+            date_params.append(as_of.isoformat())
+        join = "JOIN transactions t ON t.id = e.transaction_id"
+
+        totals = AccountTotalsAccumulator()
+        for chunk_start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[chunk_start : chunk_start + _IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                SELECT e.account_id, e.debit_currency, e.credit_currency,
+                       SUM(e.debit_amount_minor) AS debit_minor,
+                       SUM(e.credit_amount_minor) AS credit_minor,
+                       SUM(e.debit_amount_minor IS NULL
+                           OR e.credit_amount_minor IS NULL) AS unscaled
+                FROM entries e {join}
+                WHERE e.account_id IN ({placeholders}){date_filter}
+                GROUP BY e.account_id, e.debit_currency, e.credit_currency
+                """,
+                [*chunk, *date_params],
+            ).fetchall()
+            unscaled_accounts: set[str] = set()
+            for row in rows:
+                totals.add_minor(
+                    by_text[row["account_id"]],
+                    row["debit_currency"],
+                    row["credit_currency"],
+                    row["debit_minor"],
+                    row["credit_minor"],
+                )
+                if row["unscaled"]:
+                    unscaled_accounts.add(row["account_id"])
+            if not unscaled_accounts:
+                continue
+            placeholders = ", ".join("?" for _ in unscaled_accounts)
+            for row in conn.execute(
+                f"""
+                SELECT e.account_id, e.debit_amount, e.debit_currency,
+                       e.credit_amount, e.credit_currency,
+                       e.debit_amount_minor, e.credit_amount_minor
+                FROM entries e {join}
+                WHERE e.account_id IN ({placeholders}){date_filter}
+                  AND (e.debit_amount_minor IS NULL OR e.credit_amount_minor IS NULL)
+                """,
+                [*unscaled_accounts, *date_params],
+            ):
+                account_id = by_text[row["account_id"]]
+                if row["debit_amount_minor"] is None:
+                    totals.add(
+                        account_id,
+                        row["debit_currency"],
+                        debit=Decimal(row["debit_amount"]),
+                    )
+                if row["credit_amount_minor"] is None:
+                    totals.add(
+                        account_id,
+                        row["credit_currency"],
+                        credit=Decimal(row["credit_amount"]),
+                    )
+        return totals.totals()
+
+    def iter_account_totals(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[AccountTotals]:
+        """Read the latest balance snapshots on or before ``as_of`` in one query.
+
+        The ids are bound as a single JSON array, so the query does not grow
+        with the number of accounts, and rows are fetched in chunks.
+        """
+        ids = json.dumps([str(account_id) for account_id in account_ids])
+        date_filter = " AND snapshot_date <= ?" if as_of is not None else ""
+        date_params = [as_of.isoformat()] if as_of is not None else []
+        # SQLite takes the bare debit/credit columns from the MAX() row.
+        cursor = self._db.get_connection().execute(
+            f"""
+            SELECT account_id, currency, MAX(snapshot_date) AS snapshot_date,
+                   debit_total, credit_total
+            FROM account_balance_snapshots
+            WHERE account_id IN (SELECT value FROM json_each(?)){date_filter}
+            GROUP BY account_id, currency
+            ORDER BY account_id, currency
+            """,
+            [ids, *date_params],
+        )
+        try:
+            while rows := cursor.fetchmany(_STREAM_CHUNK_SIZE):
+                for row in rows:
+                    yield AccountTotals(
+                        account_id=UUID(row["account_id"]),
+                        currency=row["currency"],
+                        debit_total=Decimal(row["debit_total"]),
+                        credit_total=Decimal(row["credit_total"]),
+                    )
+        finally:
+            cursor.close()
+
+    def sum_by_account_since(
+        self,
+        opening: Iterable[AccountTotals],
+        opening_date: date,
+        account_ids: Iterable[UUID],
+        as_of: date | None = None,
+    ) -> Iterable[AccountTotals]:
+        """Carry ``opening`` forward by the change in balance snapshots.
+
+        The activity after ``opening_date`` is the difference between the
+        latest snapshots on or before ``as_of`` and on or before
+        ``opening_date``: two snapshot seeks, no entries read.
+        """
+        ids = set(account_ids)
+        activity = _totals_change(
+            self.sum_by_account(ids, as_of=opening_date),
+            self.sum_by_account(ids, as_of=as_of),
+        )
+        return _carry_forward(
+            (totals for totals in opening if totals.account_id in ids), activity
+        )
 
+    def iter_balance_history(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> Iterator[tuple[date, AccountTotals]]:
+        """Read the balance snapshots up to ``as_of`` in date order, in one query.
+
+        Account ids are mapped back to the given UUIDs rather than parsed
+        from every row.
+        """
+        by_text = {str(account_id): account_id for account_id in account_ids}
+        ids = json.dumps(list(by_text))
+        date_filter = " AND snapshot_date <= ?" if as_of is not None else ""
+        date_params = [as_of.isoformat()] if as_of is not None else []
+        cursor = self._db.get_connection().execute(
+            f"""
+            SELECT account_id, currency, snapshot_date, debit_total, credit_total
+            FROM account_balance_snapshots
+            WHERE account_id IN (SELECT value FROM json_each(?)){date_filter}
+            ORDER BY snapshot_date
+            """,
+            [ids, *date_params],
+        )
+        try:
+            while rows := cursor.fetchmany(_STREAM_CHUNK_SIZE):
+                for row in rows:
+                    yield (
+                        date.fromisoformat(row["snapshot_date"]),
+                        AccountTotals(
+                            account_id=by_text[row["account_id"]],
+                            currency=row["currency"],
+                            debit_total=Decimal(row["debit_total"]),
+                            credit_total=Decimal(row["credit_total"]),
+                        ),
+                    )
+        finally:
+            cursor.close()
+
+    def _snapshot_totals(
+        self, conn: sqlite3.Connection, ids: list[str], as_of: date | None
+    ) -> list[AccountTotals]:
+        totals: list[AccountTotals] = []
+        date_filter = " AND snapshot_date <= ?" if as_of is not None else ""
+        date_params = [as_of.isoformat()] if as_of is not None else []
+        for chunk_start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[chunk_start : chunk_start + _IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            # SQLite takes the bare debit/credit columns from the MAX() row.
+            rows = conn.execute(
+                f"""
+                SELECT account_id, currency, MAX(snapshot_date) AS snapshot_date,
+                       debit_total, credit_total
+                FROM account_balance_snapshots
+                WHERE account_id IN ({placeholders}){date_filter}
+                GROUP BY account_id, currency
+                """,
+                [*chunk, *date_params],
+            ).fetchall()
+            totals.extend(
+                AccountTotals(
+                    account_id=UUID(row["account_id"]),
+                    currency=row["currency"],
+                    debit_total=Decimal(row["debit_total"]),
+                    credit_total=Decimal(row["credit_total"]),
+                )
+                for row in rows
+            )
+        return totals
+
+    def _apply_balance_snapshots(
+        self,
+        conn: sqlite3.Connection,
+        account_totals: Iterable[AccountTotals],
+        snapshot_date: date,
+        sign: int = 1,
+    ) -> None:
+        """Fold posted totals into the running balance snapshots without committing.
+
+        See ``_snapshot_writes`` for how each account's snapshots change.
+        """
+        day = snapshot_date.isoformat()
+        for totals in account_totals:
+            key = (str(totals.account_id), totals.currency, day)
+            later = conn.execute(_LATER_SNAPSHOTS_SQL, key).fetchall()
+            previous = conn.execute(_PREVIOUS_SNAPSHOT_SQL, key).fetchone()
+            for sql, params in _snapshot_writes(totals, day, sign, later, previous):
+                conn.executemany(sql, params)
+
+    def _rows_to_transactions(self, rows: list[sqlite3.Row]) -> list[Transaction]:
+        """Hydrate transaction rows, loading their entries in batched queries.
+
+        Entries for the whole result set are fetched with chunked
+        ``IN (...)`` queries and grouped in memory, so listing N
+        transactions costs ceil(N / chunk size) entry queries instead of N.
+        """
+        if not rows:
+            return []
+        conn = self._db.get_connection()
+        entries_by_txn: dict[str, list[Entry]] = {row["id"]: [] for row in rows}
+        txn_ids = list(entries_by_txn)
+        for start in range(0, len(txn_ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = txn_ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            entry_rows = conn.execute(
+                f"SELECT * FROM entries WHERE transaction_id IN ({placeholders}) "
+                "ORDER BY rowid",
+                chunk,
+            ).fetchall()
+            for entry_row in entry_rows:
+                entries_by_txn[entry_row["transaction_id"]].append(
+                    self._row_to_entry(entry_row)
+                )
+        return [
+            self._row_to_transaction(row, entries_by_txn[row["id"]]) for row in rows
+        ]
+
+    @staticmethod
+    def _row_to_transaction(row: sqlite3.Row, entries: list[Entry]) -> Transaction:
         row_keys = row.keys()
         tags_json = row["tags"] if "tags" in row_keys else None
         tags = json.loads(tags_json) if tags_json else []
@@ -1302,7 +2467,8 @@ class SQLiteTransactionRepository(TransactionRepository):
         object.__setattr__(txn, "created_at", datetime.fromisoformat(row["created_at"]))
         return txn
 
-    def _row_to_entry(self, row: sqlite3.Row) -> Entry:
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Entry:
         row_keys = row.keys()
         return Entry(
             account_id=UUID(row["account_id"]),
@@ -1322,35 +2488,47 @@ class SQLiteTaxLotRepository(TaxLotRepository):
         self._db = database
 
     def add(self, lot: TaxLot) -> None:
-        conn = self._db.get_connection()
-        conn.execute(
-            """
-            INSERT INTO tax_lots (id, position_id, acquisition_date, cost_per_share_amount,
-                                  cost_per_share_currency, original_quantity, remaining_quantity,
-                                  acquisition_type, disposition_date, is_covered,
-                                  wash_sale_disallowed, wash_sale_adjustment_amount,
-                                  wash_sale_adjustment_currency, reference, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(lot.id),
-                str(lot.position_id),
-                lot.acquisition_date.isoformat(),
-                str(lot.cost_per_share.amount),
-                lot.cost_per_share.currency,
-                str(lot.original_quantity.value),
-                str(lot.remaining_quantity.value),
-                lot.acquisition_type.value,
-                lot.disposition_date.isoformat() if lot.disposition_date else None,
-                1 if lot.is_covered else 0,
-                1 if lot.wash_sale_disallowed else 0,
-                str(lot.wash_sale_adjustment.amount),
-                lot.wash_sale_adjustment.currency,
-                lot.reference,
-                lot.created_at.isoformat(),
-            ),
-        )
-        conn.commit()
+        self.add_many([lot])
+
+    def add_many(self, lots: Iterable[TaxLot]) -> None:
+        lots = list(lots)
+        with self._db.unit_of_work():
+            conn = self._db.get_connection()
+            conn.executemany(
+                """
+                INSERT INTO tax_lots (id, position_id, acquisition_date, cost_per_share_amount,
+                                      cost_per_share_currency, original_quantity, remaining_quantity,
+                                      acquisition_type, disposition_date, is_covered,
+                                      wash_sale_disallowed, wash_sale_adjustment_amount,
+                                      wash_sale_adjustment_currency, reference, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(lot.id),
+                        str(lot.position_id),
+                        lot.acquisition_date.isoformat(),
+                        str(lot.cost_per_share.amount),
+                        lot.cost_per_share.currency,
+                        str(lot.original_quantity.value),
+                        str(lot.remaining_quantity.value),
+                        lot.acquisition_type.value,
+                        lot.disposition_date.isoformat()
+                        if lot.disposition_date
+                        else None,
+                        1 if lot.is_covered else 0,
+                        1 if lot.wash_sale_disallowed else 0,
+                        str(lot.wash_sale_adjustment.amount),
+                        lot.wash_sale_adjustment.currency,
+                        lot.reference,
+                        lot.created_at.isoformat(),
+                    )
+                    for lot in lots
+                ],
+            )
+            _bump_ledger_versions(
+                conn, _POSITION_SCOPES_SQL, {lot.position_id for lot in lots}
+            )
 
     def get(self, lot_id: UUID) -> TaxLot | None:
         conn = self._db.get_connection()
@@ -1361,6 +2539,10 @@ class SQLiteTaxLotRepository(TaxLotRepository):
             return None
         return self._row_to_tax_lot(row)
 
+    def get_many(self, lot_ids: Iterable[UUID]) -> dict[UUID, TaxLot]:
+        rows = _select_by_ids(self._db.get_connection(), "tax_lots", lot_ids)
+        return {obj.id: obj for obj in map(self._row_to_tax_lot, rows)}
+
     def list_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         conn = self._db.get_connection()
         rows = conn.execute(
@@ -1369,6 +2551,20 @@ class SQLiteTaxLotRepository(TaxLotRepository):
         ).fetchall()
         return [self._row_to_tax_lot(row) for row in rows]
 
+    def list_by_positions(
+        self, position_ids: Iterable[UUID]
+    ) -> dict[UUID, list[TaxLot]]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "tax_lots", position_ids, column="position_id"
+        )
+        lots_by_position: dict[UUID, list[TaxLot]] = {}
+        for row in rows:
+            lot = self._row_to_tax_lot(row)
+            lots_by_position.setdefault(lot.position_id, []).append(lot)
+        for lots in lots_by_position.values():
+            lots.sort(key=lambda lot: lot.acquisition_date)
+        return lots_by_position
+
     def list_open_by_position(self, position_id: UUID) -> Iterable[TaxLot]:
         conn = self._db.get_connection()
         rows = conn.execute(
@@ -1452,7 +2648,8 @@ class SQLiteTaxLotRepository(TaxLotRepository):
                 str(lot.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _POSITION_SCOPES_SQL, [lot.position_id])
+        self._db.commit()
 
     def _row_to_tax_lot(self, row: sqlite3.Row) -> TaxLot:
         lot = TaxLot(
@@ -1489,37 +2686,59 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
         self._db = database
 
     def add(self, session: ReconciliationSession) -> None:
-        conn = self._db.get_connection()
-        # Insert session
-        conn.execute(
-            """
-            INSERT INTO reconciliation_sessions (id, account_id, file_name, file_format,
-                                                  status, created_at, closed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(session.id),
-                str(session.account_id),
-                session.file_name,
-                session.file_format,
-                session.status.value,
-                session.created_at.isoformat(),
-                session.closed_at.isoformat() if session.closed_at else None,
-            ),
-        )
-        # Insert matches
-        for match in session.matches:
-            conn.execute(
+        self.add_many([session])
+
+    def add_many(self, sessions: Iterable[ReconciliationSession]) -> None:
+        sessions = list(sessions)
+        with self._db.unit_of_work():
+            conn = self._db.get_connection()
+            conn.executemany(
                 """
-                INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
-                                                     imported_amount, imported_description,
-                                                     suggested_ledger_txn_id, confidence_score,
-                                                     status, actioned_at, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO reconciliation_sessions (id, account_id, file_name, file_format,
+                                                      status, created_at, closed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
+                [
+                    (
+                        str(session.id),
+                        str(session.account_id),
+                        session.file_name,
+                        session.file_format,
+                        session.status.value,
+                        session.created_at.isoformat(),
+                        session.closed_at.isoformat() if session.closed_at else None,
+                    )
+                    for session in sessions
+                ],
+            )
+            self._insert_matches(
+                conn,
+                [
+                    (session.id, match)
+                    for session in sessions
+                    for match in session.matches
+                ],
+            )
+        for session in sessions:
+            session.mark_clean()
+
+    def _insert_matches(
+        self,
+        conn: sqlite3.Connection,
+        matches: list[tuple[UUID, ReconciliationMatch]],
+    ) -> None:
+        conn.executemany(
+            """
+            INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
+                                                 imported_amount, imported_description,
+                                                 suggested_ledger_txn_id, confidence_score,
+                                                 status, actioned_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     str(match.id),
-                    str(session.id),
+                    str(session_id),
                     match.imported_id,
                     match.imported_date.isoformat(),
                     str(match.imported_amount),
@@ -1531,9 +2750,44 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
                     match.status.value,
                     match.actioned_at.isoformat() if match.actioned_at else None,
                     match.created_at.isoformat(),
-                ),
-            )
-        conn.commit()
+                )
+                for session_id, match in matches
+            ],
+        )
+
+    def _update_matches(
+        self, conn: sqlite3.Connection, matches: list[ReconciliationMatch]
+    ) -> None:
+        conn.executemany(
+            """
+            UPDATE reconciliation_matches SET
+                imported_id = ?,
+                imported_date = ?,
+                imported_amount = ?,
+                imported_description = ?,
+                suggested_ledger_txn_id = ?,
+                confidence_score = ?,
+                status = ?,
+                actioned_at = ?
+            WHERE id = ?
+            """,
+            [
+                (
+                    match.imported_id,
+                    match.imported_date.isoformat(),
+                    str(match.imported_amount),
+                    match.imported_description,
+                    str(match.suggested_ledger_txn_id)
+                    if match.suggested_ledger_txn_id
+                    else None,
+                    match.confidence_score,
+                    match.status.value,
+                    match.actioned_at.isoformat() if match.actioned_at else None,
+                    str(match.id),
+                )
+                for match in matches
+            ],
+        )
 
     def get(self, session_id: UUID) -> ReconciliationSession | None:
         conn = self._db.get_connection()
@@ -1544,6 +2798,73 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
             return None
         return self._row_to_session(row)
 
+    def get_many(
+        self, session_ids: Iterable[UUID]
+    ) -> dict[UUID, ReconciliationSession]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "reconciliation_sessions", session_ids
+        )
+        return {obj.id: obj for obj in map(self._row_to_session, rows)}
+
+    def get_without_matches(self, session_id: UUID) -> ReconciliationSession | None:
+        conn = self._db.get_connection()
+        row = conn.execute(
+            "SELECT * FROM reconciliation_sessions WHERE id = ?", (str(session_id),)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_session(row, matches=[])
+
+    def get_match(self, session_id: UUID, match_id: UUID) -> ReconciliationMatch | None:
+        conn = self._db.get_connection()
+        row = conn.execute(
+            "SELECT * FROM reconciliation_matches WHERE id = ? AND session_id = ?",
+            (str(match_id), str(session_id)),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_match(row)
+
+    def list_matches(
+        self,
+        session_id: UUID,
+        status: ReconciliationMatchStatus | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[ReconciliationMatch]:
+        query = "SELECT * FROM reconciliation_matches WHERE session_id = ?"
+        params: list[str | int] = [str(session_id)]
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status.value)
+        if after is not None:
+            query += " AND (created_at, id) > (?, ?)"
+            params.extend([after[0].isoformat(), str(after[1])])
+        query += " ORDER BY created_at, id LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        rows = self._db.get_connection().execute(query, params).fetchall()
+        return [self._row_to_match(row) for row in rows]
+
+    def count_matches(self, session_id: UUID) -> dict[ReconciliationMatchStatus, int]:
+        rows = (
+            self._db.get_connection()
+            .execute(
+                """
+                SELECT status, COUNT(*) AS cnt FROM reconciliation_matches
+                WHERE session_id = ?
+                GROUP BY status
+                """,
+                (str(session_id),),
+            )
+            .fetchall()
+        )
+        counts = dict.fromkeys(ReconciliationMatchStatus, 0)
+        counts.update(
+            {ReconciliationMatchStatus(row["status"]): row["cnt"] for row in rows}
+        )
+        return counts
+
     def get_pending_for_account(self, account_id: UUID) -> ReconciliationSession | None:
         conn = self._db.get_connection()
         row = conn.execute(
@@ -1555,63 +2876,82 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
         return self._row_to_session(row)
 
     def update(self, session: ReconciliationSession) -> None:
+        with self._db.unit_of_work():
+            conn = self._db.get_connection()
+            if session.is_dirty or not session.is_persisted:
+                conn.execute(
+                    """
+                    UPDATE reconciliation_sessions SET
+                        account_id = ?,
+                        file_name = ?,
+                        file_format = ?,
+                        status = ?,
+                        closed_at = ?
+                    WHERE id = ?
+                    """,
+                    (
+                        str(session.account_id),
+                        session.file_name,
+                        session.file_format,
+                        session.status.value,
+                        session.closed_at.isoformat() if session.closed_at else None,
+                        str(session.id),
+                    ),
+                )
+            if not session.is_persisted:
+                conn.execute(
+                    "DELETE FROM reconciliation_matches WHERE session_id = ?",
+                    (str(session.id),),
+                )
+            changes = session.match_changes()
+            if changes.removed_ids:
+                conn.executemany(
+                    "DELETE FROM reconciliation_matches WHERE id = ?",
+                    [(str(match_id),) for match_id in changes.removed_ids],
+                )
+            if changes.changed:
+                self._update_matches(conn, changes.changed)
+            if changes.added:
+                self._insert_matches(
+                    conn, [(session.id, match) for match in changes.added]
+                )
+        session.mark_clean()
+
+    def update_matches(self, matches: Iterable[ReconciliationMatch]) -> None:
+        matches = list(matches)
+        with self._db.unit_of_work():
+            self._update_matches(self._db.get_connection(), matches)
+        for match in matches:
+            match.mark_clean()
+
+    def update_match_status(
+        self,
+        session_id: UUID,
+        match_id: UUID,
+        status: ReconciliationMatchStatus,
+        actioned_at: datetime | None = None,
+    ) -> None:
         conn = self._db.get_connection()
         conn.execute(
             """
-            UPDATE reconciliation_sessions SET
-                account_id = ?,
-                file_name = ?,
-                file_format = ?,
-                status = ?,
-                closed_at = ?
-            WHERE id = ?
+            UPDATE reconciliation_matches SET status = ?, actioned_at = ?
+            WHERE id = ? AND session_id = ?
             """,
             (
-                str(session.account_id),
-                session.file_name,
-                session.file_format,
-                session.status.value,
-                session.closed_at.isoformat() if session.closed_at else None,
-                str(session.id),
+                status.value,
+                actioned_at.isoformat() if actioned_at else None,
+                str(match_id),
+                str(session_id),
             ),
         )
-        conn.execute(
-            "DELETE FROM reconciliation_matches WHERE session_id = ?",
-            (str(session.id),),
-        )
-        for match in session.matches:
-            conn.execute(
-                """
-                INSERT INTO reconciliation_matches (id, session_id, imported_id, imported_date,
-                                                     imported_amount, imported_description,
-                                                     suggested_ledger_txn_id, confidence_score,
-                                                     status, actioned_at, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(match.id),
-                    str(session.id),
-                    match.imported_id,
-                    match.imported_date.isoformat(),
-                    str(match.imported_amount),
-                    match.imported_description,
-                    str(match.suggested_ledger_txn_id)
-                    if match.suggested_ledger_txn_id
-                    else None,
-                    match.confidence_score,
-                    match.status.value,
-                    match.actioned_at.isoformat() if match.actioned_at else None,
-                    match.created_at.isoformat(),
-                ),
-            )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, session_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute(
             "DELETE FROM reconciliation_sessions WHERE id = ?", (str(session_id),)
         )
-        conn.commit()
+        self._db.commit()
 
     def list_by_account(self, account_id: UUID) -> list[ReconciliationSession]:
         conn = self._db.get_connection()
@@ -1621,14 +2961,17 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
         ).fetchall()
         return [self._row_to_session(row) for row in rows]
 
-    def _row_to_session(self, row: sqlite3.Row) -> ReconciliationSession:
-        conn = self._db.get_connection()
-        # Get matches for this session ordered by created_at
-        match_rows = conn.execute(
-            "SELECT * FROM reconciliation_matches WHERE session_id = ? ORDER BY created_at ASC",
-            (row["id"],),
-        ).fetchall()
-        matches = [self._row_to_match(match_row) for match_row in match_rows]
+    def _row_to_session(
+        self, row: sqlite3.Row, matches: list[ReconciliationMatch] | None = None
+    ) -> ReconciliationSession:
+        if matches is None:
+            conn = self._db.get_connection()
+            # Get matches for this session ordered by created_at
+            match_rows = conn.execute(
+                "SELECT * FROM reconciliation_matches WHERE session_id = ? ORDER BY created_at ASC, id ASC",
+                (row["id"],),
+            ).fetchall()
+            matches = [self._row_to_match(match_row) for match_row in match_rows]
 
         session = ReconciliationSession(
             account_id=UUID(row["account_id"]),
@@ -1645,6 +2988,7 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
         object.__setattr__(
             session, "created_at", datetime.fromisoformat(row["created_at"])
         )
+        session.mark_clean()
         return session
 
     def _row_to_match(self, row: sqlite3.Row) -> ReconciliationMatch:
@@ -1667,6 +3011,7 @@ class SQLiteReconciliationSessionRepository(ReconciliationSessionRepository):
         object.__setattr__(
             match, "created_at", datetime.fromisoformat(row["created_at"])
         )
+        match.mark_clean()
         return match
 
 
@@ -1692,7 +3037,10 @@ class SQLiteExchangeRateRepository(ExchangeRateRepository):
                 rate.created_at.isoformat(),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(
+            conn, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE, EXCHANGE_RATE_SCOPE]
+        )
+        self._db.commit()
 
     def get(self, rate_id: UUID) -> ExchangeRate | None:
         conn = self._db.get_connection()
@@ -1703,6 +3051,10 @@ class SQLiteExchangeRateRepository(ExchangeRateRepository):
             return None
         return self._row_to_exchange_rate(row)
 
+    def get_many(self, rate_ids: Iterable[UUID]) -> dict[UUID, ExchangeRate]:
+        rows = _select_by_ids(self._db.get_connection(), "exchange_rates", rate_ids)
+        return {obj.id: obj for obj in map(self._row_to_exchange_rate, rows)}
+
     def get_rate(
         self,
         from_currency: str,
@@ -1773,10 +3125,21 @@ class SQLiteExchangeRateRepository(ExchangeRateRepository):
         ).fetchall()
         return [self._row_to_exchange_rate(row) for row in rows]
 
+    def list_currency_pairs(self) -> list[tuple[str, str]]:
+        conn = self._db.get_connection()
+        rows = conn.execute(
+            "SELECT DISTINCT from_currency, to_currency FROM exchange_rates "
+            "ORDER BY from_currency, to_currency"
+        ).fetchall()
+        return [(row["from_currency"], row["to_currency"]) for row in rows]
+
     def delete(self, rate_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM exchange_rates WHERE id = ?", (str(rate_id),))
-        conn.commit()
+        _bump_ledger_versions(
+            conn, _ENTITY_SCOPES_SQL, [GLOBAL_LEDGER_SCOPE, EXCHANGE_RATE_SCOPE]
+        )
+        self._db.commit()
 
     def _row_to_exchange_rate(self, row: sqlite3.Row) -> ExchangeRate:
         rate = ExchangeRate(
@@ -1822,7 +3185,7 @@ class SQLiteVendorRepository(VendorRepository):
                 vendor.updated_at.isoformat(),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def get(self, vendor_id: UUID) -> Vendor | None:
         conn = self._db.get_connection()
@@ -1833,6 +3196,10 @@ class SQLiteVendorRepository(VendorRepository):
             return None
         return self._row_to_vendor(row)
 
+    def get_many(self, vendor_ids: Iterable[UUID]) -> dict[UUID, Vendor]:
+        rows = _select_by_ids(self._db.get_connection(), "vendors", vendor_ids)
+        return {obj.id: obj for obj in map(self._row_to_vendor, rows)}
+
     def update(self, vendor: Vendor) -> None:
         conn = self._db.get_connection()
         conn.execute(
@@ -1866,12 +3233,12 @@ class SQLiteVendorRepository(VendorRepository):
                 str(vendor.id),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, vendor_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM vendors WHERE id = ?", (str(vendor_id),))
-        conn.commit()
+        self._db.commit()
 
     def list_all(self, include_inactive: bool = False) -> Iterable[Vendor]:
         conn = self._db.get_connection()
@@ -1897,6 +3264,22 @@ class SQLiteVendorRepository(VendorRepository):
         ).fetchall()
         return [self._row_to_vendor(row) for row in rows]
 
+    def search(self, query: str, limit: int = 50) -> list[Vendor]:
+        match = _fts_match(query)
+        if match is None:
+            return []
+        conn = self._db.get_connection()
+        rows = conn.execute(
+            """
+            SELECT v.* FROM vendors_fts
+            JOIN vendors v ON v.rowid = vendors_fts.rowid
+            WHERE vendors_fts MATCH ? AND v.is_active = 1
+            ORDER BY vendors_fts.rank, v.name LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+        return [self._row_to_vendor(row) for row in rows]
+
     def get_by_tax_id(self, tax_id: str) -> Vendor | None:
         conn = self._db.get_connection()
         row = conn.execute(
@@ -1957,7 +3340,7 @@ class SQLiteBudgetRepository(BudgetRepository):
                 budget.updated_at.isoformat(),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def get(self, budget_id: UUID) -> Budget | None:
         conn = self._db.get_connection()
@@ -1968,6 +3351,10 @@ class SQLiteBudgetRepository(BudgetRepository):
             return None
         return self._row_to_budget(row)
 
+    def get_many(self, budget_ids: Iterable[UUID]) -> dict[UUID, Budget]:
+        rows = _select_by_ids(self._db.get_connection(), "budgets", budget_ids)
+        return {obj.id: obj for obj in map(self._row_to_budget, rows)}
+
     def update(self, budget: Budget) -> None:
         conn = self._db.get_connection()
         conn.execute(
@@ -1993,13 +3380,13 @@ class SQLiteBudgetRepository(BudgetRepository):
                 str(budget.id),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def delete(self, budget_id: UUID) -> None:
         conn = self._db.get_connection()
         # Line items deleted via CASCADE
         conn.execute("DELETE FROM budgets WHERE id = ?", (str(budget_id),))
-        conn.commit()
+        self._db.commit()
 
     def list_by_entity(
         self, entity_id: UUID, include_inactive: bool = False
@@ -2050,7 +3437,7 @@ class SQLiteBudgetRepository(BudgetRepository):
                 line_item.notes,
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def get_line_items(self, budget_id: UUID) -> Iterable[BudgetLineItem]:
         conn = self._db.get_connection()
@@ -2082,12 +3469,12 @@ class SQLiteBudgetRepository(BudgetRepository):
                 str(line_item.id),
             ),
         )
-        conn.commit()
+        self._db.commit()
 
     def delete_line_item(self, line_item_id: UUID) -> None:
         conn = self._db.get_connection()
         conn.execute("DELETE FROM budget_line_items WHERE id = ?", (str(line_item_id),))
-        conn.commit()
+        self._db.commit()
 
     def _row_to_budget(self, row: sqlite3.Row) -> Budget:
         budget = Budget(
@@ -2152,7 +3539,12 @@ class SQLiteEntityOwnershipRepository(EntityOwnershipRepository):
                 ownership.updated_at.isoformat(),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(
+            conn,
+            _ENTITY_SCOPES_SQL,
+            [ownership.owner_entity_id, ownership.owned_entity_id],
+        )
+        self._db.commit()
 
     def get(self, ownership_id: UUID) -> EntityOwnership | None:
         conn = self._db.get_connection()
@@ -2164,6 +3556,12 @@ class SQLiteEntityOwnershipRepository(EntityOwnershipRepository):
             return None
         return self._row_to_ownership(row)
 
+    def get_many(self, ownership_ids: Iterable[UUID]) -> dict[UUID, EntityOwnership]:
+        rows = _select_by_ids(
+            self._db.get_connection(), "entity_ownership", ownership_ids
+        )
+        return {obj.id: obj for obj in map(self._row_to_ownership, rows)}
+
     def list_by_owner(
         self, owner_entity_id: UUID, as_of_date: date | None = None
     ) -> Iterable[EntityOwnership]:
@@ -2245,12 +3643,14 @@ class SQLiteEntityOwnershipRepository(EntityOwnershipRepository):
                 str(ownership.id),
             ),
         )
-        conn.commit()
+        _bump_ledger_versions(conn, _OWNERSHIP_SCOPES_SQL, [ownership.id])
+        self._db.commit()
 
     def delete(self, ownership_id: UUID) -> None:
         conn = self._db.get_connection()
+        _bump_ledger_versions(conn, _OWNERSHIP_SCOPES_SQL, [ownership_id])
         conn.execute("DELETE FROM entity_ownership WHERE id = ?", (str(ownership_id),))
-        conn.commit()
+        self._db.commit()
 
     def _row_to_ownership(self, row: sqlite3.Row) -> EntityOwnership:
         ownership = EntityOwnership(
@@ -2273,3 +3673,151 @@ class SQLiteEntityOwnershipRepository(EntityOwnershipRepository):
             ownership, "updated_at", datetime.fromisoformat(row["updated_at"])
         )
         return ownership
+
+
+class SQLitePeriodCloseRepository(PeriodCloseRepository):
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    def add(self, period_close: PeriodClose) -> None:
+        conn = self._db.get_connection()
+        conn.execute(
+            """
+            INSERT INTO period_closes (
+                id, entity_id, period_end, closing_transaction_id, closed_at
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                str(period_close.id),
+                str(period_close.entity_id),
+                period_close.period_end.isoformat(),
+                str(period_close.closing_transaction_id)
+                if period_close.closing_transaction_id
+                else None,
+                period_close.closed_at.isoformat(),
+            ),
+        )
+        conn.executemany(
+            """
+            INSERT INTO period_closing_balances (
+                period_close_id, account_id, currency, debit_total, credit_total
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    str(period_close.id),
+                    str(totals.account_id),
+                    totals.currency,
+                    str(totals.debit_total),
+                    str(totals.credit_total),
+                )
+                for totals in period_close.balances
+            ],
+        )
+        _bump_ledger_versions(conn, _ENTITY_SCOPES_SQL, [period_close.entity_id])
+        self._db.commit()
+
+    def get(self, period_close_id: UUID) -> PeriodClose | None:
+        row = (
+            self._db.get_connection()
+            .execute(
+                "SELECT * FROM period_closes WHERE id = ?", (str(period_close_id),)
+            )
+            .fetchone()
+        )
+        return self._row_to_period_close(row) if row is not None else None
+
+    def get_latest(
+        self, entity_id: UUID, as_of_date: date | None = None
+    ) -> PeriodClose | None:
+        date_filter = " AND period_end <= ?" if as_of_date is not None else ""
+        date_params = [as_of_date.isoformat()] if as_of_date is not None else []
+        row = (
+            self._db.get_connection()
+            .execute(
+                f"""
+                SELECT * FROM period_closes
+                WHERE entity_id = ?{date_filter}
+                ORDER BY period_end DESC LIMIT 1
+                """,
+                [str(entity_id), *date_params],
+            )
+            .fetchone()
+        )
+        return self._row_to_period_close(row) if row is not None else None
+
+    def list_by_entity(self, entity_id: UUID) -> Iterable[PeriodClose]:
+        rows = (
+            self._db.get_connection()
+            .execute(
+                "SELECT * FROM period_closes WHERE entity_id = ? ORDER BY period_end",
+                (str(entity_id),),
+            )
+            .fetchall()
+        )
+        return [self._row_to_period_close(row) for row in rows]
+
+    def closed_through(self, entity_ids: Iterable[UUID]) -> dict[UUID, date]:
+        by_text = {str(entity_id): entity_id for entity_id in entity_ids}
+        rows = (
+            self._db.get_connection()
+            .execute(_CLOSED_THROUGH_SQL, (json.dumps(list(by_text)),))
+            .fetchall()
+        )
+        return {
+            by_text[row["entity_id"]]: date.fromisoformat(row["period_end"])
+            for row in rows
+        }
+
+    def _row_to_period_close(self, row: sqlite3.Row) -> PeriodClose:
+        balances = self._db.get_connection().execute(
+            """
+            SELECT account_id, currency, debit_total, credit_total
+            FROM period_closing_balances WHERE period_close_id = ?
+            ORDER BY account_id, currency
+            """,
+            (row["id"],),
+        )
+        return PeriodClose(
+            entity_id=UUID(row["entity_id"]),
+            period_end=date.fromisoformat(row["period_end"]),
+            id=UUID(row["id"]),
+            closing_transaction_id=UUID(row["closing_transaction_id"])
+            if row["closing_transaction_id"]
+            else None,
+            balances=[
+                AccountTotals(
+                    account_id=UUID(balance["account_id"]),
+                    currency=balance["currency"],
+                    debit_total=Decimal(balance["debit_total"]),
+                    credit_total=Decimal(balance["credit_total"]),
+                )
+                for balance in balances
+            ],
+            closed_at=datetime.fromisoformat(row["closed_at"]),
+        )
+
+
+class SQLiteLedgerVersionRepository(LedgerVersionRepository):
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    def ledger_version(self, entity_ids: Iterable[UUID] | None = None) -> int:
+        conn = self._db.get_connection()
+        if entity_ids is None:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(version), 0) FROM ledger_versions"
+            ).fetchone()
+        else:
+            scopes = [str(entity_id) for entity_id in entity_ids]
+            scopes.append(GLOBAL_LEDGER_SCOPE)
+            row = conn.execute(_LEDGER_VERSION_SQL, (json.dumps(scopes),)).fetchone()
+        return int(row[0])
+
+    def scope_version(self, scope: str) -> int:
+        row = (
+            self._db.get_connection()
+            .execute("SELECT version FROM ledger_versions WHERE scope = ?", (scope,))
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
@@ -0,0 +1,469 @@
+"""Asyncio SQLite repositories built on aiosqlite.
+
+Mirror the reads and writes of the SQLite repositories that posting
+transactions and the dashboard reports need, so async API endpoints can
+query the ledger without tying up a worker thread per request. SQL, row
+mappers and the balance snapshot bookkeeping are shared with
+``family_office_ledger.repositories.sqlite``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import json
+import sqlite3
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import aiosqlite
+
+from family_office_ledger.domain.entities import Account, Entity
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    Entry,
+    Transaction,
+    totals_by_date,
+)
+from family_office_ledger.repositories.interfaces import (
+    GLOBAL_LEDGER_SCOPE,
+    AsyncAccountRepository,
+    AsyncEntityRepository,
+    AsyncLedgerVersionRepository,
+    AsyncPeriodCloseRepository,
+    AsyncTransactionRepository,
+)
+from family_office_ledger.repositories.sqlite import (
+    _ACCOUNT_SCOPES_SQL,
+    _CLOSED_PERIODS_SQL,
+    _CLOSED_THROUGH_SQL,
+    _IN_CLAUSE_CHUNK_SIZE,
+    _INSERT_ENTRY_SQL,
+    _INSERT_TRANSACTION_SQL,
+    _LATER_SNAPSHOTS_SQL,
+    _LEDGER_VERSION_SQL,
+    _PREVIOUS_SNAPSHOT_SQL,
+    SQLiteAccountRepository,
+    SQLiteDatabase,
+    SQLiteEntityRepository,
+    SQLiteTransactionRepository,
+    _check_periods_open,
+    _entry_row,
+    _ledger_version_bump,
+    _postings,
+    _snapshot_writes,
+    _transaction_row,
+)
+
+# Rows aiosqlite fetches per worker round trip when iterating a cursor.
+_ITER_CHUNK_SIZE = 256
+
+
+class _InlineConnection:
+    """The aiosqlite calls used here, run directly on the shared connection.
+
+    For tests only: ``:memory:`` databases have a single connection shared
+    with the sync repositories, which may only be used from the thread that
+    opened it, so each statement runs on the event loop and blocks it.
+    Serve requests from a file-backed database.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    async def execute_fetchall(
+        self, sql: str, parameters: Iterable[Any] = ()
+    ) -> list[sqlite3.Row]:
+        return self._conn.execute(sql, tuple(parameters)).fetchall()
+
+    async def executemany(self, sql: str, parameters: Iterable[Sequence[Any]]) -> None:
+        self._conn.executemany(sql, parameters)
+
+    async def commit(self) -> None:
+        self._conn.commit()
+
+    async def rollback(self) -> None:
+        self._conn.rollback()
+
+
+AsyncConnection = aiosqlite.Connection | _InlineConnection
+
+
+async def _select_by_ids(
+    conn: AsyncConnection, table: str, ids: Iterable[UUID]
+) -> list[sqlite3.Row]:
+    """Async counterpart of ``sqlite._select_by_ids``."""
+    keys = list(dict.fromkeys(str(obj_id) for obj_id in ids))
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(keys), _IN_CLAUSE_CHUNK_SIZE):
+        chunk = keys[start : start + _IN_CLAUSE_CHUNK_SIZE]
+        placeholders = ", ".join("?" for _ in chunk)
+        rows.extend(
+            await conn.execute_fetchall(
+                f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk
+            )
+        )
+    return rows
+
+
+class AsyncSQLiteDatabase:
+    """aiosqlite connections to the database of a ``SQLiteDatabase``.
+
+    File-backed databases get one writer connection, opened like the sync
+    per-thread connections, and a small round-robin pool of read-only
+    connections opened like ``SQLiteDatabase.reader()``'s. Each runs its
+    statements on its own aiosqlite worker thread, so many coroutines can
+    read concurrently while a unit of work writes. ``:memory:`` databases
+    run every statement on the sync database's shared connection, blocking
+    the event loop, and are meant for tests only.
+
+    Connections are opened lazily on first use. Use
+    ``SQLiteDatabase.async_database()`` rather than building one directly,
+    so that closing the sync database closes this one too.
+    """
+
+    def __init__(self, database: SQLiteDatabase, readers: int = 4) -> None:
+        if readers < 1:
+            raise ValueError("readers must be at least 1")
+        self._database = database
+        self._reader_count = readers
+        self._writer: AsyncConnection | None = None
+        self._readers: list[AsyncConnection] = []
+        self._next_reader: itertools.cycle[AsyncConnection] | None = None
+        self._open_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._current: contextvars.ContextVar[AsyncConnection | None] = (
+            contextvars.ContextVar(f"async_unit_of_work_{id(self)}", default=None)
+        )
+
+    async def _open(self) -> AsyncConnection:
+        if self._writer is not None:
+            return self._writer
+        async with self._open_lock:
+            if self._writer is None:
+                writer: AsyncConnection
+                readers: list[AsyncConnection]
+                if self._database.in_memory:
+                    writer = _InlineConnection(self._database.get_connection())
+                    readers = [writer]
+                else:
+                    reader = self._database.reader()
+                    readers = [
+                        await aiosqlite.Connection(reader.connect, _ITER_CHUNK_SIZE)
+                        for _ in range(self._reader_count)
+                    ]
+                    writer = (
+                        readers[0]
+                        if self._database.read_only
+                        else await aiosqlite.Connection(
+                            self._database.connect, _ITER_CHUNK_SIZE
+                        )
+                    )
+                self._readers = readers
+                self._next_reader = itertools.cycle(readers)
+                self._writer = writer
+        return self._writer
+
+    async def reader(self) -> AsyncConnection:
+        """Connection for a read.
+
+        Inside :meth:`unit_of_work` this is the unit of work's connection,
+        so reads see its uncommitted writes; otherwise the next read-only
+        connection of the pool.
+        """
+        current = self._current.get()
+        if current is not None:
+            return current
+        await self._open()
+        assert self._next_reader is not None
+        return next(self._next_reader)
+
+    @contextlib.asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncConnection]:
+        """Run writes in a single transaction on the writer connection.
+
+        Units of work are serialized, commit when the outermost block exits
+        normally and roll back if an exception escapes. Nested blocks join
+        the enclosing unit of work.
+        """
+        current = self._current.get()
+        if current is not None:
+            yield current
+            return
+        conn = await self._open()
+        async with self._write_lock:
+            token = self._current.set(conn)
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+            finally:
+                self._current.reset(token)
+
+    def close(self) -> None:
+        """Close the aiosqlite connections and stop their worker threads."""
+        connections = [
+            conn
+            for conn in dict.fromkeys([self._writer, *self._readers])
+            if isinstance(conn, aiosqlite.Connection)
+        ]
+        self._writer = None
+        self._readers = []
+        self._next_reader = None
+        if not connections:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._close(connections))
+        else:
+            # Called from a coroutine (e.g. an app's shutdown handler).
+            for conn in connections:
+                conn.stop()
+
+    @staticmethod
+    async def _close(connections: list[aiosqlite.Connection]) -> None:
+        for conn in connections:
+            await conn.close()
+
+
+class AsyncSQLiteEntityRepository(AsyncEntityRepository):
+    """aiosqlite implementation of AsyncEntityRepository."""
+
+    def __init__(self, database: AsyncSQLiteDatabase) -> None:
+        self._db = database
+
+    async def get(self, entity_id: UUID) -> Entity | None:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            "SELECT * FROM entities WHERE id = ?", (str(entity_id),)
+        )
+        row = next(iter(rows), None)
+        return SQLiteEntityRepository._row_to_entity(row) if row is not None else None
+
+    async def get_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Entity]:
+        rows = await _select_by_ids(await self._db.reader(), "entities", entity_ids)
+        entities = map(SQLiteEntityRepository._row_to_entity, rows)
+        return {obj.id: obj for obj in entities}
+
+    async def list_all(self) -> list[Entity]:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall("SELECT * FROM entities")
+        return [SQLiteEntityRepository._row_to_entity(row) for row in rows]
+
+
+class AsyncSQLiteAccountRepository(AsyncAccountRepository):
+    """aiosqlite implementation of AsyncAccountRepository."""
+
+    def __init__(self, database: AsyncSQLiteDatabase) -> None:
+        self._db = database
+
+    async def get(self, account_id: UUID) -> Account | None:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            "SELECT * FROM accounts WHERE id = ?", (str(account_id),)
+        )
+        row = next(iter(rows), None)
+        return SQLiteAccountRepository._row_to_account(row) if row is not None else None
+
+    async def get_many(self, account_ids: Iterable[UUID]) -> dict[UUID, Account]:
+        rows = await _select_by_ids(await self._db.reader(), "accounts", account_ids)
+        accounts = map(SQLiteAccountRepository._row_to_account, rows)
+        return {obj.id: obj for obj in accounts}
+
+    async def list_by_entity(self, entity_id: UUID) -> list[Account]:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            "SELECT * FROM accounts WHERE entity_id = ?", (str(entity_id),)
+        )
+        return [SQLiteAccountRepository._row_to_account(row) for row in rows]
+
+
+class AsyncSQLitePeriodCloseRepository(AsyncPeriodCloseRepository):
+    """aiosqlite implementation of AsyncPeriodCloseRepository."""
+
+    def __init__(self, database: AsyncSQLiteDatabase) -> None:
+        self._db = database
+
+    async def closed_through(self, entity_ids: Iterable[UUID]) -> dict[UUID, date]:
+        by_text = {str(entity_id): entity_id for entity_id in entity_ids}
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            _CLOSED_THROUGH_SQL, (json.dumps(list(by_text)),)
+        )
+        return {
+            by_text[row["entity_id"]]: date.fromisoformat(row["period_end"])
+            for row in rows
+        }
+
+
+class AsyncSQLiteLedgerVersionRepository(AsyncLedgerVersionRepository):
+    """aiosqlite implementation of AsyncLedgerVersionRepository."""
+
+    def __init__(self, database: AsyncSQLiteDatabase) -> None:
+        self._db = database
+
+    async def ledger_version(self, entity_ids: Iterable[UUID] | None = None) -> int:
+        conn = await self._db.reader()
+        if entity_ids is None:
+            rows = await conn.execute_fetchall(
+                "SELECT COALESCE(SUM(version), 0) FROM ledger_versions"
+            )
+        else:
+            scopes = [str(entity_id) for entity_id in entity_ids]
+            scopes.append(GLOBAL_LEDGER_SCOPE)
+            rows = await conn.execute_fetchall(
+                _LEDGER_VERSION_SQL, (json.dumps(scopes),)
+            )
+        return int(next(iter(rows))[0])
+
+
+class AsyncSQLiteTransactionRepository(AsyncTransactionRepository):
+    """aiosqlite implementation of AsyncTransactionRepository."""
+
+    def __init__(self, database: AsyncSQLiteDatabase) -> None:
+        self._db = database
+
+    async def add_many(self, txns: Iterable[Transaction]) -> None:
+        txns = list(txns)
+        if not txns:
+            return
+        account_ids = {entry.account_id for txn in txns for entry in txn.entries}
+        async with self._db.unit_of_work() as conn:
+            closed = await conn.execute_fetchall(
+                _CLOSED_PERIODS_SQL, (json.dumps([str(a) for a in account_ids]),)
+            )
+            _check_periods_open(_postings(txns), closed)
+            await conn.executemany(
+                _INSERT_TRANSACTION_SQL, [_transaction_row(txn) for txn in txns]
+            )
+            await conn.executemany(
+                _INSERT_ENTRY_SQL,
+                [_entry_row(txn, entry) for txn in txns for entry in txn.entries],
+            )
+            for snapshot_date, day_totals in totals_by_date(txns).items():
+                day = snapshot_date.isoformat()
+                for totals in day_totals:
+                    key = (str(totals.account_id), totals.currency, day)
+                    later = await conn.execute_fetchall(_LATER_SNAPSHOTS_SQL, key)
+                    previous = await conn.execute_fetchall(_PREVIOUS_SNAPSHOT_SQL, key)
+                    writes = _snapshot_writes(
+                        totals, day, 1, list(later), next(iter(previous), None)
+                    )
+                    for sql, params in writes:
+                        await conn.executemany(sql, params)
+            bump_sql, bump_params = _ledger_version_bump(
+                _ACCOUNT_SCOPES_SQL, account_ids
+            )
+            await conn.executemany(bump_sql, [bump_params])
+
+    async def get(self, txn_id: UUID) -> Transaction | None:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            "SELECT * FROM transactions WHERE id = ?", (str(txn_id),)
+        )
+        if not rows:
+            return None
+        return (await self._rows_to_transactions(conn, list(rows)))[0]
+
+    async def list_page(
+        self,
+        account_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        if account_id is not None:
+            query, params = SQLiteTransactionRepository._account_query(
+                account_id, start_date, end_date, after
+            )
+        else:
+            query, params = SQLiteTransactionRepository._date_range_query(
+                start_date, end_date, after
+            )
+        query += f" LIMIT {int(limit)}"
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(query, params)
+        return await self._rows_to_transactions(conn, list(rows))
+
+    async def count_by_entity(self, entity_id: UUID) -> int:
+        conn = await self._db.reader()
+        rows = await conn.execute_fetchall(
+            """
+            SELECT COUNT(DISTINCT e.transaction_id) FROM entries e
+            JOIN accounts a ON e.account_id = a.id
+            WHERE a.entity_id = ?
+            """,
+            (str(entity_id),),
+        )
+        (count,) = next(iter(rows))
+        return int(count)
+
+    async def sum_by_account(
+        self, account_ids: Iterable[UUID], as_of: date | None = None
+    ) -> list[AccountTotals]:
+        """Read each account's latest balance snapshot on or before ``as_of``."""
+        conn = await self._db.reader()
+        ids = [str(account_id) for account_id in dict.fromkeys(account_ids)]
+        date_filter = " AND snapshot_date <= ?" if as_of is not None else ""
+        date_params = [as_of.isoformat()] if as_of is not None else []
+        totals: list[AccountTotals] = []
+        for chunk_start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[chunk_start : chunk_start + _IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            # SQLite takes the bare debit/credit columns from the MAX() row.
+            rows = await conn.execute_fetchall(
+                f"""
+                SELECT account_id, currency, MAX(snapshot_date) AS snapshot_date,
+                       debit_total, credit_total
+                FROM account_balance_snapshots
+                WHERE account_id IN ({placeholders}){date_filter}
+                GROUP BY account_id, currency
+                """,
+                [*chunk, *date_params],
+            )
+            totals.extend(
+                AccountTotals(
+                    account_id=UUID(row["account_id"]),
+                    currency=row["currency"],
+                    debit_total=Decimal(row["debit_total"]),
+                    credit_total=Decimal(row["credit_total"]),
+                )
+                for row in rows
+            )
+        return totals
+
+    @staticmethod
+    async def _rows_to_transactions(
+        conn: AsyncConnection, rows: list[sqlite3.Row]
+    ) -> list[Transaction]:
+        """Hydrate transaction rows with chunked entry queries on ``conn``."""
+        entries_by_txn: dict[str, list[Entry]] = {row["id"]: [] for row in rows}
+        txn_ids = list(entries_by_txn)
+        for start in range(0, len(txn_ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = txn_ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            entry_rows = await conn.execute_fetchall(
+                f"SELECT * FROM entries WHERE transaction_id IN ({placeholders}) "
+                "ORDER BY rowid",
+                chunk,
+            )
+            for entry_row in entry_rows:
+                entries_by_txn[entry_row["transaction_id"]].append(
+                    SQLiteTransactionRepository._row_to_entry(entry_row)
+                )
+        return [
+            SQLiteTransactionRepository._row_to_transaction(
+                row, entries_by_txn[row["id"]]
+            )
+            for row in rows
+        ]
@@ -1,23 +1,31 @@
-from family_office_ledger.services.audit import AuditService
+from family_office_ledger.domain.periods import PeriodClosedError
+from family_office_ledger.services.audit import AuditService, AuditWriter
 from family_office_ledger.services.corporate_actions import CorporateActionServiceImpl
 from family_office_ledger.services.currency import (
     CurrencyServiceImpl,
     ExchangeRateNotFoundError,
+    ResolvedRate,
 )
 from family_office_ledger.services.expense import ExpenseServiceImpl
 from family_office_ledger.services.interfaces import (
+    BalanceSeries,
     CorporateActionService,
     CurrencyService,
     ExpenseService,
     LedgerService,
     LotMatchingService,
     MatchResult,
+    PostingResult,
     ReconciliationService,
     ReconciliationSummary,
     ReportingService,
+    SeriesFrequency,
+    TrialBalance,
+    TrialBalanceLine,
 )
 from family_office_ledger.services.ledger import (
     AccountNotFoundError,
+    DuplicateTransactionError,
     LedgerServiceImpl,
     TransactionNotFoundError,
     UnbalancedTransactionError,
@@ -49,6 +57,7 @@ from family_office_ledger.services.reconciliation import (
     SessionNotFoundError,
     SessionSummary,
 )
+from family_office_ledger.services.report_cache import ReportCache, ReportCacheStats
 from family_office_ledger.services.reporting import ReportingServiceImpl
 from family_office_ledger.services.tax_documents import (
     AdjustmentCode,
@@ -74,15 +83,18 @@ from family_office_ledger.services.transfer_matching import (
 
 __all__ = [
     "AuditService",
+    "AuditWriter",
     "AdjustmentCode",
     "AssetAllocation",
     "AssetAllocationReport",
     "AccountNotFoundError",
+    "BalanceSeries",
     "CorporateActionService",
     "ConcentrationReport",
     "CorporateActionServiceImpl",
     "CurrencyService",
     "CurrencyServiceImpl",
+    "DuplicateTransactionError",
     "ExchangeRateNotFoundError",
     "ExpenseService",
     "ExpenseServiceImpl",
@@ -101,18 +113,24 @@ __all__ = [
     "MatchResult",
     "PerformanceMetrics",
     "PerformanceReport",
+    "PeriodClosedError",
     "PortfolioAnalyticsService",
+    "PostingResult",
     "QSBSHolding",
     "QSBSService",
     "QSBSSummary",
     "ReconciliationService",
     "ReconciliationServiceImpl",
+    "ResolvedRate",
     "ReconciliationSummary",
+    "ReportCache",
+    "ReportCacheStats",
     "ReportingService",
     "ReportingServiceImpl",
     "ScheduleD",
     "SecurityLookup",
     "SecurityNotFoundError",
+    "SeriesFrequency",
     "SessionExistsError",
     "SessionNotFoundError",
     "SessionSummary",
@@ -125,5 +143,7 @@ __all__ = [
     "TransferMatchNotFoundError",
     "TransferSessionExistsError",
     "TransferSessionNotFoundError",
+    "TrialBalance",
+    "TrialBalanceLine",
     "UnbalancedTransactionError",
 ]
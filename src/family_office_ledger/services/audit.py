@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import queue
 import sqlite3
+import threading
+import time
+import weakref
 from datetime import date, datetime
 from typing import Any
 from uuid import UUID
@@ -14,46 +19,252 @@ from family_office_ledger.domain.audit import (
     AuditEntry,
     AuditLogSummary,
 )
+from family_office_ledger.logging_config import get_logger
 from family_office_ledger.repositories.sqlite import SQLiteDatabase
 
+logger = get_logger(__name__)
+
+
+_AUDIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id TEXT PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    user_id TEXT,
+    timestamp TEXT NOT NULL,
+    old_values TEXT,
+    new_values TEXT,
+    change_summary TEXT NOT NULL DEFAULT '',
+    ip_address TEXT,
+    user_agent TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_log_entity_type ON audit_log(entity_type);
+CREATE INDEX IF NOT EXISTS idx_audit_log_entity_id ON audit_log(entity_id);
+CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_log_action ON audit_log(action);
+"""
+
+_INSERT_AUDIT_ENTRY = """
+INSERT INTO audit_log (
+    id, entity_type, entity_id, action, user_id, timestamp,
+    old_values, new_values, change_summary, ip_address, user_agent
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Databases whose audit schema has been created by this process.
+_schema_ready: weakref.WeakSet[SQLiteDatabase] = weakref.WeakSet()
+_schema_lock = threading.Lock()
+
+# Open writers, drained at interpreter exit.
+_open_writers: weakref.WeakSet[AuditWriter] = weakref.WeakSet()
+
+_STOP = object()
+_FLUSH = object()
+
+
+def ensure_audit_schema(database: SQLiteDatabase) -> None:
+    """Create the audit_log table and indexes once per database per process."""
+    with _schema_lock:
+        if database in _schema_ready:
+            return
+        database.get_connection().executescript(_AUDIT_SCHEMA)
+        _schema_ready.add(database)
+
+
+def _entry_params(entry: AuditEntry) -> tuple[Any, ...]:
+    return (
+        str(entry.id),
+        entry.entity_type.value,
+        str(entry.entity_id),
+        entry.action.value,
+        str(entry.user_id) if entry.user_id else None,
+        entry.timestamp.isoformat(),
+        json.dumps(entry.old_values) if entry.old_values else None,
+        json.dumps(entry.new_values) if entry.new_values else None,
+        entry.change_summary,
+        entry.ip_address,
+        entry.user_agent,
+    )
+
+
+class AuditWriter:
+    """Buffers audit entries and writes them to ``audit_log`` in batches.
+
+    Entries go into a bounded queue that a daemon thread drains with
+    ``executemany``, committing once per batch when ``batch_size`` entries
+    are waiting or ``flush_interval`` seconds after the first one arrived.
+    Producers block while the queue is full. ``close()`` writes whatever is
+    left and checkpoints the WAL so every logged entry is on disk; writing
+    to a closed writer raises ``RuntimeError``.
+
+    A batch that fails to commit is kept and retried with the next one.
+    The error is re-raised by the next ``flush()``, so readers learn that
+    entries are missing instead of reading an incomplete log.
+
+    In synchronous mode each entry is written and committed before
+    ``write`` returns. That is the default for ``:memory:`` databases, whose
+    single shared connection cannot be handed to a background thread.
+    """
+
+    def __init__(
+        self,
+        database: SQLiteDatabase,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_queue: int = 10_000,
+        synchronous: bool | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._db = database
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._synchronous = database.in_memory if synchronous is None else synchronous
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # Entries of failed batches and the last error, owned by the worker
+        # until ``flush()`` or ``close()`` hands them back.
+        self._unwritten: list[AuditEntry] = []
+        self._error: Exception | None = None
+        self._error_lock = threading.Lock()
+        ensure_audit_schema(database)
+        _open_writers.add(self)
+
+    @property
+    def synchronous(self) -> bool:
+        return self._synchronous
+
+    def write(self, entry: AuditEntry) -> None:
+        """Record ``entry``, buffering it unless the writer is synchronous."""
+        if self._synchronous:
+            self._write_batch([entry])
+            return
+        # Enqueue under the lock so nothing lands behind close()'s stop marker.
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AuditWriter is closed")
+            self._ensure_thread()
+            self._queue.put(entry)
+
+    def flush(self) -> None:
+        """Block until every entry written so far has been committed.
+
+        Raises the error of a batch that could not be committed since the
+        last flush; its entries stay queued for another attempt.
+        """
+        with self._lock:
+            if self._thread is None or self._closed:
+                return
+            self._queue.put(_FLUSH)
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write all buffered entries and sync them to disk."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+        _open_writers.discard(self)
+        if self._unwritten:
+            # Last attempt from the caller's thread; raises if it fails too.
+            self._write_batch(self._unwritten)
+            self._unwritten = []
+            self._error = None
+        if not self._db.in_memory:
+            self._db.get_connection().execute("PRAGMA wal_checkpoint(FULL)")
+
+    def _raise_error(self) -> None:
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _ensure_thread(self) -> None:
+        """Start the worker; the caller holds ``_lock``."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="audit-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch: list[AuditEntry] = []
+            markers = 1
+            if item is _STOP:
+                stopping = True
+            elif item is not _FLUSH:
+                batch.append(item)  # type: ignore[arg-type]
+                deadline = time.monotonic() + self._flush_interval
+                while len(batch) < self._batch_size:
+                    try:
+                        item = self._queue.get(
+                            timeout=max(0.0, deadline - time.monotonic())
+                        )
+                    except queue.Empty:
+                        break
+                    markers += 1
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    if item is _FLUSH:
+                        break
+                    batch.append(item)  # type: ignore[arg-type]
+            batch = self._unwritten + batch
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as exc:
+                    logger.exception("audit_flush_failed", entries=len(batch))
+                    self._db.get_connection().rollback()
+                    self._unwritten = batch
+                    with self._error_lock:
+                        self._error = exc
+                else:
+                    self._unwritten = []
+            for _ in range(markers):
+                self._queue.task_done()
+
+    def _write_batch(self, entries: list[AuditEntry]) -> None:
+        conn = self._db.get_connection()
+        conn.executemany(_INSERT_AUDIT_ENTRY, [_entry_params(e) for e in entries])
+        self._db.commit()
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close()
+
 
 class AuditService:
-    def __init__(self, database: SQLiteDatabase) -> None:
+    def __init__(
+        self, database: SQLiteDatabase, writer: AuditWriter | None = None
+    ) -> None:
         self._db = database
-        self._ensure_table_exists()
+        self._writer = writer or AuditWriter(database)
 
-    def _ensure_table_exists(self) -> None:
-        conn = self._db.get_connection()
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS audit_log (
-                id TEXT PRIMARY KEY,
-                entity_type TEXT NOT NULL,
-                entity_id TEXT NOT NULL,
-                action TEXT NOT NULL,
-                user_id TEXT,
-                timestamp TEXT NOT NULL,
-                old_values TEXT,
-                new_values TEXT,
-                change_summary TEXT NOT NULL DEFAULT '',
-                ip_address TEXT,
-                user_agent TEXT
-            )
-            """
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_audit_log_entity_type ON audit_log(entity_type)"
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_audit_log_entity_id ON audit_log(entity_id)"
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp)"
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_audit_log_action ON audit_log(action)"
-        )
-        conn.commit()
+    @property
+    def writer(self) -> AuditWriter:
+        return self._writer
+
+    def flush(self) -> None:
+        """Commit any buffered entries; reads call this first."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
 
     def log_create(
         self,
@@ -133,29 +344,7 @@ class AuditService:
         return entry
 
     def _save_entry(self, entry: AuditEntry) -> None:
-        conn = self._db.get_connection()
-        conn.execute(
-            """
-            INSERT INTO audit_log (
-                id, entity_type, entity_id, action, user_id, timestamp,
-                old_values, new_values, change_summary, ip_address, user_agent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(entry.id),
-                entry.entity_type.value,
-                str(entry.entity_id),
-                entry.action.value,
-                str(entry.user_id) if entry.user_id else None,
-                entry.timestamp.isoformat(),
-                json.dumps(entry.old_values) if entry.old_values else None,
-                json.dumps(entry.new_values) if entry.new_values else None,
-                entry.change_summary,
-                entry.ip_address,
-                entry.user_agent,
-            ),
-        )
-        conn.commit()
+        self._writer.write(entry)
 
     def _get_changed_fields(
         self, old_values: dict[str, Any], new_values: dict[str, Any]
@@ -168,6 +357,7 @@ class AuditService:
         return sorted(changed)
 
     def get_entry(self, entry_id: UUID) -> AuditEntry | None:
+        self.flush()
         conn = self._db.get_connection()
         row = conn.execute(
             "SELECT * FROM audit_log WHERE id = ?", (str(entry_id),)
@@ -183,6 +373,7 @@ class AuditService:
         limit: int = 100,
         offset: int = 0,
     ) -> list[AuditEntry]:
+        self.flush()
         conn = self._db.get_connection()
         rows = conn.execute(
             """
@@ -203,6 +394,7 @@ class AuditService:
         limit: int = 100,
         offset: int = 0,
     ) -> list[AuditEntry]:
+        self.flush()
         conn = self._db.get_connection()
 
         query = "SELECT * FROM audit_log WHERE entity_type = ?"
@@ -233,6 +425,7 @@ class AuditService:
         limit: int = 100,
         offset: int = 0,
     ) -> list[AuditEntry]:
+        self.flush()
         conn = self._db.get_connection()
 
         query = "SELECT * FROM audit_log WHERE action = ?"
@@ -260,6 +453,7 @@ class AuditService:
         limit: int = 100,
         offset: int = 0,
     ) -> list[AuditEntry]:
+        self.flush()
         conn = self._db.get_connection()
         rows = conn.execute(
             """
@@ -276,6 +470,7 @@ class AuditService:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> AuditLogSummary:
+        self.flush()
         conn = self._db.get_connection()
 
         query_base = "SELECT * FROM audit_log WHERE 1=1"
@@ -1,5 +1,7 @@
 """Corporate action service implementation."""
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
@@ -22,10 +24,14 @@ class CorporateActionServiceImpl(CorporateActionService):
         tax_lot_repo: TaxLotRepository,
         position_repo: PositionRepository,
         security_repo: SecurityRepository,
+        unit_of_work: Callable[[], AbstractContextManager[object]] | None = None,
     ) -> None:
         self._tax_lot_repo = tax_lot_repo
         self._position_repo = position_repo
         self._security_repo = security_repo
+        # Each corporate action is written as one database transaction when
+        # given e.g. ``SQLiteDatabase.unit_of_work``.
+        self._unit_of_work = unit_of_work or nullcontext
 
     def apply_split(
         self,
@@ -53,15 +59,16 @@ class CorporateActionServiceImpl(CorporateActionService):
         # Get all positions for this security
         positions = list(self._position_repo.list_by_security(security_id))
 
-        for position in positions:
-            # Get all open lots for this position
-            open_lots = list(self._tax_lot_repo.list_open_by_position(position.id))
+        with self._unit_of_work():
+            for position in positions:
+                # Get all open lots for this position
+                open_lots = list(self._tax_lot_repo.list_open_by_position(position.id))
 
-            for lot in open_lots:
-                # Use the TaxLot's built-in apply_split method
-                lot.apply_split(ratio_numerator, ratio_denominator)
-                self._tax_lot_repo.update(lot)
-                affected_count += 1
+                for lot in open_lots:
+                    # Use the TaxLot's built-in apply_split method
+                    lot.apply_split(ratio_numerator, ratio_denominator)
+                    self._tax_lot_repo.update(lot)
+                    affected_count += 1
 
         return affected_count
 
@@ -93,50 +100,54 @@ class CorporateActionServiceImpl(CorporateActionService):
             self._position_repo.list_by_security(parent_security_id)
         )
 
-        for parent_position in parent_positions:
-            # Find or get the child position for the same account
-            child_position = self._position_repo.get_by_account_and_security(
-                parent_position.account_id, child_security_id
-            )
-
-            if child_position is None:
-                continue  # Skip if no child position exists
-
-            # Get open lots for parent position
-            open_lots = list(
-                self._tax_lot_repo.list_open_by_position(parent_position.id)
-            )
-
-            for parent_lot in open_lots:
-                # Calculate cost basis allocation
-                parent_cost_per_share = parent_lot.cost_per_share
-                child_cost_per_share = Money(
-                    parent_cost_per_share.amount * allocation_ratio,
-                    parent_cost_per_share.currency,
-                )
-                new_parent_cost_per_share = Money(
-                    parent_cost_per_share.amount * (1 - allocation_ratio),
-                    parent_cost_per_share.currency,
+        child_lots: list[TaxLot] = []
+        with self._unit_of_work():
+            for parent_position in parent_positions:
+                # Find or get the child position for the same account
+                child_position = self._position_repo.get_by_account_and_security(
+                    parent_position.account_id, child_security_id
                 )
 
-                # Update parent lot cost basis
-                parent_lot.cost_per_share = new_parent_cost_per_share
-                self._tax_lot_repo.update(parent_lot)
-
-                # Create child lot
-                child_lot = TaxLot(
-                    position_id=child_position.id,
-                    acquisition_date=parent_lot.acquisition_date,
-                    cost_per_share=child_cost_per_share,
-                    original_quantity=parent_lot.original_quantity,
-                    acquisition_type=AcquisitionType.SPINOFF,
-                    is_covered=parent_lot.is_covered,
+                if child_position is None:
+                    continue  # Skip if no child position exists
+
+                # Get open lots for parent position
+                open_lots = list(
+                    self._tax_lot_repo.list_open_by_position(parent_position.id)
                 )
-                # Set remaining quantity to match the proportion
-                child_lot.remaining_quantity = parent_lot.remaining_quantity
-                self._tax_lot_repo.add(child_lot)
 
-                affected_count += 1
+                for parent_lot in open_lots:
+                    # Calculate cost basis allocation
+                    parent_cost_per_share = parent_lot.cost_per_share
+                    child_cost_per_share = Money(
+                        parent_cost_per_share.amount * allocation_ratio,
+                        parent_cost_per_share.currency,
+                    )
+                    new_parent_cost_per_share = Money(
+                        parent_cost_per_share.amount * (1 - allocation_ratio),
+                        parent_cost_per_share.currency,
+                    )
+
+                    # Update parent lot cost basis
+                    parent_lot.cost_per_share = new_parent_cost_per_share
+                    self._tax_lot_repo.update(parent_lot)
+
+                    # Create child lot
+                    child_lot = TaxLot(
+                        position_id=child_position.id,
+                        acquisition_date=parent_lot.acquisition_date,
+                        cost_per_share=child_cost_per_share,
+                        original_quantity=parent_lot.original_quantity,
+                        acquisition_type=AcquisitionType.SPINOFF,
+                        is_covered=parent_lot.is_covered,
+                    )
+                    # Set remaining quantity to match the proportion
+                    child_lot.remaining_quantity = parent_lot.remaining_quantity
+                    child_lots.append(child_lot)
+
+                    affected_count += 1
+
+            self._tax_lot_repo.add_many(child_lots)
 
         return affected_count
 
@@ -168,58 +179,64 @@ class CorporateActionServiceImpl(CorporateActionService):
         # Get old positions
         old_positions = list(self._position_repo.list_by_security(old_security_id))
 
-        for old_position in old_positions:
-            # Find the new position for the same account
-            new_position = self._position_repo.get_by_account_and_security(
-                old_position.account_id, new_security_id
-            )
-
-            if new_position is None:
-                continue  # Skip if no new position exists
-
-            # Get open lots for old position
-            open_lots = list(self._tax_lot_repo.list_open_by_position(old_position.id))
+        new_lots: list[TaxLot] = []
+        with self._unit_of_work():
+            for old_position in old_positions:
+                # Find the new position for the same account
+                new_position = self._position_repo.get_by_account_and_security(
+                    old_position.account_id, new_security_id
+                )
 
-            for old_lot in open_lots:
-                # Calculate new quantity
-                old_quantity = old_lot.remaining_quantity
-                new_quantity = Quantity(old_quantity.value * exchange_ratio)
+                if new_position is None:
+                    continue  # Skip if no new position exists
 
-                # Calculate cost basis
-                old_cost_basis = old_lot.cost_per_share * old_quantity.value
+                # Get open lots for old position
+                open_lots = list(
+                    self._tax_lot_repo.list_open_by_position(old_position.id)
+                )
 
-                # Adjust for cash in lieu if present
-                if cash_in_lieu_per_share is not None:
-                    cash_received = cash_in_lieu_per_share * old_quantity.value
-                    adjusted_cost_basis = Money(
-                        old_cost_basis.amount - cash_received.amount,
-                        old_cost_basis.currency,
+                for old_lot in open_lots:
+                    # Calculate new quantity
+                    old_quantity = old_lot.remaining_quantity
+                    new_quantity = Quantity(old_quantity.value * exchange_ratio)
+
+                    # Calculate cost basis
+                    old_cost_basis = old_lot.cost_per_share * old_quantity.value
+
+                    # Adjust for cash in lieu if present
+                    if cash_in_lieu_per_share is not None:
+                        cash_received = cash_in_lieu_per_share * old_quantity.value
+                        adjusted_cost_basis = Money(
+                            old_cost_basis.amount - cash_received.amount,
+                            old_cost_basis.currency,
+                        )
+                    else:
+                        adjusted_cost_basis = old_cost_basis
+
+                    # Calculate new cost per share
+                    new_cost_per_share = Money(
+                        adjusted_cost_basis.amount / new_quantity.value,
+                        adjusted_cost_basis.currency,
                     )
-                else:
-                    adjusted_cost_basis = old_cost_basis
 
-                # Calculate new cost per share
-                new_cost_per_share = Money(
-                    adjusted_cost_basis.amount / new_quantity.value,
-                    adjusted_cost_basis.currency,
-                )
+                    # Close old lot by selling all remaining shares
+                    old_lot.sell(old_quantity, effective_date)
+                    self._tax_lot_repo.update(old_lot)
+
+                    # Create new lot
+                    new_lot = TaxLot(
+                        position_id=new_position.id,
+                        acquisition_date=old_lot.acquisition_date,
+                        cost_per_share=new_cost_per_share,
+                        original_quantity=new_quantity,
+                        acquisition_type=AcquisitionType.MERGER,
+                        is_covered=old_lot.is_covered,
+                    )
+                    new_lots.append(new_lot)
 
-                # Close old lot by selling all remaining shares
-                old_lot.sell(old_quantity, effective_date)
-                self._tax_lot_repo.update(old_lot)
-
-                # Create new lot
-                new_lot = TaxLot(
-                    position_id=new_position.id,
-                    acquisition_date=old_lot.acquisition_date,
-                    cost_per_share=new_cost_per_share,
-                    original_quantity=new_quantity,
-                    acquisition_type=AcquisitionType.MERGER,
-                    is_covered=old_lot.is_covered,
-                )
-                self._tax_lot_repo.add(new_lot)
+                    affected_count += 1
 
-                affected_count += 1
+            self._tax_lot_repo.add_many(new_lots)
 
         return affected_count
 
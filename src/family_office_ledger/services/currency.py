@@ -1,8 +1,19 @@
-from datetime import date
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import UUID
 
 from family_office_ledger.domain.exchange_rates import ExchangeRate
 from family_office_ledger.domain.value_objects import Currency, Money
-from family_office_ledger.repositories.interfaces import ExchangeRateRepository
+from family_office_ledger.repositories.interfaces import (
+    EXCHANGE_RATE_SCOPE,
+    ExchangeRateRepository,
+    LedgerVersionRepository,
+)
 from family_office_ledger.services.interfaces import CurrencyService
 
 
@@ -16,12 +27,343 @@ class ExchangeRateNotFoundError(Exception):
     pass
 
 
+class ExchangeRateCache:
+    """In-memory rate series per currency pair, answered by as-of lookup.
+
+    Each pair is read from the repository once with ``list_by_currency_pair``
+    and kept as parallel sorted ``dates``/``rates`` lists. ``rate_as_of``
+    bisects for the latest rate effective on or before the requested date and
+    rejects it when it is older than ``max_staleness``; ``None`` accepts any
+    earlier rate and ``timedelta(0)`` only an exact date match. When a pair
+    has several rates on one date the most recently created one wins.
+
+    The set of stored pairs is read once as well, so lookups for a pair that
+    has no rates at all are answered without touching the repository.
+
+    The cache may be shared between threads. A series read while a write
+    invalidates it is not kept, so a lookup never caches rates from before
+    the write.
+    """
+
+    def __init__(
+        self,
+        exchange_rate_repo: ExchangeRateRepository,
+        max_staleness: timedelta | None = timedelta(0),
+    ) -> None:
+        if max_staleness is not None and max_staleness < timedelta(0):
+            raise ValueError("max_staleness must not be negative")
+        self._repo = exchange_rate_repo
+        self._max_staleness = max_staleness
+        self._series: dict[tuple[str, str], tuple[list[date], list[ExchangeRate]]] = {}
+        self._pairs: frozenset[tuple[str, str]] | None = None
+        self._lock = threading.Lock()
+        # Bumped by ``invalidate``; loads started before a bump are discarded.
+        self._generation = 0
+
+    @property
+    def max_staleness(self) -> timedelta | None:
+        return self._max_staleness
+
+    def pairs(self) -> frozenset[tuple[str, str]]:
+        """Every (from_currency, to_currency) pair with at least one rate."""
+        pairs = self._pairs
+        if pairs is None:
+            generation = self._generation
+            pairs = frozenset(self._repo.list_currency_pairs())
+            with self._lock:
+                if generation == self._generation:
+                    self._pairs = pairs
+        return pairs
+
+    def _load(
+        self, from_currency: str, to_currency: str
+    ) -> tuple[list[date], list[ExchangeRate]]:
+        key = (from_currency, to_currency)
+        series = self._series.get(key)
+        if series is None and key not in self.pairs():
+            return [], []
+        if series is None:
+            generation = self._generation
+            rates = sorted(
+                self._repo.list_by_currency_pair(from_currency, to_currency),
+                key=lambda r: (r.effective_date, r.created_at),
+            )
+            series = ([r.effective_date for r in rates], rates)
+            with self._lock:
+                if generation == self._generation:
+                    self._series[key] = series
+        return series
+
+    def rate_as_of(
+        self, from_currency: str, to_currency: str, as_of_date: date
+    ) -> ExchangeRate | None:
+        dates, rates = self._load(from_currency, to_currency)
+        index = bisect_right(dates, as_of_date)
+        if index == 0:
+            return None
+        rate = rates[index - 1]
+        if (
+            self._max_staleness is not None
+            and as_of_date - rate.effective_date > self._max_staleness
+        ):
+            return None
+        return rate
+
+    def invalidate(
+        self, from_currency: str | None = None, to_currency: str | None = None
+    ) -> None:
+        """Drop one pair's series, or every series when no pair is given."""
+        with self._lock:
+            self._generation += 1
+            self._pairs = None
+            if from_currency is None or to_currency is None:
+                self._series.clear()
+                return
+            self._series.pop((from_currency, to_currency), None)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLeg:
+    """One hop of a conversion, backed by a stored rate used as-is or inverted."""
+
+    from_currency: str
+    to_currency: str
+    exchange_rate: ExchangeRate
+    inverted: bool = False
+
+    @property
+    def rate(self) -> Decimal:
+        if self.inverted:
+            return Decimal("1") / self.exchange_rate.rate
+        return self.exchange_rate.rate
+
+    def apply(self, amount: Decimal) -> Decimal:
+        if self.inverted:
+            return amount / self.exchange_rate.rate
+        return amount * self.exchange_rate.rate
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedRate:
+    """A conversion rate together with the stored rates it was derived from."""
+
+    from_currency: str
+    to_currency: str
+    as_of_date: date
+    legs: tuple[RateLeg, ...]
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """Currencies visited, e.g. ``("GBP", "USD", "JPY")`` for a cross rate."""
+        return (self.from_currency, *(leg.to_currency for leg in self.legs))
+
+    @property
+    def rate(self) -> Decimal:
+        return self.apply(Decimal("1"))
+
+    @property
+    def is_cross_rate(self) -> bool:
+        return len(self.legs) > 1
+
+    def apply(self, amount: Decimal) -> Decimal:
+        for leg in self.legs:
+            amount = leg.apply(amount)
+        return amount
+
+
+class CrossRateResolver:
+    """Resolve a pair's rate directly, through a pivot, or by shortest path.
+
+    A direct rate wins, then its inverse. Failing both, each pivot currency
+    is tried in order as a single intermediate hop, and finally a
+    breadth-first search over the currencies with a usable rate on that date
+    finds the shortest chain of at most ``max_legs`` rates. Results,
+    including misses, are memoized per (pair, date) in an LRU of
+    ``memo_size`` entries; ``invalidate`` clears it whenever rates change.
+    """
+
+    def __init__(
+        self,
+        cache: ExchangeRateCache,
+        pivot_currencies: Sequence[str] = ("USD", "EUR"),
+        max_legs: int = 3,
+        memo_size: int = 4096,
+    ) -> None:
+        if max_legs < 1:
+            raise ValueError("max_legs must be at least 1")
+        if memo_size < 1:
+            raise ValueError("memo_size must be at least 1")
+        self._cache = cache
+        self._pivots = tuple(pivot_currencies)
+        self._max_legs = max_legs
+        self._memo_size = memo_size
+        self._memo: OrderedDict[tuple[str, str, date], ResolvedRate | None] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def resolve(
+        self, from_currency: str, to_currency: str, as_of_date: date
+    ) -> ResolvedRate | None:
+        key = (from_currency, to_currency, as_of_date)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+            generation = self._generation
+        resolved = self._resolve(from_currency, to_currency, as_of_date)
+        with self._lock:
+            if generation == self._generation:
+                self._memo[key] = resolved
+                if len(self._memo) > self._memo_size:
+                    self._memo.popitem(last=False)
+        return resolved
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._memo.clear()
+
+    def _leg(
+        self, from_currency: str, to_currency: str, as_of_date: date
+    ) -> RateLeg | None:
+        rate = self._cache.rate_as_of(from_currency, to_currency, as_of_date)
+        if rate is not None:
+            return RateLeg(from_currency, to_currency, rate)
+        inverse = self._cache.rate_as_of(to_currency, from_currency, as_of_date)
+        if inverse is not None:
+            return RateLeg(from_currency, to_currency, inverse, inverted=True)
+        return None
+
+    def _resolve(
+        self, from_currency: str, to_currency: str, as_of_date: date
+    ) -> ResolvedRate | None:
+        if from_currency == to_currency:
+            return ResolvedRate(from_currency, to_currency, as_of_date, ())
+
+        direct = self._leg(from_currency, to_currency, as_of_date)
+        if direct is not None:
+            return ResolvedRate(from_currency, to_currency, as_of_date, (direct,))
+        if self._max_legs < 2:
+            return None
+
+        for pivot in self._pivots:
+            if pivot in (from_currency, to_currency):
+                continue
+            first = self._leg(from_currency, pivot, as_of_date)
+            if first is None:
+                continue
+            second = self._leg(pivot, to_currency, as_of_date)
+            if second is not None:
+                return ResolvedRate(
+                    from_currency, to_currency, as_of_date, (first, second)
+                )
+
+        path = self._shortest_path(from_currency, to_currency, as_of_date)
+        if path is None:
+            return None
+        legs: list[RateLeg] = []
+        for hop_from, hop_to in zip(path, path[1:], strict=False):
+            leg = self._leg(hop_from, hop_to, as_of_date)
+            if leg is None:
+                return None
+            legs.append(leg)
+        return ResolvedRate(from_currency, to_currency, as_of_date, tuple(legs))
+
+    def _graph(self, as_of_date: date) -> dict[str, list[str]]:
+        """Currencies linked by a rate usable on ``as_of_date``, either way."""
+        neighbours: dict[str, set[str]] = {}
+        for from_currency, to_currency in self._cache.pairs():
+            rate = self._cache.rate_as_of(from_currency, to_currency, as_of_date)
+            if rate is not None:
+                neighbours.setdefault(from_currency, set()).add(to_currency)
+                neighbours.setdefault(to_currency, set()).add(from_currency)
+        return {currency: sorted(linked) for currency, linked in neighbours.items()}
+
+    def _shortest_path(
+        self, from_currency: str, to_currency: str, as_of_date: date
+    ) -> list[str] | None:
+        graph = self._graph(as_of_date)
+        if from_currency not in graph or to_currency not in graph:
+            return None
+        previous: dict[str, str | None] = {from_currency: None}
+        queue = deque([(from_currency, 0)])
+        while queue:
+            currency, legs = queue.popleft()
+            if legs == self._max_legs:
+                continue
+            for neighbour in graph[currency]:
+                if neighbour in previous:
+                    continue
+                previous[neighbour] = currency
+                if neighbour == to_currency:
+                    path = [to_currency]
+                    step = previous[to_currency]
+                    while step is not None:
+                        path.append(step)
+                        step = previous[step]
+                    return path[::-1]
+                queue.append((neighbour, legs + 1))
+        return None
+
+
 class CurrencyServiceImpl(CurrencyService):
-    def __init__(self, exchange_rate_repo: ExchangeRateRepository) -> None:
+    """Currency conversion answered from an in-memory rate cache.
+
+    Rate writes made through the service invalidate the cache. Given
+    ``ledger_versions``, the service also reads the ``EXCHANGE_RATE_SCOPE``
+    version before each lookup and drops the cache when it has moved, so
+    rates written by other services, processes or directly through the
+    repository are seen too.
+    """
+
+    def __init__(
+        self,
+        exchange_rate_repo: ExchangeRateRepository,
+        max_staleness: timedelta | None = timedelta(0),
+        pivot_currencies: Sequence[str] = ("USD", "EUR"),
+        max_legs: int = 3,
+        memo_size: int = 4096,
+        ledger_versions: LedgerVersionRepository | None = None,
+    ) -> None:
         self._repo = exchange_rate_repo
+        self._cache = ExchangeRateCache(exchange_rate_repo, max_staleness)
+        self._resolver = CrossRateResolver(
+            self._cache, pivot_currencies, max_legs, memo_size
+        )
+        self._ledger_versions = ledger_versions
+        self._rate_version: int | None = None
+        self._version_lock = threading.Lock()
+
+    @property
+    def cache(self) -> ExchangeRateCache:
+        return self._cache
+
+    def _check_rate_version(self) -> None:
+        if self._ledger_versions is None:
+            return
+        version = self._ledger_versions.scope_version(EXCHANGE_RATE_SCOPE)
+        with self._version_lock:
+            if version == self._rate_version:
+                return
+            self._rate_version = version
+        self._cache.invalidate()
+        self._resolver.invalidate()
 
     def add_rate(self, rate: ExchangeRate) -> None:
         self._repo.add(rate)
+        self._cache.invalidate(rate.from_currency, rate.to_currency)
+        self._resolver.invalidate()
+
+    def delete_rate(self, rate_id: UUID) -> bool:
+        rate = self._repo.get(rate_id)
+        if rate is None:
+            return False
+        self._repo.delete(rate_id)
+        self._cache.invalidate(rate.from_currency, rate.to_currency)
+        self._resolver.invalidate()
+        return True
 
     def get_rate(
         self,
@@ -38,29 +380,57 @@ class CurrencyServiceImpl(CurrencyService):
     ) -> ExchangeRate | None:
         return self._repo.get_latest_rate(from_currency, to_currency)
 
-    def convert(
+    def resolve_rate(
         self,
-        amount: Money,
+        from_currency: str,
         to_currency: str,
         as_of_date: date,
-    ) -> Money:
+    ) -> ResolvedRate | None:
+        self._check_rate_version()
+        return self._resolver.resolve(from_currency, to_currency, as_of_date)
+
+    def _convert_or_none(
+        self, amount: Money, to_currency: str, as_of_date: date
+    ) -> Money | None:
         from_currency = _get_currency_str(amount.currency)
         if from_currency == to_currency:
             return amount
 
-        rate = self._repo.get_rate(from_currency, to_currency, as_of_date)
-        if rate is not None:
-            converted = amount.amount * rate.rate
-            return Money(converted, to_currency)
+        resolved = self._resolver.resolve(from_currency, to_currency, as_of_date)
+        if resolved is None:
+            return None
+        return Money(resolved.apply(amount.amount), to_currency)
 
-        inverse = self._repo.get_rate(to_currency, from_currency, as_of_date)
-        if inverse is not None:
-            converted = amount.amount / inverse.rate
-            return Money(converted, to_currency)
+    def convert(
+        self,
+        amount: Money,
+        to_currency: str,
+        as_of_date: date,
+    ) -> Money:
+        self._check_rate_version()
+        converted = self._convert_or_none(amount, to_currency, as_of_date)
+        if converted is None:
+            from_currency = _get_currency_str(amount.currency)
+            raise ExchangeRateNotFoundError(
+                f"No exchange rate found for {from_currency}/{to_currency} on {as_of_date}"
+            )
+        return converted
 
-        raise ExchangeRateNotFoundError(
-            f"No exchange rate found for {from_currency}/{to_currency} on {as_of_date}"
-        )
+    def convert_many(
+        self,
+        amounts: Sequence[Money],
+        to_currency: str,
+        dates: date | Sequence[date],
+    ) -> list[Money | None]:
+        if isinstance(dates, date):
+            dates = [dates] * len(amounts)
+        elif len(dates) != len(amounts):
+            raise ValueError("amounts and dates must have the same length")
+        self._check_rate_version()
+        return [
+            self._convert_or_none(amount, to_currency, as_of_date)
+            for amount, as_of_date in zip(amounts, dates, strict=True)
+        ]
 
     def calculate_fx_gain_loss(
         self,
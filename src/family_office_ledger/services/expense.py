@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -94,7 +95,7 @@ class ExpenseServiceImpl(ExpenseService):
 
         if entity_ids:
             for entity_id in entity_ids:
-                txns = self._transaction_repo.list_by_entity(
+                txns = self._transaction_repo.iter_by_entity(
                     entity_id, start_date, end_date
                 )
                 for txn in txns:
@@ -103,7 +104,7 @@ class ExpenseServiceImpl(ExpenseService):
                         total += expense_amount
                         count += 1
         else:
-            txns = self._transaction_repo.list_by_date_range(start_date, end_date)
+            txns = self._transaction_repo.iter_by_date_range(start_date, end_date)
             for txn in txns:
                 expense_amount = self._get_expense_amount(txn, expense_account_ids)
                 if expense_amount > Decimal("0"):
@@ -168,8 +169,8 @@ class ExpenseServiceImpl(ExpenseService):
         expense_accounts = self._get_expense_accounts([entity_id])
         expense_account_ids = {a.id for a in expense_accounts}
 
-        transactions = list(
-            self._transaction_repo.list_by_entity(entity_id, start_date, end_date)
+        transactions = self._transaction_repo.iter_by_entity(
+            entity_id, start_date, end_date
         )
 
         vendor_transactions: dict[UUID, list[tuple[date, Decimal]]] = defaultdict(list)
@@ -221,19 +222,14 @@ class ExpenseServiceImpl(ExpenseService):
         entity_ids: list[UUID] | None,
         start_date: date,
         end_date: date,
-    ) -> list[Transaction]:
-        transactions: list[Transaction] = []
+    ) -> Iterator[Transaction]:
         if entity_ids:
             for entity_id in entity_ids:
-                txns = self._transaction_repo.list_by_entity(
+                yield from self._transaction_repo.iter_by_entity(
                     entity_id, start_date, end_date
                 )
-                transactions.extend(txns)
         else:
-            transactions = list(
-                self._transaction_repo.list_by_date_range(start_date, end_date)
-            )
-        return transactions
+            yield from self._transaction_repo.iter_by_date_range(start_date, end_date)
 
     def _get_expense_amount(
         self, txn: Transaction, expense_account_ids: set[UUID]
@@ -9,6 +9,8 @@ This service:
 - Creates/disposes tax lots for investment transactions
 """
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from decimal import Decimal
 from uuid import UUID
@@ -115,6 +117,7 @@ class IngestionService:
         ledger_service: LedgerService,
         lot_matching_service: LotMatchingService,
         transaction_classifier: TransactionClassifier,
+        unit_of_work: Callable[[], AbstractContextManager[object]] | None = None,
     ) -> None:
         """Initialize the ingestion service.
 
@@ -127,6 +130,8 @@ class IngestionService:
             ledger_service: Service for posting journal entries
             lot_matching_service: Service for tax lot matching and disposal
             transaction_classifier: Classifier for determining transaction types
+            unit_of_work: Optional factory for a context manager that commits
+                all writes of one file together, e.g. ``SQLiteDatabase.unit_of_work``
         """
         self._entity_repo = entity_repo
         self._account_repo = account_repo
@@ -136,6 +141,7 @@ class IngestionService:
         self._ledger_service = ledger_service
         self._lot_matching_service = lot_matching_service
         self._classifier = transaction_classifier
+        self._unit_of_work = unit_of_work or nullcontext
 
         # Cache for entities and accounts to avoid repeated lookups
         self._entity_cache: dict[str, Entity] = {}
@@ -171,26 +177,28 @@ class IngestionService:
         # Parse the file
         parsed_transactions = BankParserFactory.parse(file_path)
 
-        # Ensure system entity exists for standard accounts
-        system_entity = self._get_or_create_entity(SYSTEM_ENTITY_NAME)
-
-        # Track created entities/accounts for result
-        initial_entities = set(e.name for e in self._entity_repo.list_all())
-        initial_accounts_count = self._count_all_accounts()
-
-        # Process each transaction
-        for parsed_txn in parsed_transactions:
-            try:
-                self._process_transaction(
-                    parsed_txn,
-                    default_entity_name,
-                    result,
-                )
-                result.transaction_count += 1
-            except Exception as e:
-                result.errors.append(
-                    f"Error processing transaction {parsed_txn.import_id}: {e}"
-                )
+        # Book the whole file in one unit of work so it is committed once
+        with self._unit_of_work():
+            # Ensure system entity exists for standard accounts
+            self._get_or_create_entity(SYSTEM_ENTITY_NAME)
+
+            # Track created entities/accounts for result
+            initial_entities = set(e.name for e in self._entity_repo.list_all())
+            initial_accounts_count = self._count_all_accounts()
+
+            # Process each transaction
+            for parsed_txn in parsed_transactions:
+                try:
+                    self._process_transaction(
+                        parsed_txn,
+                        default_entity_name,
+                        result,
+                    )
+                    result.transaction_count += 1
+                except Exception as e:
+                    result.errors.append(
+                        f"Error processing transaction {parsed_txn.import_id}: {e}"
+                    )
 
         # Calculate created counts
         final_entities = set(e.name for e in self._entity_repo.list_all())
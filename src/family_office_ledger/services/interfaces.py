@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import date
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 from decimal import Decimal
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from family_office_ledger.domain.exchange_rates import ExchangeRate
 from family_office_ledger.domain.transactions import TaxLot, Transaction
-from family_office_ledger.domain.value_objects import LotSelection, Money, Quantity
+from family_office_ledger.domain.value_objects import (
+    AccountType,
+    LotSelection,
+    Money,
+    Quantity,
+)
 
 if TYPE_CHECKING:
     from family_office_ledger.domain.budgets import (
@@ -19,6 +26,35 @@ if TYPE_CHECKING:
     )
 
 
+class SeriesFrequency(StrEnum):
+    """Sampling frequency of a balance series."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+    def sample_dates(self, start_date: date, end_date: date) -> list[date]:
+        """Last day of each period from ``start_date`` through ``end_date``.
+
+        Weeks run seven days from ``start_date`` and months are calendar
+        months. The final period is cut off at ``end_date``, so it is
+        always the last sample.
+        """
+        dates: list[date] = []
+        day = start_date
+        while day <= end_date:
+            if self is SeriesFrequency.DAILY:
+                period_end = day
+            elif self is SeriesFrequency.WEEKLY:
+                period_end = day + timedelta(days=6)
+            else:
+                next_month = date(day.year + day.month // 12, day.month % 12 + 1, 1)
+                period_end = next_month - timedelta(days=1)
+            dates.append(min(period_end, end_date))
+            day = period_end + timedelta(days=1)
+        return dates
+
+
 @dataclass
 class LotDisposition:
     lot_id: UUID
@@ -46,6 +82,20 @@ class MatchResult:
     reason: str
 
 
+@dataclass
+class PostingResult:
+    """Outcome of one transaction of a ``post_transactions`` batch.
+
+    ``error`` explains a rejected transaction. It is None both for posted
+    transactions and for valid ones left unposted because a strict batch
+    was rejected.
+    """
+
+    transaction_id: UUID
+    posted: bool
+    error: str | None = None
+
+
 @dataclass
 class ReconciliationSummary:
     total_imported: int
@@ -61,6 +111,64 @@ class ReconciliationSummary:
         return self.matched_count / self.total_imported
 
 
+@dataclass(frozen=True)
+class TrialBalanceLine:
+    """Debit and credit totals of one account in one currency."""
+
+    account_id: UUID
+    account_name: str
+    entity_id: UUID
+    account_type: AccountType
+    currency: str
+    debit_total: Decimal
+    credit_total: Decimal
+
+    @property
+    def net_balance(self) -> Decimal:
+        return self.debit_total - self.credit_total
+
+
+@dataclass
+class TrialBalance:
+    """Trial balance lines, produced while the report is iterated.
+
+    ``totals`` maps each currency to its (debits, credits) over the lines
+    iterated so far, so it and ``is_balanced`` are final once the lines
+    are exhausted. The lines can only be iterated once.
+    """
+
+    as_of_date: date
+    lines: Iterable[TrialBalanceLine]
+    totals: dict[str, tuple[Decimal, Decimal]] = field(default_factory=dict)
+
+    def __iter__(self) -> Iterator[TrialBalanceLine]:
+        for line in self.lines:
+            debits, credits = self.totals.get(
+                line.currency, (Decimal("0"), Decimal("0"))
+            )
+            self.totals[line.currency] = (
+                debits + line.debit_total,
+                credits + line.credit_total,
+            )
+            yield line
+
+    @property
+    def is_balanced(self) -> bool:
+        return all(debits == credits for debits, credits in self.totals.values())
+
+
+@dataclass
+class BalanceSeries:
+    """Account balances sampled at a sorted list of dates.
+
+    ``balances`` maps each account to its balance (debits minus credits,
+    summed over currencies) on each of ``dates``.
+    """
+
+    dates: list[date]
+    balances: dict[UUID, list[Decimal]]
+
+
 class LedgerService(ABC):
     @abstractmethod
     def post_transaction(self, txn: Transaction) -> None:
@@ -70,6 +178,43 @@ class LedgerService(ABC):
     def validate_transaction(self, txn: Transaction) -> None:
         pass
 
+    def validate_transactions(self, txns: Iterable[Transaction]) -> None:
+        for txn in txns:
+            self.validate_transaction(txn)
+
+    def post_transactions(
+        self, txns: Iterable[Transaction], strict: bool = True
+    ) -> list[PostingResult]:
+        """Post a batch of transactions, reporting the outcome of each.
+
+        Invalid transactions are skipped; in ``strict`` mode a single one
+        leaves the whole batch unposted. Implementations backed by a
+        repository override this to validate the batch with one account
+        lookup and write it in one transaction.
+        """
+        txns = list(txns)
+        errors: dict[UUID, str] = {}
+        for txn in txns:
+            try:
+                self.validate_transaction(txn)
+            except Exception as exc:
+                errors[txn.id] = str(exc)
+        if strict and errors:
+            return [
+                PostingResult(txn.id, posted=False, error=errors.get(txn.id))
+                for txn in txns
+            ]
+        results = []
+        for txn in txns:
+            if txn.id not in errors:
+                self.post_transaction(txn)
+            results.append(
+                PostingResult(
+                    txn.id, posted=txn.id not in errors, error=errors.get(txn.id)
+                )
+            )
+        return results
+
     @abstractmethod
     def reverse_transaction(
         self, txn_id: UUID, reversal_date: date, memo: str
@@ -89,6 +234,33 @@ class LedgerService(ABC):
         pass
 
 
+class AsyncLedgerService(ABC):
+    """Coroutine counterpart of the ``LedgerService`` posting and balances."""
+
+    @abstractmethod
+    async def post_transaction(self, txn: Transaction) -> None:
+        pass
+
+    @abstractmethod
+    async def validate_transactions(self, txns: Iterable[Transaction]) -> None:
+        pass
+
+    async def validate_transaction(self, txn: Transaction) -> None:
+        await self.validate_transactions([txn])
+
+    @abstractmethod
+    async def get_account_balance(
+        self, account_id: UUID, as_of_date: date | None = None
+    ) -> Money:
+        pass
+
+    @abstractmethod
+    async def get_entity_balance(
+        self, entity_id: UUID, as_of_date: date | None = None
+    ) -> Money:
+        pass
+
+
 class LotMatchingService(ABC):
     @abstractmethod
     def match_sale(
@@ -331,6 +503,59 @@ class ReportingService(ABC):
     ) -> dict[str, Any]:
         pass
 
+    @abstractmethod
+    def trial_balance(
+        self,
+        as_of_date: date,
+        entity_ids: list[UUID] | None = None,
+    ) -> TrialBalance:
+        pass
+
+    @abstractmethod
+    def balance_series(
+        self,
+        dates: Iterable[date],
+        account_ids: Iterable[UUID] | None = None,
+        entity_ids: list[UUID] | None = None,
+    ) -> BalanceSeries:
+        pass
+
+    @abstractmethod
+    def net_worth_series(
+        self,
+        dates: Iterable[date],
+        entity_ids: list[UUID] | None = None,
+    ) -> dict[str, Any]:
+        pass
+
+
+class AsyncReportingService(ABC):
+    """Coroutine counterpart of the ``ReportingService`` dashboard reports."""
+
+    @abstractmethod
+    async def net_worth_report(
+        self,
+        entity_ids: list[UUID] | None,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def balance_sheet_report(
+        self,
+        entity_id: UUID,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def dashboard_summary(
+        self,
+        entity_ids: list[UUID] | None,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        pass
+
 
 class CurrencyService(ABC):
     @abstractmethod
@@ -363,6 +588,16 @@ class CurrencyService(ABC):
     ) -> Money:
         pass
 
+    @abstractmethod
+    def convert_many(
+        self,
+        amounts: Sequence[Money],
+        to_currency: str,
+        dates: date | Sequence[date],
+    ) -> list[Money | None]:
+        """Convert each amount as of its date; ``None`` where no rate exists."""
+        pass
+
     @abstractmethod
     def calculate_fx_gain_loss(
         self,
@@ -1,21 +1,37 @@
 """LedgerService implementation for double-entry accounting operations."""
 
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import AbstractContextManager, nullcontext
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
+from family_office_ledger.domain.entities import Account
+from family_office_ledger.domain.periods import (
+    PeriodClose,
+    PeriodClosedError,
+    fiscal_year_end,
+)
 from family_office_ledger.domain.transactions import (
     Entry,
     Transaction,
     UnbalancedTransactionError,
 )
-from family_office_ledger.domain.value_objects import Money
+from family_office_ledger.domain.value_objects import AccountType, Money
 from family_office_ledger.repositories.interfaces import (
     AccountRepository,
+    AsyncAccountRepository,
+    AsyncPeriodCloseRepository,
+    AsyncTransactionRepository,
     EntityRepository,
+    PeriodCloseRepository,
     TransactionRepository,
 )
-from family_office_ledger.services.interfaces import LedgerService
+from family_office_ledger.services.interfaces import (
+    AsyncLedgerService,
+    LedgerService,
+    PostingResult,
+)
 
 
 class AccountNotFoundError(Exception):
@@ -34,6 +50,39 @@ class TransactionNotFoundError(Exception):
         super().__init__(f"Transaction not found: {txn_id}")
 
 
+class DuplicateTransactionError(Exception):
+    """Raised when a transaction id is already in the ledger or the batch."""
+
+    def __init__(self, txn_id: UUID) -> None:
+        self.txn_id = txn_id
+        super().__init__(f"Duplicate transaction: {txn_id}")
+
+
+def _validation_error(
+    txn: Transaction,
+    known: Mapping[UUID, Account],
+    closed: Mapping[UUID, date] | None = None,
+) -> Exception | None:
+    """The first reason ``txn`` cannot be posted given the ``known`` accounts.
+
+    ``closed`` maps entity ids to the end of their last closed period.
+    """
+    for entry in txn.entries:
+        account = known.get(entry.account_id)
+        if account is None:
+            return AccountNotFoundError(entry.account_id)
+        closed_through = closed.get(account.entity_id) if closed else None
+        if closed_through is not None and txn.transaction_date <= closed_through:
+            return PeriodClosedError(
+                account.entity_id, closed_through, txn.transaction_date
+            )
+    if not txn.is_balanced:
+        return UnbalancedTransactionError(
+            txn_id=txn.id, debits=txn.total_debits, credits=txn.total_credits
+        )
+    return None
+
+
 class LedgerServiceImpl(LedgerService):
     """Implementation of LedgerService for double-entry accounting."""
 
@@ -42,10 +91,25 @@ class LedgerServiceImpl(LedgerService):
         transaction_repo: TransactionRepository,
         account_repo: AccountRepository,
         entity_repo: EntityRepository,
+        period_close_repo: PeriodCloseRepository | None = None,
+        unit_of_work: Callable[[], AbstractContextManager[object]] | None = None,
     ) -> None:
         self._transaction_repo = transaction_repo
         self._account_repo = account_repo
         self._entity_repo = entity_repo
+        # Without a period close repository no period is ever closed.
+        self._period_close_repo = period_close_repo
+        # A fiscal year close is written as one database transaction when
+        # given e.g. ``SQLiteDatabase.unit_of_work``.
+        self._unit_of_work = unit_of_work or nullcontext
+
+    def _closed_through(self, accounts: Iterable[Account]) -> dict[UUID, date]:
+        """End of the last closed period of each entity owning ``accounts``."""
+        if self._period_close_repo is None:
+            return {}
+        return self._period_close_repo.closed_through(
+            {account.entity_id for account in accounts}
+        )
 
     def post_transaction(self, txn: Transaction) -> None:
         """Validate and save a transaction to the ledger.
@@ -69,18 +133,95 @@ class LedgerServiceImpl(LedgerService):
         Raises:
             UnbalancedTransactionError: If debits don't equal credits
             AccountNotFoundError: If any account in the transaction doesn't exist
+            PeriodClosedError: If the transaction is dated inside a closed
+                period of an account's entity
         """
         # Check all accounts exist
+        accounts: dict[UUID, Account] = {}
         for entry in txn.entries:
             account = self._account_repo.get(entry.account_id)
             if account is None:
                 raise AccountNotFoundError(entry.account_id)
+            accounts[account.id] = account
+
+        error = _validation_error(
+            txn, accounts, self._closed_through(accounts.values())
+        )
+        if error is not None:
+            raise error
+
+    def validate_transactions(self, txns: Iterable[Transaction]) -> None:
+        """Validate many transactions with a single account lookup.
+
+        Applies the checks of ``validate_transaction`` to each transaction in
+        order and raises the first failure, but loads every referenced
+        account with one ``get_many`` call instead of one ``get`` per entry.
+
+        Args:
+            txns: The transactions to validate
+
+        Raises:
+            UnbalancedTransactionError: If debits don't equal credits
+            AccountNotFoundError: If any account in a transaction doesn't exist
+            PeriodClosedError: If a transaction is dated inside a closed period
+        """
+        txns = list(txns)
+        known = self._account_repo.get_many(
+            {entry.account_id for txn in txns for entry in txn.entries}
+        )
+        closed = self._closed_through(known.values())
+        for txn in txns:
+            error = _validation_error(txn, known, closed)
+            if error is not None:
+                raise error
+
+    def post_transactions(
+        self, txns: Iterable[Transaction], strict: bool = True
+    ) -> list[PostingResult]:
+        """Validate and save a batch of transactions in one write.
+
+        Every referenced account is loaded with one ``get_many`` call and
+        the batch's ids are checked against the ledger with another, so the
+        cost of validation does not grow with the number of entries. Valid
+        transactions are then saved with a single ``add_many``, which
+        commits them together.
 
-        # Check transaction is balanced
-        if not txn.is_balanced:
-            raise UnbalancedTransactionError(
-                txn_id=txn.id, debits=txn.total_debits, credits=txn.total_credits
+        Args:
+            txns: The transactions to post
+            strict: If True, one invalid transaction leaves the whole batch
+                unposted; otherwise only the invalid ones are skipped
+
+        Returns:
+            One result per transaction, in input order
+        """
+        txns = list(txns)
+        known = self._account_repo.get_many(
+            {entry.account_id for txn in txns for entry in txn.entries}
+        )
+        closed = self._closed_through(known.values())
+        stored = self._transaction_repo.get_many(txn.id for txn in txns)
+
+        errors: list[Exception | None] = []
+        seen: set[UUID] = set()
+        for txn in txns:
+            if txn.id in stored or txn.id in seen:
+                errors.append(DuplicateTransactionError(txn.id))
+            else:
+                errors.append(_validation_error(txn, known, closed))
+            seen.add(txn.id)
+
+        rejected = strict and any(error is not None for error in errors)
+        valid = [txn for txn, error in zip(txns, errors, strict=True) if error is None]
+        if valid and not rejected:
+            self._transaction_repo.add_many(valid)
+        return [
+            PostingResult(
+                transaction_id=txn.id,
+                posted=error is None and not rejected,
+                error=None if error is None else str(error),
             )
+            for txn, error in zip(txns, errors, strict=True)
+        ]
 
     def reverse_transaction(
         self, txn_id: UUID, reversal_date: date, memo: str
@@ -101,6 +242,7 @@ class LedgerServiceImpl(LedgerService):
 
         Raises:
             TransactionNotFoundError: If the original transaction doesn't exist
+            PeriodClosedError: If ``reversal_date`` is inside a closed period
         """
         # Get the original transaction
         original = self._transaction_repo.get(txn_id)
@@ -127,6 +269,15 @@ class LedgerServiceImpl(LedgerService):
             reverses_transaction_id=txn_id,
         )
 
+        # Only the reversal date matters: reversing a transaction of a closed
+        # period in a later, open one leaves the frozen balances untouched.
+        known = self._account_repo.get_many(
+            entry.account_id for entry in reversal_entries
+        )
+        error = _validation_error(reversal, known, self._closed_through(known.values()))
+        if isinstance(error, PeriodClosedError):
+            raise error
+
         # Save the reversal
         self._transaction_repo.add(reversal)
 
@@ -160,24 +311,26 @@ class LedgerServiceImpl(LedgerService):
         if account is None:
             raise AccountNotFoundError(account_id)
 
-        # Get all transactions for this account
-        transactions = self._transaction_repo.list_by_account(
-            account_id, end_date=as_of_date
+        # Aggregate debits and credits for this account in the repository,
+        # starting from the frozen balances of the last closed period
+        latest = (
+            self._period_close_repo.get_latest(account.entity_id, as_of_date)
+            if self._period_close_repo is not None
+            else None
         )
-
-        # Sum up debits and credits for entries in this account
-        total_debits = Decimal("0")
-        total_credits = Decimal("0")
-        currency = "USD"
-
-        for txn in transactions:
-            for entry in txn.entries:
-                if entry.account_id == account_id:
-                    total_debits += entry.debit_amount.amount
-                    total_credits += entry.credit_amount.amount
-                    currency = (
-                        entry.debit_amount.currency or entry.credit_amount.currency
-                    )
+        if latest is None:
+            totals = list(
+                self._transaction_repo.sum_by_account([account_id], as_of=as_of_date)
+            )
+        else:
+            totals = list(
+                self._transaction_repo.sum_by_account_since(
+                    latest.balances, latest.period_end, [account_id], as_of=as_of_date
+                )
+            )
+        total_debits = sum((t.debit_total for t in totals), Decimal("0"))
+        total_credits = sum((t.credit_total for t in totals), Decimal("0"))
+        currency = totals[-1].currency if totals else "USD"
 
         return Money(total_debits - total_credits, currency)
 
@@ -207,3 +360,212 @@ class LedgerServiceImpl(LedgerService):
             currency = balance.currency
 
         return Money(total, currency)
+
+    def close_fiscal_year(
+        self,
+        entity_id: UUID,
+        fiscal_year: int,
+        retained_earnings_account_id: UUID | None = None,
+    ) -> PeriodClose:
+        """Close an entity's fiscal year and freeze its closing balances.
+
+        Posts a closing transaction on the last day of the fiscal year that
+        zeroes every income and expense account, per currency, against an
+        equity account, then records the balance of every account of the
+        entity at that day. Once closed, nothing dated on or before the end
+        of the year can be posted or reversed for the entity, and balance
+        queries start from the frozen balances.
+
+        Args:
+            entity_id: ID of the entity to close
+            fiscal_year: Calendar year in which the fiscal year ends
+            retained_earnings_account_id: Equity account receiving the net
+                income; defaults to the entity's first equity account
+
+        Returns:
+            The recorded period close
+
+        Raises:
+            ValueError: If the entity, the period close repository or an
+                equity account is missing
+            PeriodClosedError: If the year or a later one is already closed
+        """
+        if self._period_close_repo is None:
+            raise ValueError("Period closes are not supported by this ledger")
+        entity = self._entity_repo.get(entity_id)
+        if entity is None:
+            raise ValueError(f"Entity not found: {entity_id}")
+        period_end = fiscal_year_end(entity.fiscal_year_end, fiscal_year)
+        latest = self._period_close_repo.get_latest(entity_id)
+        if latest is not None and latest.period_end >= period_end:
+            raise PeriodClosedError(entity_id, latest.period_end, period_end)
+
+        accounts = list(self._account_repo.list_by_entity(entity_id))
+        if retained_earnings_account_id is None:
+            equity = next(
+                (a for a in accounts if a.account_type == AccountType.EQUITY), None
+            )
+        else:
+            equity = next(
+                (a for a in accounts if a.id == retained_earnings_account_id), None
+            )
+        if equity is None or equity.account_type != AccountType.EQUITY:
+            raise ValueError(f"No equity account to close entity {entity_id} into")
+
+        closing = self._closing_transaction(entity_id, accounts, equity, period_end)
+        with self._unit_of_work():
+            if closing is not None:
+                self.post_transaction(closing)
+            period_close = PeriodClose(
+                entity_id=entity_id,
+                period_end=period_end,
+                closing_transaction_id=closing.id if closing is not None else None,
+                balances=list(
+                    self._transaction_repo.iter_account_totals(
+                        [account.id for account in accounts], as_of=period_end
+                    )
+                ),
+            )
+            self._period_close_repo.add(period_close)
+        return period_close
+
+    def list_period_closes(self, entity_id: UUID) -> list[PeriodClose]:
+        """The entity's closed periods, oldest first."""
+        if self._period_close_repo is None:
+            return []
+        return list(self._period_close_repo.list_by_entity(entity_id))
+
+    def _closing_transaction(
+        self,
+        entity_id: UUID,
+        accounts: list[Account],
+        equity: Account,
+        period_end: date,
+    ) -> Transaction | None:
+        """Zero the income and expense balances at ``period_end`` into ``equity``.
+
+        Returns None when there is nothing to close.
+        """
+        nominal = [
+            account.id
+            for account in accounts
+            if account.account_type in (AccountType.INCOME, AccountType.EXPENSE)
+        ]
+        entries: list[Entry] = []
+        net: dict[str, Decimal] = {}
+        for totals in self._transaction_repo.iter_account_totals(
+            nominal, as_of=period_end
+        ):
+            if totals.balance:
+                entries.append(
+                    _offsetting_entry(
+                        totals.account_id, totals.currency, totals.balance
+                    )
+                )
+                net[totals.currency] = (
+                    net.get(totals.currency, Decimal("0")) + totals.balance
+                )
+        if not entries:
+            return None
+        entries.extend(
+            _offsetting_entry(equity.id, currency, -amount)
+            for currency, amount in net.items()
+            if amount
+        )
+        return Transaction(
+            transaction_date=period_end,
+            entries=entries,
+            memo=f"Close fiscal year ending {period_end} for entity {entity_id}",
+        )
+
+
+def _offsetting_entry(account_id: UUID, currency: str, balance: Decimal) -> Entry:
+    """An entry that brings a debit-minus-credit ``balance`` back to zero."""
+    zero = Money(Decimal("0"), currency)
+    if balance > 0:
+        return Entry(
+            account_id=account_id,
+            debit_amount=zero,
+            credit_amount=Money(balance, currency),
+        )
+    return Entry(
+        account_id=account_id,
+        debit_amount=Money(-balance, currency),
+        credit_amount=zero,
+    )
+
+
+class AsyncLedgerServiceImpl(AsyncLedgerService):
+    """Coroutine counterpart of LedgerServiceImpl for async endpoints."""
+
+    def __init__(
+        self,
+        transaction_repo: AsyncTransactionRepository,
+        account_repo: AsyncAccountRepository,
+        period_close_repo: AsyncPeriodCloseRepository | None = None,
+    ) -> None:
+        self._transaction_repo = transaction_repo
+        self._account_repo = account_repo
+        self._period_close_repo = period_close_repo
+
+    async def post_transaction(self, txn: Transaction) -> None:
+        """Validate and save a transaction to the ledger.
+
+        Raises:
+            UnbalancedTransactionError: If debits don't equal credits
+            AccountNotFoundError: If any account in the transaction doesn't exist
+            PeriodClosedError: If the transaction is dated inside a closed period
+        """
+        await self.validate_transaction(txn)
+        await self._transaction_repo.add(txn)
+
+    async def validate_transactions(self, txns: Iterable[Transaction]) -> None:
+        """Validate transactions with one account lookup.
+
+        See ``LedgerServiceImpl.validate_transactions``.
+        """
+        txns = list(txns)
+        known = await self._account_repo.get_many(
+            {entry.account_id for txn in txns for entry in txn.entries}
+        )
+        closed = (
+            await self._period_close_repo.closed_through(
+                {account.entity_id for account in known.values()}
+            )
+            if self._period_close_repo is not None
+            else {}
+        )
+        for txn in txns:
+            error = _validation_error(txn, known, closed)
+            if error is not None:
+                raise error
+
+    async def get_account_balance(
+        self, account_id: UUID, as_of_date: date | None = None
+    ) -> Money:
+        """Debits minus credits posted to an account up to ``as_of_date``.
+
+        Raises:
+            AccountNotFoundError: If the account doesn't exist
+        """
+        if await self._account_repo.get(account_id) is None:
+            raise AccountNotFoundError(account_id)
+        totals = await self._transaction_repo.sum_by_account(
+            [account_id], as_of=as_of_date
+        )
+        total_debits = sum((t.debit_total for t in totals), Decimal("0"))
+        total_credits = sum((t.credit_total for t in totals), Decimal("0"))
+        currency = totals[-1].currency if totals else "USD"
+        return Money(total_debits - total_credits, currency)
+
+    async def get_entity_balance(
+        self, entity_id: UUID, as_of_date: date | None = None
+    ) -> Money:
+        """Sum of the balances of an entity's accounts up to ``as_of_date``."""
+        accounts = await self._account_repo.list_by_entity(entity_id)
+        totals = await self._transaction_repo.sum_by_account(
+            [account.id for account in accounts], as_of=as_of_date
+        )
+        total = sum((t.balance for t in totals), Decimal("0"))
+        currency = totals[-1].currency if totals else "USD"
+        return Money(total, currency)
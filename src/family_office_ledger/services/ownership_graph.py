@@ -8,12 +8,14 @@ from typing import Any
 from uuid import UUID
 
 from family_office_ledger.domain.ownership import EntityOwnership
+from family_office_ledger.domain.periods import PeriodClose
 from family_office_ledger.domain.value_objects import AccountType
 from family_office_ledger.repositories.interfaces import (
     AccountRepository,
     EntityOwnershipRepository,
     EntityRepository,
     HouseholdRepository,
+    PeriodCloseRepository,
     PositionRepository,
     TransactionRepository,
 )
@@ -59,6 +61,7 @@ class OwnershipGraphService:
         account_repo: AccountRepository | None = None,
         transaction_repo: TransactionRepository | None = None,
         position_repo: PositionRepository | None = None,
+        period_close_repo: PeriodCloseRepository | None = None,
     ) -> None:
         self._ownership_repo = ownership_repo
         self._household_repo = household_repo
@@ -66,6 +69,7 @@ class OwnershipGraphService:
         self._account_repo = account_repo
         self._transaction_repo = transaction_repo
         self._position_repo = position_repo
+        self._period_close_repo = period_close_repo
 
     def build_adjacency_map(self, as_of_date: date) -> dict[UUID, list[OwnershipEdge]]:
         edges = self._ownership_repo.list_active_as_of_date(as_of_date)
@@ -240,19 +244,26 @@ class OwnershipGraphService:
 
         return combined
 
-    def _calculate_account_balance(self, account_id: UUID, as_of_date: date) -> Decimal:
+    def _latest_close(self, entity_id: UUID, as_of_date: date) -> PeriodClose | None:
+        if self._period_close_repo is None:
+            return None
+        return self._period_close_repo.get_latest(entity_id, as_of_date)
+
+    def _calculate_account_balance(
+        self, account_id: UUID, as_of_date: date, close: PeriodClose | None = None
+    ) -> Decimal:
         if self._transaction_repo is None:
             return Decimal("0")
 
-        transactions = self._transaction_repo.list_by_account(
-            account_id, end_date=as_of_date
-        )
-        balance = Decimal("0")
-        for txn in transactions:
-            for entry in txn.entries:
-                if entry.account_id == account_id:
-                    balance += entry.debit_amount.amount - entry.credit_amount.amount
-        return balance
+        if close is None:
+            totals = self._transaction_repo.sum_by_account(
+                [account_id], as_of=as_of_date
+            )
+        else:
+            totals = self._transaction_repo.sum_by_account_since(
+                close.balances, close.period_end, [account_id], as_of=as_of_date
+            )
+        return sum((t.balance for t in totals), Decimal("0"))
 
     def household_look_through_net_worth(
         self, household_id: UUID, as_of_date: date
@@ -279,9 +290,10 @@ class OwnershipGraphService:
                 continue
 
             accounts = list(self._account_repo.list_by_entity(entity_id))
+            close = self._latest_close(entity_id, as_of_date)
 
             for account in accounts:
-                balance = self._calculate_account_balance(account.id, as_of_date)
+                balance = self._calculate_account_balance(account.id, as_of_date, close)
                 weighted_balance = balance * fraction
 
                 if account.account_type == AccountType.ASSET:
@@ -333,9 +345,10 @@ class OwnershipGraphService:
                 continue
 
             accounts = list(self._account_repo.list_by_entity(entity_id))
+            close = self._latest_close(entity_id, as_of_date)
 
             for account in accounts:
-                balance = self._calculate_account_balance(account.id, as_of_date)
+                balance = self._calculate_account_balance(account.id, as_of_date, close)
                 weighted_balance = balance * ownership.effective_fraction
 
                 if account.account_type == AccountType.ASSET:
@@ -386,6 +399,7 @@ class OwnershipGraphService:
             }
 
         accounts = list(self._account_repo.list_by_entity(partnership_entity_id))
+        close = self._latest_close(partnership_entity_id, as_of_date)
         capital_accounts: list[dict[str, Any]] = []
         total_capital = Decimal("0")
 
@@ -393,7 +407,7 @@ class OwnershipGraphService:
             if account.account_type != AccountType.EQUITY:
                 continue
 
-            balance = self._calculate_account_balance(account.id, as_of_date)
+            balance = self._calculate_account_balance(account.id, as_of_date, close)
 
             capital_accounts.append(
                 {
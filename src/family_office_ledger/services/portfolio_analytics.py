@@ -198,31 +198,32 @@ class PortfolioAnalyticsService:
 
         holdings_by_security: dict[UUID, dict[str, Any]] = {}
 
-        for entity_id in entity_ids:
-            positions = list(self._position_repo.list_by_entity(entity_id))
-
-            for position in positions:
-                if position.quantity.is_zero:
-                    continue
-
-                security_id = position.security_id
-
-                if security_id not in holdings_by_security:
-                    security = self._security_repo.get(security_id)
-                    holdings_by_security[security_id] = {
-                        "security": security,
-                        "market_value": Decimal("0"),
-                        "cost_basis": Decimal("0"),
-                        "position_count": 0,
-                    }
+        positions = [
+            position
+            for entity_id in entity_ids
+            for position in self._position_repo.list_by_entity(entity_id)
+            if not position.quantity.is_zero
+        ]
+        securities = self._security_repo.get_many(p.security_id for p in positions)
+
+        for position in positions:
+            security_id = position.security_id
+
+            if security_id not in holdings_by_security:
+                holdings_by_security[security_id] = {
+                    "security": securities.get(security_id),
+                    "market_value": Decimal("0"),
+                    "cost_basis": Decimal("0"),
+                    "position_count": 0,
+                }
 
-                holdings_by_security[security_id]["market_value"] += (
-                    position.market_value.amount
-                )
-                holdings_by_security[security_id]["cost_basis"] += (
-                    position.cost_basis.amount
-                )
-                holdings_by_security[security_id]["position_count"] += 1
+            holdings_by_security[security_id]["market_value"] += (
+                position.market_value.amount
+            )
+            holdings_by_security[security_id]["cost_basis"] += (
+                position.cost_basis.amount
+            )
+            holdings_by_security[security_id]["position_count"] += 1
 
         total_market_value = sum(
             (h["market_value"] for h in holdings_by_security.values()),
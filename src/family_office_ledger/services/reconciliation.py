@@ -582,6 +582,7 @@ class ReconciliationServiceImpl(ReconciliationService):
         status: ReconciliationMatchStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
     ) -> tuple[list[ReconciliationMatch], int]:
         """List matches for a session with optional filtering and pagination.
 
@@ -590,6 +591,8 @@ class ReconciliationServiceImpl(ReconciliationService):
             status: Optional status filter.
             limit: Max matches to return.
             offset: Offset for pagination.
+            after: ``(created_at, id)`` of the last match on the previous
+                page, for keyset pagination.
 
         Returns:
             Tuple of (matches, total_count).
@@ -600,18 +603,16 @@ class ReconciliationServiceImpl(ReconciliationService):
         if self._session_repo is None:
             raise RuntimeError("Session repository not configured")
 
-        session = self._session_repo.get(session_id)
-        if session is None:
+        if self._session_repo.get_without_matches(session_id) is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
 
-        matches = session.matches
-        if status is not None:
-            matches = [m for m in matches if m.status == status]
-
-        total = len(matches)
-        paginated = matches[offset : offset + limit]
+        counts = self._session_repo.count_matches(session_id)
+        total = counts[status] if status is not None else sum(counts.values())
+        matches = self._session_repo.list_matches(
+            session_id, status=status, limit=limit, offset=offset, after=after
+        )
 
-        return paginated, total
+        return matches, total
 
     def confirm_session_match(
         self, session_id: UUID, match_id: UUID
@@ -632,11 +633,11 @@ class ReconciliationServiceImpl(ReconciliationService):
         if self._session_repo is None:
             raise RuntimeError("Session repository not configured")
 
-        session = self._session_repo.get(session_id)
+        session = self._session_repo.get_without_matches(session_id)
         if session is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
 
-        match = next((m for m in session.matches if m.id == match_id), None)
+        match = self._session_repo.get_match(session_id, match_id)
         if match is None:
             raise MatchNotFoundError(f"Match not found: {match_id}")
 
@@ -648,7 +649,7 @@ class ReconciliationServiceImpl(ReconciliationService):
 
         self.confirm_match(match.imported_id, match.suggested_ledger_txn_id)
 
-        self._session_repo.update(session)
+        self._session_repo.update_matches([match])
         self._check_auto_close(session)
 
         return match
@@ -672,18 +673,18 @@ class ReconciliationServiceImpl(ReconciliationService):
         if self._session_repo is None:
             raise RuntimeError("Session repository not configured")
 
-        session = self._session_repo.get(session_id)
+        session = self._session_repo.get_without_matches(session_id)
         if session is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
 
-        match = next((m for m in session.matches if m.id == match_id), None)
+        match = self._session_repo.get_match(session_id, match_id)
         if match is None:
             raise MatchNotFoundError(f"Match not found: {match_id}")
 
         match.status = ReconciliationMatchStatus.REJECTED
         match.actioned_at = datetime.now(UTC)
 
-        self._session_repo.update(session)
+        self._session_repo.update_matches([match])
         self._check_auto_close(session)
 
         return match
@@ -707,18 +708,18 @@ class ReconciliationServiceImpl(ReconciliationService):
         if self._session_repo is None:
             raise RuntimeError("Session repository not configured")
 
-        session = self._session_repo.get(session_id)
+        session = self._session_repo.get_without_matches(session_id)
         if session is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
 
-        match = next((m for m in session.matches if m.id == match_id), None)
+        match = self._session_repo.get_match(session_id, match_id)
         if match is None:
             raise MatchNotFoundError(f"Match not found: {match_id}")
 
         match.status = ReconciliationMatchStatus.SKIPPED
         match.actioned_at = datetime.now(UTC)
 
-        self._session_repo.update(session)
+        self._session_repo.update_matches([match])
 
         return match
 
@@ -769,18 +770,19 @@ class ReconciliationServiceImpl(ReconciliationService):
         if self._session_repo is None:
             raise RuntimeError("Session repository not configured")
 
-        session = self._session_repo.get(session_id)
-        if session is None:
+        if self._session_repo.get_without_matches(session_id) is None:
             raise SessionNotFoundError(f"Session not found: {session_id}")
 
-        total = len(session.matches)
+        counts = self._session_repo.count_matches(session_id)
+        total = sum(counts.values())
+        confirmed = counts[ReconciliationMatchStatus.CONFIRMED]
         return SessionSummary(
             total_imported=total,
-            pending=session.pending_count,
-            confirmed=session.confirmed_count,
-            rejected=session.rejected_count,
-            skipped=session.skipped_count,
-            match_rate=session.match_rate,
+            pending=counts[ReconciliationMatchStatus.PENDING],
+            confirmed=confirmed,
+            rejected=counts[ReconciliationMatchStatus.REJECTED],
+            skipped=counts[ReconciliationMatchStatus.SKIPPED],
+            match_rate=confirmed / total if total else 0.0,
         )
 
     def _check_auto_close(self, session: ReconciliationSession) -> None:
@@ -788,8 +790,13 @@ class ReconciliationServiceImpl(ReconciliationService):
 
         Auto-closes when pending_count == 0 AND skipped_count == 0.
         """
-        if session.pending_count == 0 and session.skipped_count == 0:
+        if self._session_repo is None:
+            return
+        counts = self._session_repo.count_matches(session.id)
+        if (
+            counts[ReconciliationMatchStatus.PENDING] == 0
+            and counts[ReconciliationMatchStatus.SKIPPED] == 0
+        ):
             session.status = ReconciliationSessionStatus.COMPLETED
             session.closed_at = datetime.now(UTC)
-            if self._session_repo is not None:
-                self._session_repo.update(session)
+            self._session_repo.update(session)
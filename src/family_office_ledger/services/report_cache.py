@@ -0,0 +1,195 @@
+"""Report results shared between requests until the ledger changes.
+
+Dashboards request the same reports every few seconds, and each request
+recomputes them from the ledger. A ``ReportCache`` keeps the latest result
+per report and normalized parameters, tagged with the ledger version it was
+computed at (see ``LedgerVersionRepository``). A lookup at the same version
+is a hit; any write to the data of the report's entities bumps the version,
+so the next lookup recomputes and replaces the entry.
+
+Usage:
+    cache = ReportCache(max_entries=256)
+    version = SQLiteLedgerVersionRepository(db).ledger_version(entity_ids)
+    report = cache.get_or_compute(
+        "net_worth",
+        {"as_of_date": as_of_date, "entity_ids": entity_ids},
+        version,
+        lambda: service.net_worth_report(entity_ids, as_of_date),
+    )
+    cache.stats  # ReportCacheStats(hits=..., misses=..., evictions=...)
+
+Read the version before computing the report: a write landing in between
+then leaves the entry tagged with an older version than its data, which
+only costs a recomputation, never a stale hit.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from family_office_ledger.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_Key = tuple[str, str]
+
+
+def _normalize(params: Mapping[str, Any]) -> str:
+    """Canonical text of report parameters, independent of keyword order.
+
+    Values are rendered with ``str`` (dates, UUIDs, enums); list order is
+    kept because reports list their rows in the order of ``entity_ids``.
+    """
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+@dataclass
+class ReportCacheStats:
+    """Lookup counters for one report cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+
+class ReportCache:
+    """LRU of report results keyed by report name and parameters.
+
+    Holds at most ``max_entries`` results, evicting the least recently used.
+    Safe to share between threads; two requests missing on the same report
+    both compute it and the later version wins.
+
+    With a ``path``, entries saved by ``save`` are loaded back on creation,
+    so a restarted server answers from the cache until the ledger changes.
+    The file is a pickle and must only be written by this application, and
+    it belongs to one database: versions of another database could match.
+    """
+
+    def __init__(self, max_entries: int = 256, path: str | Path | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._path = Path(path) if path is not None else None
+        self._entries: OrderedDict[_Key, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = ReportCacheStats()
+        if self._path is not None:
+            self._load(self._path)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        report: str,
+        params: Mapping[str, Any],
+        version: int,
+        compute: Callable[[], T],
+        bypass: bool = False,
+    ) -> T:
+        """The cached result of ``report`` at ``version``, or ``compute()``.
+
+        ``bypass`` skips the lookup but still stores the fresh result.
+        """
+        key = (report, _normalize(params))
+        if not bypass:
+            found, value = self._lookup(key, version)
+            if found:
+                return value  # type: ignore[no-any-return]
+        result = compute()
+        self._store(key, version, result)
+        return result
+
+    async def get_or_compute_async(
+        self,
+        report: str,
+        params: Mapping[str, Any],
+        version: int,
+        compute: Callable[[], Awaitable[T]],
+        bypass: bool = False,
+    ) -> T:
+        """``get_or_compute`` for a coroutine ``compute``."""
+        key = (report, _normalize(params))
+        if not bypass:
+            found, value = self._lookup(key, version)
+            if found:
+                return value  # type: ignore[no-any-return]
+        result = await compute()
+        self._store(key, version, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def save(self) -> None:
+        """Write the entries to ``path``, replacing the file atomically."""
+        if self._path is None:
+            return
+        with self._lock:
+            entries = list(self._entries.items())
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _lookup(self, key: _Key, version: int) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, entry[1]
+            self.stats.misses += 1
+            return False, None
+
+    def _store(self, key: _Key, version: int, value: object) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            # Versions of one key only grow; don't let a slow request that
+            # read an older version replace a newer result.
+            if entry is not None and entry[0] > version:
+                return
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _load(self, path: Path) -> None:
+        try:
+            with path.open("rb") as f:
+                entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            # A file from an older release or a crashed write: start empty.
+            logger.warning("report_cache_load_failed", path=str(path), error=str(e))
+            return
+        # Saved least recently used first; keep the most recent ones.
+        for key, entry in entries[-self._max_entries :]:
+            self._entries[key] = entry
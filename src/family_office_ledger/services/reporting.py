@@ -2,38 +2,203 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import json
-from datetime import date
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
+from family_office_ledger.domain.entities import Account, Entity
+from family_office_ledger.domain.periods import PeriodClose
+from family_office_ledger.domain.transactions import AccountTotals
 from family_office_ledger.domain.value_objects import AccountType, Money
 from family_office_ledger.logging_config import get_logger
 from family_office_ledger.repositories.interfaces import (
     AccountRepository,
+    AsyncAccountRepository,
+    AsyncEntityRepository,
+    AsyncTransactionRepository,
     EntityOwnershipRepository,
     EntityRepository,
     HouseholdRepository,
+    PeriodCloseRepository,
     PositionRepository,
+    ReportingViewRepository,
     SecurityRepository,
     TaxLotRepository,
     TransactionRepository,
 )
 from family_office_ledger.services.currency import ExchangeRateNotFoundError
 from family_office_ledger.services.interfaces import (
+    AsyncReportingService,
+    BalanceSeries,
     BudgetService,
     CurrencyService,
     ReportingService,
+    TrialBalance,
+    TrialBalanceLine,
 )
 from family_office_ledger.services.ownership_graph import OwnershipGraphService
 
 logger = get_logger(__name__)
 
 
+def _asset_and_liability_totals(
+    accounts: list[Account], balances: list[Decimal]
+) -> tuple[Decimal, Decimal]:
+    """Total asset balances and absolute liability balances."""
+    assets = Decimal("0")
+    liabilities = Decimal("0")
+    for account, balance in zip(accounts, balances, strict=True):
+        if account.account_type == AccountType.ASSET:
+            assets += balance
+        elif account.account_type == AccountType.LIABILITY:
+            liabilities += abs(balance)
+    return assets, liabilities
+
+
+def _net_worth_result(
+    as_of_date: date,
+    entity_totals: list[tuple[Entity, Decimal, Decimal]],
+    base_currency: str | None,
+) -> dict[str, Any]:
+    """Net worth report from (entity, assets, liabilities) per entity."""
+    result: dict[str, Any] = {
+        "report_name": "Net Worth Report",
+        "as_of_date": as_of_date,
+        "data": [
+            {
+                "entity_id": str(entity.id),
+                "entity_name": entity.name,
+                "total_assets": assets,
+                "total_liabilities": liabilities,
+                "net_worth": assets - liabilities,
+            }
+            for entity, assets, liabilities in entity_totals
+        ],
+        "totals": {
+            "total_assets": sum((a for _, a, _ in entity_totals), Decimal("0")),
+            "total_liabilities": sum((li for _, _, li in entity_totals), Decimal("0")),
+        },
+    }
+    totals = result["totals"]
+    totals["net_worth"] = totals["total_assets"] - totals["total_liabilities"]
+    if base_currency:
+        result["base_currency"] = base_currency
+    return result
+
+
+def _balance_sheet_result(
+    as_of_date: date, accounts: list[Account], balances: list[Decimal]
+) -> dict[str, Any]:
+    """Balance sheet report from each account's balance."""
+    assets: list[dict[str, Any]] = []
+    liabilities: list[dict[str, Any]] = []
+    equity_items: list[dict[str, Any]] = []
+
+    total_assets = Decimal("0")
+    total_liabilities = Decimal("0")
+    total_equity = Decimal("0")
+
+    for account, balance in zip(accounts, balances, strict=True):
+        account_data = {
+            "account_id": str(account.id),
+            "account_name": account.name,
+            "balance": balance,
+        }
+
+        if account.account_type == AccountType.ASSET:
+            assets.append(account_data)
+            total_assets += balance
+        elif account.account_type == AccountType.LIABILITY:
+            liabilities.append(account_data)
+            # Liabilities are stored as negative (credit balance)
+            total_liabilities += abs(balance)
+        elif account.account_type == AccountType.EQUITY:
+            equity_items.append(account_data)
+            # Equity is stored as negative (credit balance)
+            total_equity += abs(balance)
+
+    return {
+        "report_name": "Balance Sheet",
+        "as_of_date": as_of_date,
+        "data": {
+            "assets": assets,
+            "liabilities": liabilities,
+            "equity": equity_items,
+        },
+        "totals": {
+            "total_assets": total_assets,
+            "total_liabilities": total_liabilities,
+            "total_equity": total_equity,
+        },
+    }
+
+
+def _sample_history(
+    history: Iterable[tuple[date, AccountTotals]],
+    dates: list[date],
+    account_ids: list[UUID],
+) -> dict[UUID, list[Decimal]]:
+    """Sample date-ordered running totals at each of the sorted ``dates``.
+
+    An account's series is only extended when its totals change, up to the
+    first sample on or after the change, and padded at the end, so the work
+    grows with the changes plus the size of the result.
+    """
+    series: dict[UUID, list[Decimal]] = {account_id: [] for account_id in account_ids}
+    currencies: dict[UUID, dict[str, Decimal]] = {
+        account_id: {} for account_id in account_ids
+    }
+    for day, totals in history:
+        account_series = series[totals.account_id]
+        by_currency = currencies[totals.account_id]
+        missing = bisect_left(dates, day) - len(account_series)
+        if missing > 0:
+            account_series.extend([sum(by_currency.values(), Decimal("0"))] * missing)
+        by_currency[totals.currency] = totals.balance
+    for account_id, account_series in series.items():
+        balance = sum(currencies[account_id].values(), Decimal("0"))
+        account_series.extend([balance] * (len(dates) - len(account_series)))
+    return series
+
+
+def _dashboard_result(
+    as_of_date: date,
+    entity_count: int,
+    account_count: int,
+    transaction_count: int,
+    net_worth: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "report_name": "Dashboard Summary",
+        "as_of_date": as_of_date,
+        "data": {
+            "total_entities": entity_count,
+            "total_accounts": account_count,
+            "total_transactions": transaction_count,
+            "net_worth": net_worth["totals"]["net_worth"],
+            "total_assets": net_worth["totals"]["total_assets"],
+            "total_liabilities": net_worth["totals"]["total_liabilities"],
+        },
+    }
+
+
 class ReportingServiceImpl(ReportingService):
-    """Implementation of ReportingService for generating financial reports."""
+    """Implementation of ReportingService for generating financial reports.
+
+    With ``reporting_views``, the net worth, balance sheet, position summary
+    and dashboard reports read precomputed balances instead of aggregating
+    account by account, as long as the views were refreshed within
+    ``max_view_staleness``; older views fall back to live computation.
+
+    With ``period_close_repo``, live as-of balances of an entity start from
+    the frozen balances of its last closed period before the as-of date.
+    """
 
     def __init__(
         self,
@@ -47,6 +212,9 @@ class ReportingServiceImpl(ReportingService):
         budget_service: BudgetService | None = None,
         ownership_repo: EntityOwnershipRepository | None = None,
         household_repo: HouseholdRepository | None = None,
+        reporting_views: ReportingViewRepository | None = None,
+        max_view_staleness: timedelta = timedelta(minutes=15),
+        period_close_repo: PeriodCloseRepository | None = None,
     ) -> None:
         self._entity_repo = entity_repo
         self._account_repo = account_repo
@@ -58,6 +226,9 @@ class ReportingServiceImpl(ReportingService):
         self._budget_service = budget_service
         self._ownership_repo = ownership_repo
         self._household_repo = household_repo
+        self._reporting_views = reporting_views
+        self._max_view_staleness = max_view_staleness
+        self._period_close_repo = period_close_repo
         self._ownership_service: OwnershipGraphService | None = None
         if ownership_repo and household_repo:
             self._ownership_service = OwnershipGraphService(
@@ -67,7 +238,24 @@ class ReportingServiceImpl(ReportingService):
                 account_repo=account_repo,
                 transaction_repo=transaction_repo,
                 position_repo=position_repo,
+                period_close_repo=period_close_repo,
+            )
+
+    def _current_views(self) -> ReportingViewRepository | None:
+        """The reporting views, if refreshed within ``max_view_staleness``."""
+        if self._reporting_views is None:
+            return None
+        refreshed_at = self._reporting_views.refreshed_at()
+        if refreshed_at is None or (
+            datetime.now(UTC) - refreshed_at > self._max_view_staleness
+        ):
+            logger.info(
+                "reporting_views_stale",
+                refreshed_at=refreshed_at.isoformat() if refreshed_at else None,
+                action="computing_live",
             )
+            return None
+        return self._reporting_views
 
     def _convert_to_base(
         self,
@@ -97,6 +285,36 @@ class ReportingServiceImpl(ReportingService):
             )
             return amount
 
+    def _convert_many_to_base(
+        self,
+        amounts: list[tuple[Decimal, str]],
+        base_currency: str,
+        as_of_date: date,
+    ) -> list[Decimal]:
+        """Batch form of _convert_to_base for (amount, currency) pairs."""
+        if self._currency_service is None or not amounts:
+            return [amount for amount, _ in amounts]
+        converted = self._currency_service.convert_many(
+            [Money(amount, currency) for amount, currency in amounts],
+            base_currency,
+            as_of_date,
+        )
+        results: list[Decimal] = []
+        for (amount, currency), money in zip(amounts, converted, strict=True):
+            if money is None:
+                logger.warning(
+                    "exchange_rate_not_found",
+                    from_currency=currency,
+                    to_currency=base_currency,
+                    as_of_date=as_of_date.isoformat(),
+                    amount=str(amount),
+                    action="using_original_amount",
+                )
+                results.append(amount)
+            else:
+                results.append(money.amount)
+        return results
+
     def net_worth_report(
         self,
         entity_ids: list[UUID] | None,
@@ -107,74 +325,80 @@ class ReportingServiceImpl(ReportingService):
         if entity_ids is None:
             entities = list(self._entity_repo.list_all())
             entity_ids = [e.id for e in entities]
-        elif len(entity_ids) == 0:
-            result: dict[str, Any] = {
-                "report_name": "Net Worth Report",
-                "as_of_date": as_of_date,
-                "data": [],
-                "totals": {
-                    "total_assets": Decimal("0"),
-                    "total_liabilities": Decimal("0"),
-                    "net_worth": Decimal("0"),
-                },
-            }
-            if base_currency:
-                result["base_currency"] = base_currency
-            return result
-
-        total_assets = Decimal("0")
-        total_liabilities = Decimal("0")
-        entity_data: list[dict[str, Any]] = []
 
+        entity_totals: list[tuple[Entity, Decimal, Decimal]] = []
+        views = self._current_views() if entity_ids else None
+        if views is not None:
+            view_totals = self._entity_totals_from_views(
+                views, entity_ids, as_of_date, base_currency
+            )
         for entity_id in entity_ids:
             entity = self._entity_repo.get(entity_id)
             if entity is None:
                 continue
 
-            entity_assets = Decimal("0")
-            entity_liabilities = Decimal("0")
+            if views is not None:
+                assets, liabilities = view_totals.get(
+                    entity_id, (Decimal("0"), Decimal("0"))
+                )
+                entity_totals.append((entity, assets, liabilities))
+                continue
 
             accounts = list(self._account_repo.list_by_entity(entity_id))
+            close = self._latest_close(entity_id, as_of_date)
+            balances = [
+                self._calculate_account_balance(account.id, as_of_date, close)
+                for account in accounts
+            ]
+
+            if base_currency and self._currency_service:
+                balances = self._convert_many_to_base(
+                    [
+                        (balance, account.currency)
+                        for account, balance in zip(accounts, balances, strict=True)
+                    ],
+                    base_currency,
+                    as_of_date,
+                )
 
-            for account in accounts:
-                balance = self._calculate_account_balance(account.id, as_of_date)
-
-                if base_currency and self._currency_service:
-                    balance = self._convert_to_base(
-                        balance, account.currency, base_currency, as_of_date
-                    )
-
-                if account.account_type == AccountType.ASSET:
-                    entity_assets += balance
-                elif account.account_type == AccountType.LIABILITY:
-                    entity_liabilities += abs(balance)
-
-            entity_data.append(
-                {
-                    "entity_id": str(entity_id),
-                    "entity_name": entity.name,
-                    "total_assets": entity_assets,
-                    "total_liabilities": entity_liabilities,
-                    "net_worth": entity_assets - entity_liabilities,
-                }
+            entity_totals.append(
+                (entity, *_asset_and_liability_totals(accounts, balances))
             )
 
-            total_assets += entity_assets
-            total_liabilities += entity_liabilities
+        return _net_worth_result(as_of_date, entity_totals, base_currency)
 
-        result = {
-            "report_name": "Net Worth Report",
-            "as_of_date": as_of_date,
-            "data": entity_data,
-            "totals": {
-                "total_assets": total_assets,
-                "total_liabilities": total_liabilities,
-                "net_worth": total_assets - total_liabilities,
-            },
-        }
-        if base_currency:
-            result["base_currency"] = base_currency
-        return result
+    def _entity_totals_from_views(
+        self,
+        views: ReportingViewRepository,
+        entity_ids: list[UUID],
+        as_of_date: date,
+        base_currency: str | None,
+    ) -> dict[UUID, tuple[Decimal, Decimal]]:
+        """(assets, liabilities) per entity from the views, in base currency."""
+        rows = views.entity_balances(entity_ids, as_of_date)
+        assets = [row.total_assets for row in rows]
+        liabilities = [row.total_liabilities for row in rows]
+        if base_currency and self._currency_service:
+            assets = self._convert_many_to_base(
+                [(row.total_assets, row.currency) for row in rows],
+                base_currency,
+                as_of_date,
+            )
+            liabilities = self._convert_many_to_base(
+                [(row.total_liabilities, row.currency) for row in rows],
+                base_currency,
+                as_of_date,
+            )
+        totals: dict[UUID, tuple[Decimal, Decimal]] = {}
+        for row, asset, liability in zip(rows, assets, liabilities, strict=True):
+            entity_assets, entity_liabilities = totals.get(
+                row.entity_id, (Decimal("0"), Decimal("0"))
+            )
+            totals[row.entity_id] = (
+                entity_assets + asset,
+                entity_liabilities + liability,
+            )
+        return totals
 
     def fx_gains_losses_report(
         self,
@@ -209,6 +433,8 @@ class ReportingServiceImpl(ReportingService):
                 continue
 
             accounts = list(self._account_repo.list_by_entity(entity_id))
+            opening_close = self._latest_close(entity_id, start_date)
+            closing_close = self._latest_close(entity_id, end_date)
 
             for account in accounts:
                 if account.currency == base_currency:
@@ -221,9 +447,11 @@ class ReportingServiceImpl(ReportingService):
                     continue
 
                 opening_balance = self._calculate_account_balance(
-                    account.id, start_date
+                    account.id, start_date, opening_close
+                )
+                closing_balance = self._calculate_account_balance(
+                    account.id, end_date, closing_close
                 )
-                closing_balance = self._calculate_account_balance(account.id, end_date)
 
                 if opening_balance == Decimal("0") and closing_balance == Decimal("0"):
                     continue
@@ -280,49 +508,17 @@ class ReportingServiceImpl(ReportingService):
         """Generate balance sheet showing assets, liabilities, and equity."""
         accounts = list(self._account_repo.list_by_entity(entity_id))
 
-        assets: list[dict[str, Any]] = []
-        liabilities: list[dict[str, Any]] = []
-        equity_items: list[dict[str, Any]] = []
-
-        total_assets = Decimal("0")
-        total_liabilities = Decimal("0")
-        total_equity = Decimal("0")
-
-        for account in accounts:
-            balance = self._calculate_account_balance(account.id, as_of_date)
-
-            account_data = {
-                "account_id": str(account.id),
-                "account_name": account.name,
-                "balance": balance,
-            }
-
-            if account.account_type == AccountType.ASSET:
-                assets.append(account_data)
-                total_assets += balance
-            elif account.account_type == AccountType.LIABILITY:
-                liabilities.append(account_data)
-                # Liabilities are stored as negative (credit balance)
-                total_liabilities += abs(balance)
-            elif account.account_type == AccountType.EQUITY:
-                equity_items.append(account_data)
-                # Equity is stored as negative (credit balance)
-                total_equity += abs(balance)
-
-        return {
-            "report_name": "Balance Sheet",
-            "as_of_date": as_of_date,
-            "data": {
-                "assets": assets,
-                "liabilities": liabilities,
-                "equity": equity_items,
-            },
-            "totals": {
-                "total_assets": total_assets,
-                "total_liabilities": total_liabilities,
-                "total_equity": total_equity,
-            },
-        }
+        views = self._current_views()
+        if views is not None:
+            view_balances = views.account_balances([a.id for a in accounts], as_of_date)
+            balances = [view_balances.get(a.id, Decimal("0")) for a in accounts]
+        else:
+            close = self._latest_close(entity_id, as_of_date)
+            balances = [
+                self._calculate_account_balance(account.id, as_of_date, close)
+                for account in accounts
+            ]
+        return _balance_sheet_result(as_of_date, accounts, balances)
 
     def income_statement_report(
         self,
@@ -468,47 +664,33 @@ class ReportingServiceImpl(ReportingService):
             entities = list(self._entity_repo.list_all())
             entity_ids = [e.id for e in entities]
 
-        position_data: list[dict[str, Any]] = []
         total_cost_basis = Decimal("0")
         total_market_value = Decimal("0")
 
-        for entity_id in entity_ids:
-            # Get all positions for this entity
-            positions = list(self._position_repo.list_by_entity(entity_id))
-
-            for position in positions:
-                # Skip zero-quantity positions
-                if position.quantity.is_zero:
-                    continue
-
-                # Get security info
-                security = self._security_repo.get(position.security_id)
-                security_symbol = security.symbol if security else "Unknown"
-                security_name = security.name if security else "Unknown"
-
-                # Get account info
-                account = self._account_repo.get(position.account_id)
-                account_name = account.name if account else "Unknown"
-
-                cost_basis = position.cost_basis.amount
-                market_value = position.market_value.amount
-                unrealized_gain = market_value - cost_basis
-
-                position_data.append(
-                    {
-                        "position_id": str(position.id),
-                        "account_name": account_name,
-                        "security_symbol": security_symbol,
-                        "security_name": security_name,
-                        "quantity": str(position.quantity.value),
-                        "cost_basis": cost_basis,
-                        "market_value": market_value,
-                        "unrealized_gain": unrealized_gain,
-                    }
-                )
+        views = self._current_views()
+        position_data: list[dict[str, Any]]
+        if views is not None:
+            position_data = [
+                {
+                    "position_id": str(value.position_id),
+                    "account_name": value.account_name,
+                    "security_symbol": value.security_symbol,
+                    "security_name": value.security_name,
+                    "quantity": str(value.quantity),
+                    "cost_basis": value.cost_basis.amount,
+                    "market_value": value.market_value.amount,
+                    "unrealized_gain": value.market_value.amount
+                    - value.cost_basis.amount,
+                }
+                for value in views.position_values(entity_ids)
+                if value.quantity != 0
+            ]
+        else:
+            position_data = self._live_position_rows(entity_ids)
 
-                total_cost_basis += cost_basis
-                total_market_value += market_value
+        for row in position_data:
+            total_cost_basis += row["cost_basis"]
+            total_market_value += row["market_value"]
 
         return {
             "report_name": "Position Summary",
@@ -521,6 +703,47 @@ class ReportingServiceImpl(ReportingService):
             },
         }
 
+    def _live_position_rows(self, entity_ids: list[UUID]) -> list[dict[str, Any]]:
+        """Position summary rows built from the position repository."""
+        # Skip zero-quantity positions
+        positions = [
+            position
+            for entity_id in entity_ids
+            for position in self._position_repo.list_by_entity(entity_id)
+            if not position.quantity.is_zero
+        ]
+
+        # Prefetch the securities and accounts of every position at once
+        securities = self._security_repo.get_many(p.security_id for p in positions)
+        accounts = self._account_repo.get_many(p.account_id for p in positions)
+
+        rows: list[dict[str, Any]] = []
+        for position in positions:
+            security = securities.get(position.security_id)
+            security_symbol = security.symbol if security else "Unknown"
+            security_name = security.name if security else "Unknown"
+
+            account = accounts.get(position.account_id)
+            account_name = account.name if account else "Unknown"
+
+            cost_basis = position.cost_basis.amount
+            market_value = position.market_value.amount
+            unrealized_gain = market_value - cost_basis
+
+            rows.append(
+                {
+                    "position_id": str(position.id),
+                    "account_name": account_name,
+                    "security_symbol": security_symbol,
+                    "security_name": security_name,
+                    "quantity": str(position.quantity.value),
+                    "cost_basis": cost_basis,
+                    "market_value": market_value,
+                    "unrealized_gain": unrealized_gain,
+                }
+            )
+        return rows
+
     def transaction_summary_by_type(
         self,
         entity_ids: list[UUID] | None,
@@ -535,12 +758,10 @@ class ReportingServiceImpl(ReportingService):
         type_amounts: dict[str, Decimal] = {}
 
         for entity_id in entity_ids:
-            transactions = list(
-                self._transaction_repo.list_by_entity(
-                    entity_id,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
+            transactions = self._transaction_repo.iter_by_entity(
+                entity_id,
+                start_date=start_date,
+                end_date=end_date,
             )
 
             for txn in transactions:
@@ -588,18 +809,15 @@ class ReportingServiceImpl(ReportingService):
         total_amount = Decimal("0")
 
         for entity in entities:
-            transactions = list(
-                self._transaction_repo.list_by_entity(
-                    entity.id,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-            )
-
-            entity_count = len(transactions)
-            entity_amount = sum(
-                (txn.total_debits.amount for txn in transactions), Decimal("0")
-            )
+            entity_count = 0
+            entity_amount = Decimal("0")
+            for txn in self._transaction_repo.iter_by_entity(
+                entity.id,
+                start_date=start_date,
+                end_date=end_date,
+            ):
+                entity_count += 1
+                entity_amount += txn.total_debits.amount
 
             data.append(
                 {
@@ -637,24 +855,22 @@ class ReportingServiceImpl(ReportingService):
 
         total_accounts = 0
         total_transactions = 0
-        for entity_id in entity_ids:
-            accounts = list(self._account_repo.list_by_entity(entity_id))
-            total_accounts += len(accounts)
-            transactions = list(self._transaction_repo.list_by_entity(entity_id))
-            total_transactions += len(transactions)
+        views = self._current_views()
+        if views is not None:
+            for activity in views.entity_activity(entity_ids).values():
+                total_accounts += activity.account_count
+                total_transactions += activity.transaction_count
+        else:
+            for entity_id in entity_ids:
+                accounts = list(self._account_repo.list_by_entity(entity_id))
+                total_accounts += len(accounts)
+                total_transactions += sum(
+                    1 for _ in self._transaction_repo.iter_by_entity(entity_id)
+                )
 
-        return {
-            "report_name": "Dashboard Summary",
-            "as_of_date": as_of_date,
-            "data": {
-                "total_entities": len(entity_ids),
-                "total_accounts": total_accounts,
-                "total_transactions": total_transactions,
-                "net_worth": net_worth["totals"]["net_worth"],
-                "total_assets": net_worth["totals"]["total_assets"],
-                "total_liabilities": net_worth["totals"]["total_liabilities"],
-            },
-        }
+        return _dashboard_result(
+            as_of_date, len(entity_ids), total_accounts, total_transactions, net_worth
+        )
 
     def export_report(
         self,
@@ -850,46 +1066,38 @@ class ReportingServiceImpl(ReportingService):
         else:
             return str(value)
 
-    def _calculate_account_balance(self, account_id: UUID, as_of_date: date) -> Decimal:
-        """Calculate account balance as of a specific date."""
-        # Get all transactions up to as_of_date
-        transactions = list(
-            self._transaction_repo.list_by_account(
-                account_id,
-                start_date=None,
-                end_date=as_of_date,
-            )
-        )
-
-        balance = Decimal("0")
-        for txn in transactions:
-            for entry in txn.entries:
-                if entry.account_id == account_id:
-                    balance += entry.debit_amount.amount
-                    balance -= entry.credit_amount.amount
+    def _latest_close(self, entity_id: UUID, as_of_date: date) -> PeriodClose | None:
+        """The entity's last period closed on or before ``as_of_date``."""
+        if self._period_close_repo is None:
+            return None
+        return self._period_close_repo.get_latest(entity_id, as_of_date)
 
-        return balance
+    def _calculate_account_balance(
+        self, account_id: UUID, as_of_date: date, close: PeriodClose | None = None
+    ) -> Decimal:
+        """Calculate account balance as of a specific date.
+
+        Given the entity's last ``close`` before ``as_of_date``, only entries
+        after it are added to its frozen balances.
+        """
+        if close is None:
+            totals = self._transaction_repo.sum_by_account(
+                [account_id], as_of=as_of_date
+            )
+        else:
+            totals = self._transaction_repo.sum_by_account_since(
+                close.balances, close.period_end, [account_id], as_of=as_of_date
+            )
+        return sum((t.balance for t in totals), Decimal("0"))
 
     def _calculate_account_balance_for_period(
         self, account_id: UUID, start_date: date, end_date: date
     ) -> Decimal:
         """Calculate account activity for a specific period."""
-        transactions = list(
-            self._transaction_repo.list_by_account(
-                account_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
+        totals = self._transaction_repo.sum_by_account(
+            [account_id], as_of=end_date, start=start_date
         )
-
-        balance = Decimal("0")
-        for txn in transactions:
-            for entry in txn.entries:
-                if entry.account_id == account_id:
-                    balance += entry.debit_amount.amount
-                    balance -= entry.credit_amount.amount
-
-        return balance
+        return sum((t.balance for t in totals), Decimal("0"))
 
     def household_net_worth_report(
         self,
@@ -1024,3 +1232,199 @@ class ReportingServiceImpl(ReportingService):
         if base_currency:
             result["base_currency"] = base_currency
         return result
+
+    def trial_balance(
+        self,
+        as_of_date: date,
+        entity_ids: list[UUID] | None = None,
+    ) -> TrialBalance:
+        """Debit and credit totals of every account with activity, per currency.
+
+        The accounts of the entities are listed up front and their totals
+        streamed with one ``iter_account_totals`` call, so lines are
+        produced as the report is iterated instead of one balance query
+        per account. Iterate the report before reading its totals.
+        """
+        if entity_ids is None:
+            entity_ids = [entity.id for entity in self._entity_repo.list_all()]
+        accounts = {
+            account.id: account
+            for entity_id in entity_ids
+            for account in self._account_repo.list_by_entity(entity_id)
+        }
+        return TrialBalance(
+            as_of_date=as_of_date,
+            lines=self._trial_balance_lines(accounts, as_of_date),
+        )
+
+    def _trial_balance_lines(
+        self, accounts: dict[UUID, Account], as_of_date: date
+    ) -> Iterator[TrialBalanceLine]:
+        for totals in self._transaction_repo.iter_account_totals(
+            accounts, as_of=as_of_date
+        ):
+            account = accounts[totals.account_id]
+            yield TrialBalanceLine(
+                account_id=account.id,
+                account_name=account.name,
+                entity_id=account.entity_id,
+                account_type=account.account_type,
+                currency=totals.currency,
+                debit_total=totals.debit_total,
+                credit_total=totals.credit_total,
+            )
+
+    def balance_series(
+        self,
+        dates: Iterable[date],
+        account_ids: Iterable[UUID] | None = None,
+        entity_ids: list[UUID] | None = None,
+    ) -> BalanceSeries:
+        """Balances of accounts on each of ``dates``, from one ordered scan.
+
+        The accounts are ``account_ids`` if given, otherwise those of
+        ``entity_ids`` (all entities if None). Their running totals up to
+        the last date are streamed once in date order by
+        ``iter_balance_history`` and sampled as the scan passes each date,
+        instead of one as-of query per account and date.
+        """
+        sample_dates = sorted(set(dates))
+        if account_ids is None:
+            if entity_ids is None:
+                entity_ids = [entity.id for entity in self._entity_repo.list_all()]
+            account_ids = [
+                account.id
+                for entity_id in entity_ids
+                for account in self._account_repo.list_by_entity(entity_id)
+            ]
+        ids = list(dict.fromkeys(account_ids))
+        if not sample_dates or not ids:
+            return BalanceSeries(sample_dates, {account_id: [] for account_id in ids})
+        history = self._transaction_repo.iter_balance_history(
+            ids, as_of=sample_dates[-1]
+        )
+        return BalanceSeries(sample_dates, _sample_history(history, sample_dates, ids))
+
+    def net_worth_series(
+        self,
+        dates: Iterable[date],
+        entity_ids: list[UUID] | None = None,
+    ) -> dict[str, Any]:
+        """Net worth of the entities on each of ``dates``.
+
+        Computed from one ``balance_series`` over all their accounts, so a
+        long monthly chart costs one scan rather than a ``net_worth_report``
+        per date.
+        """
+        if entity_ids is None:
+            entities = list(self._entity_repo.list_all())
+        else:
+            found = self._entity_repo.get_many(entity_ids)
+            entities = [
+                found[entity_id] for entity_id in entity_ids if entity_id in found
+            ]
+        accounts = [
+            account
+            for entity in entities
+            for account in self._account_repo.list_by_entity(entity.id)
+        ]
+        series = self.balance_series(dates, account_ids=[a.id for a in accounts])
+        data: list[dict[str, Any]] = []
+        for index, day in enumerate(series.dates):
+            assets, liabilities = _asset_and_liability_totals(
+                accounts, [series.balances[account.id][index] for account in accounts]
+            )
+            data.append(
+                {
+                    "as_of_date": day,
+                    "total_assets": assets,
+                    "total_liabilities": liabilities,
+                    "net_worth": assets - liabilities,
+                }
+            )
+        return {
+            "report_name": "Net Worth Series",
+            "entity_ids": [str(entity.id) for entity in entities],
+            "data": data,
+        }
+
+
+class AsyncReportingServiceImpl(AsyncReportingService):
+    """Coroutine counterpart of the ReportingServiceImpl dashboard reports.
+
+    Balances are read with one ``sum_by_account`` call per entity, and the
+    entities of a report are queried concurrently.
+    """
+
+    def __init__(
+        self,
+        entity_repo: AsyncEntityRepository,
+        account_repo: AsyncAccountRepository,
+        transaction_repo: AsyncTransactionRepository,
+    ) -> None:
+        self._entity_repo = entity_repo
+        self._account_repo = account_repo
+        self._transaction_repo = transaction_repo
+
+    async def net_worth_report(
+        self,
+        entity_ids: list[UUID] | None,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        if entity_ids is None:
+            entity_ids = [e.id for e in await self._entity_repo.list_all()]
+        rows = await asyncio.gather(
+            *(self._entity_totals(entity_id, as_of_date) for entity_id in entity_ids)
+        )
+        return _net_worth_result(
+            as_of_date, [row for row in rows if row is not None], None
+        )
+
+    async def balance_sheet_report(
+        self,
+        entity_id: UUID,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        accounts = await self._account_repo.list_by_entity(entity_id)
+        balances = await self._account_balances(accounts, as_of_date)
+        return _balance_sheet_result(as_of_date, accounts, balances)
+
+    async def dashboard_summary(
+        self,
+        entity_ids: list[UUID] | None,
+        as_of_date: date,
+    ) -> dict[str, Any]:
+        if entity_ids is None:
+            entity_ids = [e.id for e in await self._entity_repo.list_all()]
+        net_worth, accounts, transaction_counts = await asyncio.gather(
+            self.net_worth_report(entity_ids, as_of_date),
+            asyncio.gather(*map(self._account_repo.list_by_entity, entity_ids)),
+            asyncio.gather(*map(self._transaction_repo.count_by_entity, entity_ids)),
+        )
+        return _dashboard_result(
+            as_of_date,
+            len(entity_ids),
+            sum(map(len, accounts)),
+            sum(transaction_counts),
+            net_worth,
+        )
+
+    async def _entity_totals(
+        self, entity_id: UUID, as_of_date: date
+    ) -> tuple[Entity, Decimal, Decimal] | None:
+        entity = await self._entity_repo.get(entity_id)
+        if entity is None:
+            return None
+        accounts = await self._account_repo.list_by_entity(entity_id)
+        balances = await self._account_balances(accounts, as_of_date)
+        return (entity, *_asset_and_liability_totals(accounts, balances))
+
+    async def _account_balances(
+        self, accounts: list[Account], as_of_date: date
+    ) -> list[Decimal]:
+        balances = {account.id: Decimal("0") for account in accounts}
+        for totals in await self._transaction_repo.sum_by_account(
+            balances, as_of=as_of_date
+        ):
+            balances[totals.account_id] += totals.balance
+        return [balances[account.id] for account in accounts]
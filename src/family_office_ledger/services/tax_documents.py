@@ -420,17 +420,18 @@ class TaxDocumentService:
         year_start = date(tax_year, 1, 1)
         year_end = date(tax_year, 12, 31)
 
+        securities = self._security_repo.get_many(p.security_id for p in positions)
+        lots_by_position = self._tax_lot_repo.list_by_positions(p.id for p in positions)
+
         for position in positions:
-            security = self._security_repo.get(position.security_id)
+            security = securities.get(position.security_id)
             security_desc = (
                 f"{security.symbol} - {security.name}"
                 if security
                 else "Unknown Security"
             )
 
-            lots = list(self._tax_lot_repo.list_by_position(position.id))
-
-            for lot in lots:
+            for lot in lots_by_position.get(position.id, []):
                 if lot.disposition_date is None:
                     continue
                 if not (year_start <= lot.disposition_date <= year_end):
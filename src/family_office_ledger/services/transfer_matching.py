@@ -1,5 +1,6 @@
 """Transfer matching service for pairing inter-account transfers."""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from decimal import Decimal
@@ -138,29 +139,20 @@ class TransferMatchingService:
         entity_ids: list[UUID] | None,
         start_date: date | None,
         end_date: date | None,
-    ) -> list[Transaction]:
-        candidates: list[Transaction] = []
-
+    ) -> Iterator[Transaction]:
         if entity_ids:
             for entity_id in entity_ids:
-                txns = list(
-                    self._transaction_repo.list_by_entity(
-                        entity_id,
-                        start_date=start_date,
-                        end_date=end_date,
-                    )
+                yield from self._transaction_repo.iter_by_entity(
+                    entity_id,
+                    start_date=start_date,
+                    end_date=end_date,
                 )
-                candidates.extend(txns)
         elif start_date and end_date:
-            candidates = list(
-                self._transaction_repo.list_by_date_range(start_date, end_date)
-            )
-
-        return candidates
+            yield from self._transaction_repo.iter_by_date_range(start_date, end_date)
 
     def _pair_transfers(
         self,
-        transactions: list[Transaction],
+        transactions: Iterable[Transaction],
         date_tolerance_days: int,
     ) -> list[TransferMatch]:
         matches: list[TransferMatch] = []
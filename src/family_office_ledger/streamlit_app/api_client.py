@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import date
 from typing import Any
 from uuid import UUID
@@ -91,23 +91,61 @@ def create_account(
         return _handle_response(r)
 
 
-def list_transactions(
+def list_transactions_page(
     account_id: str | UUID | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
-) -> list[dict[str, Any]]:
-    params: dict[str, str] = {}
+    cursor: str | None = None,
+    limit: int = 100,
+) -> dict[str, Any]:
+    params: dict[str, str] = {"limit": str(limit)}
     if account_id:
         params["account_id"] = str(account_id)
     if start_date:
         params["start_date"] = start_date.isoformat()
     if end_date:
         params["end_date"] = end_date.isoformat()
+    if cursor:
+        params["cursor"] = cursor
     with _client() as client:
         r = client.get("/transactions", params=params)
         return _handle_response(r)
 
 
+def iter_transactions(
+    account_id: str | UUID | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    page_size: int = 500,
+) -> Iterator[dict[str, Any]]:
+    """Yield transactions page by page, following ``next_cursor``."""
+    cursor: str | None = None
+    while True:
+        page = list_transactions_page(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            limit=page_size,
+        )
+        yield from page["transactions"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return
+
+
+def list_transactions(
+    account_id: str | UUID | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> list[dict[str, Any]]:
+    return list(
+        iter_transactions(
+            account_id=account_id, start_date=start_date, end_date=end_date
+        )
+    )
+
+
 def post_transaction(
     transaction_date: date,
     entries: list[dict[str, Any]],
@@ -139,6 +177,24 @@ def net_worth_report(
         return _handle_response(r)
 
 
+def net_worth_series(
+    start_date: date,
+    end_date: date,
+    frequency: str = "monthly",
+    entity_ids: list[str] | None = None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "frequency": frequency,
+    }
+    if entity_ids:
+        params["entity_ids"] = entity_ids
+    with _client() as client:
+        r = client.get("/reports/net-worth/series", params=params)
+        return _handle_response(r)
+
+
 def balance_sheet(entity_id: str | UUID, as_of_date: date) -> dict[str, Any]:
     with _client() as client:
         r = client.get(
@@ -44,6 +44,15 @@ def get_net_worth_data(as_of: date) -> dict[str, Any]:
         return {}
 
 
+@st.cache_data(ttl=60)
+def get_net_worth_series(start: date, end: date) -> dict[str, Any]:
+    """Fetch monthly net worth series with caching."""
+    try:
+        return api_client.net_worth_series(start_date=start, end_date=end)
+    except Exception:
+        return {}
+
+
 @st.cache_data(ttl=60)
 def get_transactions(start: date, end: date) -> list[dict[str, Any]]:
     """Fetch transactions with caching."""
@@ -280,6 +289,33 @@ try:
         else:
             st.info("No financial data to display.")
 
+        # Net Worth Trend
+        section_header("Net Worth Trend")
+
+        series_data = get_net_worth_series(as_of - timedelta(days=365), as_of)
+        points = series_data.get("points", [])
+        if points:
+            fig_trend = go.Figure(
+                data=[
+                    go.Scatter(
+                        x=[p["as_of_date"] for p in points],
+                        y=[float(p["net_worth"]) for p in points],
+                        mode="lines+markers",
+                        line={"color": COLORS["primary"], "width": 2},
+                    )
+                ]
+            )
+            fig_trend.update_layout(
+                **get_plotly_layout(),
+                showlegend=False,
+                height=300,
+                yaxis={"gridcolor": "#e2e8f0", "gridwidth": 1},
+                xaxis={"showgrid": False},
+            )
+            st.plotly_chart(fig_trend, use_container_width=True)
+        else:
+            st.info("No net worth history to display.")
+
     with col_right:
         # Recent Transactions
         section_header("Recent Transactions")
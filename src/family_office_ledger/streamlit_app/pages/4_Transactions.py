@@ -42,17 +42,28 @@ def get_accounts() -> list[dict[str, Any]]:
         return []
 
 
-@st.cache_data(ttl=30)
-def get_transactions(
-    account_id: str | None, start: date, end: date
-) -> list[dict[str, Any]]:
-    """Fetch transactions with caching."""
+HISTORY_PAGE_SIZE = 50
+
+
+def _fetch_transaction_page(
+    account_id: str | None, start: date, end: date, cursor: str | None
+) -> dict[str, Any]:
+    """Fetch one page of transactions."""
     try:
-        return api_client.list_transactions(
-            account_id=account_id, start_date=start, end_date=end
+        return api_client.list_transactions_page(
+            account_id=account_id,
+            start_date=start,
+            end_date=end,
+            cursor=cursor,
+            limit=HISTORY_PAGE_SIZE,
         )
     except Exception:
-        return []
+        return {"transactions": [], "next_cursor": None}
+
+
+# Wrapped by call rather than as a decorator, so the page keeps its typed
+# signature when streamlit's own annotations are unavailable.
+get_transaction_page = st.cache_data(ttl=30)(_fetch_transaction_page)
 
 
 tab_entry, tab_history = st.tabs(["New Journal Entry", "Transaction History"])
@@ -211,7 +222,8 @@ with tab_entry:
                         f"Transaction posted! ID: {result.get('id', 'unknown')[:8]}..."
                     )
                     st.session_state.entry_rows = 2
-                    get_transactions.clear()
+                    get_transaction_page.clear()
+                    st.session_state.pop("txn_history", None)
                     st.rerun()
                 except api_client.APIError as e:
                     st.error(f"Failed to post: {e.detail}")
@@ -242,18 +254,28 @@ with tab_history:
     if not isinstance(filter_end, date):
         filter_end = date.today()
 
+    # Pages are fetched lazily: the first page on load, then one more each
+    # time "Load more" is pressed, following the API's next_cursor.
+    history_filters = (filter_account or None, filter_start, filter_end)
+    history = st.session_state.get("txn_history")
+    if history is None or history["filters"] != history_filters:
+        history = {"filters": history_filters, "cursors": [None]}
+        st.session_state.txn_history = history
+
     try:
-        txns = get_transactions(
-            account_id=filter_account if filter_account else None,
-            start=filter_start,
-            end=filter_end,
-        )
-        if txns:
-            txns_sorted = sorted(
-                txns, key=lambda x: x.get("transaction_date", ""), reverse=True
+        txns: list[dict[str, Any]] = []
+        next_cursor: str | None = None
+        for cursor in history["cursors"]:
+            page = get_transaction_page(
+                account_id=history_filters[0],
+                start=filter_start,
+                end=filter_end,
+                cursor=cursor,
             )
-
-            for txn in txns_sorted[:50]:
+            txns.extend(page["transactions"])
+            next_cursor = page["next_cursor"]
+        if txns:
+            for txn in txns:
                 with st.expander(
                     f"**{txn.get('transaction_date', 'N/A')}** - "
                     f"{txn.get('memo', 'No memo')} ({txn.get('reference', 'No ref')})"
@@ -285,8 +307,11 @@ with tab_history:
                         )
                     st.caption(f"ID: {txn.get('id', 'N/A')}")
 
-            if len(txns) > 50:
-                st.info(f"Showing 50 of {len(txns)} transactions.")
+            if next_cursor is not None:
+                st.caption(f"Showing the first {len(txns)} transactions.")
+                if st.button("Load more", key="load_more_transactions"):
+                    history["cursors"].append(next_cursor)
+                    st.rerun()
         else:
             st.info("No transactions found for the selected filters.")
     except api_client.APIError as e:
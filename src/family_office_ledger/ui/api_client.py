@@ -167,9 +167,14 @@ class LedgerAPIClient:
             params["start_date"] = _iso(start_date)
         if end_date is not None:
             params["end_date"] = _iso(end_date)
-        data = await self._request_json("GET", "/transactions", params=params)
-        assert isinstance(data, list)
-        return data
+        transactions: list[dict[str, Any]] = []
+        while True:
+            data = await self._request_json("GET", "/transactions", params=params)
+            assert isinstance(data, dict)
+            transactions.extend(data["transactions"])
+            if data["next_cursor"] is None:
+                return transactions
+            params["cursor"] = data["next_cursor"]
 
     async def net_worth_report(
         self,
@@ -249,6 +249,19 @@ class TestExistingAPIClientFunctions:
         assert result.get("name") == "Checking"
         assert "id" in result
 
+    def test_net_worth_series(self, mock_httpx_client) -> None:
+        """Test fetching the monthly net worth series."""
+        from family_office_ledger.streamlit_app import api_client
+
+        result = api_client.net_worth_series(
+            start_date=date(2024, 1, 1), end_date=date(2024, 3, 15)
+        )
+        assert [p["as_of_date"] for p in result["points"]] == [
+            "2024-01-31",
+            "2024-02-29",
+            "2024-03-15",
+        ]
+
     def test_post_transaction(self, mock_httpx_client) -> None:
         """Test posting a transaction."""
         from family_office_ledger.streamlit_app import api_client
@@ -1,6 +1,5 @@
 """Tests for FastAPI endpoints."""
 
-
 import pytest
 from httpx import Client
 
@@ -124,6 +123,76 @@ class TestEntityEndpoints:
         response = test_client.get(f"/entities/{fake_id}")
         assert response.status_code == 404
 
+    def test_close_fiscal_year_locks_the_period(self, test_client: Client) -> None:
+        entity_id = test_client.post(
+            "/entities",
+            json={
+                "name": "Closing LLC",
+                "entity_type": "llc",
+                "fiscal_year_end": "2024-06-30",
+            },
+        ).json()["id"]
+        account_ids = {
+            account_type: test_client.post(
+                "/accounts",
+                json={
+                    "name": f"Closing {account_type}",
+                    "entity_id": entity_id,
+                    "account_type": account_type,
+                },
+            ).json()["id"]
+            for account_type in ("asset", "income", "equity")
+        }
+
+        def post(txn_date: str) -> int:
+            return test_client.post(
+                "/transactions",
+                json={
+                    "transaction_date": txn_date,
+                    "entries": [
+                        {"account_id": account_ids["asset"], "debit_amount": "90.00"},
+                        {"account_id": account_ids["income"], "credit_amount": "90.00"},
+                    ],
+                },
+            ).status_code
+
+        assert post("2024-05-01") == 201
+        response = test_client.post(
+            f"/entities/{entity_id}/period-closes", json={"fiscal_year": 2024}
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["period_end"] == "2024-06-30"
+        assert data["closing_transaction_id"] is not None
+        balances = {b["account_id"]: b for b in data["balances"]}
+        assert balances[account_ids["equity"]]["credit_total"] == "90.00"
+        assert post("2024-06-30") == 422
+        assert post("2024-07-01") == 201
+        assert (
+            test_client.post(
+                f"/entities/{entity_id}/period-closes", json={"fiscal_year": 2024}
+            ).status_code
+            == 409
+        )
+        listed = test_client.get(f"/entities/{entity_id}/period-closes").json()
+        assert [c["id"] for c in listed] == [data["id"]]
+
+    def test_close_fiscal_year_errors(self, test_client: Client) -> None:
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        response = test_client.post(
+            f"/entities/{fake_id}/period-closes", json={"fiscal_year": 2024}
+        )
+        assert response.status_code == 404
+
+        entity_id = test_client.post(
+            "/entities", json={"name": "No Equity", "entity_type": "trust"}
+        ).json()["id"]
+        response = test_client.post(
+            f"/entities/{entity_id}/period-closes", json={"fiscal_year": 2024}
+        )
+        assert response.status_code == 400
+
 
 class TestAccountEndpoints:
     """Tests for /accounts endpoints."""
@@ -330,7 +399,11 @@ class TestTransactionEndpoints:
     def test_list_transactions_returns_empty(self, test_client: Client) -> None:
         response = test_client.get("/transactions")
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {
+            "transactions": [],
+            "next_cursor": None,
+            "limit": 100,
+        }
 
     def test_list_transactions_filter_by_account_id(self, test_client: Client) -> None:
         # Create entity and accounts
@@ -384,7 +457,7 @@ class TestTransactionEndpoints:
         # Filter by account_id
         response = test_client.get(f"/transactions?account_id={account1_id}")
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["transactions"]
         assert len(data) == 1
 
     def test_list_transactions_filter_by_date_range(self, test_client: Client) -> None:
@@ -460,10 +533,202 @@ class TestTransactionEndpoints:
             "/transactions?start_date=2025-01-01&end_date=2025-01-31"
         )
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["transactions"]
         assert len(data) == 1
         assert data[0]["memo"] == "Jan 1"
 
+    def test_list_transactions_pages_with_cursor(self, test_client: Client) -> None:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Paging Test", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash PG", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        equity_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Equity PG",
+                "entity_id": entity_id,
+                "account_type": "equity",
+            },
+        ).json()["id"]
+        for day in (3, 1, 2, 2, 5):
+            test_client.post(
+                "/transactions",
+                json={
+                    "transaction_date": f"2025-03-0{day}",
+                    "memo": f"Mar {day}",
+                    "entries": [
+                        {
+                            "account_id": cash_id,
+                            "debit_amount": "10.00",
+                            "credit_amount": "0",
+                        },
+                        {
+                            "account_id": equity_id,
+                            "debit_amount": "0",
+                            "credit_amount": "10.00",
+                        },
+                    ],
+                },
+            )
+
+        seen: list[dict] = []
+        params: dict[str, str] = {"account_id": cash_id, "limit": "2"}
+        pages = 0
+        while True:
+            response = test_client.get("/transactions", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            pages += 1
+            assert len(page["transactions"]) <= 2
+            seen.extend(page["transactions"])
+            if page["next_cursor"] is None:
+                break
+            params["cursor"] = page["next_cursor"]
+
+        assert pages == 3
+        assert [t["memo"] for t in seen] == [
+            "Mar 1",
+            "Mar 2",
+            "Mar 2",
+            "Mar 3",
+            "Mar 5",
+        ]
+        assert len({t["id"] for t in seen}) == 5
+
+    def test_list_transactions_rejects_invalid_cursor(
+        self, test_client: Client
+    ) -> None:
+        response = test_client.get("/transactions?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_search_transactions_ranks_matches(self, test_client: Client) -> None:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Search Test", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash ST", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        expense_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Expense ST",
+                "entity_id": entity_id,
+                "account_type": "expense",
+            },
+        ).json()["id"]
+        for memo, reference in (
+            ("Invoice payment", "RENT-2025-01"),
+            ("January rent", ""),
+            ("Legal fees", ""),
+        ):
+            test_client.post(
+                "/transactions",
+                json={
+                    "transaction_date": "2025-01-31",
+                    "memo": memo,
+                    "reference": reference,
+                    "entries": [
+                        {
+                            "account_id": expense_id,
+                            "debit_amount": "25.00",
+                            "credit_amount": "0",
+                        },
+                        {
+                            "account_id": cash_id,
+                            "debit_amount": "0",
+                            "credit_amount": "25.00",
+                        },
+                    ],
+                },
+            )
+
+        response = test_client.get("/transactions/search", params={"q": "rent"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "rent"
+        assert data["total"] == 2
+        assert [t["memo"] for t in data["transactions"]] == [
+            "January rent",
+            "Invoice payment",
+        ]
+
+    def test_search_transactions_requires_query(self, test_client: Client) -> None:
+        response = test_client.get("/transactions/search")
+        assert response.status_code == 422
+
+    def _batch_accounts(self, test_client: Client) -> tuple[str, str]:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Batch Test", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash BT", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        income_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Income BT",
+                "entity_id": entity_id,
+                "account_type": "income",
+            },
+        ).json()["id"]
+        return cash_id, income_id
+
+    @staticmethod
+    def _batch_item(cash_id: str, income_id: str, credit: str) -> dict:
+        return {
+            "transaction_date": "2025-02-01",
+            "memo": "Batch",
+            "entries": [
+                {"account_id": cash_id, "debit_amount": "10.00", "credit_amount": "0"},
+                {"account_id": income_id, "debit_amount": "0", "credit_amount": credit},
+            ],
+        }
+
+    def test_post_transaction_batch_returns_201(self, test_client: Client) -> None:
+        cash_id, income_id = self._batch_accounts(test_client)
+
+        response = test_client.post(
+            "/transactions/batch",
+            json={
+                "transactions": [
+                    self._batch_item(cash_id, income_id, "10.00") for _ in range(3)
+                ]
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["posted"], data["failed"]) == (3, 0)
+        listed = test_client.get("/transactions", params={"account_id": cash_id})
+        assert len(listed.json()["transactions"]) == 3
+
+    def test_post_strict_transaction_batch_returns_422(
+        self, test_client: Client
+    ) -> None:
+        cash_id, income_id = self._batch_accounts(test_client)
+        items = [
+            self._batch_item(cash_id, income_id, "10.00"),
+            self._batch_item(cash_id, income_id, "5.00"),
+        ]
+
+        strict = test_client.post("/transactions/batch", json={"transactions": items})
+        lenient = test_client.post(
+            "/transactions/batch", json={"transactions": items, "strict": False}
+        )
+
+        assert strict.status_code == 422
+        assert (strict.json()["posted"], strict.json()["failed"]) == (0, 1)
+        assert lenient.status_code == 201
+        assert [r["posted"] for r in lenient.json()["results"]] == [True, False]
+        listed = test_client.get("/transactions", params={"account_id": cash_id})
+        assert len(listed.json()["transactions"]) == 1
+
 
 class TestReportEndpoints:
     """Tests for /reports endpoints."""
@@ -575,3 +840,175 @@ class TestReportEndpoints:
             f"/reports/balance-sheet/{fake_id}?as_of_date=2025-01-28"
         )
         assert response.status_code == 404
+
+    def test_trial_balance_report(self, test_client: Client) -> None:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Trial Balance Entity", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash TB", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        equity_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Equity TB",
+                "entity_id": entity_id,
+                "account_type": "equity",
+            },
+        ).json()["id"]
+        test_client.post(
+            "/transactions",
+            json={
+                "transaction_date": "2025-01-10",
+                "entries": [
+                    {"account_id": cash_id, "debit_amount": "500.00"},
+                    {"account_id": equity_id, "credit_amount": "500.00"},
+                ],
+            },
+        )
+
+        response = test_client.get(
+            "/reports/trial-balance",
+            params={"as_of_date": "2025-01-31", "entity_ids": [entity_id]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["report_name"] == "Trial Balance"
+        assert data["is_balanced"] is True
+        assert {
+            (line["account_name"], line["net_balance"]) for line in data["lines"]
+        } == {("Cash TB", "500.00"), ("Equity TB", "-500.00")}
+        assert data["totals"] == [
+            {"currency": "USD", "debit_total": "500.00", "credit_total": "500.00"}
+        ]
+
+    def test_net_worth_series_report(self, test_client: Client) -> None:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Series Entity", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash NWS", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        equity_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Equity NWS",
+                "entity_id": entity_id,
+                "account_type": "equity",
+            },
+        ).json()["id"]
+        for txn_date, amount in (("2025-01-10", "500.00"), ("2025-02-03", "250.00")):
+            test_client.post(
+                "/transactions",
+                json={
+                    "transaction_date": txn_date,
+                    "entries": [
+                        {"account_id": cash_id, "debit_amount": amount},
+                        {"account_id": equity_id, "credit_amount": amount},
+                    ],
+                },
+            )
+
+        response = test_client.get(
+            "/reports/net-worth/series",
+            params={
+                "start_date": "2025-01-01",
+                "end_date": "2025-03-15",
+                "entity_ids": [entity_id],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["frequency"] == "monthly"
+        assert [(p["as_of_date"], p["net_worth"]) for p in data["points"]] == [
+            ("2025-01-31", "500.00"),
+            ("2025-02-28", "750.00"),
+            ("2025-03-15", "750.00"),
+        ]
+
+    def test_net_worth_series_rejects_reversed_range(self, test_client: Client) -> None:
+        response = test_client.get(
+            "/reports/net-worth/series",
+            params={"start_date": "2025-03-01", "end_date": "2025-01-01"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestReportCache:
+    """Tests for report results served from the report cache."""
+
+    def _cash_and_equity(self, test_client: Client) -> tuple[str, str]:
+        entity_id = test_client.post(
+            "/entities", json={"name": "Cached Entity", "entity_type": "llc"}
+        ).json()["id"]
+        cash_id = test_client.post(
+            "/accounts",
+            json={"name": "Cash RC", "entity_id": entity_id, "account_type": "asset"},
+        ).json()["id"]
+        equity_id = test_client.post(
+            "/accounts",
+            json={
+                "name": "Equity RC",
+                "entity_id": entity_id,
+                "account_type": "equity",
+            },
+        ).json()["id"]
+        return cash_id, equity_id
+
+    def _deposit(self, test_client: Client, cash_id: str, equity_id: str) -> None:
+        response = test_client.post(
+            "/transactions",
+            json={
+                "transaction_date": "2025-01-10",
+                "entries": [
+                    {"account_id": cash_id, "debit_amount": "500.00"},
+                    {"account_id": equity_id, "credit_amount": "500.00"},
+                ],
+            },
+        )
+        assert response.status_code == 201
+
+    def _stats(self, test_client: Client) -> dict:
+        response = test_client.get("/reports/cache")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_repeated_dashboard_is_served_from_cache(self, test_client: Client) -> None:
+        self._cash_and_equity(test_client)
+
+        first = test_client.get("/reports/dashboard?as_of_date=2025-01-28")
+        second = test_client.get("/reports/dashboard?as_of_date=2025-01-28")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        stats = self._stats(test_client)
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_posting_a_transaction_invalidates_cached_report(
+        self, test_client: Client
+    ) -> None:
+        cash_id, equity_id = self._cash_and_equity(test_client)
+        url = "/reports/net-worth?as_of_date=2025-01-28"
+        before = test_client.get(url).json()
+
+        self._deposit(test_client, cash_id, equity_id)
+        after = test_client.get(url).json()
+
+        assert after != before
+        assert after["totals"]["net_worth"] == "500.00"
+        assert self._stats(test_client)["hits"] == 0
+
+    def test_no_cache_header_bypasses_cache(self, test_client: Client) -> None:
+        url = "/reports/net-worth?as_of_date=2025-01-28"
+        test_client.get(url)
+
+        response = test_client.get(url, headers={"Cache-Control": "no-cache"})
+
+        assert response.status_code == 200
+        stats = self._stats(test_client)
+        assert (stats["hits"], stats["misses"]) == (0, 1)
@@ -1,5 +1,8 @@
 """Tests for audit trail service."""
 
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -9,7 +12,7 @@ from family_office_ledger.domain.audit import (
     AuditEntityType,
 )
 from family_office_ledger.repositories.sqlite import SQLiteDatabase
-from family_office_ledger.services.audit import AuditService
+from family_office_ledger.services.audit import AuditService, AuditWriter
 
 
 @pytest.fixture
@@ -249,3 +252,100 @@ class TestAuditServiceSummary:
         assert summary.total_entries == 0
         assert summary.oldest_entry is None
         assert summary.newest_entry is None
+
+
+class TestAuditWriter:
+    @pytest.fixture
+    def file_db(self, tmp_path: Path) -> Iterator[SQLiteDatabase]:
+        database = SQLiteDatabase(tmp_path / "audit.db")
+        database.initialize()
+        yield database
+        database.close()
+
+    def _count(self, database: SQLiteDatabase) -> int:
+        conn = database.reader().get_connection()
+        return conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+
+    def test_in_memory_databases_write_synchronously(self, db: SQLiteDatabase):
+        writer = AuditWriter(db)
+        service = AuditService(db, writer)
+
+        service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "A"})
+
+        assert writer.synchronous
+        count = db.get_connection().execute("SELECT COUNT(*) FROM audit_log")
+        assert count.fetchone()[0] == 1
+
+    def test_buffers_until_batch_is_full(self, file_db: SQLiteDatabase):
+        writer = AuditWriter(file_db, batch_size=3, flush_interval=60)
+        service = AuditService(file_db, writer)
+
+        for _ in range(2):
+            service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "A"})
+        assert self._count(file_db) == 0
+
+        service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "A"})
+        writer.flush()
+        assert self._count(file_db) == 3
+        writer.close()
+
+    def test_reads_see_buffered_entries(self, file_db: SQLiteDatabase):
+        service = AuditService(file_db, AuditWriter(file_db, flush_interval=60))
+
+        entry = service.log_create(AuditEntityType.ACCOUNT, uuid4(), {"name": "B"})
+
+        assert service.get_entry(entry.id) is not None
+        service.close()
+
+    def test_close_writes_remaining_entries(self, file_db: SQLiteDatabase):
+        writer = AuditWriter(file_db, flush_interval=60)
+        service = AuditService(file_db, writer)
+        for _ in range(5):
+            service.log_delete(AuditEntityType.SECURITY, uuid4(), {"symbol": "X"})
+
+        writer.close()
+
+        assert self._count(file_db) == 5
+        with pytest.raises(RuntimeError):
+            service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "late"})
+
+    def test_reads_after_close_do_not_block(self, file_db: SQLiteDatabase):
+        service = AuditService(file_db, AuditWriter(file_db, flush_interval=60))
+        entry = service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "A"})
+
+        service.close()
+        service.flush()
+
+        assert service.get_entry(entry.id) is not None
+
+    def test_failed_batch_is_retried_and_reported(
+        self, file_db: SQLiteDatabase, monkeypatch: pytest.MonkeyPatch
+    ):
+        writer = AuditWriter(file_db, flush_interval=60)
+        service = AuditService(file_db, writer)
+        write_batch = writer._write_batch
+
+        def fail_once(entries):
+            monkeypatch.setattr(writer, "_write_batch", write_batch)
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(writer, "_write_batch", fail_once)
+        service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "A"})
+        with pytest.raises(sqlite3.OperationalError):
+            writer.flush()
+        assert self._count(file_db) == 0
+
+        service.log_create(AuditEntityType.ENTITY, uuid4(), {"name": "B"})
+        writer.flush()
+
+        assert self._count(file_db) == 2
+        writer.close()
+
+    def test_schema_is_created_once_per_database(self, db: SQLiteDatabase):
+        statements: list[str] = []
+        db.get_connection().set_trace_callback(statements.append)
+
+        AuditService(db)
+        AuditService(db)
+
+        assert sum("CREATE TABLE" in s for s in statements) == 1
@@ -210,3 +210,62 @@ class TestMain:
         result = main(["--database", str(db_path), "init", "--force"])
 
         assert result == 0
+
+
+class TestSnapshotsCommands:
+    def _ledger_with_transaction(self, tmp_path) -> Path:
+        from datetime import date
+        from decimal import Decimal
+
+        from family_office_ledger.domain.entities import Account
+        from family_office_ledger.domain.transactions import Entry, Transaction
+        from family_office_ledger.domain.value_objects import Money
+        from family_office_ledger.repositories.sqlite import (
+            SQLiteTransactionRepository,
+        )
+
+        db_path = tmp_path / "test.db"
+        db = SQLiteDatabase(str(db_path))
+        db.initialize()
+        entity = Entity(name="Test LLC", entity_type=EntityType.LLC)
+        SQLiteEntityRepository(db).add(entity)
+        cash = Account(name="Cash", entity_id=entity.id, account_type=AccountType.ASSET)
+        income = Account(
+            name="Income", entity_id=entity.id, account_type=AccountType.INCOME
+        )
+        SQLiteAccountRepository(db).add(cash)
+        SQLiteAccountRepository(db).add(income)
+        txn = Transaction(transaction_date=date(2024, 1, 15))
+        txn.add_entry(Entry(account_id=cash.id, debit_amount=Money(Decimal("100"))))
+        txn.add_entry(Entry(account_id=income.id, credit_amount=Money(Decimal("100"))))
+        SQLiteTransactionRepository(db).add(txn)
+        db.close()
+        return db_path
+
+    def test_verify_passes_for_maintained_snapshots(self, tmp_path, capsys):
+        db_path = self._ledger_with_transaction(tmp_path)
+
+        result = main(["--database", str(db_path), "snapshots", "verify"])
+
+        assert result == 0
+        assert "match" in capsys.readouterr().out
+
+    def test_verify_reports_drift_until_rebuild(self, tmp_path, capsys):
+        db_path = self._ledger_with_transaction(tmp_path)
+        db = SQLiteDatabase(str(db_path))
+        db.get_connection().execute("DELETE FROM account_balance_snapshots")
+        db.get_connection().commit()
+        db.close()
+
+        assert main(["--database", str(db_path), "snapshots", "verify"]) == 1
+        assert "2 balance snapshot discrepancies" in capsys.readouterr().out
+
+        assert main(["--database", str(db_path), "snapshots", "rebuild"]) == 0
+        assert "Rebuilt 2 balance snapshots" in capsys.readouterr().out
+        assert main(["--database", str(db_path), "snapshots", "verify"]) == 0
+
+    def test_snapshots_no_subcommand_prints_help(self, tmp_path, capsys):
+        result = main(["snapshots"])
+
+        assert result == 0
+        assert "rebuild" in capsys.readouterr().out
@@ -965,3 +965,51 @@ class TestMultiplePositions:
         assert updated_lot2 is not None
         assert updated_lot2.original_quantity == Quantity(Decimal("60"))
         assert updated_lot2.cost_per_share == Money(Decimal("60.00"))
+
+
+class TestUnitOfWork:
+    """Corporate actions run inside the database unit of work when given one."""
+
+    def test_failed_spinoff_rolls_back_parent_lot_updates(
+        self,
+        db: SQLiteDatabase,
+        position_repo: SQLitePositionRepository,
+        security_repo: SQLiteSecurityRepository,
+        test_security: Security,
+        test_position: Position,
+        test_account: Account,
+    ) -> None:
+        """A failure while adding child lots leaves the parent lots untouched."""
+
+        class FailingTaxLotRepository(SQLiteTaxLotRepository):
+            def add_many(self, lots):  # type: ignore[no-untyped-def]
+                raise RuntimeError("disk full")
+
+        tax_lot_repo = FailingTaxLotRepository(db)
+        service = CorporateActionServiceImpl(
+            tax_lot_repo, position_repo, security_repo, unit_of_work=db.unit_of_work
+        )
+        child_security = Security(symbol="SPIN", name="SpinCo")
+        security_repo.add(child_security)
+        position_repo.add(
+            Position(account_id=test_account.id, security_id=child_security.id)
+        )
+        parent_lot = TaxLot(
+            position_id=test_position.id,
+            acquisition_date=date(2023, 1, 15),
+            cost_per_share=Money(Decimal("100.00")),
+            original_quantity=Quantity(Decimal("10")),
+        )
+        SQLiteTaxLotRepository(db).add(parent_lot)
+
+        with pytest.raises(RuntimeError):
+            service.apply_spinoff(
+                parent_security_id=test_security.id,
+                child_security_id=child_security.id,
+                allocation_ratio=Decimal("0.2"),
+                effective_date=date(2024, 6, 15),
+            )
+
+        stored = tax_lot_repo.get(parent_lot.id)
+        assert stored is not None
+        assert stored.cost_per_share == Money(Decimal("100.00"))
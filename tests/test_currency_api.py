@@ -255,6 +255,35 @@ class TestCurrencyConversionEndpoints:
         assert data["rate_used"] == "0.92"
         assert data["as_of_date"] == "2025-01-15"
 
+    def test_convert_currency_sees_rate_changes(self, test_client: Client) -> None:
+        payload = {
+            "amount": "100.00",
+            "from_currency": "USD",
+            "to_currency": "EUR",
+            "as_of_date": "2025-01-15",
+        }
+        rate = {
+            "from_currency": "USD",
+            "to_currency": "EUR",
+            "effective_date": "2025-01-15",
+        }
+        rate_id = test_client.post(
+            "/currency/rates", json={**rate, "rate": "0.92"}
+        ).json()["id"]
+        first = test_client.post("/currency/convert", json=payload)
+
+        test_client.delete(f"/currency/rates/{rate_id}")
+        test_client.post("/currency/rates", json={**rate, "rate": "0.95"})
+        second = test_client.post("/currency/convert", json=payload)
+
+        assert first.json()["converted_amount"] == "92.0000"
+        assert second.json()["converted_amount"] == "95.0000"
+
+    def test_requests_share_the_rate_cache(self, test_db: SQLiteDatabase) -> None:
+        from family_office_ledger.api.routes import get_currency_service
+
+        assert get_currency_service(test_db) is get_currency_service(test_db)
+
     def test_convert_currency_with_inverse_rate(self, test_client: Client) -> None:
         test_client.post(
             "/currency/rates",
@@ -277,6 +306,37 @@ class TestCurrencyConversionEndpoints:
         data = response.json()
         assert data["rate_used"] == "inverse"
 
+    def test_convert_currency_reports_cross_rate_path(
+        self, test_client: Client
+    ) -> None:
+        for from_currency, to_currency, rate in (
+            ("GBP", "USD", "1.25"),
+            ("USD", "JPY", "150"),
+        ):
+            test_client.post(
+                "/currency/rates",
+                json={
+                    "from_currency": from_currency,
+                    "to_currency": to_currency,
+                    "rate": rate,
+                    "effective_date": "2025-01-15",
+                },
+            )
+
+        payload = {
+            "amount": "100.00",
+            "from_currency": "GBP",
+            "to_currency": "JPY",
+            "as_of_date": "2025-01-15",
+        }
+        response = test_client.post("/currency/convert", json=payload)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["converted_amount"] == "18750.0000"
+        assert data["rate_used"] == "187.50"
+        assert data["rate_path"] == ["GBP", "USD", "JPY"]
+        assert len(data["rate_ids"]) == 2
+
     def test_convert_currency_rate_not_found(self, test_client: Client) -> None:
         payload = {
             "amount": "100.00",
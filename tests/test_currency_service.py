@@ -1,6 +1,6 @@
 """Tests for CurrencyService."""
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
@@ -10,6 +10,7 @@ from family_office_ledger.domain.value_objects import Money
 from family_office_ledger.repositories.sqlite import (
     SQLiteDatabase,
     SQLiteExchangeRateRepository,
+    SQLiteLedgerVersionRepository,
 )
 from family_office_ledger.services.currency import (
     CurrencyServiceImpl,
@@ -219,6 +220,423 @@ class TestCurrencyServiceConvert:
         assert result.amount == expected
 
 
+class TestCurrencyServiceRateCache:
+    """Tests for the exchange-rate series cache behind convert."""
+
+    def _add_series(self, currency_service: CurrencyServiceImpl) -> None:
+        for day, value in ((1, "0.90"), (10, "0.92"), (20, "0.95")):
+            currency_service.add_rate(
+                ExchangeRate(
+                    from_currency="USD",
+                    to_currency="EUR",
+                    rate=Decimal(value),
+                    effective_date=date(2026, 1, day),
+                )
+            )
+
+    def test_default_requires_exact_date(self, currency_service: CurrencyServiceImpl):
+        """Without a staleness allowance only same-day rates are used."""
+        self._add_series(currency_service)
+
+        with pytest.raises(ExchangeRateNotFoundError):
+            currency_service.convert(
+                Money(Decimal("100"), "USD"), "EUR", date(2026, 1, 12)
+            )
+
+    def test_uses_nearest_rate_on_or_before_date(self, db: SQLiteDatabase):
+        """Convert picks the latest rate effective on or before the date."""
+        service = CurrencyServiceImpl(
+            SQLiteExchangeRateRepository(db), max_staleness=timedelta(days=5)
+        )
+        self._add_series(service)
+        amount = Money(Decimal("100"), "USD")
+
+        assert service.convert(amount, "EUR", date(2026, 1, 12)).amount == Decimal("92")
+        assert service.convert(amount, "EUR", date(2026, 1, 20)).amount == Decimal("95")
+        with pytest.raises(ExchangeRateNotFoundError):
+            service.convert(amount, "EUR", date(2026, 1, 16))
+        with pytest.raises(ExchangeRateNotFoundError):
+            service.convert(amount, "EUR", date(2025, 12, 31))
+
+    def test_unbounded_staleness_uses_any_earlier_rate(self, db: SQLiteDatabase):
+        """max_staleness=None accepts arbitrarily old rates, including inverses."""
+        service = CurrencyServiceImpl(
+            SQLiteExchangeRateRepository(db), max_staleness=None
+        )
+        service.add_rate(
+            ExchangeRate(
+                from_currency="EUR",
+                to_currency="USD",
+                rate=Decimal("1.25"),
+                effective_date=date(2020, 1, 1),
+            )
+        )
+
+        result = service.convert(Money(Decimal("100"), "USD"), "EUR", date(2026, 1, 1))
+
+        assert result.amount == Decimal("80")
+
+    def test_series_loaded_once_per_pair(
+        self, db: SQLiteDatabase, currency_service: CurrencyServiceImpl
+    ):
+        """Repeated conversions reuse the loaded series."""
+        self._add_series(currency_service)
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            for day in (1, 10, 20, 1, 10):
+                currency_service.convert(
+                    Money(Decimal("100"), "USD"), "EUR", date(2026, 1, day)
+                )
+        finally:
+            conn.set_trace_callback(None)
+
+        # One query for the stored pairs, one for the USD/EUR series.
+        assert sum("FROM exchange_rates" in s for s in statements) == 2
+
+    def test_add_rate_invalidates_pair(self, currency_service: CurrencyServiceImpl):
+        """A rate added after the series was loaded is visible to convert."""
+        self._add_series(currency_service)
+        amount = Money(Decimal("100"), "USD")
+        currency_service.convert(amount, "EUR", date(2026, 1, 10))
+
+        currency_service.add_rate(
+            ExchangeRate(
+                from_currency="USD",
+                to_currency="EUR",
+                rate=Decimal("0.93"),
+                effective_date=date(2026, 1, 12),
+            )
+        )
+
+        assert currency_service.convert(amount, "EUR", date(2026, 1, 12)).amount == (
+            Decimal("93")
+        )
+
+    def test_delete_rate_invalidates_pair(self, currency_service: CurrencyServiceImpl):
+        """A deleted rate is no longer used by convert."""
+        rate = ExchangeRate(
+            from_currency="USD",
+            to_currency="EUR",
+            rate=Decimal("0.92"),
+            effective_date=date(2026, 1, 15),
+        )
+        currency_service.add_rate(rate)
+        amount = Money(Decimal("100"), "USD")
+        currency_service.convert(amount, "EUR", date(2026, 1, 15))
+
+        assert currency_service.delete_rate(rate.id) is True
+        assert currency_service.delete_rate(rate.id) is False
+        with pytest.raises(ExchangeRateNotFoundError):
+            currency_service.convert(amount, "EUR", date(2026, 1, 15))
+
+    def test_rate_written_elsewhere_invalidates_watched_cache(self, db: SQLiteDatabase):
+        """With ledger versions, writes bypassing the service are seen too."""
+        service = CurrencyServiceImpl(
+            SQLiteExchangeRateRepository(db),
+            ledger_versions=SQLiteLedgerVersionRepository(db),
+        )
+        other = CurrencyServiceImpl(SQLiteExchangeRateRepository(db))
+        self._add_series(other)
+        amount = Money(Decimal("100"), "USD")
+        assert service.convert(amount, "EUR", date(2026, 1, 10)).amount == (
+            Decimal("92")
+        )
+
+        other.add_rate(
+            ExchangeRate(
+                from_currency="USD",
+                to_currency="GBP",
+                rate=Decimal("0.80"),
+                effective_date=date(2026, 1, 10),
+            )
+        )
+        resolved = service.resolve_rate("USD", "GBP", date(2026, 1, 10))
+        assert resolved is not None
+
+        rate = SQLiteExchangeRateRepository(db).get_rate(
+            "USD", "EUR", date(2026, 1, 10)
+        )
+        assert rate is not None
+        SQLiteExchangeRateRepository(db).delete(rate.id)
+        assert service.convert_many([amount], "EUR", date(2026, 1, 10)) == [None]
+
+    def test_unchanged_rate_version_keeps_cache(self, db: SQLiteDatabase):
+        """Only a moved rate version drops the loaded series."""
+        service = CurrencyServiceImpl(
+            SQLiteExchangeRateRepository(db),
+            ledger_versions=SQLiteLedgerVersionRepository(db),
+        )
+        self._add_series(service)
+        amount = Money(Decimal("100"), "USD")
+        service.convert(amount, "EUR", date(2026, 1, 10))
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            service.convert(amount, "EUR", date(2026, 1, 20))
+        finally:
+            conn.set_trace_callback(None)
+
+        assert not any("FROM exchange_rates" in s for s in statements)
+
+    def test_series_read_during_invalidation_is_not_kept(
+        self, db: SQLiteDatabase, currency_service: CurrencyServiceImpl
+    ):
+        """A load that races a rate write is used once but not cached."""
+        self._add_series(currency_service)
+        repo = SQLiteExchangeRateRepository(db)
+        cache = currency_service.cache
+        cache.pairs()
+
+        class WriteDuringRead(SQLiteExchangeRateRepository):
+            def list_by_currency_pair(self, *args, **kwargs):
+                rates = list(super().list_by_currency_pair(*args, **kwargs))
+                cache.invalidate("USD", "EUR")
+                return rates
+
+        cache._repo = WriteDuringRead(db)
+        assert cache.rate_as_of("USD", "EUR", date(2026, 1, 10)) is not None
+        cache._repo = repo
+
+        assert ("USD", "EUR") not in cache._series
+
+    def test_negative_staleness_rejected(self, db: SQLiteDatabase):
+        """A negative staleness limit is a configuration error."""
+        with pytest.raises(ValueError):
+            CurrencyServiceImpl(
+                SQLiteExchangeRateRepository(db), max_staleness=timedelta(days=-1)
+            )
+
+
+class TestCurrencyServiceCrossRates:
+    """Tests for conversions through intermediate currencies."""
+
+    def _add(
+        self,
+        currency_service: CurrencyServiceImpl,
+        from_currency: str,
+        to_currency: str,
+        rate: str,
+        effective_date: date = date(2026, 1, 15),
+    ) -> ExchangeRate:
+        exchange_rate = ExchangeRate(
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate=Decimal(rate),
+            effective_date=effective_date,
+        )
+        currency_service.add_rate(exchange_rate)
+        return exchange_rate
+
+    def test_converts_through_pivot_currency(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """GBP -> JPY goes through USD when only USD rates are stored."""
+        gbp_usd = self._add(currency_service, "GBP", "USD", "1.25")
+        usd_jpy = self._add(currency_service, "USD", "JPY", "150")
+
+        result = currency_service.convert(
+            Money(Decimal("100"), "GBP"), "JPY", date(2026, 1, 15)
+        )
+        resolved = currency_service.resolve_rate("GBP", "JPY", date(2026, 1, 15))
+
+        assert result.amount == Decimal("18750")
+        assert resolved is not None
+        assert resolved.path == ("GBP", "USD", "JPY")
+        assert resolved.rate == Decimal("187.5")
+        assert [leg.exchange_rate.id for leg in resolved.legs] == [
+            gbp_usd.id,
+            usd_jpy.id,
+        ]
+
+    def test_pivot_legs_may_be_inverted(self, currency_service: CurrencyServiceImpl):
+        """Pivot hops use inverse rates when only the other direction exists."""
+        self._add(currency_service, "USD", "GBP", "0.80")
+        self._add(currency_service, "USD", "JPY", "150")
+
+        resolved = currency_service.resolve_rate("GBP", "JPY", date(2026, 1, 15))
+
+        assert resolved is not None
+        assert [leg.inverted for leg in resolved.legs] == [True, False]
+        assert currency_service.convert(
+            Money(Decimal("80"), "GBP"), "JPY", date(2026, 1, 15)
+        ).amount == Decimal("15000")
+
+    def test_direct_rate_preferred_over_pivot(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """A stored cross rate is used instead of triangulating."""
+        self._add(currency_service, "GBP", "USD", "1.25")
+        self._add(currency_service, "USD", "JPY", "150")
+        self._add(currency_service, "GBP", "JPY", "190")
+
+        resolved = currency_service.resolve_rate("GBP", "JPY", date(2026, 1, 15))
+
+        assert resolved is not None
+        assert resolved.path == ("GBP", "JPY")
+        assert not resolved.is_cross_rate
+
+    def test_shortest_path_without_pivot(self, currency_service: CurrencyServiceImpl):
+        """Currencies not linked through a pivot are joined by the shortest path."""
+        self._add(currency_service, "CHF", "SEK", "11")
+        self._add(currency_service, "SEK", "NOK", "1.5")
+        self._add(currency_service, "NOK", "DKK", "0.5")
+
+        resolved = currency_service.resolve_rate("CHF", "DKK", date(2026, 1, 15))
+
+        assert resolved is not None
+        assert resolved.path == ("CHF", "SEK", "NOK", "DKK")
+        assert resolved.rate == Decimal("8.25")
+
+    def test_path_longer_than_max_legs_not_used(self, db: SQLiteDatabase):
+        """max_legs caps how many stored rates a conversion may chain."""
+        service = CurrencyServiceImpl(SQLiteExchangeRateRepository(db), max_legs=2)
+        self._add(service, "CHF", "SEK", "11")
+        self._add(service, "SEK", "NOK", "1.5")
+        self._add(service, "NOK", "DKK", "0.5")
+
+        assert service.resolve_rate("CHF", "NOK", date(2026, 1, 15)) is not None
+        assert service.resolve_rate("CHF", "DKK", date(2026, 1, 15)) is None
+
+    def test_legs_must_share_the_as_of_date(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """Each hop is subject to the same as-of date and staleness limit."""
+        self._add(currency_service, "GBP", "USD", "1.25", date(2026, 1, 14))
+        self._add(currency_service, "USD", "JPY", "150")
+
+        with pytest.raises(ExchangeRateNotFoundError):
+            currency_service.convert(
+                Money(Decimal("100"), "GBP"), "JPY", date(2026, 1, 15)
+            )
+
+    def test_misses_are_memoized(
+        self, db: SQLiteDatabase, currency_service: CurrencyServiceImpl
+    ):
+        """Repeated failing lookups do not query the repository again."""
+        self._add(currency_service, "GBP", "USD", "1.25")
+        amount = Money(Decimal("100"), "CHF")
+        assert currency_service.convert_many([amount], "USD", date(2026, 1, 15)) == [
+            None
+        ]
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            results = currency_service.convert_many(
+                [amount] * 50, "USD", date(2026, 1, 15)
+            )
+        finally:
+            conn.set_trace_callback(None)
+
+        assert results == [None] * 50
+        assert statements == []
+
+    def test_add_rate_clears_memoized_paths(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """A new rate can complete a path that previously failed."""
+        self._add(currency_service, "GBP", "USD", "1.25")
+        assert currency_service.resolve_rate("GBP", "JPY", date(2026, 1, 15)) is None
+
+        self._add(currency_service, "USD", "JPY", "150")
+
+        resolved = currency_service.resolve_rate("GBP", "JPY", date(2026, 1, 15))
+        assert resolved is not None
+        assert resolved.path == ("GBP", "USD", "JPY")
+
+    def test_memo_evicts_least_recently_used(self, db: SQLiteDatabase):
+        """The per-(pair, date) memo is bounded by memo_size."""
+        service = CurrencyServiceImpl(
+            SQLiteExchangeRateRepository(db), max_staleness=None, memo_size=2
+        )
+        self._add(service, "EUR", "USD", "1.10")
+        service.resolve_rate("EUR", "USD", date(2026, 1, 15))
+        service.resolve_rate("EUR", "USD", date(2026, 1, 16))
+        service.resolve_rate("EUR", "USD", date(2026, 1, 15))
+        service.resolve_rate("EUR", "USD", date(2026, 1, 17))
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            service.resolve_rate("EUR", "USD", date(2026, 1, 15))
+        finally:
+            conn.set_trace_callback(None)
+        assert statements == []
+        assert service.resolve_rate("EUR", "USD", date(2026, 1, 16)) is not None
+
+
+class TestCurrencyServiceConvertMany:
+    """Tests for convert_many method."""
+
+    def test_convert_many_with_per_amount_dates(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """Each amount is converted as of its own date; misses are None."""
+        for day, value in ((1, "0.90"), (2, "0.91")):
+            currency_service.add_rate(
+                ExchangeRate(
+                    from_currency="USD",
+                    to_currency="EUR",
+                    rate=Decimal(value),
+                    effective_date=date(2026, 1, day),
+                )
+            )
+
+        results = currency_service.convert_many(
+            [
+                Money(Decimal("100"), "USD"),
+                Money(Decimal("100"), "USD"),
+                Money(Decimal("5"), "EUR"),
+                Money(Decimal("100"), "GBP"),
+            ],
+            "EUR",
+            [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3), date(2026, 1, 1)],
+        )
+
+        assert results[0] == Money(Decimal("90"), "EUR")
+        assert results[1] == Money(Decimal("91"), "EUR")
+        assert results[2] == Money(Decimal("5"), "EUR")
+        assert results[3] is None
+
+    def test_convert_many_with_single_date(self, currency_service: CurrencyServiceImpl):
+        """A single date applies to every amount."""
+        currency_service.add_rate(
+            ExchangeRate(
+                from_currency="EUR",
+                to_currency="USD",
+                rate=Decimal("1.10"),
+                effective_date=date(2026, 1, 15),
+            )
+        )
+
+        results = currency_service.convert_many(
+            [Money(Decimal("10"), "EUR"), Money(Decimal("20"), "EUR")],
+            "USD",
+            date(2026, 1, 15),
+        )
+
+        assert [r.amount for r in results if r is not None] == [
+            Decimal("11.00"),
+            Decimal("22.00"),
+        ]
+
+    def test_convert_many_rejects_mismatched_dates(
+        self, currency_service: CurrencyServiceImpl
+    ):
+        """amounts and dates must line up."""
+        with pytest.raises(ValueError):
+            currency_service.convert_many(
+                [Money(Decimal("10"), "EUR")],
+                "USD",
+                [date(2026, 1, 1), date(2026, 1, 2)],
+            )
+
+
 class TestCurrencyServiceCalculateFxGainLoss:
     """Tests for calculate_fx_gain_loss method."""
 
@@ -329,6 +329,24 @@ class TestSQLiteExchangeRateRepository:
         rates = list(repo.list_by_date(date(2026, 1, 15)))
         assert rates == []
 
+    def test_list_currency_pairs(self, repo: SQLiteExchangeRateRepository):
+        """list_currency_pairs returns each stored pair once, sorted."""
+        for from_currency, to_currency, day in (
+            ("USD", "EUR", 14),
+            ("USD", "EUR", 15),
+            ("GBP", "USD", 15),
+        ):
+            repo.add(
+                ExchangeRate(
+                    from_currency=from_currency,
+                    to_currency=to_currency,
+                    rate=Decimal("1.1"),
+                    effective_date=date(2026, 1, day),
+                )
+            )
+
+        assert repo.list_currency_pairs() == [("GBP", "USD"), ("USD", "EUR")]
+
     def test_delete_rate(self, repo: SQLiteExchangeRateRepository):
         """Can delete an exchange rate."""
         rate = ExchangeRate(
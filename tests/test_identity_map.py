@@ -0,0 +1,184 @@
+"""Tests for the request-scoped identity map."""
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from family_office_ledger.domain.entities import Account, Entity, Position, Security
+from family_office_ledger.domain.value_objects import (
+    AccountType,
+    EntityType,
+    Money,
+    Quantity,
+)
+from family_office_ledger.repositories.identity_map import IdentityMap
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteDatabase,
+    SQLiteEntityRepository,
+    SQLitePositionRepository,
+    SQLiteSecurityRepository,
+    SQLiteTaxLotRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.services.reporting import ReportingServiceImpl
+
+
+@pytest.fixture
+def db() -> SQLiteDatabase:
+    database = SQLiteDatabase(":memory:")
+    database.initialize()
+    return database
+
+
+@pytest.fixture
+def identity_map() -> IdentityMap:
+    return IdentityMap()
+
+
+@pytest.fixture
+def entity(db: SQLiteDatabase) -> Entity:
+    entity = Entity(name="Smith Trust", entity_type=EntityType.TRUST)
+    SQLiteEntityRepository(db).add(entity)
+    return entity
+
+
+class TestIdentityMap:
+    def test_repeated_get_returns_same_instance(
+        self, db: SQLiteDatabase, identity_map: IdentityMap, entity: Entity
+    ):
+        repo = identity_map.entities(SQLiteEntityRepository(db))
+
+        first = repo.get(entity.id)
+        second = repo.get(entity.id)
+
+        assert first is not None
+        assert first is second
+        assert identity_map.stats.misses == 1
+        assert identity_map.stats.hits == 1
+        assert identity_map.stats.lookups == 2
+
+    def test_missing_ids_are_remembered(
+        self, db: SQLiteDatabase, identity_map: IdentityMap
+    ):
+        repo = identity_map.securities(SQLiteSecurityRepository(db))
+        missing = uuid4()
+
+        assert repo.get(missing) is None
+        assert repo.get(missing) is None
+        assert identity_map.stats.misses == 1
+        assert identity_map.stats.hits == 1
+
+    def test_list_results_share_instances_with_get(
+        self, db: SQLiteDatabase, identity_map: IdentityMap, entity: Entity
+    ):
+        repo = identity_map.accounts(SQLiteAccountRepository(db))
+        account = Account(
+            name="Cash", entity_id=entity.id, account_type=AccountType.ASSET
+        )
+        SQLiteAccountRepository(db).add(account)
+
+        loaded = repo.get(account.id)
+        listed = list(repo.list_by_entity(entity.id))
+        by_name = repo.get_by_name("Cash", entity.id)
+
+        assert listed[0] is loaded
+        assert by_name is loaded
+
+    def test_writes_update_the_map(
+        self, db: SQLiteDatabase, identity_map: IdentityMap, entity: Entity
+    ):
+        repo = identity_map.entities(SQLiteEntityRepository(db))
+        assert repo.get(entity.id) is not None
+
+        renamed = Entity(
+            name="Renamed Trust", entity_type=EntityType.TRUST, id=entity.id
+        )
+        repo.update(renamed)
+        assert repo.get(entity.id) is renamed
+
+        repo.delete(entity.id)
+        assert repo.get(entity.id) is None
+
+        added = Entity(name="Later LLC", entity_type=EntityType.LLC)
+        assert repo.get(added.id) is None
+        repo.add(added)
+        assert repo.get(added.id) is added
+
+    def test_maps_are_independent(self, db: SQLiteDatabase, entity: Entity):
+        first = IdentityMap().entities(SQLiteEntityRepository(db))
+        second = IdentityMap().entities(SQLiteEntityRepository(db))
+
+        assert first.get(entity.id) is not second.get(entity.id)
+
+
+class TestReportLookups:
+    def test_position_summary_queries_each_row_once(
+        self, db: SQLiteDatabase, identity_map: IdentityMap, entity: Entity
+    ):
+        account = Account(
+            name="Brokerage",
+            entity_id=entity.id,
+            account_type=AccountType.ASSET,
+        )
+        SQLiteAccountRepository(db).add(account)
+        security = Security(symbol="AAPL", name="Apple Inc.")
+        SQLiteSecurityRepository(db).add(security)
+        other = Security(symbol="MSFT", name="Microsoft Corp.")
+        SQLiteSecurityRepository(db).add(other)
+        position_repo = SQLitePositionRepository(db)
+        for held in (security, other):
+            position = Position(account_id=account.id, security_id=held.id)
+            position.update_from_lots(Quantity(Decimal("10")), Money(Decimal("100")))
+            position_repo.add(position)
+
+        service = ReportingServiceImpl(
+            entity_repo=identity_map.entities(SQLiteEntityRepository(db)),
+            account_repo=identity_map.accounts(SQLiteAccountRepository(db)),
+            transaction_repo=SQLiteTransactionRepository(db),
+            position_repo=position_repo,
+            tax_lot_repo=SQLiteTaxLotRepository(db),
+            security_repo=identity_map.securities(SQLiteSecurityRepository(db)),
+        )
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            report = service.position_summary_report(None, date(2024, 12, 31))
+            service.position_summary_report(None, date(2024, 12, 31))
+        finally:
+            conn.set_trace_callback(None)
+
+        lookups = [
+            s
+            for s in statements
+            if "FROM accounts WHERE id" in s or "FROM securities WHERE id" in s
+        ]
+        assert len(report["data"]) == 2
+        assert len(lookups) == 2
+        assert identity_map.stats.misses == 3
+        assert identity_map.stats.hits == 3
+
+    def test_get_many_serves_hits_and_loads_misses_together(
+        self, db: SQLiteDatabase, identity_map: IdentityMap
+    ):
+        inner = SQLiteSecurityRepository(db)
+        first = Security(symbol="AAPL", name="Apple Inc.")
+        second = Security(symbol="MSFT", name="Microsoft Corp.")
+        inner.add(first)
+        inner.add(second)
+        repo = identity_map.securities(inner)
+        cached = repo.get(first.id)
+        missing = uuid4()
+
+        found = repo.get_many([first.id, second.id, missing])
+
+        assert found[first.id] is cached
+        assert set(found) == {first.id, second.id}
+        assert repo.get(second.id) is found[second.id]
+        assert repo.get(missing) is None
+        assert identity_map.stats.misses == 3
+        assert identity_map.stats.hits == 3
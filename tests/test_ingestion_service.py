@@ -10,7 +10,8 @@ Tests cover:
 - Idempotency (re-import doesn't duplicate entities/accounts)
 """
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -1693,6 +1694,61 @@ class TestEdgeCases:
 # =============================================================================
 
 
+class TestUnitOfWork:
+    """ingest_file books a whole file inside one unit of work."""
+
+    def test_ingest_file_runs_inside_single_unit_of_work(
+        self,
+        entity_repo: MockEntityRepository,
+        account_repo: MockAccountRepository,
+        security_repo: MockSecurityRepository,
+        position_repo: MockPositionRepository,
+        tax_lot_repo: MockTaxLotRepository,
+        ledger_service: MockLedgerService,
+        lot_matching_service: MockLotMatchingService,
+        classifier: TransactionClassifier,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        events: list[str] = []
+
+        @contextmanager
+        def unit_of_work() -> Iterator[None]:
+            events.append("begin")
+            yield
+            events.append("commit")
+
+        original_post = ledger_service.post_transaction
+
+        def post_transaction(txn: Transaction) -> None:
+            events.append("post")
+            original_post(txn)
+
+        monkeypatch.setattr(ledger_service, "post_transaction", post_transaction)
+        monkeypatch.setattr(
+            "family_office_ledger.services.ingestion.BankParserFactory.parse",
+            lambda file_path: [
+                create_parsed_transaction(Decimal("10.00"), "INTEREST PAYMENT"),
+                create_parsed_transaction(Decimal("20.00"), "INTEREST PAYMENT"),
+            ],
+        )
+        service = IngestionService(
+            entity_repo=entity_repo,
+            account_repo=account_repo,
+            security_repo=security_repo,
+            position_repo=position_repo,
+            tax_lot_repo=tax_lot_repo,
+            ledger_service=ledger_service,
+            lot_matching_service=lot_matching_service,
+            transaction_classifier=classifier,
+            unit_of_work=unit_of_work,
+        )
+
+        result = service.ingest_file("statement.csv")
+
+        assert result.transaction_count == 2
+        assert events == ["begin", "post", "post", "commit"]
+
+
 class TestRealFileIntegration:
     """Integration tests with real bank statement files.
 
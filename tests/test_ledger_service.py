@@ -7,6 +7,7 @@ from uuid import uuid4
 import pytest
 
 from family_office_ledger.domain.entities import Account, Entity
+from family_office_ledger.domain.periods import PeriodClose, PeriodClosedError
 from family_office_ledger.domain.transactions import Entry, Transaction
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
@@ -18,10 +19,17 @@ from family_office_ledger.repositories.sqlite import (
     SQLiteAccountRepository,
     SQLiteDatabase,
     SQLiteEntityRepository,
+    SQLitePeriodCloseRepository,
     SQLiteTransactionRepository,
 )
+from family_office_ledger.repositories.sqlite_async import (
+    AsyncSQLiteAccountRepository,
+    AsyncSQLitePeriodCloseRepository,
+    AsyncSQLiteTransactionRepository,
+)
 from family_office_ledger.services.ledger import (
     AccountNotFoundError,
+    AsyncLedgerServiceImpl,
     LedgerServiceImpl,
     TransactionNotFoundError,
     UnbalancedTransactionError,
@@ -209,6 +217,176 @@ class TestValidateTransaction:
         ledger_service.validate_transaction(txn)
 
 
+# ===== validate_transactions Tests =====
+
+
+def _transfer(debit_account, credit_account, debit: str, credit: str) -> Transaction:
+    txn = Transaction(transaction_date=date(2024, 1, 15))
+    txn.add_entry(Entry(account_id=debit_account, debit_amount=Money(Decimal(debit))))
+    txn.add_entry(
+        Entry(account_id=credit_account, credit_amount=Money(Decimal(credit)))
+    )
+    return txn
+
+
+class TestValidateTransactions:
+    def test_valid_transactions_pass(
+        self, ledger_service: LedgerServiceImpl, test_accounts: dict[str, Account]
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+
+        ledger_service.validate_transactions(
+            [_transfer(cash, income, "100", "100"), _transfer(income, cash, "5", "5")]
+        )
+
+    def test_raises_first_failure_in_order(
+        self, ledger_service: LedgerServiceImpl, test_accounts: dict[str, Account]
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        unbalanced = _transfer(cash, income, "100", "50")
+        missing = uuid4()
+
+        with pytest.raises(UnbalancedTransactionError) as excinfo:
+            ledger_service.validate_transactions(
+                [unbalanced, _transfer(missing, income, "1", "1")]
+            )
+        assert excinfo.value.txn_id == unbalanced.id
+
+        with pytest.raises(AccountNotFoundError) as not_found:
+            ledger_service.validate_transactions(
+                [_transfer(missing, income, "1", "1"), unbalanced]
+            )
+        assert not_found.value.account_id == missing
+
+    def test_looks_up_accounts_once(
+        self,
+        ledger_service: LedgerServiceImpl,
+        account_repo: SQLiteAccountRepository,
+        test_accounts: dict[str, Account],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        calls: list[set] = []
+        get_many = account_repo.get_many
+        monkeypatch.setattr(
+            account_repo,
+            "get_many",
+            lambda ids: calls.append(set(ids)) or get_many(ids),
+        )
+
+        ledger_service.validate_transactions(
+            [_transfer(cash, income, "1", "1") for _ in range(50)]
+        )
+
+        assert calls == [{cash, income}]
+
+
+# ===== post_transactions Tests =====
+
+
+class TestPostTransactions:
+    def test_posts_every_valid_transaction(
+        self,
+        ledger_service: LedgerServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        txns = [
+            _transfer(cash, income, "100", "100"),
+            _transfer(income, cash, "5", "5"),
+        ]
+
+        results = ledger_service.post_transactions(txns)
+
+        assert [r.transaction_id for r in results] == [t.id for t in txns]
+        assert all(r.posted and r.error is None for r in results)
+        assert set(transaction_repo.get_many(t.id for t in txns)) == {
+            t.id for t in txns
+        }
+
+    def test_strict_batch_is_rejected_as_a_whole(
+        self,
+        ledger_service: LedgerServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        valid = _transfer(cash, income, "100", "100")
+        unbalanced = _transfer(cash, income, "100", "50")
+
+        results = ledger_service.post_transactions([valid, unbalanced])
+
+        assert [r.posted for r in results] == [False, False]
+        assert results[0].error is None
+        assert results[1].error is not None and "unbalanced" in results[1].error
+        assert transaction_repo.get(valid.id) is None
+
+    def test_lenient_batch_skips_invalid_transactions(
+        self,
+        ledger_service: LedgerServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        valid = _transfer(cash, income, "100", "100")
+        missing = uuid4()
+
+        results = ledger_service.post_transactions(
+            [valid, _transfer(missing, income, "1", "1")], strict=False
+        )
+
+        assert [r.posted for r in results] == [True, False]
+        assert results[1].error == f"Account not found: {missing}"
+        assert transaction_repo.get(valid.id) is not None
+        assert ledger_service.get_account_balance(cash) == Money(Decimal("100"))
+
+    def test_rejects_duplicate_transaction_ids(
+        self, ledger_service: LedgerServiceImpl, test_accounts: dict[str, Account]
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        posted = _transfer(cash, income, "1", "1")
+        ledger_service.post_transaction(posted)
+        fresh = _transfer(cash, income, "2", "2")
+
+        results = ledger_service.post_transactions([posted, fresh, fresh], strict=False)
+
+        assert [r.posted for r in results] == [False, True, False]
+        assert results[0].error == f"Duplicate transaction: {posted.id}"
+        assert results[2].error == f"Duplicate transaction: {fresh.id}"
+
+    def test_validates_with_one_lookup_and_writes_once(
+        self,
+        ledger_service: LedgerServiceImpl,
+        account_repo: SQLiteAccountRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        lookups: list[set] = []
+        writes: list[list] = []
+        get_many = account_repo.get_many
+        add_many = transaction_repo.add_many
+        monkeypatch.setattr(
+            account_repo,
+            "get_many",
+            lambda ids: lookups.append(set(ids)) or get_many(ids),
+        )
+        monkeypatch.setattr(
+            transaction_repo,
+            "add_many",
+            lambda txns: writes.append(list(txns)) or add_many(writes[-1]),
+        )
+
+        ledger_service.post_transactions(
+            [_transfer(cash, income, "1", "1") for _ in range(50)]
+        )
+
+        assert lookups == [{cash, income}]
+        assert [len(batch) for batch in writes] == [50]
+
+
 # ===== post_transaction Tests =====
 
 
@@ -1007,3 +1185,272 @@ class TestLedgerServiceIntegration:
             test_accounts["cash"].id, as_of_date=date(2024, 1, 25)
         )
         assert balance_jan25 == Money.zero()
+
+
+# ===== close_fiscal_year Tests =====
+
+
+def _dated(txn: Transaction, day: date) -> Transaction:
+    txn.transaction_date = day
+    return txn
+
+
+class TestCloseFiscalYear:
+    @pytest.fixture
+    def closing_service(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        account_repo: SQLiteAccountRepository,
+        entity_repo: SQLiteEntityRepository,
+    ) -> LedgerServiceImpl:
+        return LedgerServiceImpl(
+            transaction_repo=transaction_repo,
+            account_repo=account_repo,
+            entity_repo=entity_repo,
+            period_close_repo=SQLitePeriodCloseRepository(db),
+            unit_of_work=db.unit_of_work,
+        )
+
+    @pytest.fixture
+    def equity(
+        self, account_repo: SQLiteAccountRepository, test_accounts: dict[str, Account]
+    ) -> Account:
+        account = Account(
+            name="Retained Earnings",
+            entity_id=test_accounts["entity"].id,
+            account_type=AccountType.EQUITY,
+        )
+        account_repo.add(account)
+        return account
+
+    @pytest.fixture
+    def closed_2024(
+        self,
+        closing_service: LedgerServiceImpl,
+        test_accounts: dict[str, Account],
+        equity: Account,
+    ) -> PeriodClose:
+        cash, income, expense = (
+            test_accounts[k].id for k in ("cash", "income", "expense")
+        )
+        closing_service.post_transaction(
+            _dated(_transfer(cash, income, "1000.00", "1000.00"), date(2024, 3, 1))
+        )
+        closing_service.post_transaction(
+            _dated(_transfer(expense, cash, "300.00", "300.00"), date(2024, 9, 1))
+        )
+        return closing_service.close_fiscal_year(test_accounts["entity"].id, 2024)
+
+    def test_rolls_income_and_expense_into_equity(
+        self,
+        closing_service: LedgerServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+        equity: Account,
+        closed_2024: PeriodClose,
+    ):
+        assert closed_2024.period_end == date(2024, 12, 31)
+        closing = transaction_repo.get(closed_2024.closing_transaction_id)
+        assert closing is not None
+        assert closing.transaction_date == date(2024, 12, 31)
+        assert closing.is_balanced
+
+        balance = closing_service.get_account_balance
+        assert balance(test_accounts["income"].id) == Money(Decimal("0"))
+        assert balance(test_accounts["expense"].id) == Money(Decimal("0"))
+        assert balance(equity.id) == Money(Decimal("-700.00"))
+        assert balance(test_accounts["cash"].id) == Money(Decimal("700.00"))
+
+        frozen = {t.account_id: t.balance for t in closed_2024.balances}
+        assert frozen[test_accounts["cash"].id] == Decimal("700.00")
+        assert frozen[equity.id] == Decimal("-700.00")
+        assert closing_service.list_period_closes(test_accounts["entity"].id) == [
+            closed_2024
+        ]
+
+    def test_locks_the_closed_period(
+        self,
+        closing_service: LedgerServiceImpl,
+        test_accounts: dict[str, Account],
+        closed_2024: PeriodClose,
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        inside = _dated(_transfer(cash, income, "5.00", "5.00"), date(2024, 12, 31))
+        with pytest.raises(PeriodClosedError):
+            closing_service.post_transaction(inside)
+        (result,) = closing_service.post_transactions([inside])
+        assert not result.posted
+        assert "Period closed through 2024-12-31" in (result.error or "")
+
+        with pytest.raises(PeriodClosedError):
+            closing_service.reverse_transaction(
+                closed_2024.closing_transaction_id, date(2024, 12, 31), "undo"
+            )
+
+    def test_balances_continue_from_the_close(
+        self,
+        closing_service: LedgerServiceImpl,
+        test_accounts: dict[str, Account],
+        closed_2024: PeriodClose,
+    ):
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        later = _dated(_transfer(cash, income, "50.00", "50.00"), date(2025, 2, 1))
+        closing_service.post_transaction(later)
+        closing_service.reverse_transaction(later.id, date(2025, 3, 1), "undo")
+        closing_service.post_transaction(
+            _dated(_transfer(cash, income, "20.00", "20.00"), date(2025, 4, 1))
+        )
+
+        balance = closing_service.get_account_balance
+        assert balance(cash, date(2024, 6, 30)) == Money(Decimal("1000.00"))
+        assert balance(cash, date(2025, 2, 28)) == Money(Decimal("750.00"))
+        assert balance(cash) == Money(Decimal("720.00"))
+        assert balance(income) == Money(Decimal("-20.00"))
+
+    def test_rejects_closing_a_closed_year_again(
+        self,
+        closing_service: LedgerServiceImpl,
+        test_accounts: dict[str, Account],
+        closed_2024: PeriodClose,
+    ):
+        entity_id = test_accounts["entity"].id
+        with pytest.raises(PeriodClosedError):
+            closing_service.close_fiscal_year(entity_id, 2024)
+        with pytest.raises(PeriodClosedError):
+            closing_service.close_fiscal_year(entity_id, 2023)
+        assert closing_service.close_fiscal_year(entity_id, 2025).period_end == date(
+            2025, 12, 31
+        )
+
+    def test_requires_an_equity_account(
+        self, closing_service: LedgerServiceImpl, test_accounts: dict[str, Account]
+    ):
+        with pytest.raises(ValueError, match="No equity account"):
+            closing_service.close_fiscal_year(test_accounts["entity"].id, 2024)
+        with pytest.raises(ValueError, match="Entity not found"):
+            closing_service.close_fiscal_year(uuid4(), 2024)
+
+    def test_uses_the_entity_fiscal_year_end(
+        self,
+        closing_service: LedgerServiceImpl,
+        entity_repo: SQLiteEntityRepository,
+        account_repo: SQLiteAccountRepository,
+    ):
+        entity = Entity(
+            name="Leap Year Co",
+            entity_type=EntityType.LLC,
+            fiscal_year_end=date(2024, 2, 29),
+        )
+        entity_repo.add(entity)
+        account_repo.add(
+            Account(name="Equity", entity_id=entity.id, account_type=AccountType.EQUITY)
+        )
+
+        period_close = closing_service.close_fiscal_year(entity.id, 2023)
+
+        assert period_close.period_end == date(2023, 2, 28)
+        assert period_close.closing_transaction_id is None
+
+
+# ===== AsyncLedgerServiceImpl Tests =====
+
+
+class TestAsyncLedgerService:
+    @pytest.fixture
+    def async_ledger_service(self, db: SQLiteDatabase) -> AsyncLedgerServiceImpl:
+        async_db = db.async_database()
+        return AsyncLedgerServiceImpl(
+            transaction_repo=AsyncSQLiteTransactionRepository(async_db),
+            account_repo=AsyncSQLiteAccountRepository(async_db),
+        )
+
+    def _deposit(self, test_accounts: dict[str, Account], amount: str) -> Transaction:
+        txn = Transaction(transaction_date=date(2024, 1, 15))
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["cash"].id,
+                debit_amount=Money(Decimal(amount)),
+            )
+        )
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["income"].id,
+                credit_amount=Money(Decimal(amount)),
+            )
+        )
+        return txn
+
+    async def test_post_transaction_updates_balances(
+        self,
+        async_ledger_service: AsyncLedgerServiceImpl,
+        ledger_service: LedgerServiceImpl,
+        test_accounts: dict[str, Account],
+    ):
+        await async_ledger_service.post_transaction(
+            self._deposit(test_accounts, "250.00")
+        )
+
+        cash_id = test_accounts["cash"].id
+        entity_id = test_accounts["entity"].id
+        assert await async_ledger_service.get_account_balance(cash_id) == Money(
+            Decimal("250.00")
+        )
+        assert await async_ledger_service.get_entity_balance(
+            entity_id
+        ) == ledger_service.get_entity_balance(entity_id)
+
+    async def test_post_transaction_rejects_invalid_transactions(
+        self,
+        async_ledger_service: AsyncLedgerServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+    ):
+        unbalanced = self._deposit(test_accounts, "100.00")
+        unbalanced.entries[1].credit_amount = Money(Decimal("90.00"))
+        unknown = self._deposit(test_accounts, "100.00")
+        unknown.entries[0].account_id = uuid4()
+
+        with pytest.raises(UnbalancedTransactionError):
+            await async_ledger_service.post_transaction(unbalanced)
+        with pytest.raises(AccountNotFoundError):
+            await async_ledger_service.post_transaction(unknown)
+        with pytest.raises(AccountNotFoundError):
+            await async_ledger_service.get_account_balance(uuid4())
+        assert list(transaction_repo.list_by_date_range(date.min, date.max)) == []
+
+    async def test_post_transaction_respects_closed_periods(
+        self,
+        db: SQLiteDatabase,
+        ledger_service: LedgerServiceImpl,
+        account_repo: SQLiteAccountRepository,
+        test_accounts: dict[str, Account],
+    ):
+        account_repo.add(
+            Account(
+                name="Equity",
+                entity_id=test_accounts["entity"].id,
+                account_type=AccountType.EQUITY,
+            )
+        )
+        LedgerServiceImpl(
+            transaction_repo=SQLiteTransactionRepository(db),
+            account_repo=account_repo,
+            entity_repo=SQLiteEntityRepository(db),
+            period_close_repo=SQLitePeriodCloseRepository(db),
+        ).close_fiscal_year(test_accounts["entity"].id, 2024)
+        async_db = db.async_database()
+        service = AsyncLedgerServiceImpl(
+            transaction_repo=AsyncSQLiteTransactionRepository(async_db),
+            account_repo=AsyncSQLiteAccountRepository(async_db),
+            period_close_repo=AsyncSQLitePeriodCloseRepository(async_db),
+        )
+
+        with pytest.raises(PeriodClosedError):
+            await service.post_transaction(self._deposit(test_accounts, "10.00"))
+        await service.post_transaction(
+            _dated(self._deposit(test_accounts, "10.00"), date(2025, 1, 1))
+        )
+        assert ledger_service.get_account_balance(test_accounts["cash"].id) == Money(
+            Decimal("10.00")
+        )
@@ -608,3 +608,79 @@ class TestBackwardCompatibility:
 
         assert report["totals"]["total_assets"] == Decimal("1000.00")
         assert report["base_currency"] == "USD"
+
+
+class TestReportRateLookups:
+    def test_reports_load_each_rate_series_once(
+        self,
+        db: SQLiteDatabase,
+        reporting_service_with_currency: ReportingServiceImpl,
+        test_entity: Entity,
+        account_repo: SQLiteAccountRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        exchange_rate_repo: SQLiteExchangeRateRepository,
+    ):
+        eur_income = Account(
+            name="EUR Income",
+            entity_id=test_entity.id,
+            account_type=AccountType.INCOME,
+            currency="EUR",
+        )
+        account_repo.add(eur_income)
+        for effective_date, rate in (
+            (date(2024, 1, 1), "1.10"),
+            (date(2024, 12, 31), "1.15"),
+        ):
+            exchange_rate_repo.add(
+                ExchangeRate(
+                    from_currency="EUR",
+                    to_currency="USD",
+                    rate=Decimal(rate),
+                    effective_date=effective_date,
+                )
+            )
+        for i in range(10):
+            account = Account(
+                name=f"EUR Cash {i}",
+                entity_id=test_entity.id,
+                account_type=AccountType.ASSET,
+                currency="EUR",
+            )
+            account_repo.add(account)
+            txn = Transaction(transaction_date=date(2024, 1, 1), memo="EUR Deposit")
+            txn.add_entry(
+                Entry(
+                    account_id=account.id,
+                    debit_amount=Money(Decimal("100.00"), "EUR"),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=eur_income.id,
+                    credit_amount=Money(Decimal("100.00"), "EUR"),
+                )
+            )
+            transaction_repo.add(txn)
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            net_worth = reporting_service_with_currency.net_worth_report(
+                entity_ids=[test_entity.id],
+                as_of_date=date(2024, 12, 31),
+                base_currency="USD",
+            )
+            fx = reporting_service_with_currency.fx_gains_losses_report(
+                entity_ids=[test_entity.id],
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 12, 31),
+                base_currency="USD",
+            )
+        finally:
+            conn.set_trace_callback(None)
+
+        assert net_worth["totals"]["total_assets"] == Decimal("1150.00")
+        assert fx["totals"]["total_fx_gain_loss"] == Decimal("50.00")
+        # The stored pairs, then the EUR/USD series; USD/EUR is known absent.
+        assert sum("FROM exchange_rates" in s for s in statements) == 2
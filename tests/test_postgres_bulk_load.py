@@ -0,0 +1,62 @@
+"""Tests for the COPY payload rendering of the PostgreSQL bulk loader.
+
+Loading itself needs a server and is covered in test_repositories_postgres;
+these tests check the text-format rows handed to ``copy_expert``.
+"""
+
+from decimal import Decimal
+
+from family_office_ledger.domain.value_objects import Currency
+from family_office_ledger.repositories.postgres import _copy_field, _CopyStream
+
+
+class TestCopyField:
+    def test_null_and_booleans(self):
+        assert _copy_field(None) == "\\N"
+        assert _copy_field(True) == "t"
+        assert _copy_field(False) == "f"
+
+    def test_enum_renders_value(self):
+        assert _copy_field(Currency.EUR) == "EUR"
+
+    def test_special_characters_escaped(self):
+        assert _copy_field("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+
+    def test_numbers_and_literal_null_marker(self):
+        assert _copy_field(Decimal("1.50")) == "1.50"
+        assert _copy_field(0) == "0"
+        assert _copy_field("\\N") == "\\\\N"
+
+
+class TestCopyStream:
+    rows = [("1", None, True), ("2", "x\ty", False), ("3", "", Currency.USD)]
+    expected = "1\t\\N\tt\n2\tx\\ty\tf\n3\t\tUSD\n"
+
+    def test_read_all(self):
+        stream = _CopyStream(self.rows)
+
+        assert stream.read() == self.expected
+        assert stream.read() == ""
+        assert stream.row_count == 3
+
+    def test_read_in_chunks_matches_read_all(self):
+        stream = _CopyStream(iter(self.rows))
+        chunks = []
+        while chunk := stream.read(5):
+            assert len(chunk) <= 5
+            chunks.append(chunk)
+
+        assert "".join(chunks) == self.expected
+
+    def test_rows_rendered_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield (str(i),)
+
+        stream = _CopyStream(rows())
+        stream.read(8)
+
+        assert len(consumed) < 10
@@ -0,0 +1,219 @@
+"""Tests for the PostgreSQL connection pool.
+
+The pool only needs a connection factory, so these tests drive it with
+in-process stand-ins for psycopg2 connections and run without a server.
+"""
+
+import threading
+import time
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from family_office_ledger.repositories.postgres import PostgresConnectionPool
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection") -> None:
+        self._conn = conn
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def execute(self, query: str) -> None:
+        if self._conn.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        self._conn.pings += 1
+        self._conn.status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = 0
+        self.broken = False
+        self.pings = 0
+        self.rollbacks = 0
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def get_transaction_status(self) -> int:
+        return self.status
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class FakeConnect:
+    def __init__(self) -> None:
+        self.opened: list[FakeConnection] = []
+
+    def __call__(self) -> FakeConnection:
+        conn = FakeConnection()
+        self.opened.append(conn)
+        return conn
+
+
+@pytest.fixture
+def connect() -> FakeConnect:
+    return FakeConnect()
+
+
+class TestPostgresConnectionPool:
+    def test_first_checkout_opens_min_size(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=3, max_size=5)
+
+        conn = pool.checkout()
+
+        assert len(connect.opened) == 3
+        assert pool.size == 3
+        assert pool.idle_count == 2
+        pool.checkin(conn)
+        assert pool.idle_count == 3
+
+    def test_checkin_reuses_connection(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert len(connect.opened) == 1
+
+    def test_checkin_rolls_back_open_transaction(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1)
+
+        with pool.connection() as conn:
+            conn.status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+        assert conn.rollbacks == 1
+        assert pool.checkout() is conn
+
+    def test_checkout_times_out_when_exhausted(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1, timeout=0.05)
+        held = pool.checkout()
+
+        with pytest.raises(TimeoutError):
+            pool.checkout()
+
+        pool.checkin(held)
+        assert pool.checkout() is held
+
+    def test_waiting_checkout_gets_returned_connection(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1, timeout=5)
+        held = pool.checkout()
+        received: list[FakeConnection] = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.checkout()))
+        waiter.start()
+        time.sleep(0.05)
+        pool.checkin(held)
+        waiter.join(timeout=5)
+
+        assert received == [held]
+        assert len(connect.opened) == 1
+
+    def test_broken_connection_replaced_on_checkout(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(
+            connect, min_size=0, max_size=1, health_check_interval=0
+        )
+        with pool.connection() as first:
+            pass
+        first.broken = True
+
+        with pool.connection() as second:
+            pass
+
+        assert second is not first
+        assert first.closed
+        assert len(connect.opened) == 2
+        assert pool.size == 1
+
+    def test_health_check_leaves_no_open_transaction(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(
+            connect, min_size=0, max_size=1, health_check_interval=0
+        )
+        with pool.connection():
+            pass
+
+        with pool.connection() as conn:
+            assert conn.pings == 1
+            assert conn.status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def test_recently_used_connection_not_pinged(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1)
+        with pool.connection() as conn:
+            pass
+
+        with pool.connection():
+            pass
+
+        assert conn.pings == 0
+
+    def test_closed_connection_frees_its_slot(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1, timeout=0.05)
+        conn = pool.checkout()
+        conn.close()
+
+        pool.checkin(conn)
+
+        assert pool.size == 0
+        assert pool.checkout() is not conn
+
+    def test_idle_connections_above_min_size_are_trimmed(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=1, max_size=3, max_idle=0)
+        held = [pool.checkout() for _ in range(3)]
+        for conn in held:
+            pool.checkin(conn)
+
+        pool.checkin(pool.checkout())
+
+        assert pool.size == 1
+        assert sum(1 for conn in held if conn.closed) == 2
+
+    def test_close_rejects_checkout_and_closes_idle(self, connect: FakeConnect):
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=2)
+        idle = pool.checkout()
+        busy = pool.checkout()
+        pool.checkin(idle)
+
+        pool.close()
+
+        assert idle.closed
+        with pytest.raises(RuntimeError):
+            pool.checkout()
+        pool.checkin(busy)
+        assert busy.closed
+        assert pool.size == 0
+
+    def test_failed_connect_releases_slot(self):
+        attempts = 0
+
+        def connect() -> FakeConnection:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise psycopg2.OperationalError("could not connect")
+            return FakeConnection()
+
+        pool = PostgresConnectionPool(connect, min_size=0, max_size=1, timeout=0.05)
+
+        with pytest.raises(psycopg2.OperationalError):
+            pool.checkout()
+        assert pool.size == 0
+        assert isinstance(pool.checkout(), FakeConnection)
+
+    def test_invalid_sizes_rejected(self, connect: FakeConnect):
+        with pytest.raises(ValueError):
+            PostgresConnectionPool(connect, min_size=3, max_size=2)
@@ -312,6 +312,51 @@ class TestListMatches:
         assert data["limit"] == 1
         assert data["offset"] == 1
 
+    def test_list_matches_follows_cursor(
+        self, test_client: Client, test_account_id: str, sample_csv_file: str
+    ) -> None:
+        """next_cursor pages through every match exactly once."""
+        create_response = test_client.post(
+            "/reconciliation/sessions",
+            json={
+                "account_id": test_account_id,
+                "file_path": sample_csv_file,
+                "file_format": "csv",
+            },
+        )
+        session_id = create_response.json()["id"]
+        url = f"/reconciliation/sessions/{session_id}/matches?limit=2"
+
+        first = test_client.get(url).json()
+        second = test_client.get(f"{url}&cursor={first['next_cursor']}").json()
+
+        assert len(first["matches"]) == 2
+        assert first["next_cursor"] is not None
+        assert len(second["matches"]) == 1
+        assert second["next_cursor"] is None
+        seen = {m["id"] for m in first["matches"] + second["matches"]}
+        assert len(seen) == 3
+
+    def test_list_matches_invalid_cursor_returns_400(
+        self, test_client: Client, test_account_id: str, sample_csv_file: str
+    ) -> None:
+        """A malformed cursor is rejected."""
+        create_response = test_client.post(
+            "/reconciliation/sessions",
+            json={
+                "account_id": test_account_id,
+                "file_path": sample_csv_file,
+                "file_format": "csv",
+            },
+        )
+        session_id = create_response.json()["id"]
+
+        response = test_client.get(
+            f"/reconciliation/sessions/{session_id}/matches?cursor=not-a-cursor"
+        )
+
+        assert response.status_code == 400
+
     def test_list_matches_filter_by_status(
         self,
         test_client: Client,
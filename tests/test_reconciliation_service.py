@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from family_office_ledger.domain.entities import Account, Entity
+from family_office_ledger.domain.periods import PeriodClose, PeriodClosedError
 from family_office_ledger.domain.transactions import Entry, Transaction
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
@@ -18,6 +19,7 @@ from family_office_ledger.repositories.sqlite import (
     SQLiteAccountRepository,
     SQLiteDatabase,
     SQLiteEntityRepository,
+    SQLitePeriodCloseRepository,
     SQLiteTransactionRepository,
 )
 from family_office_ledger.services.interfaces import ReconciliationSummary
@@ -552,6 +554,35 @@ class TestCreateFromImport:
         assert retrieved.memo == "TRANSFER"
         assert retrieved.reference == "IMP_NEW_003"
 
+    def test_create_transaction_in_closed_period_rejected(
+        self,
+        db: SQLiteDatabase,
+        reconciliation_service: ReconciliationServiceImpl,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict[str, Account],
+        test_entity: Entity,
+    ) -> None:
+        """Imports cannot post into a closed fiscal period."""
+        SQLitePeriodCloseRepository(db).add(
+            PeriodClose(entity_id=test_entity.id, period_end=date(2024, 12, 31))
+        )
+        imported = {
+            "import_id": "IMP_CLOSED",
+            "date": date(2024, 12, 15),
+            "amount": Decimal("250.00"),
+            "description": "LATE DEPOSIT",
+        }
+
+        with pytest.raises(PeriodClosedError):
+            reconciliation_service.create_from_import(
+                imported_transaction=imported,
+                account_id=test_accounts["checking"].id,
+            )
+
+        assert (
+            list(transaction_repo.list_by_account(test_accounts["checking"].id)) == []
+        )
+
 
 # ===== get_reconciliation_summary Tests =====
 
@@ -340,3 +340,82 @@ class TestReconciliationSessionProperties:
         assert session.confirmed_count == 0
         assert session.rejected_count == 0
         assert session.skipped_count == 0
+
+
+class TestReconciliationSessionChangeTracking:
+    """Tests for dirty tracking used by delta persistence."""
+
+    def _session(self, count: int = 3) -> ReconciliationSession:
+        session = ReconciliationSession(
+            account_id=uuid4(),
+            file_name="test.csv",
+            file_format="csv",
+        )
+        for i in range(count):
+            session.matches.append(
+                ReconciliationMatch(
+                    session_id=session.id,
+                    imported_id=f"txn_{i:03d}",
+                    imported_date=date(2026, 1, 15),
+                    imported_amount=Decimal("100.00"),
+                )
+            )
+        return session
+
+    def test_new_match_is_clean(self):
+        """A freshly constructed match has no pending changes."""
+        match = self._session(1).matches[0]
+
+        assert not match.is_dirty
+
+    def test_field_assignment_marks_match_dirty(self):
+        """Changing a field marks the match dirty until marked clean."""
+        match = self._session(1).matches[0]
+
+        match.status = ReconciliationMatchStatus.CONFIRMED
+        assert match.is_dirty
+
+        match.mark_clean()
+        assert not match.is_dirty
+
+    def test_unpersisted_session_reports_all_matches_added(self):
+        """Every match is new before the session is persisted."""
+        session = self._session()
+
+        changes = session.match_changes()
+
+        assert not session.is_persisted
+        assert len(changes.added) == 3
+        assert changes.changed == []
+        assert changes.removed_ids == []
+
+    def test_match_changes_since_mark_clean(self):
+        """Changes are diffed against the state recorded by mark_clean."""
+        session = self._session()
+        session.mark_clean()
+        removed = session.matches.pop(0)
+        session.matches[0].status = ReconciliationMatchStatus.REJECTED
+        added = ReconciliationMatch(
+            session_id=session.id,
+            imported_id="txn_new",
+            imported_date=date(2026, 1, 16),
+            imported_amount=Decimal("5.00"),
+        )
+        session.matches.append(added)
+
+        changes = session.match_changes()
+
+        assert changes.added == [added]
+        assert changes.changed == [session.matches[0]]
+        assert changes.removed_ids == [removed.id]
+        assert not session.is_dirty
+
+    def test_session_field_assignment_marks_session_dirty(self):
+        """Changing a session field marks only the session dirty."""
+        session = self._session()
+        session.mark_clean()
+
+        session.status = ReconciliationSessionStatus.COMPLETED
+
+        assert session.is_dirty
+        assert session.match_changes().changed == []
@@ -107,6 +107,38 @@ class TestSQLiteReconciliationSessionRepository:
         assert retrieved_match1.suggested_ledger_txn_id == ledger_txn_id
         assert retrieved_match1.confidence_score == 85
 
+    def test_add_many_sessions_with_matches(
+        self, repo: SQLiteReconciliationSessionRepository
+    ):
+        """add_many stores every session and its matches."""
+        sessions = []
+        for index in range(3):
+            session = ReconciliationSession(
+                account_id=uuid4(),
+                file_name=f"statement_{index}.csv",
+                file_format="csv",
+            )
+            session.matches = [
+                ReconciliationMatch(
+                    session_id=session.id,
+                    imported_id=f"txn_{index}_{n}",
+                    imported_date=date(2026, 1, 15),
+                    imported_amount=Decimal("10.00") * (n + 1),
+                )
+                for n in range(index)
+            ]
+            sessions.append(session)
+
+        repo.add_many(sessions)
+
+        for session in sessions:
+            retrieved = repo.get(session.id)
+            assert retrieved is not None
+            assert retrieved.file_name == session.file_name
+            assert [m.imported_id for m in retrieved.matches] == [
+                m.imported_id for m in session.matches
+            ]
+
     def test_get_pending_for_account(self, repo: SQLiteReconciliationSessionRepository):
         """Can get the pending session for an account."""
         account_id = uuid4()
@@ -397,3 +429,221 @@ class TestSQLiteReconciliationSessionRepository:
         # Should be ordered by created_at ASC
         imported_ids = [m.imported_id for m in retrieved.matches]
         assert imported_ids == ["txn_001", "txn_002", "txn_003"]
+
+
+class TestReconciliationSessionDeltaWrites:
+    """update() and the match-level paths write only the rows that changed."""
+
+    @pytest.fixture
+    def stored(
+        self, repo: SQLiteReconciliationSessionRepository
+    ) -> ReconciliationSession:
+        session = ReconciliationSession(
+            account_id=uuid4(),
+            file_name="test.csv",
+            file_format="csv",
+        )
+        for i in range(50):
+            session.matches.append(
+                ReconciliationMatch(
+                    session_id=session.id,
+                    imported_id=f"txn_{i:03d}",
+                    imported_date=date(2026, 1, 15),
+                    imported_amount=Decimal("100.00"),
+                )
+            )
+        repo.add(session)
+        loaded = repo.get(session.id)
+        assert loaded is not None
+        return loaded
+
+    def _writes(self, db: SQLiteDatabase, action) -> list[str]:
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            action()
+        finally:
+            conn.set_trace_callback(None)
+        return [
+            s
+            for s in statements
+            if s.lstrip().split(None, 1)[0] in ("INSERT", "UPDATE", "DELETE")
+        ]
+
+    def test_update_writes_only_changed_match(
+        self,
+        db: SQLiteDatabase,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        stored.matches[7].status = ReconciliationMatchStatus.CONFIRMED
+
+        writes = self._writes(db, lambda: repo.update(stored))
+
+        assert len(writes) == 1
+        assert "UPDATE reconciliation_matches" in writes[0]
+        retrieved = repo.get(stored.id)
+        assert retrieved is not None
+        assert retrieved.matches[7].status == ReconciliationMatchStatus.CONFIRMED
+        assert retrieved.pending_count == 49
+
+    def test_unchanged_session_writes_nothing(
+        self,
+        db: SQLiteDatabase,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        assert self._writes(db, lambda: repo.update(stored)) == []
+
+    def test_update_inserts_and_deletes_matches(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        removed = stored.matches.pop(0)
+        stored.matches.append(
+            ReconciliationMatch(
+                session_id=stored.id,
+                imported_id="txn_new",
+                imported_date=date(2026, 1, 16),
+                imported_amount=Decimal("5.00"),
+            )
+        )
+        repo.update(stored)
+
+        retrieved = repo.get(stored.id)
+        assert retrieved is not None
+        ids = {m.imported_id for m in retrieved.matches}
+        assert removed.imported_id not in ids
+        assert "txn_new" in ids
+        assert len(ids) == 50
+
+    def test_update_matches_writes_one_row_per_match(
+        self,
+        db: SQLiteDatabase,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        match = stored.matches[3]
+        match.status = ReconciliationMatchStatus.SKIPPED
+
+        writes = self._writes(db, lambda: repo.update_matches([match]))
+
+        assert len(writes) == 1
+        assert not match.is_dirty
+        retrieved = repo.get(stored.id)
+        assert retrieved is not None
+        assert retrieved.skipped_count == 1
+
+    def test_update_match_status(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        actioned_at = datetime(2026, 1, 20, 9, 0, tzinfo=UTC)
+
+        repo.update_match_status(
+            stored.id,
+            stored.matches[0].id,
+            ReconciliationMatchStatus.REJECTED,
+            actioned_at,
+        )
+
+        retrieved = repo.get(stored.id)
+        assert retrieved is not None
+        assert retrieved.matches[0].status == ReconciliationMatchStatus.REJECTED
+        assert retrieved.matches[0].actioned_at == actioned_at
+        assert retrieved.rejected_count == 1
+
+
+class TestReconciliationMatchQueries:
+    """Match-level reads page and count without loading the session."""
+
+    @pytest.fixture
+    def stored(
+        self, repo: SQLiteReconciliationSessionRepository
+    ) -> ReconciliationSession:
+        session = ReconciliationSession(
+            account_id=uuid4(),
+            file_name="test.csv",
+            file_format="csv",
+        )
+        for i in range(10):
+            match = ReconciliationMatch(
+                session_id=session.id,
+                imported_id=f"txn_{i:03d}",
+                imported_date=date(2026, 1, 15),
+                imported_amount=Decimal("100.00"),
+                status=ReconciliationMatchStatus.CONFIRMED
+                if i % 3 == 0
+                else ReconciliationMatchStatus.PENDING,
+            )
+            object.__setattr__(
+                match, "created_at", datetime(2026, 1, 15, 10, i, tzinfo=UTC)
+            )
+            session.matches.append(match)
+        repo.add(session)
+        return session
+
+    def test_count_matches_groups_by_status(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        counts = repo.count_matches(stored.id)
+
+        assert counts[ReconciliationMatchStatus.CONFIRMED] == 4
+        assert counts[ReconciliationMatchStatus.PENDING] == 6
+        assert counts[ReconciliationMatchStatus.SKIPPED] == 0
+
+    def test_list_matches_filters_and_pages(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        pending = repo.list_matches(
+            stored.id, ReconciliationMatchStatus.PENDING, limit=4, offset=1
+        )
+
+        assert [m.imported_id for m in pending] == [
+            "txn_002",
+            "txn_004",
+            "txn_005",
+            "txn_007",
+        ]
+
+    def test_list_matches_seeks_past_cursor(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        seen: list[str] = []
+        after = None
+        while page := repo.list_matches(stored.id, limit=3, after=after):
+            seen.extend(m.imported_id for m in page)
+            after = (page[-1].created_at, page[-1].id)
+
+        assert seen == [m.imported_id for m in stored.matches]
+
+    def test_get_match_and_session_without_matches(
+        self,
+        repo: SQLiteReconciliationSessionRepository,
+        stored: ReconciliationSession,
+    ):
+        match = repo.get_match(stored.id, stored.matches[4].id)
+        header = repo.get_without_matches(stored.id)
+
+        assert match is not None
+        assert match.imported_id == "txn_004"
+        assert not match.is_dirty
+        assert repo.get_match(uuid4(), stored.matches[4].id) is None
+        assert header is not None
+        assert header.matches == []
+
+        header.status = ReconciliationSessionStatus.ABANDONED
+        repo.update(header)
+        retrieved = repo.get(stored.id)
+        assert retrieved is not None
+        assert retrieved.status == ReconciliationSessionStatus.ABANDONED
+        assert len(retrieved.matches) == 10
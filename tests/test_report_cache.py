@@ -0,0 +1,157 @@
+"""Tests for the version-keyed report cache."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from family_office_ledger.services.report_cache import ReportCache
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> dict[str, int]:
+        self.calls += 1
+        return {"call": self.calls}
+
+
+class TestReportCache:
+    def test_same_version_is_a_hit(self):
+        cache = ReportCache()
+        compute = Counter()
+
+        first = cache.get_or_compute(
+            "net_worth", {"as_of": date(2024, 1, 1)}, 1, compute
+        )
+        second = cache.get_or_compute(
+            "net_worth", {"as_of": date(2024, 1, 1)}, 1, compute
+        )
+
+        assert first is second
+        assert compute.calls == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.lookups == 2
+
+    def test_new_version_recomputes_and_replaces(self):
+        cache = ReportCache()
+        compute = Counter()
+
+        cache.get_or_compute("net_worth", {}, 1, compute)
+        result = cache.get_or_compute("net_worth", {}, 2, compute)
+
+        assert result == {"call": 2}
+        assert len(cache) == 1
+        assert cache.get_or_compute("net_worth", {}, 2, compute) == {"call": 2}
+
+    def test_key_is_independent_of_parameter_order(self):
+        cache = ReportCache()
+        compute = Counter()
+        entity_id = uuid4()
+
+        cache.get_or_compute("summary", {"a": 1, "ids": [entity_id]}, 1, compute)
+        cache.get_or_compute("summary", {"ids": [entity_id], "a": 1}, 1, compute)
+        cache.get_or_compute("summary", {"a": 2, "ids": [entity_id]}, 1, compute)
+        cache.get_or_compute("other", {"a": 1, "ids": [entity_id]}, 1, compute)
+
+        assert compute.calls == 3
+
+    def test_bypass_recomputes_and_refreshes_the_entry(self):
+        cache = ReportCache()
+        compute = Counter()
+
+        cache.get_or_compute("net_worth", {}, 1, compute)
+        bypassed = cache.get_or_compute("net_worth", {}, 1, compute, bypass=True)
+
+        assert bypassed == {"call": 2}
+        assert cache.get_or_compute("net_worth", {}, 1, compute) == {"call": 2}
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_older_version_does_not_replace_newer_entry(self):
+        cache = ReportCache()
+
+        cache.get_or_compute("net_worth", {}, 5, lambda: "new")
+        cache.get_or_compute("net_worth", {}, 4, lambda: "old")
+
+        assert cache.get_or_compute("net_worth", {}, 5, lambda: "miss") == "new"
+
+    def test_evicts_least_recently_used(self):
+        cache = ReportCache(max_entries=2)
+
+        cache.get_or_compute("a", {}, 1, lambda: "a")
+        cache.get_or_compute("b", {}, 1, lambda: "b")
+        cache.get_or_compute("a", {}, 1, lambda: "miss")
+        cache.get_or_compute("c", {}, 1, lambda: "c")
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        assert cache.get_or_compute("a", {}, 1, lambda: "miss") == "a"
+        assert cache.get_or_compute("b", {}, 1, lambda: "recomputed") == "recomputed"
+
+    def test_rejects_empty_cache(self):
+        with pytest.raises(ValueError):
+            ReportCache(max_entries=0)
+
+    def test_clear(self):
+        cache = ReportCache()
+        cache.get_or_compute("a", {}, 1, lambda: "a")
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    async def test_get_or_compute_async(self):
+        cache = ReportCache()
+        calls = []
+
+        async def compute() -> str:
+            calls.append(1)
+            return "report"
+
+        assert await cache.get_or_compute_async("a", {}, 1, compute) == "report"
+        assert await cache.get_or_compute_async("a", {}, 1, compute) == "report"
+        assert len(calls) == 1
+
+
+class TestReportCachePersistence:
+    def test_save_and_reload(self, tmp_path):
+        path = tmp_path / "cache" / "reports.pickle"
+        params = {"as_of": date(2024, 1, 1)}
+        cache = ReportCache(path=path)
+        cache.get_or_compute("net_worth", params, 3, lambda: 42)
+        cache.save()
+
+        reloaded = ReportCache(path=path)
+
+        assert len(reloaded) == 1
+        assert reloaded.get_or_compute("net_worth", params, 3, lambda: 0) == 42
+        assert reloaded.get_or_compute("net_worth", params, 4, lambda: 0) == 0
+
+    def test_reload_keeps_most_recently_used(self, tmp_path):
+        path = tmp_path / "reports.pickle"
+        cache = ReportCache(max_entries=3, path=path)
+        cache.get_or_compute("a", {}, 1, lambda: "a")
+        cache.get_or_compute("b", {}, 1, lambda: "b")
+        cache.get_or_compute("c", {}, 1, lambda: "c")
+        cache.save()
+
+        reloaded = ReportCache(max_entries=2, path=path)
+
+        assert reloaded.get_or_compute("c", {}, 1, lambda: "miss") == "c"
+        assert reloaded.get_or_compute("b", {}, 1, lambda: "miss") == "b"
+        assert reloaded.get_or_compute("a", {}, 1, lambda: "miss") == "miss"
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "reports.pickle"
+        path.write_bytes(b"not a pickle")
+
+        assert len(ReportCache(path=path)) == 0
+
+    def test_save_without_path_is_a_no_op(self, tmp_path):
+        cache = ReportCache()
+        cache.get_or_compute("a", {}, 1, lambda: "a")
+
+        cache.save()
+
+        assert list(tmp_path.iterdir()) == []
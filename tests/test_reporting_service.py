@@ -3,13 +3,26 @@
 import json
 import os
 import tempfile
-from datetime import date
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from uuid import UUID, uuid4
 
 import pytest
 
 from family_office_ledger.domain.entities import Account, Entity, Position, Security
-from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+from family_office_ledger.domain.periods import PeriodClose
+from family_office_ledger.domain.report_views import (
+    EntityActivity,
+    EntityBalance,
+    PositionValue,
+)
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    Entry,
+    TaxLot,
+    Transaction,
+)
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
     AccountType,
@@ -19,16 +32,31 @@ from family_office_ledger.domain.value_objects import (
     Money,
     Quantity,
 )
+from family_office_ledger.repositories.interfaces import (
+    ReportingViewRepository,
+    TransactionRepository,
+)
 from family_office_ledger.repositories.sqlite import (
     SQLiteAccountRepository,
     SQLiteDatabase,
     SQLiteEntityRepository,
+    SQLitePeriodCloseRepository,
     SQLitePositionRepository,
     SQLiteSecurityRepository,
     SQLiteTaxLotRepository,
     SQLiteTransactionRepository,
 )
-from family_office_ledger.services.reporting import ReportingServiceImpl
+from family_office_ledger.repositories.sqlite_async import (
+    AsyncSQLiteAccountRepository,
+    AsyncSQLiteEntityRepository,
+    AsyncSQLiteTransactionRepository,
+)
+from family_office_ledger.services.interfaces import SeriesFrequency
+from family_office_ledger.services.ledger import LedgerServiceImpl
+from family_office_ledger.services.reporting import (
+    AsyncReportingServiceImpl,
+    ReportingServiceImpl,
+)
 
 
 @pytest.fixture
@@ -440,6 +468,354 @@ class TestBalanceSheetReport:
         assert report["totals"]["total_equity"] == Decimal("0")
 
 
+# ===== trial_balance Tests =====
+
+
+def _journal(
+    transaction_repo: SQLiteTransactionRepository,
+    txn_date: date,
+    debit: Account,
+    credit: Account,
+    amount: str,
+    credit_amount: str | None = None,
+) -> None:
+    txn = Transaction(transaction_date=txn_date)
+    txn.add_entry(Entry(account_id=debit.id, debit_amount=Money(Decimal(amount))))
+    txn.add_entry(
+        Entry(
+            account_id=credit.id,
+            credit_amount=Money(Decimal(credit_amount or amount)),
+        )
+    )
+    transaction_repo.add(txn)
+
+
+class TestTrialBalance:
+    def test_lists_accounts_with_activity_and_balances(
+        self,
+        reporting_service: ReportingServiceImpl,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        _journal(
+            transaction_repo,
+            date(2024, 1, 5),
+            test_accounts["cash"],
+            test_accounts["equity"],
+            "10000.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 1, 20),
+            test_accounts["expense"],
+            test_accounts["cash"],
+            "250.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 2, 1),
+            test_accounts["cash"],
+            test_accounts["income"],
+            "75.00",
+        )
+
+        report = reporting_service.trial_balance(as_of_date=date(2024, 1, 31))
+        lines = {line.account_name: line for line in report}
+
+        assert set(lines) == {"Cash", "Retained Earnings", "Expenses"}
+        assert lines["Cash"].debit_total == Decimal("10000.00")
+        assert lines["Cash"].credit_total == Decimal("250.00")
+        assert lines["Cash"].net_balance == Decimal("9750.00")
+        assert lines["Retained Earnings"].net_balance == Decimal("-10000.00")
+        assert lines["Expenses"].account_type == AccountType.EXPENSE
+        assert report.totals == {"USD": (Decimal("10250.00"), Decimal("10250.00"))}
+        assert report.is_balanced
+
+    def test_filters_by_entity(
+        self,
+        reporting_service: ReportingServiceImpl,
+        account_repo: SQLiteAccountRepository,
+        test_accounts: dict[str, Account],
+        test_entity_2: Entity,
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        other_cash = Account(
+            name="Other Cash",
+            entity_id=test_entity_2.id,
+            account_type=AccountType.ASSET,
+        )
+        other_equity = Account(
+            name="Other Equity",
+            entity_id=test_entity_2.id,
+            account_type=AccountType.EQUITY,
+        )
+        account_repo.add(other_cash)
+        account_repo.add(other_equity)
+        _journal(
+            transaction_repo,
+            date(2024, 1, 5),
+            test_accounts["cash"],
+            test_accounts["equity"],
+            "100",
+        )
+        _journal(transaction_repo, date(2024, 1, 5), other_cash, other_equity, "40")
+
+        report = reporting_service.trial_balance(
+            as_of_date=date(2024, 1, 31), entity_ids=[test_entity_2.id]
+        )
+
+        assert sorted(line.account_name for line in report) == [
+            "Other Cash",
+            "Other Equity",
+        ]
+        assert report.totals == {"USD": (Decimal("40"), Decimal("40"))}
+
+    def test_reports_unbalanced_currency(
+        self,
+        reporting_service: ReportingServiceImpl,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        # Repositories store what they are given; the ledger service would
+        # have rejected this transaction.
+        _journal(
+            transaction_repo,
+            date(2024, 1, 5),
+            test_accounts["cash"],
+            test_accounts["income"],
+            "100",
+            credit_amount="90",
+        )
+
+        report = reporting_service.trial_balance(as_of_date=date(2024, 1, 31))
+        list(report)
+
+        assert report.totals == {"USD": (Decimal("100"), Decimal("90"))}
+        assert not report.is_balanced
+
+
+# ===== balance_series Tests =====
+
+
+class TestBalanceSeries:
+    def test_samples_running_balances_at_each_date(
+        self,
+        reporting_service: ReportingServiceImpl,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        _journal(
+            transaction_repo,
+            date(2024, 1, 5),
+            test_accounts["cash"],
+            test_accounts["equity"],
+            "10000.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 1, 20),
+            test_accounts["expense"],
+            test_accounts["cash"],
+            "250.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 3, 1),
+            test_accounts["cash"],
+            test_accounts["income"],
+            "75.00",
+        )
+        cash = test_accounts["cash"].id
+
+        series = reporting_service.balance_series(
+            [date(2024, 2, 29), date(2024, 1, 1), date(2024, 1, 5)],
+            account_ids=[cash, test_accounts["liability"].id],
+        )
+
+        assert series.dates == [date(2024, 1, 1), date(2024, 1, 5), date(2024, 2, 29)]
+        assert series.balances[cash] == [
+            Decimal("0"),
+            Decimal("10000.00"),
+            Decimal("9750.00"),
+        ]
+        assert series.balances[test_accounts["liability"].id] == [Decimal("0")] * 3
+
+    def test_net_worth_series_matches_net_worth_report(
+        self,
+        reporting_service: ReportingServiceImpl,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        _journal(
+            transaction_repo,
+            date(2024, 1, 5),
+            test_accounts["cash"],
+            test_accounts["equity"],
+            "10000.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 2, 10),
+            test_accounts["expense"],
+            test_accounts["liability"],
+            "300.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 3, 15),
+            test_accounts["liability"],
+            test_accounts["cash"],
+            "300.00",
+        )
+        dates = SeriesFrequency.MONTHLY.sample_dates(
+            date(2024, 1, 1), date(2024, 3, 20)
+        )
+
+        report = reporting_service.net_worth_series(dates)
+
+        assert [point["as_of_date"] for point in report["data"]] == dates
+        for point in report["data"]:
+            expected = reporting_service.net_worth_report(None, point["as_of_date"])
+            assert point["total_assets"] == expected["totals"]["total_assets"]
+            assert point["total_liabilities"] == expected["totals"]["total_liabilities"]
+            assert point["net_worth"] == expected["totals"]["net_worth"]
+        assert [point["total_liabilities"] for point in report["data"]] == [
+            Decimal("0"),
+            Decimal("300.00"),
+            Decimal("0"),
+        ]
+
+
+class _CarryForwardTransactionRepository(SQLiteTransactionRepository):
+    """Reads only the entries after a close instead of the snapshots."""
+
+    sum_by_account_since = TransactionRepository.sum_by_account_since
+
+
+class TestPeriodCloses:
+    def _service(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+    ) -> ReportingServiceImpl:
+        return ReportingServiceImpl(
+            entity_repo=SQLiteEntityRepository(db),
+            account_repo=SQLiteAccountRepository(db),
+            transaction_repo=transaction_repo,
+            position_repo=SQLitePositionRepository(db),
+            tax_lot_repo=SQLiteTaxLotRepository(db),
+            security_repo=SQLiteSecurityRepository(db),
+            period_close_repo=SQLitePeriodCloseRepository(db),
+        )
+
+    def test_reports_match_after_closing_a_year(
+        self,
+        db: SQLiteDatabase,
+        reporting_service: ReportingServiceImpl,
+        test_entity: Entity,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        _journal(
+            transaction_repo,
+            date(2023, 3, 1),
+            test_accounts["cash"],
+            test_accounts["income"],
+            "5000.00",
+        )
+        _journal(
+            transaction_repo,
+            date(2023, 6, 1),
+            test_accounts["expense"],
+            test_accounts["liability"],
+            "800.00",
+        )
+        LedgerServiceImpl(
+            transaction_repo=transaction_repo,
+            account_repo=SQLiteAccountRepository(db),
+            entity_repo=SQLiteEntityRepository(db),
+            period_close_repo=SQLitePeriodCloseRepository(db),
+        ).close_fiscal_year(test_entity.id, 2023)
+        _journal(
+            transaction_repo,
+            date(2024, 2, 1),
+            test_accounts["cash"],
+            test_accounts["income"],
+            "100.00",
+        )
+
+        for service in (
+            self._service(db, transaction_repo),
+            self._service(db, _CarryForwardTransactionRepository(db)),
+        ):
+            for as_of in (date(2023, 12, 31), date(2024, 6, 30)):
+                assert service.balance_sheet_report(
+                    test_entity.id, as_of
+                ) == reporting_service.balance_sheet_report(test_entity.id, as_of)
+                assert service.net_worth_report(
+                    [test_entity.id], as_of
+                ) == reporting_service.net_worth_report([test_entity.id], as_of)
+
+        report = self._service(db, transaction_repo).balance_sheet_report(
+            test_entity.id, date(2024, 6, 30)
+        )
+        assert report["totals"]["total_assets"] == Decimal("5100.00")
+        assert report["totals"]["total_equity"] == Decimal("4200.00")
+
+    def test_as_of_balances_start_from_the_frozen_balances(
+        self,
+        db: SQLiteDatabase,
+        test_entity: Entity,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        cash = test_accounts["cash"]
+        SQLitePeriodCloseRepository(db).add(
+            PeriodClose(
+                entity_id=test_entity.id,
+                period_end=date(2023, 12, 31),
+                balances=[AccountTotals(cash.id, "USD", Decimal("500.00"))],
+            )
+        )
+        _journal(
+            transaction_repo,
+            date(2024, 1, 10),
+            cash,
+            test_accounts["income"],
+            "25.00",
+        )
+        service = self._service(db, _CarryForwardTransactionRepository(db))
+
+        report = service.balance_sheet_report(test_entity.id, date(2024, 1, 31))
+
+        assert report["totals"]["total_assets"] == Decimal("525.00")
+
+
+class TestSeriesFrequency:
+    def test_samples_period_ends_up_to_end_date(self):
+        start = date(2024, 1, 15)
+
+        assert SeriesFrequency.DAILY.sample_dates(start, date(2024, 1, 17)) == [
+            date(2024, 1, 15),
+            date(2024, 1, 16),
+            date(2024, 1, 17),
+        ]
+        assert SeriesFrequency.WEEKLY.sample_dates(start, date(2024, 1, 30)) == [
+            date(2024, 1, 21),
+            date(2024, 1, 28),
+            date(2024, 1, 30),
+        ]
+        assert SeriesFrequency.MONTHLY.sample_dates(start, date(2024, 3, 10)) == [
+            date(2024, 1, 31),
+            date(2024, 2, 29),
+            date(2024, 3, 10),
+        ]
+        assert SeriesFrequency.MONTHLY.sample_dates(
+            date(2019, 1, 1), date(2023, 12, 31)
+        )[-2:] == [date(2023, 11, 30), date(2023, 12, 31)]
+        assert SeriesFrequency.MONTHLY.sample_dates(start, date(2024, 1, 1)) == []
+
+
 # ===== income_statement_report Tests =====
 
 
@@ -1208,3 +1584,248 @@ class TestBudgetReport:
         assert len(result["data"]) == 2
         assert result["totals"]["total_budgeted"] == "8000"
         assert result["totals"]["total_actual"] == "0"
+
+
+# ===== Reporting views =====
+
+
+class StubReportingViews(ReportingViewRepository):
+    """Fixed view contents, refreshed ``age`` ago (never if None)."""
+
+    def __init__(self, age: timedelta | None = timedelta(0)) -> None:
+        self.age = age
+        self.balances: dict[UUID, Decimal] = {}
+        self.entities: list[EntityBalance] = []
+        self.activity: dict[UUID, EntityActivity] = {}
+        self.positions: list[PositionValue] = []
+
+    def refreshed_at(self) -> datetime | None:
+        if self.age is None:
+            return None
+        return datetime.now(UTC) - self.age
+
+    def account_balances(
+        self, account_ids: Iterable[UUID], as_of: date
+    ) -> dict[UUID, Decimal]:
+        ids = set(account_ids)
+        return {k: v for k, v in self.balances.items() if k in ids}
+
+    def entity_balances(
+        self, entity_ids: Iterable[UUID], as_of: date
+    ) -> list[EntityBalance]:
+        ids = set(entity_ids)
+        return [row for row in self.entities if row.entity_id in ids]
+
+    def entity_activity(self, entity_ids: Iterable[UUID]) -> dict[UUID, EntityActivity]:
+        ids = set(entity_ids)
+        return {k: v for k, v in self.activity.items() if k in ids}
+
+    def position_values(self, entity_ids: Iterable[UUID]) -> list[PositionValue]:
+        ids = set(entity_ids)
+        return [row for row in self.positions if row.entity_id in ids]
+
+
+def _service_with_views(
+    views: StubReportingViews,
+    entity_repo: SQLiteEntityRepository,
+    account_repo: SQLiteAccountRepository,
+    transaction_repo: SQLiteTransactionRepository,
+    position_repo: SQLitePositionRepository,
+    tax_lot_repo: SQLiteTaxLotRepository,
+    security_repo: SQLiteSecurityRepository,
+) -> ReportingServiceImpl:
+    return ReportingServiceImpl(
+        entity_repo=entity_repo,
+        account_repo=account_repo,
+        transaction_repo=transaction_repo,
+        position_repo=position_repo,
+        tax_lot_repo=tax_lot_repo,
+        security_repo=security_repo,
+        reporting_views=views,
+        max_view_staleness=timedelta(minutes=5),
+    )
+
+
+class TestReportingViews:
+    @pytest.fixture
+    def views(self, test_entity: Entity, test_accounts: dict[str, Account]):
+        views = StubReportingViews()
+        views.entities = [
+            EntityBalance(
+                test_entity.id,
+                "USD",
+                total_assets=Decimal("700"),
+                total_liabilities=Decimal("200"),
+            )
+        ]
+        views.balances = {
+            test_accounts["cash"].id: Decimal("700"),
+            test_accounts["liability"].id: Decimal("-200"),
+        }
+        views.activity = {
+            test_entity.id: EntityActivity(
+                test_entity.id, account_count=6, transaction_count=42
+            )
+        }
+        views.positions = [
+            PositionValue(
+                position_id=uuid4(),
+                entity_id=test_entity.id,
+                account_name="Brokerage",
+                security_symbol="AAPL",
+                security_name="Apple Inc.",
+                quantity=Decimal("10"),
+                cost_basis=Money(Decimal("1000")),
+                market_value=Money(Decimal("1500")),
+            )
+        ]
+        return views
+
+    @pytest.fixture
+    def service(
+        self,
+        views: StubReportingViews,
+        entity_repo: SQLiteEntityRepository,
+        account_repo: SQLiteAccountRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        position_repo: SQLitePositionRepository,
+        tax_lot_repo: SQLiteTaxLotRepository,
+        security_repo: SQLiteSecurityRepository,
+    ) -> ReportingServiceImpl:
+        return _service_with_views(
+            views,
+            entity_repo,
+            account_repo,
+            transaction_repo,
+            position_repo,
+            tax_lot_repo,
+            security_repo,
+        )
+
+    def test_fresh_views_serve_net_worth(
+        self, service: ReportingServiceImpl, test_entity: Entity
+    ):
+        report = service.net_worth_report([test_entity.id], date(2024, 1, 31))
+
+        assert report["data"][0]["entity_name"] == "Smith Family Trust"
+        assert report["totals"]["total_assets"] == Decimal("700")
+        assert report["totals"]["total_liabilities"] == Decimal("200")
+        assert report["totals"]["net_worth"] == Decimal("500")
+
+    def test_fresh_views_serve_balance_sheet(
+        self,
+        service: ReportingServiceImpl,
+        test_entity: Entity,
+        test_accounts: dict[str, Account],
+    ):
+        report = service.balance_sheet_report(test_entity.id, date(2024, 1, 31))
+
+        balances = {
+            row["account_name"]: row["balance"] for row in report["data"]["assets"]
+        }
+        assert balances == {"Cash": Decimal("700"), "Brokerage": Decimal("0")}
+        assert report["totals"]["total_liabilities"] == Decimal("200")
+
+    def test_fresh_views_serve_dashboard_and_positions(
+        self, service: ReportingServiceImpl, test_entity: Entity
+    ):
+        dashboard = service.dashboard_summary([test_entity.id], date(2024, 1, 31))
+        positions = service.position_summary_report([test_entity.id], date(2024, 1, 31))
+
+        assert dashboard["data"]["total_accounts"] == 6
+        assert dashboard["data"]["total_transactions"] == 42
+        assert dashboard["data"]["net_worth"] == Decimal("500")
+        assert positions["data"][0]["quantity"] == "10"
+        assert positions["totals"]["total_unrealized_gain"] == Decimal("500")
+
+    @pytest.mark.parametrize("age", [timedelta(minutes=6), None])
+    def test_stale_or_unrefreshed_views_fall_back_to_live(
+        self,
+        age: timedelta | None,
+        views: StubReportingViews,
+        service: ReportingServiceImpl,
+        test_entity: Entity,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ):
+        views.age = age
+        txn = Transaction(transaction_date=date(2024, 1, 15))
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["cash"].id, debit_amount=Money(Decimal("50"))
+            )
+        )
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["income"].id,
+                credit_amount=Money(Decimal("50")),
+            )
+        )
+        transaction_repo.add(txn)
+
+        report = service.net_worth_report([test_entity.id], date(2024, 1, 31))
+        dashboard = service.dashboard_summary([test_entity.id], date(2024, 1, 31))
+
+        assert report["totals"]["total_assets"] == Decimal("50")
+        assert dashboard["data"]["total_transactions"] == 1
+
+
+class TestAsyncReportingService:
+    """The async dashboard reports match ReportingServiceImpl's."""
+
+    @pytest.fixture
+    def async_reporting_service(self, db: SQLiteDatabase) -> AsyncReportingServiceImpl:
+        async_db = db.async_database()
+        return AsyncReportingServiceImpl(
+            entity_repo=AsyncSQLiteEntityRepository(async_db),
+            account_repo=AsyncSQLiteAccountRepository(async_db),
+            transaction_repo=AsyncSQLiteTransactionRepository(async_db),
+        )
+
+    @pytest.fixture(autouse=True)
+    def ledger(
+        self,
+        test_accounts: dict[str, Account],
+        transaction_repo: SQLiteTransactionRepository,
+    ) -> None:
+        postings = [
+            ("cash", "income", "10000.00", date(2024, 1, 15)),
+            ("expense", "liability", "500.00", date(2024, 1, 20)),
+            ("brokerage", "cash", "2500.00", date(2024, 2, 1)),
+            ("cash", "equity", "1000.00", date(2024, 1, 5)),
+        ]
+        for debit, credit, amount, day in postings:
+            txn = Transaction(transaction_date=day)
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts[debit].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts[credit].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+
+    @pytest.mark.parametrize("as_of", [date(2024, 1, 31), date(2024, 12, 31)])
+    async def test_reports_match_sync_service(
+        self,
+        reporting_service: ReportingServiceImpl,
+        async_reporting_service: AsyncReportingServiceImpl,
+        test_entity: Entity,
+        test_entity_2: Entity,
+        as_of: date,
+    ):
+        for entity_ids in (None, [test_entity.id, test_entity_2.id, uuid4()]):
+            assert await async_reporting_service.net_worth_report(
+                entity_ids, as_of
+            ) == reporting_service.net_worth_report(entity_ids, as_of)
+            assert await async_reporting_service.dashboard_summary(
+                entity_ids, as_of
+            ) == reporting_service.dashboard_summary(entity_ids, as_of)
+        assert await async_reporting_service.balance_sheet_report(
+            test_entity.id, as_of
+        ) == reporting_service.balance_sheet_report(test_entity.id, as_of)
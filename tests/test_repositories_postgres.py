@@ -1,10 +1,14 @@
 """Tests for PostgreSQL repository implementations."""
 
 import os
+import threading
+import time
 from datetime import date
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import psycopg2
+import psycopg2.extensions
 import pytest
 
 # Check for PostgreSQL availability
@@ -31,7 +35,13 @@ if not SKIP_POSTGRES:
         ExchangeRate,
         ExchangeRateSource,
     )
-    from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+    from family_office_ledger.domain.periods import PeriodClose, PeriodClosedError
+    from family_office_ledger.domain.transactions import (
+        AccountTotals,
+        Entry,
+        TaxLot,
+        Transaction,
+    )
     from family_office_ledger.domain.value_objects import (
         AccountSubType,
         AccountType,
@@ -42,18 +52,28 @@ if not SKIP_POSTGRES:
         Quantity,
     )
     from family_office_ledger.domain.vendors import Vendor
+    from family_office_ledger.repositories.interfaces import EXCHANGE_RATE_SCOPE
     from family_office_ledger.repositories.postgres import (
         PostgresAccountRepository,
         PostgresBudgetRepository,
+        PostgresBulkLoader,
         PostgresDatabase,
         PostgresEntityRepository,
         PostgresExchangeRateRepository,
+        PostgresLedgerVersionRepository,
+        PostgresPeriodCloseRepository,
         PostgresPositionRepository,
+        PostgresReportingViews,
         PostgresSecurityRepository,
         PostgresTaxLotRepository,
         PostgresTransactionRepository,
         PostgresVendorRepository,
     )
+    from family_office_ledger.services.ledger import (
+        AccountNotFoundError,
+        LedgerServiceImpl,
+    )
+    from family_office_ledger.services.reporting import ReportingServiceImpl
 
 
 @pytest.fixture
@@ -64,6 +84,9 @@ def db() -> "PostgresDatabase":
     database.initialize()
     conn = database.get_connection()
     with conn.cursor() as cur:
+        cur.execute("DELETE FROM account_balance_snapshots")
+        cur.execute("DELETE FROM period_closing_balances")
+        cur.execute("DELETE FROM period_closes")
         cur.execute("DELETE FROM entries")
         cur.execute("DELETE FROM tax_lots")
         cur.execute("DELETE FROM transactions")
@@ -75,8 +98,12 @@ def db() -> "PostgresDatabase":
         cur.execute("DELETE FROM entities")
         cur.execute("DELETE FROM exchange_rates")
         cur.execute("DELETE FROM vendors")
+        cur.execute("DELETE FROM ledger_versions")
     conn.commit()
-    return database
+    yield database
+    # Roll back whatever a test left open so the next test's migrations
+    # are not blocked waiting on its locks.
+    database.close()
 
 
 @pytest.fixture
@@ -458,6 +485,21 @@ class TestPostgresSecurityRepository:
         result = security_repo.get(uuid4())
         assert result is None
 
+    def test_get_many_skips_missing(
+        self, security_repo: "PostgresSecurityRepository"
+    ) -> None:
+        securities = [
+            Security(symbol=f"SYM{i}", name=f"Security {i}") for i in range(3)
+        ]
+        for security in securities:
+            security_repo.add(security)
+        missing = uuid4()
+
+        found = security_repo.get_many([s.id for s in securities] + [missing])
+
+        assert set(found) == {s.id for s in securities}
+        assert security_repo.get_many([]) == {}
+
     def test_get_by_symbol(self, security_repo: "PostgresSecurityRepository") -> None:
         security = Security(symbol="MSFT", name="Microsoft Corp")
         security_repo.add(security)
@@ -795,6 +837,32 @@ class TestPostgresTransactionRepository:
         assert len(retrieved.entries) == 2
         assert retrieved.is_balanced
 
+    def test_entries_keep_posting_order(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        cash, income = test_accounts["cash"].id, test_accounts["income"].id
+        txns = []
+        for day in (1, 2):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            for memo in ("c", "a", "d", "b"):
+                txn.add_entry(
+                    Entry(
+                        account_id=cash,
+                        debit_amount=Money(Decimal("1.00")),
+                        memo=memo,
+                    )
+                )
+            txn.add_entry(
+                Entry(account_id=income, credit_amount=Money(Decimal("4.00")))
+            )
+            txns.append(txn)
+
+        transaction_repo.add_many(txns)
+
+        expected = ["c", "a", "d", "b", ""]
+        for txn in transaction_repo.list_by_account(cash):
+            assert [entry.memo for entry in txn.entries] == expected
+
     def test_get_nonexistent_transaction_returns_none(
         self, transaction_repo: "PostgresTransactionRepository"
     ) -> None:
@@ -1012,6 +1080,319 @@ class TestPostgresTransactionRepository:
         assert date(2024, 1, 15) in dates
         assert date(2024, 2, 15) in dates
 
+    def test_sum_by_account(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        for day, amount in ((1, "100.25"), (15, "50.50"), (31, "0.0000001")):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+
+        totals = {
+            t.account_id: t
+            for t in transaction_repo.sum_by_account(
+                [test_accounts["cash"].id, test_accounts["income"].id],
+                as_of=date(2024, 1, 31),
+                start=date(2024, 1, 15),
+            )
+        }
+
+        assert totals[test_accounts["cash"].id].debit_total == Decimal("50.5000001")
+        assert totals[test_accounts["income"].id].balance == Decimal("-50.5000001")
+
+    def test_iter_account_totals(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        for day, amount in ((1, "10"), (20, "2.5")):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+        ids = [test_accounts["cash"].id, test_accounts["income"].id]
+
+        streamed = list(
+            transaction_repo.iter_account_totals(ids, as_of=date(2024, 1, 15))
+        )
+
+        assert [t.account_id for t in streamed] == sorted(ids)
+        assert {t.account_id: t.balance for t in streamed} == {
+            test_accounts["cash"].id: Decimal("10"),
+            test_accounts["income"].id: Decimal("-10"),
+        }
+
+    def test_sum_by_account_since_seeds_from_opening(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        for day, amount in ((1, "10"), (20, "2.5")):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+        cash_id = test_accounts["cash"].id
+        opening = [AccountTotals(cash_id, "USD", Decimal("100"), Decimal("40"))]
+
+        carried = transaction_repo.sum_by_account_since(
+            opening, date(2024, 1, 15), [cash_id], as_of=date(2024, 1, 31)
+        )
+
+        assert list(carried) == [
+            AccountTotals(cash_id, "USD", Decimal("102.5"), Decimal("40"))
+        ]
+
+    def test_iter_balance_history(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        for day, amount in ((20, "2.5"), (1, "10"), (31, "4")):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+
+        streamed = list(
+            transaction_repo.iter_balance_history(
+                [test_accounts["cash"].id], as_of=date(2024, 1, 30)
+            )
+        )
+
+        assert [(day, t.balance) for day, t in streamed] == [
+            (date(2024, 1, 1), Decimal("10")),
+            (date(2024, 1, 20), Decimal("12.5")),
+        ]
+
+    def test_balance_snapshots_track_postings(
+        self,
+        db: "PostgresDatabase",
+        transaction_repo: "PostgresTransactionRepository",
+        test_accounts: dict,
+    ) -> None:
+        for day, amount in ((3, "5"), (1, "10")):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            transaction_repo.add(txn)
+
+        as_of = list(
+            transaction_repo.sum_by_account(
+                [test_accounts["cash"].id], as_of=date(2024, 1, 2)
+            )
+        )
+
+        assert [t.debit_total for t in as_of] == [Decimal("10")]
+        assert db.verify_balance_snapshots() == []
+        assert db.rebuild_balance_snapshots() == 4
+
+    def test_add_many_in_unit_of_work(
+        self,
+        db: "PostgresDatabase",
+        transaction_repo: "PostgresTransactionRepository",
+        test_accounts: dict,
+    ) -> None:
+        txns = []
+        for day in (2, 1, 2):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal("10")),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal("10")),
+                )
+            )
+            txns.append(txn)
+
+        with db.unit_of_work():
+            transaction_repo.add_many(txns[:2])
+            transaction_repo.add_many(txns[2:])
+
+        stored = list(transaction_repo.list_by_account(test_accounts["cash"].id))
+        assert len(stored) == 3
+        assert db.verify_balance_snapshots() == []
+
+        doomed = Transaction(transaction_date=date(2024, 1, 3))
+        doomed.add_entry(
+            Entry(account_id=test_accounts["cash"].id, debit_amount=Money(Decimal("1")))
+        )
+        doomed.add_entry(
+            Entry(
+                account_id=test_accounts["income"].id,
+                credit_amount=Money(Decimal("1")),
+            )
+        )
+        with pytest.raises(RuntimeError), db.unit_of_work():
+            transaction_repo.add(doomed)
+            raise RuntimeError("boom")
+        assert transaction_repo.get(doomed.id) is None
+
+    def test_iter_methods_match_list_methods(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        txns = []
+        for day in (5, 15, 25):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(day)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(day)),
+                )
+            )
+            txns.append(txn)
+        transaction_repo.add_many(txns)
+        account_id = test_accounts["cash"].id
+        entity_id = test_accounts["entity"].id
+        start, end = date(2024, 1, 10), date(2024, 1, 31)
+
+        pairs = [
+            (
+                transaction_repo.iter_by_account(account_id, start, end),
+                transaction_repo.list_by_account(account_id, start, end),
+            ),
+            (
+                transaction_repo.iter_by_entity(entity_id),
+                transaction_repo.list_by_entity(entity_id),
+            ),
+            (
+                transaction_repo.iter_by_date_range(start, end),
+                transaction_repo.list_by_date_range(start, end),
+            ),
+        ]
+
+        for streamed, listed in pairs:
+            streamed_txns = list(streamed)
+            assert [t.id for t in streamed_txns] == [t.id for t in listed]
+            assert all(len(t.entries) == 2 for t in streamed_txns)
+
+    def test_list_page_seeks_past_cursor(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        txns = []
+        for day in (3, 1, 2, 2, 5, 4):
+            txn = Transaction(transaction_date=date(2024, 1, day))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(day)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(day)),
+                )
+            )
+            txns.append(txn)
+        transaction_repo.add_many(txns)
+
+        seen = []
+        after = None
+        while page := transaction_repo.list_page(
+            account_id=test_accounts["cash"].id, after=after, limit=4
+        ):
+            seen.extend(page)
+            after = (page[-1].transaction_date, page[-1].id)
+
+        assert len(seen) == 6
+        assert len({t.id for t in seen}) == 6
+        assert [t.transaction_date.day for t in seen] == [1, 2, 2, 3, 4, 5]
+
+    def test_search_matches_word_prefixes_ranked_by_field(
+        self, transaction_repo: "PostgresTransactionRepository", test_accounts: dict
+    ) -> None:
+        txns = {}
+        for memo, reference, category in (
+            ("Quarterly payment", "", "rent"),
+            ("Office rental", "", None),
+            ("Parent company fee", "", None),
+            ("Invoice", "INV-42", None),
+        ):
+            txn = Transaction(
+                transaction_date=date(2024, 1, 1),
+                memo=memo,
+                reference=reference,
+                category=category,
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal("1")),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal("1")),
+                )
+            )
+            transaction_repo.add(txn)
+            txns[memo] = txn.id
+
+        assert [t.id for t in transaction_repo.search("ren")] == [
+            txns["Office rental"],
+            txns["Quarterly payment"],
+        ]
+        assert [t.id for t in transaction_repo.search("inv 42")] == [txns["Invoice"]]
+        assert transaction_repo.search('" & !') == []
+
 
 # ===== Tax Lot Repository Tests =====
 
@@ -1258,6 +1639,305 @@ class TestPostgresTaxLotRepository:
 # ===== Database Tests =====
 
 
+class TestPostgresBulkLoader:
+    @pytest.fixture
+    def test_data(
+        self,
+        entity_repo: "PostgresEntityRepository",
+        account_repo: "PostgresAccountRepository",
+        security_repo: "PostgresSecurityRepository",
+    ) -> dict:
+        entity = Entity(name="Test Entity", entity_type=EntityType.TRUST)
+        entity_repo.add(entity)
+        cash = Account(
+            name="Cash",
+            entity_id=entity.id,
+            account_type=AccountType.ASSET,
+            sub_type=AccountSubType.CHECKING,
+        )
+        brokerage = Account(
+            name="Brokerage",
+            entity_id=entity.id,
+            account_type=AccountType.ASSET,
+            sub_type=AccountSubType.BROKERAGE,
+        )
+        account_repo.add(cash)
+        account_repo.add(brokerage)
+        security = Security(symbol="AAPL", name="Apple Inc.")
+        security_repo.add(security)
+        return {"cash": cash, "brokerage": brokerage, "security": security}
+
+    @pytest.fixture
+    def loader(
+        self,
+        db: "PostgresDatabase",
+        transaction_repo: "PostgresTransactionRepository",
+        account_repo: "PostgresAccountRepository",
+        entity_repo: "PostgresEntityRepository",
+    ) -> "PostgresBulkLoader":
+        ledger = LedgerServiceImpl(transaction_repo, account_repo, entity_repo)
+        return PostgresBulkLoader(db, ledger.validate_transactions)
+
+    def _purchase(self, test_data: dict, day: int, amount: str) -> "Transaction":
+        txn = Transaction(
+            transaction_date=date(2024, 1, day),
+            memo="Buy\tAAPL\nlot \\ 1",
+            tags=["bulk"],
+        )
+        txn.add_entry(
+            Entry(
+                account_id=test_data["brokerage"].id,
+                debit_amount=Money(Decimal(amount)),
+            )
+        )
+        txn.add_entry(
+            Entry(account_id=test_data["cash"].id, credit_amount=Money(Decimal(amount)))
+        )
+        return txn
+
+    def test_load_writes_all_tables_and_snapshots(
+        self,
+        db: "PostgresDatabase",
+        loader: "PostgresBulkLoader",
+        transaction_repo: "PostgresTransactionRepository",
+        position_repo: "PostgresPositionRepository",
+        tax_lot_repo: "PostgresTaxLotRepository",
+        test_data: dict,
+    ) -> None:
+        transaction_repo.add(self._purchase(test_data, 3, "7"))
+        position = Position(
+            account_id=test_data["brokerage"].id,
+            security_id=test_data["security"].id,
+        )
+        lot = TaxLot(
+            position_id=position.id,
+            acquisition_date=date(2024, 1, 2),
+            cost_per_share=Money(Decimal("150.00")),
+            original_quantity=Quantity(Decimal("10")),
+        )
+        txns = [self._purchase(test_data, day, "1500.00") for day in (2, 2, 5)]
+        txns[0].entries[0].tax_lot_id = lot.id
+
+        result = loader.load(txns, tax_lots=[lot], positions=[position])
+
+        assert (result.transactions, result.entries) == (3, 6)
+        assert (result.tax_lots, result.positions) == (1, 1)
+        assert result.total_rows == 11
+        assert position_repo.get(position.id) is not None
+        assert tax_lot_repo.get(lot.id) is not None
+        stored = transaction_repo.get(txns[0].id)
+        assert stored is not None
+        assert stored.memo == txns[0].memo
+        assert stored.tags == ["bulk"]
+        assert stored.entries[0].tax_lot_id == lot.id
+        assert db.verify_balance_snapshots() == []
+
+    def test_validation_failure_writes_nothing(
+        self,
+        loader: "PostgresBulkLoader",
+        transaction_repo: "PostgresTransactionRepository",
+        test_data: dict,
+    ) -> None:
+        good = self._purchase(test_data, 2, "10")
+        bad = self._purchase(test_data, 3, "10")
+        bad.entries[0].account_id = uuid4()
+
+        with pytest.raises(AccountNotFoundError):
+            loader.load([good, bad])
+
+        assert transaction_repo.get(good.id) is None
+
+    def test_duplicate_rolls_back_whole_load(
+        self,
+        db: "PostgresDatabase",
+        loader: "PostgresBulkLoader",
+        transaction_repo: "PostgresTransactionRepository",
+        test_data: dict,
+    ) -> None:
+        existing = self._purchase(test_data, 2, "10")
+        transaction_repo.add(existing)
+        fresh = self._purchase(test_data, 3, "10")
+
+        with pytest.raises(psycopg2.IntegrityError):
+            loader.load([fresh, existing])
+
+        assert transaction_repo.get(fresh.id) is None
+        assert db.verify_balance_snapshots() == []
+
+
+class TestPostgresReportingViews:
+    @pytest.fixture
+    def views(self, db: "PostgresDatabase") -> "PostgresReportingViews":
+        views = PostgresReportingViews(db, refresh_after_rows=5)
+        views.create()
+        yield views
+        views.stop_refresh_schedule()
+
+    @pytest.fixture
+    def ledger(
+        self,
+        entity_repo: "PostgresEntityRepository",
+        account_repo: "PostgresAccountRepository",
+        security_repo: "PostgresSecurityRepository",
+        position_repo: "PostgresPositionRepository",
+        transaction_repo: "PostgresTransactionRepository",
+    ) -> dict:
+        entity = Entity(name="Views Trust", entity_type=EntityType.TRUST)
+        other = Entity(name="Views LLC", entity_type=EntityType.LLC)
+        entity_repo.add(entity)
+        entity_repo.add(other)
+        accounts = {
+            name: Account(
+                name=name,
+                entity_id=owner.id,
+                account_type=account_type,
+                currency=currency,
+            )
+            for name, owner, account_type, currency in (
+                ("Cash", entity, AccountType.ASSET, "USD"),
+                ("Euro Cash", entity, AccountType.ASSET, "EUR"),
+                ("Card", entity, AccountType.LIABILITY, "USD"),
+                ("Equity", entity, AccountType.EQUITY, "USD"),
+                ("Income", entity, AccountType.INCOME, "USD"),
+                ("Other Cash", other, AccountType.ASSET, "USD"),
+                ("Other Equity", other, AccountType.EQUITY, "USD"),
+            )
+        }
+        for account in accounts.values():
+            account_repo.add(account)
+        security = Security(symbol="MSFT", name="Microsoft")
+        security_repo.add(security)
+        position = Position(account_id=accounts["Cash"].id, security_id=security.id)
+        position.update_from_lots(Quantity(Decimal("4")), Money(Decimal("1200")))
+        position.update_market_value(Decimal("400"))
+        position_repo.add(position)
+        position_repo.add(
+            Position(account_id=accounts["Other Cash"].id, security_id=security.id)
+        )
+        for day, debit, credit, amount, currency in (
+            (2, "Cash", "Equity", "1000", "USD"),
+            (3, "Euro Cash", "Income", "250", "EUR"),
+            (5, "Cash", "Card", "300", "USD"),
+            (9, "Card", "Cash", "120.5", "USD"),
+            (9, "Other Cash", "Other Equity", "75", "USD"),
+        ):
+            txn = Transaction(transaction_date=date(2024, 3, day))
+            money = Money(Decimal(amount), currency)
+            txn.add_entry(Entry(account_id=accounts[debit].id, debit_amount=money))
+            txn.add_entry(Entry(account_id=accounts[credit].id, credit_amount=money))
+            transaction_repo.add(txn)
+        return {"entities": [entity, other], "accounts": accounts}
+
+    def _service(self, db: "PostgresDatabase", views=None) -> "ReportingServiceImpl":
+        return ReportingServiceImpl(
+            entity_repo=PostgresEntityRepository(db),
+            account_repo=PostgresAccountRepository(db),
+            transaction_repo=PostgresTransactionRepository(db),
+            position_repo=PostgresPositionRepository(db),
+            tax_lot_repo=PostgresTaxLotRepository(db),
+            security_repo=PostgresSecurityRepository(db),
+            reporting_views=views,
+        )
+
+    def test_reports_match_live_computation(
+        self, db: "PostgresDatabase", views: "PostgresReportingViews", ledger: dict
+    ) -> None:
+        views.refresh()
+        live, viewed = self._service(db), self._service(db, views)
+        entity_ids = [e.id for e in ledger["entities"]]
+
+        for as_of in (date(2024, 3, 1), date(2024, 3, 5), date(2024, 3, 31)):
+            assert viewed.net_worth_report(entity_ids, as_of) == (
+                live.net_worth_report(entity_ids, as_of)
+            )
+            assert viewed.balance_sheet_report(entity_ids[0], as_of) == (
+                live.balance_sheet_report(entity_ids[0], as_of)
+            )
+        as_of = date(2024, 3, 31)
+        assert viewed.dashboard_summary(entity_ids, as_of) == (
+            live.dashboard_summary(entity_ids, as_of)
+        )
+        assert viewed.position_summary_report(entity_ids, as_of) == (
+            live.position_summary_report(entity_ids, as_of)
+        )
+        report = viewed.net_worth_report(entity_ids, as_of)
+        assert report["data"][0]["total_assets"] == Decimal("1429.5")
+        assert report["data"][0]["total_liabilities"] == Decimal("179.5")
+
+    def test_refresh_after_enough_writes(
+        self,
+        db: "PostgresDatabase",
+        views: "PostgresReportingViews",
+        ledger: dict,
+        transaction_repo: "PostgresTransactionRepository",
+    ) -> None:
+        views.refresh()
+        refreshed_at = views.refreshed_at()
+        entity_id = ledger["entities"][1].id
+        txn = Transaction(transaction_date=date(2024, 3, 20))
+        txn.add_entry(
+            Entry(
+                account_id=ledger["accounts"]["Other Cash"].id,
+                debit_amount=Money(Decimal("25")),
+            )
+        )
+        txn.add_entry(
+            Entry(
+                account_id=ledger["accounts"]["Other Equity"].id,
+                credit_amount=Money(Decimal("25")),
+            )
+        )
+        transaction_repo.add(txn)
+
+        views.note_writes(3)
+        assert views.entity_activity([entity_id])[entity_id].transaction_count == 1
+        views.note_writes(3)
+        assert views.entity_activity([entity_id])[entity_id].transaction_count == 2
+        assert views.refreshed_at() > refreshed_at
+
+    def test_bulk_loader_reports_writes(
+        self,
+        db: "PostgresDatabase",
+        views: "PostgresReportingViews",
+        ledger: dict,
+        transaction_repo: "PostgresTransactionRepository",
+        account_repo: "PostgresAccountRepository",
+        entity_repo: "PostgresEntityRepository",
+    ) -> None:
+        service = LedgerServiceImpl(transaction_repo, account_repo, entity_repo)
+        loader = PostgresBulkLoader(db, service.validate_transactions, views=views)
+        cash = ledger["accounts"]["Other Cash"]
+        txns = []
+        for day in (21, 22):
+            txn = Transaction(transaction_date=date(2024, 3, day))
+            txn.add_entry(Entry(account_id=cash.id, debit_amount=Money(Decimal("5"))))
+            txn.add_entry(
+                Entry(
+                    account_id=ledger["accounts"]["Other Equity"].id,
+                    credit_amount=Money(Decimal("5")),
+                )
+            )
+            txns.append(txn)
+
+        loader.load(txns)
+
+        assert views.account_balances([cash.id], date(2024, 3, 31)) == {
+            cash.id: Decimal("85")
+        }
+
+    def test_refresh_schedule(
+        self, db: "PostgresDatabase", views: "PostgresReportingViews"
+    ) -> None:
+        refreshed_at = views.refreshed_at()
+        views.start_refresh_schedule(0.05)
+        deadline = time.monotonic() + 10
+        while views.refreshed_at() == refreshed_at and time.monotonic() < deadline:
+            time.sleep(0.05)
+        views.stop_refresh_schedule()
+
+        assert views.refreshed_at() > refreshed_at
+
+
 class TestPostgresDatabase:
     def test_initialize_creates_tables(self, db: "PostgresDatabase") -> None:
         conn = db.get_connection()
@@ -1293,8 +1973,46 @@ class TestPostgresDatabase:
         db.get_connection()
         db.close()
 
-        # After close, get_connection should create a new connection
-        assert db._connection is None
+        # After close the pool holds no open connections
+        assert db.pool.size == 0
+
+    def test_scope_shares_one_pooled_connection(self) -> None:
+        assert POSTGRES_URL is not None
+        db = PostgresDatabase(POSTGRES_URL, min_size=0, max_size=2)
+        try:
+            with db.scope():
+                first = db.get_connection()
+                with db.unit_of_work():
+                    assert db.get_connection() is first
+                assert db.pool.idle_count == 0
+            assert db.pool.idle_count == 1
+        finally:
+            db.close()
+
+    def test_threads_check_out_separate_connections(self) -> None:
+        assert POSTGRES_URL is not None
+        db = PostgresDatabase(POSTGRES_URL, min_size=0, max_size=4)
+        barrier = threading.Barrier(3)
+        seen: list[object] = []
+
+        def work() -> None:
+            with db.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT pg_backend_pid() AS pid")
+                    seen.append(cur.fetchone()["pid"])
+                barrier.wait(timeout=10)
+
+        try:
+            threads = [threading.Thread(target=work) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+            assert len(set(seen)) == 3
+            assert db.pool.size == 3
+            assert db.pool.idle_count == 3
+        finally:
+            db.close()
 
     def test_initialize_is_idempotent(self, db: "PostgresDatabase") -> None:
         db.initialize()  # Should not raise
@@ -1312,6 +2030,217 @@ class TestPostgresDatabase:
         assert len(tables) > 0
 
 
+LEGACY_TEXT_SCHEMA = """
+CREATE TABLE entities (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    entity_type TEXT NOT NULL,
+    fiscal_year_end TEXT NOT NULL,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    formation_date TEXT
+);
+CREATE TABLE accounts (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    account_type TEXT NOT NULL,
+    sub_type TEXT NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    is_investment_account BOOLEAN NOT NULL DEFAULT FALSE,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TEXT NOT NULL,
+    UNIQUE(name, entity_id),
+    FOREIGN KEY (entity_id) REFERENCES entities(id)
+);
+CREATE TABLE transactions (
+    id TEXT PRIMARY KEY,
+    transaction_date TEXT NOT NULL,
+    posted_date TEXT,
+    memo TEXT NOT NULL DEFAULT '',
+    reference TEXT NOT NULL DEFAULT '',
+    created_by TEXT,
+    created_at TEXT NOT NULL,
+    is_reversed BOOLEAN NOT NULL DEFAULT FALSE,
+    reverses_transaction_id TEXT,
+    FOREIGN KEY (reverses_transaction_id) REFERENCES transactions(id)
+);
+CREATE TABLE entries (
+    id TEXT PRIMARY KEY,
+    transaction_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    debit_amount TEXT NOT NULL,
+    debit_currency TEXT NOT NULL,
+    credit_amount TEXT NOT NULL,
+    credit_currency TEXT NOT NULL,
+    memo TEXT NOT NULL DEFAULT '',
+    tax_lot_id TEXT,
+    FOREIGN KEY (transaction_id) REFERENCES transactions(id) ON DELETE CASCADE,
+    FOREIGN KEY (account_id) REFERENCES accounts(id)
+);
+CREATE INDEX idx_transactions_date ON transactions(transaction_date);
+"""
+
+
+@pytest.fixture
+def legacy_url():
+    """A throwaway schema holding ledger tables with TEXT columns, as created by earlier versions."""
+    assert POSTGRES_URL is not None
+    schema = f"legacy_{uuid4().hex[:12]}"
+    admin = psycopg2.connect(POSTGRES_URL)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(f"CREATE SCHEMA {schema}")
+    url = psycopg2.extensions.make_dsn(POSTGRES_URL, options=f"-c search_path={schema}")
+    seed = psycopg2.connect(url)
+    with seed, seed.cursor() as cur:
+        cur.execute(LEGACY_TEXT_SCHEMA)
+    seed.close()
+    try:
+        yield url
+    finally:
+        with admin.cursor() as cur:
+            cur.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def _seed_legacy_ledger(url: str, transactions: int) -> tuple[str, str, str]:
+    entity_id, cash_id, income_id = str(uuid4()), str(uuid4()), str(uuid4())
+    conn = psycopg2.connect(url)
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO entities VALUES (%s, 'Legacy LLC', 'llc', '2024-12-31', "
+            "TRUE, '2024-01-01T00:00:00+00:00', '2024-01-01T00:00:00+00:00', '')",
+            (entity_id,),
+        )
+        for account_id, name, account_type in (
+            (cash_id, "Cash", "asset"),
+            (income_id, "Income", "income"),
+        ):
+            cur.execute(
+                "INSERT INTO accounts VALUES (%s, %s, %s, %s, 'other', 'USD', "
+                "FALSE, TRUE, '2024-01-01T00:00:00+00:00')",
+                (account_id, name, entity_id, account_type),
+            )
+        for day in range(1, transactions + 1):
+            txn_id = str(uuid4())
+            cur.execute(
+                "INSERT INTO transactions (id, transaction_date, memo, created_at) "
+                "VALUES (%s, %s, 'legacy', '2024-01-01T09:30:00+00:00')",
+                (txn_id, f"2024-01-{day:02d}"),
+            )
+            for account_id, debit, credit in (
+                (cash_id, "10.25", "0"),
+                (income_id, "0", "10.25"),
+            ):
+                cur.execute(
+                    "INSERT INTO entries VALUES (%s, %s, %s, %s, 'USD', %s, 'USD')",
+                    (str(uuid4()), txn_id, account_id, debit, credit),
+                )
+    conn.close()
+    return entity_id, cash_id, income_id
+
+
+class TestPostgresNativeTypeMigration:
+    def test_initialize_converts_text_columns(self, legacy_url: str) -> None:
+        entity_id, cash_id, _ = _seed_legacy_ledger(legacy_url, transactions=5)
+        db = PostgresDatabase(legacy_url)
+        try:
+            db.initialize()
+
+            conn = db.get_connection()
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT table_name, column_name, data_type
+                    FROM information_schema.columns
+                    WHERE table_schema = current_schema()
+                    """
+                )
+                types = {
+                    (row["table_name"], row["column_name"]): row["data_type"]
+                    for row in cur.fetchall()
+                }
+                cur.execute(
+                    """
+                    SELECT conname FROM pg_constraint
+                    WHERE connamespace = current_schema()::regnamespace
+                      AND NOT convalidated
+                    """
+                )
+                unvalidated = cur.fetchall()
+            conn.commit()
+            assert types["entities", "id"] == "uuid"
+            assert types["entities", "formation_date"] == "date"
+            assert types["transactions", "transaction_date"] == "date"
+            assert types["transactions", "created_at"] == "timestamp with time zone"
+            assert types["entries", "debit_amount"] == "numeric"
+            assert types["entries", "memo"] == "text"
+            assert not any(column.endswith("__native") for _, column in types)
+            assert unvalidated == []
+
+            entity = PostgresEntityRepository(db).get(UUID(entity_id))
+            assert entity is not None
+            assert entity.fiscal_year_end == date(2024, 12, 31)
+            assert entity.formation_date is None
+            txn_repo = PostgresTransactionRepository(db)
+            txns = list(txn_repo.list_by_date_range(date(2024, 1, 2), date(2024, 1, 3)))
+            assert [txn.transaction_date for txn in txns] == [
+                date(2024, 1, 2),
+                date(2024, 1, 3),
+            ]
+            assert txns[0].entries[0].debit_amount.amount in (
+                Decimal("10.25"),
+                Decimal("0"),
+            )
+            (totals,) = txn_repo.sum_by_account([UUID(cash_id)])
+            assert totals.debit_total == Decimal("51.25")
+            assert db.verify_balance_snapshots() == []
+        finally:
+            db.close()
+
+    def test_migration_copies_in_batches(self, legacy_url: str) -> None:
+        _seed_legacy_ledger(legacy_url, transactions=7)
+        db = PostgresDatabase(legacy_url)
+        try:
+            # Seven transactions and fourteen entries, copied three rows at a time.
+            assert db.migrate_to_native_types(batch_size=3) == 1 + 2 + 7 + 14
+            assert db.migrate_to_native_types(batch_size=3) == 0
+        finally:
+            db.close()
+
+    def test_writes_during_backfill_reach_native_columns(self, legacy_url: str) -> None:
+        _seed_legacy_ledger(legacy_url, transactions=1)
+        db = PostgresDatabase(legacy_url)
+        try:
+            db._add_native_shadow_columns("transactions", ["id", "transaction_date"])
+            conn = db.get_connection()
+            txn_id = uuid4()
+            with conn.cursor() as cur:
+                cur.execute(
+                    "INSERT INTO transactions (id, transaction_date, created_at) "
+                    "VALUES (%s, '2024-02-29', '2024-02-29T00:00:00+00:00')",
+                    (str(txn_id),),
+                )
+                cur.execute(
+                    "SELECT id__native, transaction_date__native FROM transactions "
+                    "WHERE id = %s",
+                    (str(txn_id),),
+                )
+                row = cur.fetchone()
+            conn.commit()
+            assert row["id__native"] == txn_id
+            assert row["transaction_date__native"] == date(2024, 2, 29)
+
+            # Finishes the migration, then adds the columns reads rely on.
+            db.initialize()
+
+            assert PostgresTransactionRepository(db).get(txn_id) is not None
+        finally:
+            db.close()
+
+
 # ===== Integration Tests =====
 
 
@@ -1589,6 +2518,28 @@ class TestPostgresExchangeRateRepository:
         assert len(filtered) == 1
         assert filtered[0].rate == Decimal("0.85")
 
+    def test_list_currency_pairs(
+        self, exchange_rate_repo: "PostgresExchangeRateRepository"
+    ) -> None:
+        for from_currency, to_currency, day in (
+            ("USD", "EUR", 14),
+            ("USD", "EUR", 15),
+            ("GBP", "USD", 15),
+        ):
+            exchange_rate_repo.add(
+                ExchangeRate(
+                    from_currency=from_currency,
+                    to_currency=to_currency,
+                    rate=Decimal("1.1"),
+                    effective_date=date(2024, 1, day),
+                )
+            )
+
+        assert exchange_rate_repo.list_currency_pairs() == [
+            ("GBP", "USD"),
+            ("USD", "EUR"),
+        ]
+
     def test_list_by_date(
         self, exchange_rate_repo: "PostgresExchangeRateRepository"
     ) -> None:
@@ -1822,6 +2773,19 @@ class TestPostgresVendorRepository:
         assert retrieved.default_account_id == account.id
         assert retrieved.default_category == "utilities"
 
+    def test_search_matches_name_and_notes(
+        self, vendor_repo: "PostgresVendorRepository"
+    ) -> None:
+        by_name = Vendor(name="Rentals Inc")
+        by_notes = Vendor(name="Acme Corp", notes="Office rent and parking")
+        inactive = Vendor(name="Rent Co", is_active=False)
+        for vendor in (by_name, by_notes, inactive, Vendor(name="Parent LLC")):
+            vendor_repo.add(vendor)
+
+        results = vendor_repo.search("rent")
+
+        assert [v.id for v in results] == [by_name.id, by_notes.id]
+
 
 # ===== Budget Repository Tests =====
 
@@ -2163,3 +3127,172 @@ class TestPostgresBudgetRepository:
         line_items = list(budget_repo.get_line_items(budget.id))
         assert len(line_items) == 1
         assert line_items[0].account_id == account.id
+
+
+class TestPostgresPeriodCloseRepository:
+    @pytest.fixture
+    def period_close_repo(
+        self, db: "PostgresDatabase"
+    ) -> "PostgresPeriodCloseRepository":
+        return PostgresPeriodCloseRepository(db)
+
+    @pytest.fixture
+    def persisted_entity(self, entity_repo: "PostgresEntityRepository") -> "Entity":
+        entity = Entity(name="Closing Entity", entity_type=EntityType.LLC)
+        entity_repo.add(entity)
+        return entity
+
+    def test_add_and_get_with_balances(
+        self,
+        period_close_repo: "PostgresPeriodCloseRepository",
+        persisted_entity: "Entity",
+    ) -> None:
+        account_id = uuid4()
+        period_close = PeriodClose(
+            entity_id=persisted_entity.id,
+            period_end=date(2024, 12, 31),
+            closing_transaction_id=uuid4(),
+            balances=[
+                AccountTotals(account_id, "EUR", Decimal("1.5"), Decimal("0")),
+                AccountTotals(account_id, "USD", Decimal("10"), Decimal("2.25")),
+            ],
+        )
+
+        period_close_repo.add(period_close)
+
+        retrieved = period_close_repo.get(period_close.id)
+        assert retrieved is not None
+        assert retrieved.period_end == date(2024, 12, 31)
+        assert retrieved.closing_transaction_id == period_close.closing_transaction_id
+        assert retrieved.balances == period_close.balances
+        assert period_close_repo.get(uuid4()) is None
+
+    def test_get_latest_and_closed_through(
+        self,
+        period_close_repo: "PostgresPeriodCloseRepository",
+        persisted_entity: "Entity",
+    ) -> None:
+        for year in (2023, 2022, 2024):
+            period_close_repo.add(
+                PeriodClose(
+                    entity_id=persisted_entity.id, period_end=date(year, 12, 31)
+                )
+            )
+
+        assert [
+            c.period_end.year
+            for c in period_close_repo.list_by_entity(persisted_entity.id)
+        ] == [2022, 2023, 2024]
+        latest = period_close_repo.get_latest(persisted_entity.id, date(2024, 6, 30))
+        assert latest is not None and latest.period_end == date(2023, 12, 31)
+        assert period_close_repo.closed_through([persisted_entity.id, uuid4()]) == {
+            persisted_entity.id: date(2024, 12, 31)
+        }
+
+    def test_transaction_writes_into_closed_period_rejected(
+        self,
+        period_close_repo: "PostgresPeriodCloseRepository",
+        account_repo: "PostgresAccountRepository",
+        transaction_repo: "PostgresTransactionRepository",
+        persisted_entity: "Entity",
+    ) -> None:
+        accounts = [
+            Account(
+                name=account_type.value,
+                entity_id=persisted_entity.id,
+                account_type=account_type,
+            )
+            for account_type in (AccountType.ASSET, AccountType.INCOME)
+        ]
+        for account in accounts:
+            account_repo.add(account)
+
+        def txn(day: date) -> "Transaction":
+            txn = Transaction(transaction_date=day)
+            txn.add_entry(
+                Entry(account_id=accounts[0].id, debit_amount=Money(Decimal("10")))
+            )
+            txn.add_entry(
+                Entry(account_id=accounts[1].id, credit_amount=Money(Decimal("10")))
+            )
+            return txn
+
+        open_txn = txn(date(2025, 2, 1))
+        transaction_repo.add(open_txn)
+        period_close_repo.add(
+            PeriodClose(entity_id=persisted_entity.id, period_end=date(2024, 12, 31))
+        )
+
+        with pytest.raises(PeriodClosedError) as exc_info:
+            transaction_repo.add(txn(date(2024, 12, 31)))
+        assert exc_info.value.entity_id == persisted_entity.id
+        open_txn.transaction_date = date(2024, 12, 1)
+        with pytest.raises(PeriodClosedError):
+            transaction_repo.update(open_txn)
+        assert len(list(transaction_repo.list_by_account(accounts[0].id))) == 1
+
+
+class TestPostgresLedgerVersionRepository:
+    @pytest.fixture
+    def versions(self, db: "PostgresDatabase") -> "PostgresLedgerVersionRepository":
+        return PostgresLedgerVersionRepository(db)
+
+    @pytest.fixture
+    def test_data(
+        self,
+        entity_repo: "PostgresEntityRepository",
+        account_repo: "PostgresAccountRepository",
+    ) -> dict:
+        entities = [
+            Entity(name=name, entity_type=EntityType.LLC) for name in ("A", "B")
+        ]
+        accounts = []
+        for entity in entities:
+            entity_repo.add(entity)
+            for account_type in (AccountType.ASSET, AccountType.INCOME):
+                account = Account(
+                    name=account_type.value,
+                    entity_id=entity.id,
+                    account_type=account_type,
+                )
+                account_repo.add(account)
+                accounts.append(account)
+        return {"entities": entities, "accounts": accounts}
+
+    def test_transaction_writes_bump_only_their_entity(
+        self,
+        versions: "PostgresLedgerVersionRepository",
+        transaction_repo: "PostgresTransactionRepository",
+        test_data: dict,
+    ) -> None:
+        entity_a, entity_b = (e.id for e in test_data["entities"])
+        cash, income = test_data["accounts"][:2]
+        before_a = versions.ledger_version([entity_a])
+        before_b = versions.ledger_version([entity_b])
+        before_all = versions.ledger_version()
+
+        txn = Transaction(transaction_date=date(2024, 1, 15))
+        txn.add_entry(Entry(account_id=cash.id, debit_amount=Money(Decimal("10"))))
+        txn.add_entry(Entry(account_id=income.id, credit_amount=Money(Decimal("10"))))
+        transaction_repo.add(txn)
+
+        assert versions.ledger_version([entity_a]) > before_a
+        assert versions.ledger_version([entity_b]) == before_b
+        assert versions.ledger_version() > before_all
+
+    def test_rate_writes_bump_every_entity(
+        self,
+        versions: "PostgresLedgerVersionRepository",
+        exchange_rate_repo: "PostgresExchangeRateRepository",
+        test_data: dict,
+    ) -> None:
+        entity_ids = [e.id for e in test_data["entities"]]
+        before = [versions.ledger_version([e]) for e in entity_ids]
+
+        exchange_rate_repo.add(
+            ExchangeRate("EUR", "USD", Decimal("1.1"), date(2024, 1, 1))
+        )
+
+        after = [versions.ledger_version([e]) for e in entity_ids]
+        assert all(a > b for a, b in zip(after, before, strict=True))
+        assert versions.scope_version(EXCHANGE_RATE_SCOPE) == 1
@@ -1,13 +1,23 @@
 """Tests for SQLite repository implementations."""
 
+import sqlite3
+import threading
 from datetime import date
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from family_office_ledger.domain.entities import Account, Entity, Position, Security
-from family_office_ledger.domain.transactions import Entry, TaxLot, Transaction
+from family_office_ledger.domain.exchange_rates import ExchangeRate
+from family_office_ledger.domain.ownership import EntityOwnership
+from family_office_ledger.domain.periods import PeriodClose, PeriodClosedError
+from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    Entry,
+    TaxLot,
+    Transaction,
+)
 from family_office_ledger.domain.value_objects import (
     AccountSubType,
     AccountType,
@@ -17,10 +27,18 @@ from family_office_ledger.domain.value_objects import (
     Money,
     Quantity,
 )
+from family_office_ledger.repositories.interfaces import (
+    EXCHANGE_RATE_SCOPE,
+    TransactionRepository,
+)
 from family_office_ledger.repositories.sqlite import (
     SQLiteAccountRepository,
     SQLiteDatabase,
+    SQLiteEntityOwnershipRepository,
     SQLiteEntityRepository,
+    SQLiteExchangeRateRepository,
+    SQLiteLedgerVersionRepository,
+    SQLitePeriodCloseRepository,
     SQLitePositionRepository,
     SQLiteSecurityRepository,
     SQLiteTaxLotRepository,
@@ -394,6 +412,23 @@ class TestSQLiteSecurityRepository:
         result = security_repo.get(uuid4())
         assert result is None
 
+    def test_get_many_spans_chunks_and_skips_missing(
+        self, security_repo: SQLiteSecurityRepository
+    ):
+        securities = [
+            Security(symbol=f"SYM{i}", name=f"Security {i}") for i in range(1203)
+        ]
+        for security in securities:
+            security_repo.add(security)
+        missing = uuid4()
+
+        found = security_repo.get_many([s.id for s in securities] + [missing])
+
+        assert len(found) == 1203
+        assert missing not in found
+        assert found[securities[700].id].symbol == "SYM700"
+        assert security_repo.get_many([]) == {}
+
     def test_get_by_symbol(self, security_repo: SQLiteSecurityRepository):
         security = Security(symbol="MSFT", name="Microsoft Corp")
         security_repo.add(security)
@@ -493,6 +528,24 @@ class TestSQLitePositionRepository:
 
         return {"entity": entity, "account": account, "security": security}
 
+    def test_add_many_positions(
+        self,
+        position_repo: SQLitePositionRepository,
+        security_repo: SQLiteSecurityRepository,
+        test_data: dict,
+    ):
+        other = Security(symbol="MSFT", name="Microsoft Corp.")
+        security_repo.add(other)
+        positions = [
+            Position(account_id=test_data["account"].id, security_id=security.id)
+            for security in (test_data["security"], other)
+        ]
+
+        position_repo.add_many(positions)
+
+        stored = position_repo.list_by_account(test_data["account"].id)
+        assert {p.id for p in stored} == {p.id for p in positions}
+
     def test_add_and_get_position(
         self, position_repo: SQLitePositionRepository, test_data: dict
     ):
@@ -940,6 +993,652 @@ class TestSQLiteTransactionRepository:
         assert date(2024, 1, 15) in dates
         assert date(2024, 2, 15) in dates
 
+    def test_list_by_account_batches_entry_queries(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        amounts = [Decimal(n) for n in range(1, 1201)]
+        for amount in amounts:
+            txn = Transaction(transaction_date=date(2024, 1, 15), memo=str(amount))
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(amount),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(amount),
+                )
+            )
+            transaction_repo.add(txn)
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            transactions = list(
+                transaction_repo.list_by_account(test_accounts["cash"].id)
+            )
+        finally:
+            conn.set_trace_callback(None)
+
+        entry_queries = [s for s in statements if "FROM entries WHERE" in s]
+        assert len(transactions) == 1200
+        assert len(entry_queries) == 3
+        for txn in transactions:
+            assert len(txn.entries) == 2
+            assert txn.entries[0].account_id == test_accounts["cash"].id
+            assert txn.entries[0].debit_amount.amount == Decimal(txn.memo)
+            assert txn.entries[1].credit_amount.amount == Decimal(txn.memo)
+
+    def test_iter_methods_match_list_methods(
+        self,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        for day in (5, 15, 25):
+            self._post(
+                transaction_repo,
+                test_accounts,
+                date(2024, 1, day),
+                Money(Decimal(day)),
+            )
+        account_id = test_accounts["cash"].id
+        entity_id = test_accounts["cash"].entity_id
+        start, end = date(2024, 1, 10), date(2024, 1, 31)
+
+        pairs = [
+            (
+                transaction_repo.iter_by_account(account_id, start, end),
+                transaction_repo.list_by_account(account_id, start, end),
+            ),
+            (
+                transaction_repo.iter_by_entity(entity_id),
+                transaction_repo.list_by_entity(entity_id),
+            ),
+            (
+                transaction_repo.iter_by_date_range(start, end),
+                transaction_repo.list_by_date_range(start, end),
+            ),
+        ]
+
+        for streamed, listed in pairs:
+            assert not isinstance(streamed, list)
+            assert [t.id for t in streamed] == [t.id for t in listed]
+
+    def test_iter_by_account_hydrates_in_chunks(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        for n in range(1, 1201):
+            self._post(
+                transaction_repo,
+                test_accounts,
+                date(2024, 1, 15),
+                Money(Decimal(n)),
+            )
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            stream = transaction_repo.iter_by_account(test_accounts["cash"].id)
+            first = next(stream)
+            queries_after_first = len(
+                [s for s in statements if "FROM entries WHERE" in s]
+            )
+            rest = list(stream)
+        finally:
+            conn.set_trace_callback(None)
+
+        entry_queries = [s for s in statements if "FROM entries WHERE" in s]
+        assert len(first.entries) == 2
+        assert len(rest) == 1199
+        assert queries_after_first == 1
+        assert len(entry_queries) == 3
+
+    def test_list_page_seeks_past_cursor(
+        self,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        for day in (3, 1, 2, 2, 5, 4):
+            self._post(
+                transaction_repo,
+                test_accounts,
+                date(2024, 1, day),
+                Money(Decimal(day)),
+            )
+        expected = TransactionRepository.list_page(
+            transaction_repo, account_id=test_accounts["cash"].id, limit=10
+        )
+
+        for filters in ({"account_id": test_accounts["cash"].id}, {}):
+            pages: list[list[Transaction]] = []
+            after = None
+            while page := transaction_repo.list_page(after=after, limit=4, **filters):
+                pages.append(page)
+                after = (page[-1].transaction_date, page[-1].id)
+
+            assert [len(page) for page in pages] == [4, 2]
+            assert [t.id for page in pages for t in page] == [t.id for t in expected]
+
+        window = transaction_repo.list_page(
+            start_date=date(2024, 1, 2), end_date=date(2024, 1, 4)
+        )
+        assert [t.transaction_date.day for t in window] == [2, 2, 3, 4]
+
+    def _post(
+        self,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+        txn_date: date,
+        amount: Money,
+    ) -> None:
+        txn = Transaction(transaction_date=txn_date)
+        txn.add_entry(Entry(account_id=test_accounts["cash"].id, debit_amount=amount))
+        txn.add_entry(
+            Entry(account_id=test_accounts["income"].id, credit_amount=amount)
+        )
+        transaction_repo.add(txn)
+
+    def test_sum_by_account_groups_by_account_and_currency(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("100.25"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 2), Money(Decimal("50.50"))
+        )
+        self._post(
+            transaction_repo,
+            test_accounts,
+            date(2024, 1, 3),
+            Money(Decimal("10"), "EUR"),
+        )
+
+        totals = {
+            (t.account_id, t.currency): t
+            for t in transaction_repo.sum_by_account(
+                [test_accounts["cash"].id, test_accounts["income"].id]
+            )
+        }
+
+        assert len(totals) == 4
+        cash_usd = totals[(test_accounts["cash"].id, "USD")]
+        assert cash_usd.debit_total == Decimal("150.75")
+        assert cash_usd.credit_total == Decimal("0")
+        assert totals[(test_accounts["cash"].id, "EUR")].balance == Decimal("10")
+        assert totals[(test_accounts["income"].id, "USD")].balance == Decimal("-150.75")
+
+    def test_sum_by_account_respects_date_window(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        for day in (1, 15, 31):
+            self._post(
+                transaction_repo, test_accounts, date(2024, 1, day), Money(Decimal(day))
+            )
+
+        cash_id = test_accounts["cash"].id
+        as_of = list(
+            transaction_repo.sum_by_account([cash_id], as_of=date(2024, 1, 15))
+        )
+        window = list(
+            transaction_repo.sum_by_account(
+                [cash_id], as_of=date(2024, 1, 31), start=date(2024, 1, 15)
+            )
+        )
+
+        assert [t.debit_total for t in as_of] == [Decimal("16")]
+        assert [t.debit_total for t in window] == [Decimal("46")]
+        assert (
+            list(transaction_repo.sum_by_account([cash_id], as_of=date(2023, 12, 31)))
+            == []
+        )
+
+    def test_iter_account_totals_matches_sum_by_account(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        for day, amount in ((1, Money(Decimal("5"))), (9, Money(Decimal("7"), "EUR"))):
+            self._post(transaction_repo, test_accounts, date(2024, 1, day), amount)
+        self._post(
+            transaction_repo, test_accounts, date(2024, 2, 1), Money(Decimal("11"))
+        )
+        ids = [test_accounts["cash"].id, test_accounts["income"].id]
+
+        streamed = list(
+            transaction_repo.iter_account_totals(ids, as_of=date(2024, 1, 31))
+        )
+
+        assert streamed == sorted(
+            transaction_repo.sum_by_account(ids, as_of=date(2024, 1, 31)),
+            key=lambda t: (t.account_id, t.currency),
+        )
+        assert len(streamed) == 4
+        assert list(transaction_repo.iter_account_totals(ids[:1])) == [
+            t
+            for t in transaction_repo.iter_account_totals(ids)
+            if t.account_id == ids[0]
+        ]
+
+    def test_iter_balance_history_matches_default(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        for day, amount in (
+            (9, Money(Decimal("7"), "EUR")),
+            (1, Money(Decimal("5"))),
+            (9, Money(Decimal("3"))),
+        ):
+            self._post(transaction_repo, test_accounts, date(2024, 1, day), amount)
+        self._post(
+            transaction_repo, test_accounts, date(2024, 2, 1), Money(Decimal("11"))
+        )
+        ids = [test_accounts["cash"].id, test_accounts["income"].id]
+
+        def key(item: tuple[date, AccountTotals]) -> tuple[date, UUID, str]:
+            return item[0], item[1].account_id, item[1].currency
+
+        streamed = list(
+            transaction_repo.iter_balance_history(ids, as_of=date(2024, 1, 31))
+        )
+        folded = TransactionRepository.iter_balance_history(
+            transaction_repo, ids, as_of=date(2024, 1, 31)
+        )
+
+        assert [day for day, _ in streamed] == sorted(day for day, _ in streamed)
+        assert sorted(streamed, key=key) == sorted(folded, key=key)
+        assert (
+            date(2024, 1, 9),
+            AccountTotals(test_accounts["cash"].id, "USD", Decimal("8")),
+        ) in streamed
+        assert len(streamed) == 6
+
+    def test_sum_by_account_since_matches_default(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        for day in (1, 15, 31):
+            self._post(
+                transaction_repo, test_accounts, date(2024, 1, day), Money(Decimal(day))
+            )
+        cash_id = test_accounts["cash"].id
+        opening = list(
+            transaction_repo.sum_by_account([cash_id], as_of=date(2024, 1, 15))
+        )
+
+        def since(repo: TransactionRepository, as_of: date) -> list[AccountTotals]:
+            return list(
+                repo.sum_by_account_since(
+                    opening, date(2024, 1, 15), [cash_id], as_of=as_of
+                )
+            )
+
+        for as_of in (date(2024, 1, 20), date(2024, 2, 1)):
+            carried = since(transaction_repo, as_of)
+            folded = TransactionRepository.sum_by_account_since(
+                transaction_repo, opening, date(2024, 1, 15), [cash_id], as_of=as_of
+            )
+            assert carried == list(folded)
+        assert [t.balance for t in since(transaction_repo, date(2024, 2, 1))] == [
+            Decimal("47")
+        ]
+
+    def test_sum_by_account_since_seeds_from_opening(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        for day in (1, 20):
+            self._post(
+                transaction_repo, test_accounts, date(2024, 1, day), Money(Decimal(day))
+            )
+        cash_id = test_accounts["cash"].id
+        opening = [AccountTotals(cash_id, "USD", Decimal("100"), Decimal("40"))]
+
+        carried = transaction_repo.sum_by_account_since(
+            opening, date(2024, 1, 15), [cash_id], as_of=date(2024, 1, 31)
+        )
+
+        assert list(carried) == [
+            AccountTotals(cash_id, "USD", Decimal("120"), Decimal("40"))
+        ]
+        assert (
+            list(
+                transaction_repo.sum_by_account_since(
+                    opening, date(2024, 1, 15), [cash_id], as_of=date(2024, 1, 15)
+                )
+            )
+            == opening
+        )
+
+    def test_sum_by_account_sums_unscaled_amounts_exactly(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("1.25"))
+        )
+        self._post(
+            transaction_repo,
+            test_accounts,
+            date(2024, 1, 2),
+            Money(Decimal("0.0000001")),
+        )
+
+        totals = list(transaction_repo.sum_by_account([test_accounts["cash"].id]))
+
+        assert len(totals) == 1
+        assert totals[0].debit_total == Decimal("1.2500001")
+
+    def test_backfill_entry_minor_units(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        for amount in ("1.10", "2.20", "3.30"):
+            self._post(
+                transaction_repo,
+                test_accounts,
+                date(2024, 1, 1),
+                Money(Decimal(amount)),
+            )
+        conn = db.get_connection()
+        conn.execute(
+            "UPDATE entries SET debit_amount_minor = NULL, credit_amount_minor = NULL"
+        )
+        conn.commit()
+
+        updated = db.backfill_entry_minor_units(batch_size=4)
+
+        assert updated == 6
+        rows = conn.execute(
+            "SELECT debit_amount_minor FROM entries "
+            "WHERE account_id = ? ORDER BY debit_amount_minor",
+            (str(test_accounts["cash"].id),),
+        ).fetchall()
+        assert [row[0] for row in rows] == [1_100_000, 2_200_000, 3_300_000]
+        totals = list(transaction_repo.sum_by_account([test_accounts["cash"].id]))
+        assert totals[0].debit_total == Decimal("6.6")
+
+    def _snapshots(self, db: SQLiteDatabase, account_id) -> list[tuple[str, str, str]]:
+        rows = db.get_connection().execute(
+            "SELECT snapshot_date, debit_total, credit_total "
+            "FROM account_balance_snapshots WHERE account_id = ? "
+            "ORDER BY snapshot_date",
+            (str(account_id),),
+        )
+        return [(row[0], str(Decimal(row[1])), str(Decimal(row[2]))) for row in rows]
+
+    def test_add_maintains_running_balance_snapshots(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("10"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 3), Money(Decimal("5"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 3), Money(Decimal("1"))
+        )
+        # Backdated posting shifts every later snapshot.
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 2), Money(Decimal("2"))
+        )
+
+        assert self._snapshots(db, test_accounts["cash"].id) == [
+            ("2024-01-01", "10", "0"),
+            ("2024-01-02", "12", "0"),
+            ("2024-01-03", "18", "0"),
+        ]
+        assert self._snapshots(db, test_accounts["income"].id)[-1] == (
+            "2024-01-03",
+            "0",
+            "18",
+        )
+        assert db.verify_balance_snapshots() == []
+
+    def test_update_moving_transaction_date_moves_snapshot(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("10"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 5), Money(Decimal("5"))
+        )
+        txn = next(
+            t
+            for t in transaction_repo.list_by_account(test_accounts["cash"].id)
+            if t.transaction_date == date(2024, 1, 5)
+        )
+
+        txn.transaction_date = date(2024, 1, 9)
+        transaction_repo.update(txn)
+
+        assert self._snapshots(db, test_accounts["cash"].id) == [
+            ("2024-01-01", "10", "0"),
+            ("2024-01-09", "15", "0"),
+        ]
+        assert db.verify_balance_snapshots() == []
+
+    def test_verify_reports_and_rebuild_repairs_snapshots(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("10"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 2), Money(Decimal("5"))
+        )
+        conn = db.get_connection()
+        conn.execute(
+            "UPDATE account_balance_snapshots SET debit_total = '99' "
+            "WHERE snapshot_date = '2024-01-02' AND account_id = ?",
+            (str(test_accounts["cash"].id),),
+        )
+        conn.execute(
+            "INSERT INTO account_balance_snapshots VALUES (?, 'USD', '2023-12-31', '1', '0')",
+            (str(test_accounts["cash"].id),),
+        )
+        conn.commit()
+
+        discrepancies = db.verify_balance_snapshots()
+
+        assert {(d.snapshot_date, d.stored, d.expected) for d in discrepancies} == {
+            (
+                date(2024, 1, 2),
+                (Decimal("99"), Decimal("0")),
+                (Decimal("15"), Decimal("0")),
+            ),
+            (date(2023, 12, 31), (Decimal("1"), Decimal("0")), None),
+        }
+        assert db.rebuild_balance_snapshots() == 4
+        assert db.verify_balance_snapshots() == []
+
+    def test_sum_by_account_reads_latest_snapshot(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        self._post(
+            transaction_repo, test_accounts, date(2024, 1, 1), Money(Decimal("10"))
+        )
+        self._post(
+            transaction_repo, test_accounts, date(2024, 2, 1), Money(Decimal("5"))
+        )
+
+        statements: list[str] = []
+        conn = db.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            totals = list(
+                transaction_repo.sum_by_account(
+                    [test_accounts["cash"].id], as_of=date(2024, 1, 31)
+                )
+            )
+        finally:
+            conn.set_trace_callback(None)
+
+        assert [t.debit_total for t in totals] == [Decimal("10")]
+        assert len(statements) == 1
+        assert "account_balance_snapshots" in statements[0]
+
+    def test_add_many_inserts_transactions_and_snapshots(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        txns = []
+        for day, amount in ((2, "5"), (1, "10"), (2, "7")):
+            txn = Transaction(transaction_date=date(2024, 1, day), memo=amount)
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["cash"].id,
+                    debit_amount=Money(Decimal(amount)),
+                )
+            )
+            txn.add_entry(
+                Entry(
+                    account_id=test_accounts["income"].id,
+                    credit_amount=Money(Decimal(amount)),
+                )
+            )
+            txns.append(txn)
+
+        transaction_repo.add_many(txns)
+
+        stored = list(transaction_repo.list_by_account(test_accounts["cash"].id))
+        assert sorted(t.memo for t in stored) == ["10", "5", "7"]
+        assert all(len(t.entries) == 2 for t in stored)
+        assert self._snapshots(db, test_accounts["cash"].id) == [
+            ("2024-01-01", "10", "0"),
+            ("2024-01-02", "22", "0"),
+        ]
+        assert db.verify_balance_snapshots() == []
+
+    def test_add_many_rolls_back_on_failure(
+        self,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        txn = Transaction(transaction_date=date(2024, 1, 1))
+        txn.add_entry(
+            Entry(account_id=test_accounts["cash"].id, debit_amount=Money(Decimal("1")))
+        )
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["income"].id,
+                credit_amount=Money(Decimal("1")),
+            )
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            transaction_repo.add_many([txn, txn])
+
+        assert transaction_repo.get(txn.id) is None
+        assert list(transaction_repo.sum_by_account([test_accounts["cash"].id])) == []
+
+    def _post_memo(
+        self,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+        memo: str,
+        reference: str = "",
+        category: str | None = None,
+    ) -> Transaction:
+        txn = Transaction(
+            transaction_date=date(2024, 1, 1),
+            memo=memo,
+            reference=reference,
+            category=category,
+        )
+        txn.add_entry(
+            Entry(account_id=test_accounts["cash"].id, debit_amount=Money(Decimal("1")))
+        )
+        txn.add_entry(
+            Entry(
+                account_id=test_accounts["income"].id,
+                credit_amount=Money(Decimal("1")),
+            )
+        )
+        transaction_repo.add(txn)
+        return txn
+
+    def test_search_matches_word_prefixes_ranked_by_field(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        by_category = self._post_memo(
+            transaction_repo, test_accounts, "Quarterly payment", category="rent"
+        )
+        by_memo = self._post_memo(transaction_repo, test_accounts, "Office rental")
+        self._post_memo(transaction_repo, test_accounts, "Parent company fee")
+        by_reference = self._post_memo(
+            transaction_repo, test_accounts, "Invoice", reference="INV-42"
+        )
+
+        assert [t.id for t in transaction_repo.search("ren")] == [
+            by_memo.id,
+            by_category.id,
+        ]
+        assert [t.id for t in transaction_repo.search("inv 42")] == [by_reference.id]
+        assert transaction_repo.search("rent", limit=1)[0].id == by_memo.id
+
+    def test_search_treats_query_syntax_as_words(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        txn = self._post_memo(transaction_repo, test_accounts, "Wire OR check")
+
+        assert [t.id for t in transaction_repo.search('"wire" OR (')] == [txn.id]
+        assert transaction_repo.search('" * ()') == []
+
+    def test_search_follows_updates(
+        self, transaction_repo: SQLiteTransactionRepository, test_accounts: dict
+    ):
+        txn = self._post_memo(transaction_repo, test_accounts, "Staples order")
+
+        txn.memo = "Printer paper"
+        transaction_repo.update(txn)
+
+        assert transaction_repo.search("staples") == []
+        assert [t.id for t in transaction_repo.search("printer")] == [txn.id]
+
+    def test_initialize_indexes_existing_transactions(
+        self,
+        db: SQLiteDatabase,
+        transaction_repo: SQLiteTransactionRepository,
+        test_accounts: dict,
+    ):
+        conn = db.get_connection()
+        conn.executescript(
+            """
+            DROP TRIGGER transactions_fts_insert;
+            DROP TRIGGER transactions_fts_delete;
+            DROP TRIGGER transactions_fts_update;
+            DROP TABLE transactions_fts;
+            """
+        )
+        txn = self._post_memo(transaction_repo, test_accounts, "Legacy import")
+
+        db.initialize()
+
+        assert [t.id for t in transaction_repo.search("legacy")] == [txn.id]
+
 
 # ===== Tax Lot Repository Tests =====
 
@@ -974,6 +1673,61 @@ class TestSQLiteTaxLotRepository:
         position_repo.add(position)
         return position
 
+    def test_add_many_tax_lots(
+        self, tax_lot_repo: SQLiteTaxLotRepository, test_position: Position
+    ):
+        lots = [
+            TaxLot(
+                position_id=test_position.id,
+                acquisition_date=date(2023, month, 1),
+                cost_per_share=Money(Decimal("100.00") + month),
+                original_quantity=Quantity(Decimal("10")),
+            )
+            for month in (3, 1, 2)
+        ]
+
+        tax_lot_repo.add_many(lots)
+
+        stored = list(tax_lot_repo.list_by_position(test_position.id))
+        assert [lot.acquisition_date.month for lot in stored] == [1, 2, 3]
+        assert stored[0].cost_per_share == Money(Decimal("101.00"))
+
+    def test_list_by_positions_groups_lots(
+        self,
+        tax_lot_repo: SQLiteTaxLotRepository,
+        security_repo: SQLiteSecurityRepository,
+        position_repo: SQLitePositionRepository,
+        test_position: Position,
+    ):
+        security = Security(symbol="MSFT", name="Microsoft Corp")
+        security_repo.add(security)
+        other = Position(account_id=test_position.account_id, security_id=security.id)
+        position_repo.add(other)
+        lots = [
+            TaxLot(
+                position_id=position.id,
+                acquisition_date=date(2023, month, 1),
+                cost_per_share=Money(Decimal("100.00")),
+                original_quantity=Quantity(Decimal("10")),
+            )
+            for position, month in (
+                (test_position, 2),
+                (other, 5),
+                (test_position, 1),
+            )
+        ]
+        tax_lot_repo.add_many(lots)
+        empty = uuid4()
+
+        grouped = tax_lot_repo.list_by_positions([test_position.id, other.id, empty])
+
+        assert [lot.acquisition_date.month for lot in grouped[test_position.id]] == [
+            1,
+            2,
+        ]
+        assert [lot.id for lot in grouped[other.id]] == [lots[1].id]
+        assert empty not in grouped
+
     def test_add_and_get_tax_lot(
         self, tax_lot_repo: SQLiteTaxLotRepository, test_position: Position
     ):
@@ -1183,6 +1937,321 @@ class TestSQLiteTaxLotRepository:
         assert retrieved.created_at == original_created_at
 
 
+# ===== Period Close Repository Tests =====
+
+
+class TestSQLitePeriodCloseRepository:
+    @pytest.fixture
+    def period_close_repo(self, db: SQLiteDatabase) -> SQLitePeriodCloseRepository:
+        return SQLitePeriodCloseRepository(db)
+
+    @pytest.fixture
+    def entity(self, entity_repo: SQLiteEntityRepository) -> Entity:
+        entity = Entity(name="Closing Entity", entity_type=EntityType.LLC)
+        entity_repo.add(entity)
+        return entity
+
+    def test_add_and_get_with_balances(
+        self, period_close_repo: SQLitePeriodCloseRepository, entity: Entity
+    ):
+        account_id = uuid4()
+        period_close = PeriodClose(
+            entity_id=entity.id,
+            period_end=date(2024, 12, 31),
+            closing_transaction_id=uuid4(),
+            balances=[
+                AccountTotals(account_id, "EUR", Decimal("1.5"), Decimal("0")),
+                AccountTotals(account_id, "USD", Decimal("10"), Decimal("2.25")),
+            ],
+        )
+
+        period_close_repo.add(period_close)
+
+        assert period_close_repo.get(period_close.id) == period_close
+        assert period_close_repo.get(uuid4()) is None
+
+    def test_get_latest_and_list_by_entity(
+        self,
+        period_close_repo: SQLitePeriodCloseRepository,
+        entity: Entity,
+    ):
+        closes = [
+            PeriodClose(entity_id=entity.id, period_end=date(year, 12, 31))
+            for year in (2023, 2022, 2024)
+        ]
+        for period_close in closes:
+            period_close_repo.add(period_close)
+
+        assert [
+            c.period_end.year for c in period_close_repo.list_by_entity(entity.id)
+        ] == [
+            2022,
+            2023,
+            2024,
+        ]
+        latest = period_close_repo.get_latest(entity.id)
+        assert latest is not None and latest.period_end == date(2024, 12, 31)
+        latest = period_close_repo.get_latest(entity.id, date(2024, 6, 30))
+        assert latest is not None and latest.period_end == date(2023, 12, 31)
+        assert period_close_repo.get_latest(entity.id, date(2022, 12, 30)) is None
+
+        other = uuid4()
+        assert period_close_repo.closed_through([entity.id, other]) == {
+            entity.id: date(2024, 12, 31)
+        }
+
+    def test_transaction_writes_into_closed_period_rejected(
+        self,
+        period_close_repo: SQLitePeriodCloseRepository,
+        account_repo: SQLiteAccountRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        entity: Entity,
+    ):
+        cash = Account(name="Cash", entity_id=entity.id, account_type=AccountType.ASSET)
+        income = Account(
+            name="Income", entity_id=entity.id, account_type=AccountType.INCOME
+        )
+        account_repo.add(cash)
+        account_repo.add(income)
+
+        def txn(day: date) -> Transaction:
+            return Transaction(
+                transaction_date=day,
+                entries=[
+                    Entry(account_id=cash.id, debit_amount=Money(Decimal("10"))),
+                    Entry(account_id=income.id, credit_amount=Money(Decimal("10"))),
+                ],
+            )
+
+        closed = txn(date(2024, 6, 1))
+        open_txn = txn(date(2025, 2, 1))
+        transaction_repo.add_many([closed, open_txn])
+        period_close_repo.add(
+            PeriodClose(entity_id=entity.id, period_end=date(2024, 12, 31))
+        )
+
+        with pytest.raises(PeriodClosedError) as exc_info:
+            transaction_repo.add_many([txn(date(2025, 1, 2)), txn(date(2024, 12, 31))])
+        assert exc_info.value.closed_through == date(2024, 12, 31)
+        assert len(list(transaction_repo.list_by_account(cash.id))) == 2
+
+        open_txn.transaction_date = date(2024, 12, 1)
+        with pytest.raises(PeriodClosedError):
+            transaction_repo.update(open_txn)
+        closed.transaction_date = date(2025, 1, 15)
+        with pytest.raises(PeriodClosedError):
+            transaction_repo.update(closed)
+
+        closed.transaction_date = date(2024, 6, 1)
+        closed.memo = "annotated"
+        transaction_repo.update(closed)
+        retrieved = transaction_repo.get(closed.id)
+        assert retrieved is not None and retrieved.memo == "annotated"
+
+
+class TestSQLiteLedgerVersionRepository:
+    @pytest.fixture
+    def versions(self, db: SQLiteDatabase) -> SQLiteLedgerVersionRepository:
+        return SQLiteLedgerVersionRepository(db)
+
+    @pytest.fixture
+    def ledger(
+        self,
+        entity_repo: SQLiteEntityRepository,
+        account_repo: SQLiteAccountRepository,
+        security_repo: SQLiteSecurityRepository,
+        position_repo: SQLitePositionRepository,
+    ) -> dict:
+        entities = [
+            Entity(name=name, entity_type=EntityType.LLC) for name in ("A", "B")
+        ]
+        accounts = []
+        for entity in entities:
+            entity_repo.add(entity)
+            for account_type in (AccountType.ASSET, AccountType.INCOME):
+                account = Account(
+                    name=account_type.value,
+                    entity_id=entity.id,
+                    account_type=account_type,
+                )
+                account_repo.add(account)
+                accounts.append(account)
+        security = Security(symbol="AAPL", name="Apple Inc.")
+        security_repo.add(security)
+        position = Position(account_id=accounts[0].id, security_id=security.id)
+        position_repo.add(position)
+        return {"entities": entities, "accounts": accounts, "position": position}
+
+    def _txn(self, debit: Account, credit: Account) -> Transaction:
+        return Transaction(
+            transaction_date=date(2024, 1, 15),
+            entries=[
+                Entry(account_id=debit.id, debit_amount=Money(Decimal("10"))),
+                Entry(account_id=credit.id, credit_amount=Money(Decimal("10"))),
+            ],
+        )
+
+    def test_empty_database_is_version_zero(
+        self, versions: SQLiteLedgerVersionRepository
+    ):
+        assert versions.ledger_version() == 0
+        assert versions.ledger_version([uuid4()]) == 0
+
+    def test_transaction_writes_bump_only_their_entity(
+        self,
+        versions: SQLiteLedgerVersionRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        ledger: dict,
+    ):
+        entity_a, entity_b = (e.id for e in ledger["entities"])
+        a_cash, a_income = ledger["accounts"][:2]
+        before_a = versions.ledger_version([entity_a])
+        before_b = versions.ledger_version([entity_b])
+        before_all = versions.ledger_version()
+
+        txn = self._txn(a_cash, a_income)
+        transaction_repo.add(txn)
+
+        after_add = versions.ledger_version([entity_a])
+        assert after_add > before_a
+        assert versions.ledger_version([entity_b]) == before_b
+        assert versions.ledger_version() > before_all
+
+        txn.memo = "edited"
+        transaction_repo.update(txn)
+        assert versions.ledger_version([entity_a]) > after_add
+        assert versions.ledger_version([entity_b]) == before_b
+
+    def test_position_and_lot_writes_bump_the_account_entity(
+        self,
+        versions: SQLiteLedgerVersionRepository,
+        position_repo: SQLitePositionRepository,
+        tax_lot_repo: SQLiteTaxLotRepository,
+        ledger: dict,
+    ):
+        entity_a, entity_b = (e.id for e in ledger["entities"])
+        position = ledger["position"]
+        before_b = versions.ledger_version([entity_b])
+
+        version = versions.ledger_version([entity_a])
+        position.update_market_value(Decimal("150"))
+        position_repo.update(position)
+        assert versions.ledger_version([entity_a]) > version
+
+        version = versions.ledger_version([entity_a])
+        lot = TaxLot(
+            position_id=position.id,
+            acquisition_date=date(2023, 1, 1),
+            cost_per_share=Money(Decimal("100")),
+            original_quantity=Quantity(Decimal("1")),
+        )
+        tax_lot_repo.add(lot)
+        assert versions.ledger_version([entity_a]) > version
+
+        version = versions.ledger_version([entity_a])
+        lot.remaining_quantity = Quantity(Decimal("0.5"))
+        tax_lot_repo.update(lot)
+        assert versions.ledger_version([entity_a]) > version
+
+        assert versions.ledger_version([entity_b]) == before_b
+
+    def test_rate_and_security_writes_bump_every_entity(
+        self,
+        db: SQLiteDatabase,
+        versions: SQLiteLedgerVersionRepository,
+        security_repo: SQLiteSecurityRepository,
+        ledger: dict,
+    ):
+        entity_ids = [e.id for e in ledger["entities"]]
+        before = [versions.ledger_version([entity_id]) for entity_id in entity_ids]
+
+        rate = ExchangeRate("EUR", "USD", Decimal("1.1"), date(2024, 1, 1))
+        SQLiteExchangeRateRepository(db).add(rate)
+        after_rate = [versions.ledger_version([e]) for e in entity_ids]
+        assert all(a > b for a, b in zip(after_rate, before, strict=True))
+
+        SQLiteExchangeRateRepository(db).delete(rate.id)
+        security_repo.add(Security(symbol="MSFT", name="Microsoft"))
+        after = [versions.ledger_version([e]) for e in entity_ids]
+        assert all(a > b for a, b in zip(after, after_rate, strict=True))
+
+    def test_only_rate_writes_bump_the_rate_scope(
+        self,
+        db: SQLiteDatabase,
+        versions: SQLiteLedgerVersionRepository,
+        security_repo: SQLiteSecurityRepository,
+    ):
+        assert versions.scope_version(EXCHANGE_RATE_SCOPE) == 0
+
+        rate = ExchangeRate("EUR", "USD", Decimal("1.1"), date(2024, 1, 1))
+        SQLiteExchangeRateRepository(db).add(rate)
+        SQLiteExchangeRateRepository(db).delete(rate.id)
+        assert versions.scope_version(EXCHANGE_RATE_SCOPE) == 2
+
+        security_repo.add(Security(symbol="MSFT", name="Microsoft"))
+        assert versions.scope_version(EXCHANGE_RATE_SCOPE) == 2
+
+    def test_ownership_writes_bump_owner_and_owned(
+        self,
+        db: SQLiteDatabase,
+        versions: SQLiteLedgerVersionRepository,
+        entity_repo: SQLiteEntityRepository,
+        ledger: dict,
+    ):
+        entity_a, entity_b = (e.id for e in ledger["entities"])
+        bystander = Entity(name="C", entity_type=EntityType.TRUST)
+        entity_repo.add(bystander)
+        ownership_repo = SQLiteEntityOwnershipRepository(db)
+        before_c = versions.ledger_version([bystander.id])
+
+        def versions_of_pair() -> tuple[int, int]:
+            return (
+                versions.ledger_version([entity_a]),
+                versions.ledger_version([entity_b]),
+            )
+
+        def assert_both_bumped(before: tuple[int, int]) -> tuple[int, int]:
+            after = versions_of_pair()
+            assert after[0] > before[0] and after[1] > before[1]
+            return after
+
+        before = versions_of_pair()
+        ownership = EntityOwnership(
+            owner_entity_id=entity_a,
+            owned_entity_id=entity_b,
+            ownership_fraction=Decimal("0.5"),
+            effective_start_date=date(2024, 1, 1),
+        )
+        ownership_repo.add(ownership)
+        before = assert_both_bumped(before)
+
+        ownership.ownership_fraction = Decimal("0.6")
+        ownership_repo.update(ownership)
+        before = assert_both_bumped(before)
+
+        ownership_repo.delete(ownership.id)
+        assert_both_bumped(before)
+
+        assert versions.ledger_version([bystander.id]) == before_c
+
+    def test_rolled_back_write_does_not_bump(
+        self,
+        db: SQLiteDatabase,
+        versions: SQLiteLedgerVersionRepository,
+        transaction_repo: SQLiteTransactionRepository,
+        ledger: dict,
+    ):
+        entity_a = ledger["entities"][0].id
+        a_cash, a_income = ledger["accounts"][:2]
+        before = versions.ledger_version([entity_a])
+
+        with pytest.raises(RuntimeError), db.unit_of_work():
+            transaction_repo.add(self._txn(a_cash, a_income))
+            raise RuntimeError("abort")
+
+        assert versions.ledger_version([entity_a]) == before
+
+
 # ===== Database Tests =====
 
 
@@ -1221,6 +2290,115 @@ class TestSQLiteDatabase:
         # After close, get_connection should create a new connection
         assert db._connection is None
 
+    def test_unit_of_work_commits_once_at_end(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db")
+        db.initialize()
+        reader = SQLiteDatabase(tmp_path / "ledger.db")
+        entity_repo = SQLiteEntityRepository(db)
+
+        with db.unit_of_work():
+            entity_repo.add(Entity(name="First", entity_type=EntityType.LLC))
+            with db.unit_of_work():
+                entity_repo.add(Entity(name="Second", entity_type=EntityType.LLC))
+            assert list(SQLiteEntityRepository(reader).list_all()) == []
+
+        names = {e.name for e in SQLiteEntityRepository(reader).list_all()}
+        assert names == {"First", "Second"}
+
+    def test_unit_of_work_rolls_back_on_error(self):
+        db = SQLiteDatabase(":memory:")
+        db.initialize()
+        entity_repo = SQLiteEntityRepository(db)
+
+        with pytest.raises(RuntimeError), db.unit_of_work():
+            entity_repo.add(Entity(name="Doomed", entity_type=EntityType.LLC))
+            raise RuntimeError("boom")
+
+        assert entity_repo.get_by_name("Doomed") is None
+        entity_repo.add(Entity(name="Kept", entity_type=EntityType.LLC))
+        assert entity_repo.get_by_name("Kept") is not None
+
+    def test_file_database_uses_wal_and_pragmas(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db", busy_timeout=2.5)
+        conn = db.get_connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 2500
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_rejects_unknown_synchronous_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteDatabase(tmp_path / "ledger.db", synchronous="FAST; DROP")
+
+    def test_file_database_uses_one_connection_per_thread(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db")
+        main_conn = db.get_connection()
+        other: list[sqlite3.Connection] = []
+
+        thread = threading.Thread(target=lambda: other.append(db.get_connection()))
+        thread.start()
+        thread.join()
+
+        assert db.get_connection() is main_conn
+        assert other[0] is not main_conn
+
+        db.close()
+        assert db.get_connection() is not main_conn
+
+    def test_connect_opens_unpooled_configured_connection(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db")
+        db.initialize()
+
+        conn = db.connect()
+        try:
+            assert conn is not db.get_connection()
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            read_only = db.reader().connect()
+            assert read_only.execute("PRAGMA query_only").fetchone()[0] == 1
+            read_only.close()
+        finally:
+            conn.close()
+            db.close()
+
+    def test_reader_sees_committed_data_while_writer_is_open(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db")
+        db.initialize()
+        entity_repo = SQLiteEntityRepository(db)
+        entity_repo.add(Entity(name="Committed", entity_type=EntityType.LLC))
+        reader_repo = SQLiteEntityRepository(db.reader())
+
+        with db.unit_of_work():
+            entity_repo.add(Entity(name="Pending", entity_type=EntityType.LLC))
+            names: list[str] = []
+            thread = threading.Thread(
+                target=lambda: names.extend(e.name for e in reader_repo.list_all())
+            )
+            thread.start()
+            thread.join(timeout=1)
+            assert not thread.is_alive()
+            assert names == ["Committed"]
+
+        assert {e.name for e in reader_repo.list_all()} == {"Committed", "Pending"}
+
+    def test_reader_is_read_only(self, tmp_path):
+        db = SQLiteDatabase(tmp_path / "ledger.db")
+        db.initialize()
+        reader = db.reader()
+
+        assert reader.read_only
+        assert db.reader() is reader
+        with pytest.raises(sqlite3.OperationalError):
+            SQLiteEntityRepository(reader).add(
+                Entity(name="Nope", entity_type=EntityType.LLC)
+            )
+
+    def test_in_memory_reader_is_the_database(self):
+        db = SQLiteDatabase(":memory:")
+
+        assert db.reader() is db
+
     def test_initialize_is_idempotent(self):
         db = SQLiteDatabase(":memory:")
         db.initialize()
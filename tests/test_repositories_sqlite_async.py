@@ -0,0 +1,227 @@
+"""Tests for the aiosqlite repository implementations."""
+
+import asyncio
+import threading
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from family_office_ledger.domain.entities import Account, Entity
+from family_office_ledger.domain.transactions import Entry, Transaction
+from family_office_ledger.domain.value_objects import (
+    AccountType,
+    EntityType,
+    Money,
+)
+from family_office_ledger.repositories.sqlite import (
+    SQLiteAccountRepository,
+    SQLiteDatabase,
+    SQLiteEntityRepository,
+    SQLiteLedgerVersionRepository,
+    SQLiteTransactionRepository,
+)
+from family_office_ledger.repositories.sqlite_async import (
+    AsyncSQLiteAccountRepository,
+    AsyncSQLiteDatabase,
+    AsyncSQLiteEntityRepository,
+    AsyncSQLiteLedgerVersionRepository,
+    AsyncSQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=["file", "memory"])
+def db(request, tmp_path) -> SQLiteDatabase:
+    """A file-backed database (aiosqlite threads) or an in-memory one (inline)."""
+    path = tmp_path / "ledger.db" if request.param == "file" else ":memory:"
+    database = SQLiteDatabase(path, check_same_thread=False)
+    database.initialize()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def async_db(db: SQLiteDatabase) -> AsyncSQLiteDatabase:
+    return db.async_database(readers=2)
+
+
+@pytest.fixture
+def entity(db: SQLiteDatabase) -> Entity:
+    entity = Entity(name="Smith Family Trust", entity_type=EntityType.TRUST)
+    SQLiteEntityRepository(db).add(entity)
+    return entity
+
+
+@pytest.fixture
+def accounts(db: SQLiteDatabase, entity: Entity) -> dict[str, Account]:
+    repo = SQLiteAccountRepository(db)
+    accounts = {
+        "cash": Account(
+            name="Cash", entity_id=entity.id, account_type=AccountType.ASSET
+        ),
+        "income": Account(
+            name="Income", entity_id=entity.id, account_type=AccountType.INCOME
+        ),
+    }
+    for account in accounts.values():
+        repo.add(account)
+    return accounts
+
+
+def _deposit(
+    accounts: dict[str, Account], day: date, amount: str = "100.00"
+) -> Transaction:
+    txn = Transaction(transaction_date=day, memo=f"Deposit {day}")
+    txn.add_entry(
+        Entry(account_id=accounts["cash"].id, debit_amount=Money(Decimal(amount)))
+    )
+    txn.add_entry(
+        Entry(account_id=accounts["income"].id, credit_amount=Money(Decimal(amount)))
+    )
+    return txn
+
+
+class TestAsyncSQLiteRepositories:
+    async def test_reads_entities_and_accounts(
+        self,
+        async_db: AsyncSQLiteDatabase,
+        entity: Entity,
+        accounts: dict[str, Account],
+    ):
+        entity_repo = AsyncSQLiteEntityRepository(async_db)
+        account_repo = AsyncSQLiteAccountRepository(async_db)
+
+        assert (await entity_repo.get(entity.id)).name == "Smith Family Trust"
+        assert [e.id for e in await entity_repo.list_all()] == [entity.id]
+        assert set(await entity_repo.get_many([entity.id])) == {entity.id}
+        assert (await account_repo.get(accounts["cash"].id)).name == "Cash"
+        assert {a.id for a in await account_repo.list_by_entity(entity.id)} == {
+            a.id for a in accounts.values()
+        }
+        assert await account_repo.get_many([]) == {}
+
+    async def test_add_many_is_readable_by_sync_repository(
+        self, db: SQLiteDatabase, async_db: AsyncSQLiteDatabase, accounts
+    ):
+        txn = _deposit(accounts, date(2024, 1, 15))
+        await AsyncSQLiteTransactionRepository(async_db).add_many([txn])
+
+        stored = SQLiteTransactionRepository(db).get(txn.id)
+        assert stored is not None
+        assert [e.id for e in stored.entries] == [e.id for e in txn.entries]
+        assert stored.memo == "Deposit 2024-01-15"
+
+    async def test_list_page_matches_sync_repository(
+        self, db: SQLiteDatabase, async_db: AsyncSQLiteDatabase, accounts
+    ):
+        txns = [_deposit(accounts, date(2024, 1, day)) for day in (3, 1, 2, 5)]
+        SQLiteTransactionRepository(db).add_many(txns)
+        sync_repo = SQLiteTransactionRepository(db)
+        async_repo = AsyncSQLiteTransactionRepository(async_db)
+
+        for kwargs in (
+            {"limit": 2},
+            {
+                "account_id": accounts["cash"].id,
+                "after": (date(2024, 1, 2), txns[2].id),
+            },
+            {"start_date": date(2024, 1, 2), "end_date": date(2024, 1, 3)},
+        ):
+            expected = sync_repo.list_page(**kwargs)
+            actual = await async_repo.list_page(**kwargs)
+            assert [t.id for t in actual] == [t.id for t in expected]
+            assert [len(t.entries) for t in actual] == [2] * len(expected)
+
+    async def test_sum_by_account_includes_backdated_postings(
+        self, db: SQLiteDatabase, async_db: AsyncSQLiteDatabase, accounts
+    ):
+        repo = AsyncSQLiteTransactionRepository(async_db)
+        await repo.add(_deposit(accounts, date(2024, 1, 20), "100.00"))
+        await repo.add(_deposit(accounts, date(2024, 1, 10), "50.00"))
+
+        cash = accounts["cash"].id
+        as_of_15 = await repo.sum_by_account([cash], as_of=date(2024, 1, 15))
+        assert [t.balance for t in as_of_15] == [Decimal("50.00")]
+        totals = await repo.sum_by_account([cash])
+        assert totals == list(SQLiteTransactionRepository(db).sum_by_account([cash]))
+        assert db.verify_balance_snapshots() == []
+
+    async def test_count_by_entity_counts_each_transaction_once(
+        self, async_db: AsyncSQLiteDatabase, entity: Entity, accounts
+    ):
+        repo = AsyncSQLiteTransactionRepository(async_db)
+        await repo.add_many([_deposit(accounts, date(2024, 1, d)) for d in (1, 2)])
+
+        assert await repo.count_by_entity(entity.id) == 2
+
+    async def test_unit_of_work_rolls_back_every_write(
+        self, db: SQLiteDatabase, async_db: AsyncSQLiteDatabase, accounts
+    ):
+        repo = AsyncSQLiteTransactionRepository(async_db)
+        first = _deposit(accounts, date(2024, 1, 1))
+
+        with pytest.raises(RuntimeError):
+            async with async_db.unit_of_work():
+                await repo.add(first)
+                # Reads inside the unit of work see its pending writes.
+                assert (await repo.get(first.id)) is not None
+                raise RuntimeError("boom")
+
+        assert await repo.get(first.id) is None
+        assert SQLiteTransactionRepository(db).get(first.id) is None
+        assert db.verify_balance_snapshots() == []
+
+    async def test_concurrent_writes_are_serialized(
+        self, db: SQLiteDatabase, async_db: AsyncSQLiteDatabase, accounts
+    ):
+        repo = AsyncSQLiteTransactionRepository(async_db)
+        txns = [_deposit(accounts, date(2024, 1, 1 + i % 28)) for i in range(40)]
+
+        await asyncio.gather(*(repo.add(txn) for txn in txns))
+
+        totals = await repo.sum_by_account([accounts["cash"].id])
+        assert [t.balance for t in totals] == [Decimal("4000.00")]
+        assert db.verify_balance_snapshots() == []
+
+    async def test_add_many_bumps_ledger_version(
+        self,
+        db: SQLiteDatabase,
+        async_db: AsyncSQLiteDatabase,
+        entity: Entity,
+        accounts: dict[str, Account],
+    ):
+        versions = AsyncSQLiteLedgerVersionRepository(async_db)
+        before = await versions.ledger_version([entity.id])
+
+        await AsyncSQLiteTransactionRepository(async_db).add_many(
+            [_deposit(accounts, date(2024, 1, 15))]
+        )
+
+        after = await versions.ledger_version([entity.id])
+        assert after > before
+        assert after == SQLiteLedgerVersionRepository(db).ledger_version([entity.id])
+
+
+class TestAsyncSQLiteDatabase:
+    def test_async_database_is_cached(self, db: SQLiteDatabase):
+        assert db.async_database() is db.async_database()
+
+    def test_rejects_empty_reader_pool(self, db: SQLiteDatabase):
+        with pytest.raises(ValueError):
+            AsyncSQLiteDatabase(db, readers=0)
+
+    def test_close_stops_worker_threads(self, tmp_path):
+        database = SQLiteDatabase(tmp_path / "other.db")
+        database.initialize()
+        before = set(threading.enumerate())
+        repo = AsyncSQLiteEntityRepository(database.async_database(readers=3))
+
+        assert asyncio.run(repo.list_all()) == []
+        workers = set(threading.enumerate()) - before
+        # One worker per reader plus the writer.
+        assert len(workers) == 4
+
+        database.close()
+        for worker in workers:
+            worker.join(timeout=5)
+        assert not any(worker.is_alive() for worker in workers)
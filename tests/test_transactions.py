@@ -5,12 +5,16 @@ from uuid import uuid4
 import pytest
 
 from family_office_ledger.domain.transactions import (
+    AccountTotals,
+    AccountTotalsAccumulator,
     Entry,
     InsufficientQuantityError,
     InvalidLotOperationError,
+    SnapshotChanges,
     TaxLot,
     Transaction,
     UnbalancedTransactionError,
+    balance_snapshot_changes,
 )
 from family_office_ledger.domain.value_objects import (
     AcquisitionType,
@@ -317,3 +321,55 @@ class TestTaxLot:
         assert AcquisitionType.EXERCISE.value == "exercise"
         assert AcquisitionType.SPINOFF.value == "spinoff"
         assert AcquisitionType.MERGER.value == "merger"
+
+
+class TestBalanceSnapshotChanges:
+    totals = AccountTotals(uuid4(), "USD", Decimal("10"), Decimal("0"))
+
+    def test_creates_missing_day_from_previous_and_shifts_later(self):
+        changes = balance_snapshot_changes(
+            self.totals,
+            date(2024, 1, 5),
+            1,
+            [(date(2024, 1, 9), Decimal("100"), Decimal("40"))],
+            (Decimal("100"), Decimal("40")),
+        )
+
+        assert changes == SnapshotChanges(
+            [
+                (date(2024, 1, 5), Decimal("110"), Decimal("40")),
+                (date(2024, 1, 9), Decimal("110"), Decimal("40")),
+            ],
+            delete_day=False,
+        )
+
+    def test_deletes_day_left_without_activity(self):
+        changes = balance_snapshot_changes(
+            self.totals,
+            date(2024, 1, 5),
+            -1,
+            [
+                (date(2024, 1, 5), Decimal("10"), Decimal("0")),
+                (date(2024, 1, 9), Decimal("25"), Decimal("5")),
+            ],
+            None,
+        )
+
+        assert changes == SnapshotChanges(
+            [(date(2024, 1, 9), Decimal("15"), Decimal("5"))], delete_day=True
+        )
+
+
+class TestAccountTotalsAccumulator:
+    def test_merges_minor_unit_sums_and_exact_amounts(self):
+        account_id = uuid4()
+        totals = AccountTotalsAccumulator()
+
+        totals.add_minor(account_id, "USD", "USD", 1_250_000, None)
+        totals.add_minor(account_id, "USD", "EUR", 0, 500_000)
+        totals.add(account_id, "USD", debit=Decimal("0.0000001"))
+
+        assert totals.totals() == [
+            AccountTotals(account_id, "USD", Decimal("1.2500001"), Decimal("0")),
+            AccountTotals(account_id, "EUR", Decimal("0"), Decimal("0.5")),
+        ]
@@ -218,6 +218,27 @@ class TestSQLiteVendorRepository:
         assert retrieved is not None
         assert retrieved.is_active is False
 
+    def test_search_matches_name_and_notes(self, vendor_repo: SQLiteVendorRepository):
+        by_name = Vendor(name="Rentals Inc")
+        by_notes = Vendor(name="Acme Corp", notes="Office rent and parking")
+        inactive = Vendor(name="Rent Co", is_active=False)
+        for vendor in (by_name, by_notes, inactive, Vendor(name="Parent LLC")):
+            vendor_repo.add(vendor)
+
+        results = vendor_repo.search("rent")
+
+        assert [v.id for v in results] == [by_name.id, by_notes.id]
+
+    def test_search_follows_renames(self, vendor_repo: SQLiteVendorRepository):
+        vendor = Vendor(name="Old Name")
+        vendor_repo.add(vendor)
+
+        vendor.name = "New Name"
+        vendor_repo.update(vendor)
+
+        assert vendor_repo.search("old") == []
+        assert [v.id for v in vendor_repo.search("new")] == [vendor.id]
+
 
 class TestVendorSchemaMigration:
     def test_vendors_table_exists(self, db: SQLiteDatabase):